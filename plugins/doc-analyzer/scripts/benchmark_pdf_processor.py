@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pdf_processor.py
+
+Generates a synthetic text-heavy PDF (no extra dependencies) and times
+page text extraction with a single process vs. a process pool.
+With --memory, runs process_pdf on growing documents in fresh processes
+and reports peak RSS, which should stay flat as page count grows.
+
+Usage:
+    python benchmark_pdf_processor.py --pages 300 --workers 4
+    python benchmark_pdf_processor.py --input real_report.pdf --workers 4
+    python benchmark_pdf_processor.py --memory 100,300,1000
+
+Dependencies:
+    pip install pdfplumber
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_processor import available_cpus, effective_workers, extract_page_texts, process_pdf, pdfplumber  # noqa: E402
+
+# Synthetic page layout (A4, Helvetica 9pt)
+LINES_PER_PAGE = 60
+WORDS = (
+    "revenue operating profit margin guidance capex memory foundry battery "
+    "cathode demand supply consensus target price estimate quarter growth"
+).split()
+
+
+def _page_stream(page_num: int) -> bytes:
+    """Content stream for one page of filler text."""
+    lines = [f"BT /F1 9 Tf 40 810 Td 12 TL (Section {page_num // 10 + 1}. Page {page_num + 1}) Tj"]
+    for i in range(LINES_PER_PAGE):
+        words = [WORDS[(page_num * 7 + i * 3 + k) % len(WORDS)] for k in range(12)]
+        lines.append(f"T* ({' '.join(words)} {page_num + 1}.{i:02d}) Tj")
+    lines.append("ET")
+    return "\n".join(lines).encode("latin-1")
+
+
+def write_synthetic_pdf(path: str, pages: int) -> None:
+    """Write a minimal valid PDF with `pages` pages of text."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page_num in range(pages):
+        stream = _page_stream(page_num)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for obj_id, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (obj_id, body))
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+def page_count(pdf_path: str) -> int:
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def bench_extraction(pdf_path: str, workers: int) -> float:
+    """Seconds to extract every page with the given worker count (after effective_workers capping)."""
+    total_pages = page_count(pdf_path)
+    start = time.perf_counter()
+    texts = extract_page_texts(pdf_path, total_pages, workers)
+    elapsed = time.perf_counter() - start
+    assert len(texts) == total_pages
+    return elapsed
+
+
+def _peak_rss_mb(pdf_path: str, output_dir: str) -> float:
+    """Run process_pdf and return this process's peak RSS in MB (runs in a fresh process)."""
+    process_pdf(pdf_path, output_dir)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_memory(page_counts: list, tmp: str):
+    """Peak RSS of process_pdf per document length, each in a clean spawned process."""
+    ctx = multiprocessing.get_context("spawn")
+    for pages in page_counts:
+        pdf_path = os.path.join(tmp, f"synthetic_{pages}.pdf")
+        write_synthetic_pdf(pdf_path, pages)
+        with ctx.Pool(1) as pool:
+            start = time.perf_counter()
+            peak = pool.apply(_peak_rss_mb, (pdf_path, os.path.join(tmp, f"out_{pages}")))
+            elapsed = time.perf_counter() - start
+        print(f"  {pages:>5} pages: peak RSS {peak:.0f} MB ({elapsed:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pdf_processor page extraction")
+    parser.add_argument("--input", "-i", help="PDF to benchmark (default: generate a synthetic one)")
+    parser.add_argument("--pages", "-p", type=int, default=300, help="Synthetic PDF page count (default: 300)")
+    parser.add_argument("--workers", "-w", type=int, default=available_cpus(),
+                        help="Worker processes to compare against 1 (default: all CPUs)")
+    parser.add_argument("--memory", "-m",
+                        help="Comma-separated page counts for the peak RSS benchmark (e.g. 100,300,1000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.memory:
+            print("process_pdf peak RSS:")
+            bench_memory([int(n) for n in args.memory.split(",")], tmp)
+            return
+
+        pdf_path = args.input
+        if not pdf_path:
+            pdf_path = os.path.join(tmp, "synthetic.pdf")
+            write_synthetic_pdf(pdf_path, args.pages)
+            print(f"Synthetic PDF: {args.pages} pages, {os.path.getsize(pdf_path) / 1024:.0f} KB")
+
+        serial = bench_extraction(pdf_path, 1)
+        print(f"  workers=1: {serial:.2f}s")
+        if args.workers > 1:
+            used = effective_workers(args.workers, page_count(pdf_path))
+            parallel = bench_extraction(pdf_path, args.workers)
+            print(f"  workers={args.workers} (runs {used}): {parallel:.2f}s (speedup x{serial / parallel:.2f})")
+        print(f"  CPUs available: {available_cpus()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,112 @@
 PDF Processor for Doc Analyzer Plugin
 
 Processes PDF documents with hybrid chunking strategy:
-1. Try section-based chunking (using TOC/headers)
+1. Try section-based chunking (PDF outline, printed TOC, font-size or
+   numbered headings, in that order)
 2. Fall back to fixed-size chunking if structure unclear
+With --max-tokens / --max-chars, chunks are instead packed against a size
+budget (within sections when detected), with optional overlap.
 
 Usage:
     python pdf_processor.py --input report.pdf --output /tmp/doc-analyzer/report/
+    python pdf_processor.py --input report.pdf --output /tmp/doc-analyzer/report/ --workers 4
+    python pdf_processor.py --input report.pdf --output /tmp/doc-analyzer/report/ --force
+    python pdf_processor.py --input report.pdf --output /tmp/doc-analyzer/report/ --tables csv
+    python pdf_processor.py --input report.pdf --output /tmp/doc-analyzer/report/ --max-tokens 8000 --overlap 400
+    python pdf_processor.py --input reports/ --output /tmp/doc-analyzer/ --workers 8
+    python pdf_processor.py --input "reports/2025-*/*.pdf" --output /tmp/doc-analyzer/
 
 Dependencies:
     pip install pdfplumber
 """
 
 import argparse
+import glob
+import hashlib
 import json
 import os
 import re
 import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
 try:
     import pdfplumber
+    # pdfminer ships with pdfplumber (outline parsing)
+    from pdfminer.psparser import PSLiteral
+    from pdfminer.pdftypes import resolve1
 except ImportError:
     print("ERROR: pdfplumber not installed. Run: pip install pdfplumber")
     sys.exit(1)
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from table_extractor import (  # noqa: E402
+    TABLE_MIN_NUMERIC_LINES,
+    detect_unit,
+    extract_page_tables,
+    numeric_line_count,
+    table_dir,
+    write_table,
+)
+
+# Page ranges handed to each worker process (more shards than workers balances uneven pages)
+SHARDS_PER_WORKER = 4
+
+# Fewer pages than this per worker -> fewer workers (serial for short reports):
+# a worker costs ~0.1s to start and open the PDF, a text page ~0.07-0.25s to extract
+MIN_PAGES_PER_WORKER = 8
+
+# Page text beyond this many characters is spilled from memory to a temp file
+# (keeps peak memory flat on 1,000+ page filings)
+SPILL_THRESHOLD_CHARS = 4_000_000
+
+# Read size for file fingerprinting
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Section detection
+MIN_SECTIONS = 3               # fewer detected sections -> fixed-size chunking
+TOC_SCAN_PAGES = 5             # printed TOC is looked for in the first pages
+HEADING_SIZE_RATIO = 1.2       # heading font >= body font x ratio
+MAX_HEADINGS_PER_PAGE = 5
+LEAD_LINES = 3                 # first lines of a page checked for numbered headers
+RUNNING_HEADER_SHARE = 0.3     # text on more pages than this is a running header, not a section
+MAX_SECTION_PAGE_SHARE = 0.5   # a heading level on more pages than this is per-page titles (slides)
+
+_SECTION_NUMBER = r'(?:제\s*\d+\s*[장절부]|\d+(?:\.\d+)*\.?|[IVX]+\.|[가-하]\.|Chapter\s+\d+|Section\s+\d+|Part\s+\d+)'
+
+# Printed TOC line: numbered title, leader (dots / middle dots / ellipsis), page number
+TOC_LEADER_RE = re.compile(
+    r'^(?P<title>' + _SECTION_NUMBER + r'?\s*\S.*?)\s*(?:\.{2,}|·{2,}|…+|_{3,})\s*(?P<page>\d{1,4})$'
+)
+# Without leaders (only trusted on a page titled 목차/Contents): "1. Introduction 5"
+TOC_LOOSE_RE = re.compile(r'^(?P<title>' + _SECTION_NUMBER + r'\s*\S.*?)\s+(?P<page>\d{1,4})$')
+TOC_TITLE_RE = re.compile(r'^(목\s*차|contents|table of contents)$', re.IGNORECASE)
+
+# Numbered section header at the start of a line (all former patterns in one alternation)
+SECTION_HEADER_RE = re.compile(
+    r'^(?:'
+    r'제?\s*\d+[장절]\.?\s*.+'          # Korean chapter/section
+    r'|\d+\.\s+[가-힣].+'                # 1. 서론
+    r'|\d+\.\s+[A-Z][A-Za-z\s]+'        # 1. Introduction
+    r'|Chapter\s+\d+[:\s].+'
+    r'|Section\s+\d+[:\s].+'
+    r'|[IVX]+\.\s+.+'                    # Roman numerals
+    r')$'
+)
+PAGE_NUMBER_ONLY_RE = re.compile(r'^[\d\s\-/.|]+$')
+
+# Budget chunking: token estimate without a tokenizer dependency
+# (Hangul/CJK ~1 token per character, other text ~4 characters per token)
+CJK_CHAR_RE = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3040-\u30ff\u4e00-\u9fff]')
+CHARS_PER_TOKEN = 4
+# Oversized pages split into paragraphs, then lines, then fixed slices
+PARAGRAPH_RE = re.compile(r'\S[\s\S]*?(?=\n\s*\n|\Z)')
+LINE_RE = re.compile(r'[^\n]+')
+
 
 def get_file_info(pdf_path: str) -> dict:
     """Get basic file information."""
@@ -42,41 +125,349 @@ def get_file_info(pdf_path: str) -> dict:
     }
 
 
-def extract_toc(pdf) -> list:
+def file_hash(pdf_path: str) -> str:
+    """SHA-256 of the PDF file contents."""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def page_hashes(pdf) -> list:
     """
-    Try to extract table of contents from PDF.
-    Returns list of {title, page} dicts.
+    Per-page fingerprints from raw content streams (no layout analysis, so cheap).
+    A page whose streams cannot be read gets None and always counts as changed.
     """
-    toc = []
+    hashes = []
+    for page in pdf.pages:
+        try:
+            digest = hashlib.sha256()
+            for stream in page.page_obj.contents:
+                digest.update(resolve1(stream).get_data())
+            hashes.append(digest.hexdigest()[:16])
+        except Exception:
+            hashes.append(None)
+    return hashes
 
-    # Method 1: Check PDF outline/bookmarks
+
+def load_previous_metadata(output_dir: str):
+    """metadata.json from an earlier run, or None."""
+    metadata_file = os.path.join(output_dir, "metadata.json")
+    if not os.path.exists(metadata_file):
+        return None
     try:
-        if hasattr(pdf, 'metadata') and pdf.metadata:
-            # Some PDFs have outline in metadata
-            pass
-    except:
-        pass
-
-    # Method 2: Look for TOC-like patterns in first few pages
-    toc_patterns = [
-        r'^(목차|contents|table of contents)$',
-        r'^\d+\.\s+.+\s+\d+$',  # "1. Introduction 5"
-        r'^[IVX]+\.\s+.+\s+\d+$',  # "I. Overview 3"
-    ]
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def reusable_chunks(previous: dict, hashes: list) -> dict:
+    """
+    Chunks from the previous run whose pages are all unchanged and whose file still exists.
+    Returns {chunk_id: chunk metadata}.
+    """
+    if not previous:
+        return {}
+    old_hashes = previous.get("page_hashes") or []
+    reusable = {}
+    for chunk in previous.get("chunks", []):
+        page_range = range(chunk["start_page"] - 1, chunk["end_page"])
+        unchanged = all(
+            p < len(old_hashes) and p < len(hashes) and hashes[p] is not None and old_hashes[p] == hashes[p]
+            for p in page_range
+        )
+        if unchanged and os.path.exists(chunk["file"]):
+            reusable[chunk["chunk_id"]] = chunk
+    return reusable
+
+
+def _reuse(reusable: dict, chunk_id: int, section_title: str, start_page: int, end_page: int,
+           span: list = None):
+    """Previous chunk metadata if it covers exactly the same section and pages (and in-page span)."""
+    chunk = (reusable or {}).get(chunk_id)
+    if chunk and chunk["section_title"] == section_title \
+            and chunk["start_page"] == start_page + 1 and chunk["end_page"] == end_page \
+            and chunk.get("span") == span:
+        return chunk
+    return None
+
+
+def page_heads(page, text: str) -> dict:
+    """
+    Section-detection summary of one page, built from the chars already
+    parsed for extract_text (no extra page read): body font size,
+    large-font lines, the first lines of text, printed-TOC entries and
+    table hints (numeric line count, "단위" currency unit).
+    """
+    sizes = Counter(round(c["size"], 1) for c in page.chars if c["text"].strip())
+    body = sizes.most_common(1)[0][0] if sizes else None
+
+    headings = []
+    if body:
+        for line in page.extract_text_lines():
+            title = line["text"].strip()
+            size = max((c["size"] for c in line["chars"]), default=0)
+            if size >= body * HEADING_SIZE_RATIO and 2 <= len(title) <= 100 \
+                    and not PAGE_NUMBER_ONLY_RE.match(title):
+                headings.append([round(size, 1), title])
+                if len(headings) >= MAX_HEADINGS_PER_PAGE:
+                    break
+
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    return {
+        "body": body,
+        "headings": headings,
+        "lead": lines[:LEAD_LINES],
+        "toc": toc_entries(lines),
+        "numeric_lines": numeric_line_count(lines),
+        "unit": detect_unit(text),
+    }
+
+
+def extract_page(page) -> tuple:
+    """Extract one page's text and heads, then drop its cached layout objects."""
+    text = page.extract_text() or ""
+    heads = page_heads(page, text)
+    page.close()
+    return text, heads
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> list:
+    """Extract (text, heads) of pages [start, end). Runs in a worker process with its own PDF handle."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [extract_page(pdf.pages[i]) for i in range(start, end)]
+
+
+def page_shards(total_pages: int, workers: int) -> list:
+    """Split pages into contiguous (start, end) ranges for the worker pool."""
+    shard_count = max(1, min(total_pages, workers * SHARDS_PER_WORKER))
+    size, extra = divmod(total_pages, shard_count)
+    shards = []
+    start = 0
+    for i in range(shard_count):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            shards.append((start, end))
+        start = end
+    return shards
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (cgroup/affinity aware where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def effective_workers(workers: int, pages: int) -> int:
+    """
+    Requested workers capped by available CPUs and MIN_PAGES_PER_WORKER.
+    Extra processes on a busy or single CPU only add start-up cost.
+    """
+    return max(1, min(workers, available_cpus(), pages // MIN_PAGES_PER_WORKER))
+
+
+def iter_page_texts(pdf_path: str, total_pages: int, workers: int = 1):
+    """
+    Yield (text, heads) of every page, in page order.
+    With workers > 1, page ranges are sharded across a process pool
+    (extract_text is CPU-bound, so threads would not help), capped by
+    effective_workers.
+    """
+    workers = effective_workers(workers, total_pages)
+    if workers <= 1:
+        yield from _extract_page_range(pdf_path, 0, total_pages)
+        return
+
+    shards = page_shards(total_pages, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(
+            _extract_page_range,
+            [pdf_path] * len(shards),
+            [start for start, _ in shards],
+            [end for _, end in shards],
+        )
+        # map() yields in submission order, so pages come back in order
+        for part in parts:
+            yield from part
+
+
+def extract_page_texts(pdf_path: str, total_pages: int, workers: int = 1) -> list:
+    """Extract text of every page, in page order."""
+    return [text for text, _ in iter_page_texts(pdf_path, total_pages, workers)]
+
+
+class PageTextCache:
+    """
+    Extract-once page text store shared by TOC detection and chunking.
+    Pages are extracted lazily (or all up front with prefetch) and kept in
+    memory until SPILL_THRESHOLD_CHARS, after which texts move to a temp file.
+    Page heads (see page_heads) stay in memory; known_heads from a previous
+    run let unchanged pages skip extraction during section detection.
+    """
+
+    def __init__(self, pdf, pdf_path: str, spill_chars: int = SPILL_THRESHOLD_CHARS,
+                 known_heads: dict = None):
+        self.pdf = pdf
+        self.pdf_path = pdf_path
+        self.spill_chars = spill_chars
+        self.extractions = 0
+        self._heads = dict(known_heads or {})
+        self._memory = {}
+        self._memory_chars = 0
+        self._offsets = {}  # page -> (offset, length) in the spill file
+        self._spill = None
+
+    def __len__(self) -> int:
+        return len(self.pdf.pages)
+
+    def __getitem__(self, page_num: int) -> str:
+        if page_num in self._memory:
+            return self._memory[page_num]
+        if page_num in self._offsets:
+            offset, length = self._offsets[page_num]
+            self._spill.seek(offset)
+            return self._spill.read(length).decode('utf-8')
+
+        text, heads = extract_page(self.pdf.pages[page_num])
+        self.extractions += 1
+        self._heads[page_num] = heads
+        self._store(page_num, text)
+        return text
+
+    def heads(self, page_num: int) -> dict:
+        """Section-detection summary of a page (extracts the page if not known yet)."""
+        if page_num not in self._heads:
+            self[page_num]
+        return self._heads[page_num]
+
+    def known_heads(self) -> list:
+        """Heads per page where known (None otherwise), for metadata.json."""
+        return [self._heads.get(page_num) for page_num in range(len(self))]
+
+    def prefetch(self, workers: int):
+        """Extract every page up front with a process pool."""
+        for page_num, (text, heads) in enumerate(iter_page_texts(self.pdf_path, len(self), workers)):
+            self.extractions += 1
+            self._heads[page_num] = heads
+            self._store(page_num, text)
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill is not None
+
+    def _store(self, page_num: int, text: str):
+        if self._spill is not None:
+            self._write_spill(page_num, text)
+            return
+        self._memory[page_num] = text
+        self._memory_chars += len(text)
+        if self._memory_chars > self.spill_chars:
+            self._spill = tempfile.TemporaryFile(prefix="doc-analyzer-pages-")
+            for cached_page, cached_text in self._memory.items():
+                self._write_spill(cached_page, cached_text)
+            self._memory.clear()
+            self._memory_chars = 0
+
+    def _write_spill(self, page_num: int, text: str):
+        data = text.encode('utf-8')
+        self._spill.seek(0, os.SEEK_END)
+        self._offsets[page_num] = (self._spill.tell(), len(data))
+        self._spill.write(data)
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._memory.clear()
+        self._offsets.clear()
 
-    for i, page in enumerate(pdf.pages[:5]):  # Check first 5 pages
-        text = page.extract_text() or ""
-        lines = text.split('\n')
 
-        for line in lines:
-            line = line.strip()
-            # Look for section headers with page numbers
-            match = re.match(r'^(\d+\.?\s+.+?)\s+\.{2,}\s*(\d+)$', line)
-            if match:
-                toc.append({
-                    "title": match.group(1).strip(),
-                    "page": int(match.group(2))
-                })
+def _outline_page(doc, dest, action, page_ids: dict):
+    """0-indexed page of an outline entry's destination, or None."""
+    if dest is None and action is not None:
+        action = resolve1(action)
+        if isinstance(action, dict):
+            dest = action.get("D")
+    dest = resolve1(dest)
+    if isinstance(dest, PSLiteral):
+        dest = dest.name
+    if isinstance(dest, (str, bytes)):
+        dest = resolve1(doc.get_dest(dest))
+    if isinstance(dest, dict):
+        dest = resolve1(dest.get("D"))
+    if isinstance(dest, list) and dest:
+        return page_ids.get(getattr(dest[0], "objid", None))
+    return None
+
+
+def outline_toc(pdf) -> list:
+    """
+    Sections from the PDF outline (bookmarks): top level, or top two levels
+    when the top level alone is too coarse. Returns list of {title, page}.
+    """
+    try:
+        outlines = list(pdf.doc.get_outlines())
+    except Exception:
+        return []
+
+    page_ids = {page.page_obj.pageid: i for i, page in enumerate(pdf.pages)}
+    entries = []
+    for level, title, dest, action, _ in outlines:
+        try:
+            page_num = _outline_page(pdf.doc, dest, action, page_ids)
+        except Exception:
+            page_num = None
+        if page_num is not None and title and title.strip():
+            entries.append((level, title.strip(), page_num))
+    if not entries:
+        return []
+
+    top = min(level for level, _, _ in entries)
+    selected = [e for e in entries if e[0] == top]
+    if len({page for _, _, page in selected}) < MIN_SECTIONS:
+        selected = [e for e in entries if e[0] <= top + 1]
+    return _as_sections((title, page_num) for _, title, page_num in selected)
+
+
+def toc_entries(lines: list) -> list:
+    """
+    Printed-TOC entries on one page as [title, page].
+    Dotted/middle-dot leader lines are accepted anywhere; plain
+    "1. Introduction 5" lines only on a page titled 목차/Contents.
+    """
+    is_toc_page = any(TOC_TITLE_RE.match(line) for line in lines[:LEAD_LINES])
+    entries = []
+    for line in lines:
+        match = TOC_LEADER_RE.match(line) or (is_toc_page and TOC_LOOSE_RE.match(line))
+        if match:
+            entries.append([match.group("title").strip(), int(match.group("page"))])
+    return entries
+
+
+def _as_sections(candidates) -> list:
+    """(title, 0-indexed page) pairs -> sorted {title, page} list, one section per start page."""
+    sections = {}
+    for title, page_num in candidates:
+        sections.setdefault(page_num, title)
+    return [{"title": title, "page": page_num + 1} for page_num, title in sorted(sections.items())]
+
+
+def extract_toc(pages: PageTextCache) -> list:
+    """
+    Try to extract a printed table of contents from the first pages.
+    Returns list of {title, page} dicts.
+    """
+    toc = []
+    total_pages = len(pages)
+
+    for i in range(min(TOC_SCAN_PAGES, total_pages)):
+        for title, page in pages.heads(i)["toc"]:
+            if 1 <= page <= total_pages:
+                toc.append({"title": title, "page": page})
 
     return toc
 
@@ -87,150 +478,527 @@ def detect_section_headers(text: str) -> list:
     Returns list of {title, position} dicts.
     """
     headers = []
-    lines = text.split('\n')
-
-    patterns = [
-        # Korean section patterns
-        r'^(제?\s*\d+[장절]\.?\s*.+)$',
-        r'^(\d+\.\s+[가-힣].+)$',
-        # English section patterns
-        r'^(\d+\.\s+[A-Z][A-Za-z\s]+)$',
-        r'^(Chapter\s+\d+[:\s].+)$',
-        r'^(Section\s+\d+[:\s].+)$',
-        # Roman numerals
-        r'^([IVX]+\.\s+.+)$',
-    ]
-
-    for i, line in enumerate(lines):
+    for i, line in enumerate(text.split('\n')):
         line = line.strip()
-        if not line:
-            continue
+        if line and SECTION_HEADER_RE.match(line):
+            headers.append({
+                "title": line,
+                "line_number": i
+            })
+    return headers
+
+
+def _font_sections(heads: list, total_pages: int) -> list:
+    """Sections from the largest heading font level that starts between MIN_SECTIONS and half the pages."""
+    bodies = sorted(h["body"] for h in heads if h["body"])
+    if not bodies:
+        return []
+    body = bodies[len(bodies) // 2]
+
+    repeated = Counter(title for h in heads for title in {t for _, t in h["headings"]})
+    by_size = {}  # size -> {page: first title}
+    for page_num, h in enumerate(heads):
+        for size, title in h["headings"]:
+            if size >= body * HEADING_SIZE_RATIO and repeated[title] <= max(1, total_pages * RUNNING_HEADER_SHARE):
+                by_size.setdefault(round(size * 2) / 2, {}).setdefault(page_num, title)
+
+    for size in sorted(by_size, reverse=True):
+        starts = by_size[size]
+        if MIN_SECTIONS <= len(starts) <= total_pages * MAX_SECTION_PAGE_SHARE:
+            return _as_sections((title, page_num) for page_num, title in starts.items())
+    return []
+
 
-        for pattern in patterns:
-            if re.match(pattern, line):
-                headers.append({
-                    "title": line,
-                    "line_number": i
-                })
+def _header_sections(heads: list, total_pages: int) -> list:
+    """Sections from numbered headers among each page's first lines."""
+    starts = {}
+    for page_num, h in enumerate(heads):
+        for line in h["lead"]:
+            if SECTION_HEADER_RE.match(line):
+                starts[page_num] = line
                 break
+    repeated = Counter(starts.values())
+    starts = {p: t for p, t in starts.items() if repeated[t] <= max(1, total_pages * RUNNING_HEADER_SHARE)}
+    if MIN_SECTIONS <= len(starts) <= total_pages * MAX_SECTION_PAGE_SHARE:
+        return _as_sections((title, page_num) for page_num, title in starts.items())
+    return []
 
-    return headers
 
+def detect_sections(pages: PageTextCache) -> tuple:
+    """
+    Section-detection engine. Tries, in order:
+    1. PDF outline/bookmarks (no page text needed)
+    2. Printed TOC in the first TOC_SCAN_PAGES pages
+    3. One pass over page heads: font-size headings, then numbered headers
+    Returns (sections, source) with source in outline/toc/font/header,
+    or ([], None) when the structure is unclear.
+    """
+    sections = outline_toc(pages.pdf)
+    if len(sections) >= MIN_SECTIONS:
+        return sections, "outline"
+
+    toc = extract_toc(pages)
+    if len(toc) >= MIN_SECTIONS:
+        return toc, "toc"
+
+    total_pages = len(pages)
+    heads = [pages.heads(page_num) for page_num in range(total_pages)]
+    for source, detect in (("font", _font_sections), ("header", _header_sections)):
+        sections = detect(heads, total_pages)
+        if sections:
+            return sections, source
+
+    return [], None
+
+
+def table_candidates(pages: PageTextCache) -> list:
+    """0-indexed pages whose text looks tabular (from page heads, no extra reads)."""
+    return [
+        page_num for page_num in range(len(pages))
+        if pages.heads(page_num).get("numeric_lines", 0) >= TABLE_MIN_NUMERIC_LINES
+    ]
 
-def chunk_by_sections(pdf, toc: list, output_dir: str) -> list:
+
+def _extract_tables_range(pdf_path: str, page_units: list) -> list:
+    """(page, tables) for [(page, unit), ...]. Runs in a worker process with its own PDF handle."""
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, unit in page_units:
+            page = pdf.pages[page_num]
+            try:
+                tables = extract_page_tables(page, unit)
+            except Exception:
+                tables = []
+            page.close()
+            results.append((page_num, tables))
+    return results
+
+
+def extract_tables(pdf_path: str, page_units: list, workers: int = 1):
     """
-    Chunk PDF by sections based on TOC.
-    Returns list of chunk metadata.
+    Yield (page, tables) for candidate pages, in page order.
+    With workers > 1, candidate pages are sharded across a process pool
+    (capped by effective_workers).
     """
-    chunks = []
-    chunk_dir = os.path.join(output_dir, "chunks")
-    os.makedirs(chunk_dir, exist_ok=True)
+    workers = effective_workers(workers, len(page_units))
+    if workers <= 1:
+        yield from _extract_tables_range(pdf_path, page_units)
+        return
 
-    if not toc:
-        return []
+    shards = page_shards(len(page_units), workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_extract_tables_range, [pdf_path] * len(shards),
+                         [page_units[start:end] for start, end in shards])
+        for part in parts:
+            yield from part
+
+
+def write_tables(pdf_path: str, pages: PageTextCache, output_dir: str, fmt: str, workers: int = 1) -> dict:
+    """
+    Table-extraction stage: candidate pages -> {output_dir}/tables/p{page}_t{n}.{csv|parquet}
+    plus tables/tables.json (header, unit, FnGuide-style metrics per table).
+    """
+    out_dir = table_dir(output_dir)
+    for name in os.listdir(out_dir):
+        os.remove(os.path.join(out_dir, name))
+
+    candidates = table_candidates(pages)
+    page_units = [(page_num, pages.heads(page_num).get("unit")) for page_num in candidates]
+
+    index = []
+    for page_num, tables in extract_tables(pdf_path, page_units, workers):
+        for n, table in enumerate(tables, start=1):
+            path = write_table(table, os.path.join(out_dir, f"p{page_num + 1:03d}_t{n}"), fmt)
+            index.append({
+                "file": path,
+                "page": page_num + 1,
+                "header": table["header"],
+                "rows": len(table["rows"]),
+                "unit": table["unit"],
+                "numeric_ratio": table["numeric_ratio"],
+                "metrics": table["metrics"],
+                "metric_units": table["metric_units"],
+            })
 
+    index_file = os.path.join(out_dir, "tables.json")
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+    return {"format": fmt, "candidate_pages": len(candidates), "count": len(index), "index": index_file}
+
+
+def write_pages(f, pages: PageTextCache, start_page: int, end_page: int) -> int:
+    """
+    Stream pages [start_page, end_page) into an open chunk file, one page at a time.
+    Returns the number of characters written.
+    """
+    char_count = 0
+    for page_num in range(start_page, min(end_page, len(pages))):
+        block = f"\n--- Page {page_num + 1} ---\n{pages[page_num]}"
+        f.write(block)
+        char_count += len(block)
+    return char_count
+
+
+def section_ranges(toc: list, total_pages: int) -> list:
+    """TOC entries -> [(title, start_page, end_page)], 0-indexed, end exclusive."""
     # Add end marker
-    toc_with_end = toc + [{"title": "END", "page": len(pdf.pages) + 1}]
+    toc_with_end = toc + [{"title": "END", "page": total_pages + 1}]
 
+    ranges = []
     for i in range(len(toc)):
         start_page = toc_with_end[i]["page"] - 1  # 0-indexed
         end_page = toc_with_end[i + 1]["page"] - 1
 
         # Clamp to valid range
-        start_page = max(0, min(start_page, len(pdf.pages) - 1))
-        end_page = max(start_page + 1, min(end_page, len(pdf.pages)))
-
-        # Extract text from section pages
-        section_text = ""
-        for page_num in range(start_page, end_page):
-            if page_num < len(pdf.pages):
-                page_text = pdf.pages[page_num].extract_text() or ""
-                section_text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-
-        if section_text.strip():
-            chunk_file = os.path.join(chunk_dir, f"chunk_{i+1:03d}.txt")
-            with open(chunk_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Section: {toc[i]['title']}\n\n{section_text}")
+        start_page = max(0, min(start_page, total_pages - 1))
+        end_page = max(start_page + 1, min(end_page, total_pages))
+        ranges.append((toc[i]["title"], start_page, end_page))
+    return ranges
 
+
+def chunk_by_sections(pages: PageTextCache, toc: list, output_dir: str, reusable: dict = None) -> list:
+    """
+    Chunk PDF by sections based on TOC.
+    Chunks found in `reusable` with the same pages are kept as-is.
+    Returns list of chunk metadata.
+    """
+    chunks = []
+    chunk_dir = os.path.join(output_dir, "chunks")
+    os.makedirs(chunk_dir, exist_ok=True)
+
+    for i, (title, start_page, end_page) in enumerate(section_ranges(toc, len(pages))):
+        previous = _reuse(reusable, i + 1, title, start_page, end_page)
+        if previous:
+            chunks.append(previous)
+            continue
+
+        # Stream section pages straight into the chunk file
+        chunk_file = os.path.join(chunk_dir, f"chunk_{i+1:03d}.txt")
+        with open(chunk_file, 'w', encoding='utf-8') as f:
+            f.write(f"# Section: {title}\n\n")
+            char_count = write_pages(f, pages, start_page, end_page)
+
+        if not char_count:
+            os.remove(chunk_file)
+        else:
             chunks.append({
                 "chunk_id": i + 1,
                 "file": chunk_file,
-                "section_title": toc[i]["title"],
+                "section_title": title,
                 "start_page": start_page + 1,
                 "end_page": end_page,
-                "char_count": len(section_text)
+                "char_count": char_count
             })
 
     return chunks
 
 
-def chunk_by_pages(pdf, chunk_size: int, output_dir: str) -> list:
+def chunk_by_pages(pages: PageTextCache, chunk_size: int, output_dir: str, reusable: dict = None) -> list:
     """
     Chunk PDF by fixed number of pages.
+    Chunks found in `reusable` with the same pages are kept as-is.
     Returns list of chunk metadata.
     """
     chunks = []
     chunk_dir = os.path.join(output_dir, "chunks")
     os.makedirs(chunk_dir, exist_ok=True)
 
-    total_pages = len(pdf.pages)
+    total_pages = len(pages)
     chunk_num = 0
 
     for start_page in range(0, total_pages, chunk_size):
         chunk_num += 1
         end_page = min(start_page + chunk_size, total_pages)
 
-        # Extract text from chunk pages
-        chunk_text = ""
-        for page_num in range(start_page, end_page):
-            page_text = pdf.pages[page_num].extract_text() or ""
-            chunk_text += f"\n--- Page {page_num + 1} ---\n{page_text}"
+        previous = _reuse(reusable, chunk_num, f"Pages {start_page + 1}-{end_page}", start_page, end_page)
+        if previous:
+            chunks.append(previous)
+            continue
 
-        if chunk_text.strip():
-            chunk_file = os.path.join(chunk_dir, f"chunk_{chunk_num:03d}.txt")
-            with open(chunk_file, 'w', encoding='utf-8') as f:
-                f.write(chunk_text)
+        # Stream chunk pages straight into the chunk file
+        chunk_file = os.path.join(chunk_dir, f"chunk_{chunk_num:03d}.txt")
+        with open(chunk_file, 'w', encoding='utf-8') as f:
+            char_count = write_pages(f, pages, start_page, end_page)
 
+        if not char_count:
+            os.remove(chunk_file)
+        else:
             chunks.append({
                 "chunk_id": chunk_num,
                 "file": chunk_file,
                 "section_title": f"Pages {start_page + 1}-{end_page}",
                 "start_page": start_page + 1,
                 "end_page": end_page,
-                "char_count": len(chunk_text)
+                "char_count": char_count
             })
 
     return chunks
 
 
-def process_pdf(input_path: str, output_dir: str, chunk_size: int = 10) -> dict:
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM tokens: Hangul/CJK characters count 1, other text 1 per CHARS_PER_TOKEN."""
+    return _tokens(len(text), len(CJK_CHAR_RE.findall(text)))
+
+
+def _tokens(chars: int, cjk: int) -> int:
+    return cjk + -(-(chars - cjk) // CHARS_PER_TOKEN)
+
+
+def _page_marker(page_num: int) -> str:
+    return f"\n--- Page {page_num + 1} ---\n"
+
+
+def split_page(pages: PageTextCache, page_num: int, limit: int, measure) -> list:
+    """
+    Pieces of one page for budget packing: [(page, start, end, size)].
+    The whole page when it fits in `limit`, else paragraphs, then lines,
+    then fixed-width slices. Sizes include the page marker.
+    """
+    text = pages[page_num]
+    overhead = measure(_page_marker(page_num))
+    units = []
+
+    def split(start: int, end: int, level: int):
+        size = measure(text[start:end]) + overhead
+        if size <= limit or end - start <= 1:
+            units.append((page_num, start, end, size))
+            return
+        if level < 2:
+            regex = PARAGRAPH_RE if level == 0 else LINE_RE
+            spans = [(start + m.start(), start + m.end()) for m in regex.finditer(text[start:end])]
+            if len(spans) > 1:
+                for span_start, span_end in spans:
+                    split(span_start, span_end, level + 1)
+                return
+            split(start, end, level + 1)
+            return
+        # measure(s) <= len(s) for both units, so slices of this width always fit
+        width = max(1, limit - overhead)
+        for slice_start in range(start, end, width):
+            slice_end = min(slice_start + width, end)
+            units.append((page_num, slice_start, slice_end, measure(text[slice_start:slice_end]) + overhead))
+
+    split(0, len(text), 0)
+    if not units:
+        return [(page_num, 0, 0, overhead)]
+    # The first piece starts at 0 (leading whitespace included) so that a page
+    # block that starts a page always begins at page offset 0
+    first = (page_num, 0, units[0][2], measure(text[:units[0][2]]) + overhead)
+    # Count the separator before each piece too: it is written when pieces stay together
+    return [first] + [
+        (page_num, start, end, measure(text[prev[2]:end]) + overhead)
+        for prev, (_, start, end, _) in zip(units, units[1:])
+    ]
+
+
+def _overlap_tail(chunk: list, pages: PageTextCache, overlap: int, measure) -> list:
+    """Trailing pieces of a chunk totalling at most `overlap` (whole units, then lines of the next one)."""
+    tail, size = [], 0
+    for page_num, start, end, unit_size in reversed(chunk):
+        if size + unit_size <= overlap:
+            tail.insert(0, (page_num, start, end, unit_size))
+            size += unit_size
+            continue
+        text = pages[page_num]
+        overhead = measure(_page_marker(page_num))
+        for m in reversed(list(LINE_RE.finditer(text[start:end]))):
+            line_size = measure(m.group()) + overhead
+            if size + line_size > overlap:
+                break
+            tail.insert(0, (page_num, start + m.start(), start + m.end(), line_size))
+            size += line_size
+        break
+    return tail
+
+
+def pack_units(units: list, budget: int, overlap: int, pages: PageTextCache, measure) -> list:
+    """
+    Greedy single pass: fill each chunk up to `budget`, starting the next one
+    with up to `overlap` of the previous chunk's tail. Returns [[unit, ...], ...].
+    """
+    packed = []
+    chunk, size = [], 0
+    for unit in units:
+        if chunk and size + unit[3] > budget:
+            packed.append(chunk)
+            chunk = _overlap_tail(chunk, pages, overlap, measure) if overlap else []
+            size = sum(u[3] for u in chunk)
+            while chunk and size + unit[3] > budget:
+                size -= chunk.pop(0)[3]
+        chunk.append(unit)
+        size += unit[3]
+    if chunk:
+        packed.append(chunk)
+    return packed
+
+
+def write_units(f, pages: PageTextCache, units: list, header: str = "") -> tuple:
+    """
+    Write a header and packed pieces with page markers (original separators
+    kept within a page). Returns (char_count, token_count) of what was written.
+    """
+    f.write(header)
+    char_count, cjk_count = len(header), len(CJK_CHAR_RE.findall(header))
+    prev_page, prev_end = None, None
+    for page_num, start, end, _ in units:
+        text = pages[page_num]
+        if page_num == prev_page and start >= prev_end:
+            block = text[prev_end:end]
+        else:
+            block = _page_marker(page_num) + text[start:end]
+        f.write(block)
+        char_count += len(block)
+        cjk_count += len(CJK_CHAR_RE.findall(block))
+        prev_page, prev_end = page_num, end
+    return char_count, _tokens(char_count, cjk_count)
+
+
+def chunk_by_budget(pages: PageTextCache, budget: dict, output_dir: str, reusable: dict = None,
+                    toc: list = None) -> list:
+    """
+    Chunk PDF by a size budget: {"unit": "tokens" | "chars", "size": N, "overlap": M}.
+    Pages are packed whole when they fit, otherwise split into paragraphs/lines,
+    in one pass over the cached page text. With a TOC, each section is packed
+    separately. Records exact char_count and token_count per chunk.
+    Returns list of chunk metadata.
+    """
+    chunks = []
+    chunk_dir = os.path.join(output_dir, "chunks")
+    os.makedirs(chunk_dir, exist_ok=True)
+
+    measure = estimate_tokens if budget["unit"] == "tokens" else len
+    ranges = section_ranges(toc, len(pages)) if toc else [(None, 0, len(pages))]
+
+    chunk_num = 0
+    for title, start_page, end_page in ranges:
+        header = f"# Section: {title}\n\n" if title else ""
+        limit = budget["size"] - measure(header)
+        units = [u for page_num in range(start_page, end_page)
+                 for u in split_page(pages, page_num, limit, measure)]
+        packed = pack_units(units, limit, budget.get("overlap", 0), pages, measure)
+
+        for part, group in enumerate(packed, start=1):
+            chunk_num += 1
+            first, last = group[0], group[-1]
+            span = [first[1], last[2]]
+            if title:
+                section_title = title if len(packed) == 1 else f"{title} ({part}/{len(packed)})"
+            else:
+                section_title = f"Pages {first[0] + 1}-{last[0] + 1}"
+
+            previous = _reuse(reusable, chunk_num, section_title, first[0], last[0] + 1, span)
+            if previous:
+                chunks.append(previous)
+                continue
+
+            chunk_file = os.path.join(chunk_dir, f"chunk_{chunk_num:03d}.txt")
+            with open(chunk_file, 'w', encoding='utf-8') as f:
+                char_count, token_count = write_units(f, pages, group, header)
+
+            chunks.append({
+                "chunk_id": chunk_num,
+                "file": chunk_file,
+                "section_title": section_title,
+                "start_page": first[0] + 1,
+                "end_page": last[0] + 1,
+                "span": span,
+                "char_count": char_count,
+                "token_count": token_count,
+            })
+
+    return chunks
+
+
+def _chunks_intact(metadata: dict) -> bool:
+    return all(os.path.exists(chunk["file"]) for chunk in metadata.get("chunks", []))
+
+
+def process_pdf(input_path: str, output_dir: str, chunk_size: int = 10, workers: int = 1,
+                force: bool = False, tables: str = None, budget: dict = None) -> dict:
     """
     Main PDF processing function.
     Uses hybrid chunking: section-based if TOC available, else fixed-size.
+    Every page is extracted at most once into a shared PageTextCache;
+    with workers > 1 the cache is filled up front by a process pool.
+
+    Re-runs are incremental (unless force): an unchanged file (same SHA-256
+    and chunk size) is skipped, otherwise only chunks whose pages changed
+    are regenerated. force rebuilds every chunk but still removes stale
+    chunk files of the previous run. An existing queue.json is never overwritten.
+
+    tables ("csv" / "parquet") adds the table-extraction stage on candidate pages.
+    budget ({"unit": "tokens" | "chars", "size", "overlap"}) switches to
+    size-budget chunking (see chunk_by_budget).
     """
     # Get file info
     file_info = get_file_info(input_path)
+    sha256 = file_hash(input_path)
 
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
+    previous = load_previous_metadata(output_dir)
+    if previous and not force and previous.get("file_sha256") == sha256 \
+            and previous.get("requested_chunk_size") == chunk_size \
+            and (previous.get("tables") or {}).get("format") == tables \
+            and previous.get("budget") == budget and _chunks_intact(previous):
+        previous["incremental"] = {"status": "unchanged", "reused": previous["chunk_count"], "regenerated": 0}
+        _init_queue(output_dir, file_info["doc_name"])
+        return previous
+
     # Open PDF
     with pdfplumber.open(input_path) as pdf:
         total_pages = len(pdf.pages)
+        hashes = page_hashes(pdf)
+        reusable = {} if force else reusable_chunks(previous, hashes)
 
-        # Try to extract TOC
-        toc = extract_toc(pdf)
+        # Heads of unchanged pages carry over, so section detection need not re-read them
+        known_heads = {}
+        if previous and not force:
+            old_hashes = previous.get("page_hashes") or []
+            old_heads = previous.get("page_heads") or []
+            known_heads = {
+                p: old_heads[p] for p in range(min(len(hashes), len(old_hashes), len(old_heads)))
+                if hashes[p] is not None and hashes[p] == old_hashes[p] and old_heads[p] is not None
+            }
 
-        # Decide chunking strategy
-        if toc and len(toc) >= 3:
-            # Use section-based chunking
-            chunking_method = "section"
-            chunks = chunk_by_sections(pdf, toc, output_dir)
-        else:
-            # Fall back to fixed-size chunking
-            chunking_method = "fixed"
-            toc = []
-            chunks = chunk_by_pages(pdf, chunk_size, output_dir)
+        pages = PageTextCache(pdf, input_path, known_heads=known_heads)
+        try:
+            # Parallel extraction: workers open the PDF independently, texts return in page order
+            # (skipped when earlier chunks can be reused, since most pages won't be read)
+            if workers > 1 and not reusable:
+                pages.prefetch(workers)
+
+            # Detect sections (outline, printed TOC, headings)
+            toc, section_source = detect_sections(pages)
+
+            # Decide chunking strategy
+            if budget:
+                # Size-budget packing (inside detected sections, if any)
+                chunking_method = "budget"
+                chunks = chunk_by_budget(pages, budget, output_dir, reusable, toc)
+            elif toc:
+                # Use section-based chunking
+                chunking_method = "section"
+                chunks = chunk_by_sections(pages, toc, output_dir, reusable)
+            else:
+                # Fall back to fixed-size chunking
+                chunking_method = "fixed"
+                chunks = chunk_by_pages(pages, chunk_size, output_dir, reusable)
+
+            table_info = write_tables(input_path, pages, output_dir, tables, workers) if tables else None
+            heads = pages.known_heads()
+        finally:
+            pages.close()
+
+    # Drop chunk files left over from a previous, longer chunk list
+    kept_files = {chunk["file"] for chunk in chunks}
+    for chunk in (previous or {}).get("chunks", []):
+        if chunk["file"] not in kept_files and os.path.exists(chunk["file"]):
+            os.remove(chunk["file"])
+
+    reused = sum(1 for chunk in chunks if reusable.get(chunk["chunk_id"]) is chunk)
 
     # Build metadata
     metadata = {
@@ -238,11 +1006,25 @@ def process_pdf(input_path: str, output_dir: str, chunk_size: int = 10) -> dict:
         "file_name": file_info["file_name"],
         "file_path": file_info["file_path"],
         "size_mb": file_info["size_mb"],
+        "file_sha256": sha256,
         "total_pages": total_pages,
         "chunking_method": chunking_method,
         "chunk_size": chunk_size if chunking_method == "fixed" else None,
+        "requested_chunk_size": chunk_size,
+        "budget": budget,
         "chunk_count": len(chunks),
+        "total_chars": sum(chunk["char_count"] for chunk in chunks),
+        "max_chunk_chars": max((chunk["char_count"] for chunk in chunks), default=0),
         "toc": toc,
+        "section_source": section_source,
+        "page_hashes": hashes,
+        "page_heads": heads,
+        "tables": table_info,
+        "incremental": {
+            "status": "updated" if previous else "new",
+            "reused": reused,
+            "regenerated": len(chunks) - reused,
+        },
         "chunks": chunks
     }
 
@@ -251,18 +1033,175 @@ def process_pdf(input_path: str, output_dir: str, chunk_size: int = 10) -> dict:
     with open(metadata_file, 'w', encoding='utf-8') as f:
         json.dump(metadata, f, ensure_ascii=False, indent=2)
 
-    # Initialize queue file
+    _init_queue(output_dir, file_info["doc_name"])
+
+    return metadata
+
+
+def _init_queue(output_dir: str, doc_name: str):
+    """Create queue.json unless one exists (keeps discovered/completed progress across re-runs)."""
+    queue_file = os.path.join(output_dir, "queue.json")
+    if os.path.exists(queue_file):
+        return
+
     queue = {
-        "doc_name": file_info["doc_name"],
+        "doc_name": doc_name,
         "discovered": [],
         "completed": [],
         "current": None
     }
-    queue_file = os.path.join(output_dir, "queue.json")
     with open(queue_file, 'w', encoding='utf-8') as f:
         json.dump(queue, f, ensure_ascii=False, indent=2)
 
-    return metadata
+
+def find_pdfs(pattern: str) -> list:
+    """PDF files in a directory (non-recursive) or matching a glob pattern, sorted."""
+    if os.path.isdir(pattern):
+        candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        candidates = glob.glob(pattern, recursive=True)
+    return sorted(path for path in candidates if os.path.isfile(path) and path.lower().endswith('.pdf'))
+
+
+def batch_output_dirs(pdf_paths: list, output_root: str, known: dict = None) -> dict:
+    """
+    Per-document output dir under output_root, stable across re-runs.
+    known ({absolute file path: output dir name}, from the previous manifest)
+    is reused as-is. A new document gets its file stem, or stem + a hash of
+    its absolute path when another document (new or known) has that name,
+    so adding files never moves an existing document's output.
+    """
+    known = known or {}
+    stems = Counter(Path(path).stem for path in pdf_paths if str(Path(path).absolute()) not in known)
+    taken = set(known.values())
+    dirs = {}
+    for path in pdf_paths:
+        key = str(Path(path).absolute())
+        name = known.get(key)
+        if name is None:
+            name = Path(path).stem
+            if stems[name] > 1 or name in taken:
+                name = f"{name}_{hashlib.sha256(key.encode('utf-8')).hexdigest()[:8]}"
+        dirs[path] = os.path.join(output_root, name)
+    return dirs
+
+
+def load_manifest_dirs(manifest_file: str) -> dict:
+    """{absolute file path: output dir name} recorded by earlier batch runs."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest.get("output_dirs") or {
+        doc["file_path"]: os.path.basename(doc["output_dir"]) for doc in manifest.get("documents", [])
+    }
+
+
+def _process_one(input_path: str, output_dir: str, chunk_size: int, workers: int, force: bool,
+                 tables: str = None, budget: dict = None) -> dict:
+    """Batch worker: process one PDF, reporting failure instead of raising."""
+    try:
+        metadata = process_pdf(input_path, output_dir, chunk_size, workers, force, tables, budget)
+    except Exception as e:
+        return {"file_path": str(Path(input_path).absolute()), "output_dir": output_dir,
+                "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    return {
+        "doc_name": metadata["doc_name"],
+        "file_path": metadata["file_path"],
+        "output_dir": output_dir,
+        "file_sha256": metadata["file_sha256"],
+        "total_pages": metadata["total_pages"],
+        "chunking_method": metadata["chunking_method"],
+        "chunk_count": metadata["chunk_count"],
+        "status": metadata["incremental"]["status"],
+        "regenerated": metadata["incremental"]["regenerated"],
+        "table_count": (metadata.get("tables") or {}).get("count"),
+    }
+
+
+def _write_manifest(manifest_file: str, manifest: dict):
+    """Atomic write so an interrupted batch never leaves a truncated manifest."""
+    tmp_file = manifest_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, manifest_file)
+
+
+def process_batch(pdf_paths: list, output_root: str, chunk_size: int = 10, cpu_budget: int = 1,
+                  force: bool = False, on_done=None, tables: str = None, budget: dict = None) -> dict:
+    """
+    Process many PDFs concurrently within a global CPU budget.
+    Documents run in a shared process pool (min(budget, documents) at a time);
+    leftover budget goes to per-document page extraction workers.
+    Writes {output_root}/manifest.json after every document, so an interrupted
+    batch resumes by re-running: finished documents are skipped as unchanged.
+    The manifest's "output_dirs" keeps every document's directory across runs.
+    """
+    os.makedirs(output_root, exist_ok=True)
+    manifest_file = os.path.join(output_root, "manifest.json")
+    known_dirs = load_manifest_dirs(manifest_file)
+    output_dirs = batch_output_dirs(pdf_paths, output_root, known_dirs)
+
+    concurrency = max(1, min(cpu_budget, len(pdf_paths)))
+    per_doc_workers = max(1, cpu_budget // concurrency)
+
+    manifest = {
+        "output_root": str(Path(output_root).absolute()),
+        "cpu_budget": cpu_budget,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "finished_at": None,
+        "failed": 0,
+        "output_dirs": {
+            **known_dirs,
+            **{str(Path(path).absolute()): os.path.basename(output_dirs[path]) for path in pdf_paths},
+        },
+        "documents": [
+            {"file_path": str(Path(path).absolute()), "output_dir": output_dirs[path], "status": "pending"}
+            for path in pdf_paths
+        ],
+    }
+    slots = {output_dirs[path]: i for i, path in enumerate(pdf_paths)}
+
+    if concurrency == 1:
+        results = (
+            _process_one(path, output_dirs[path], chunk_size, per_doc_workers, force, tables, budget)
+            for path in pdf_paths
+        )
+        pool = futures = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=concurrency)
+        futures = [
+            pool.submit(_process_one, path, output_dirs[path], chunk_size, per_doc_workers, force, tables, budget)
+            for path in pdf_paths
+        ]
+        results = (future.result() for future in as_completed(futures))
+
+    try:
+        for result in results:
+            manifest["documents"][slots[result["output_dir"]]] = result
+            manifest["failed"] += result["status"] == "failed"
+            _write_manifest(manifest_file, manifest)
+            if on_done:
+                on_done(result)
+    finally:
+        if pool is not None:
+            # Interrupted: drop queued documents, let running ones finish cleanly
+            for future in futures:
+                future.cancel()
+            pool.shutdown()
+
+    manifest["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    _write_manifest(manifest_file, manifest)
+    return manifest
+
+
+def _print_batch_progress(result: dict):
+    if result["status"] == "failed":
+        print(f"  FAILED {result['file_path']}: {result['error']}")
+    else:
+        print(f"  {result['status']:<9} {result['doc_name']} "
+              f"({result['total_pages']} pages, {result['chunk_count']} chunks)")
 
 
 def main():
@@ -272,12 +1211,12 @@ def main():
     parser.add_argument(
         "--input", "-i",
         required=True,
-        help="Input PDF file path"
+        help="Input PDF file path, or a directory / glob pattern for batch mode"
     )
     parser.add_argument(
         "--output", "-o",
         required=True,
-        help="Output directory for chunks and metadata"
+        help="Output directory for chunks and metadata (batch mode: one subdirectory per PDF)"
     )
     parser.add_argument(
         "--chunk-size", "-c",
@@ -285,9 +1224,69 @@ def main():
         default=10,
         help="Pages per chunk for fixed-size chunking (default: 10)"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Processes for page text extraction, capped at one per 8 pages and by CPUs; "
+             "in batch mode the total CPU budget (default: 1, 0 = all CPUs)"
+    )
+    size_group = parser.add_mutually_exclusive_group()
+    size_group.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Pack pages/paragraphs into chunks of at most N estimated tokens instead of --chunk-size pages"
+    )
+    size_group.add_argument(
+        "--max-chars",
+        type=int,
+        help="Like --max-tokens, with an exact character budget"
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        default=0,
+        help="Tokens/chars of each chunk's tail repeated at the start of the next (with --max-tokens/--max-chars)"
+    )
+    parser.add_argument(
+        "--tables", "-t",
+        choices=["csv", "parquet"],
+        help="Also extract numeric tables from candidate pages into tables/ (parquet needs pandas + pyarrow)"
+    )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Reprocess every page even if the file is unchanged"
+    )
 
     args = parser.parse_args()
 
+    workers = args.workers if args.workers > 0 else available_cpus()
+
+    budget = None
+    if args.max_tokens or args.max_chars:
+        size = args.max_tokens or args.max_chars
+        if size < 100 or not 0 <= args.overlap <= size // 2:
+            parser.error("budget must be >= 100 and --overlap between 0 and half the budget")
+        budget = {"unit": "tokens" if args.max_tokens else "chars", "size": size, "overlap": args.overlap}
+    elif args.overlap:
+        parser.error("--overlap requires --max-tokens or --max-chars")
+
+    # Batch mode: directory or glob pattern
+    if os.path.isdir(args.input) or glob.has_magic(args.input):
+        pdf_paths = find_pdfs(args.input)
+        if not pdf_paths:
+            print(f"ERROR: No PDF files found: {args.input}")
+            sys.exit(1)
+
+        print(f"Processing {len(pdf_paths)} PDFs (CPU budget: {workers})")
+        manifest = process_batch(pdf_paths, args.output, args.chunk_size, workers, args.force,
+                                 on_done=_print_batch_progress, tables=args.tables, budget=budget)
+        print(f"\nBatch complete: {len(manifest['documents']) - manifest['failed']} processed, "
+              f"{manifest['failed']} failed")
+        print(f"  Manifest: {os.path.join(args.output, 'manifest.json')}")
+        sys.exit(1 if manifest["failed"] else 0)
+
     # Validate input
     if not os.path.exists(args.input):
         print(f"ERROR: Input file not found: {args.input}")
@@ -299,7 +1298,8 @@ def main():
 
     # Process PDF
     print(f"Processing: {args.input}")
-    metadata = process_pdf(args.input, args.output, args.chunk_size)
+    metadata = process_pdf(args.input, args.output, args.chunk_size, workers, args.force, args.tables, budget)
+    incremental = metadata["incremental"]
 
     # Print summary
     print(f"\nProcessing complete!")
@@ -308,10 +1308,18 @@ def main():
     print(f"  Size: {metadata['size_mb']} MB")
     print(f"  Chunking: {metadata['chunking_method']}")
     print(f"  Chunks: {metadata['chunk_count']}")
+    if metadata.get("budget"):
+        print(f"  Budget: {metadata['budget']['size']} {metadata['budget']['unit']} "
+              f"(overlap {metadata['budget']['overlap']}, largest chunk {metadata['max_chunk_chars']} chars)")
+    if metadata.get("tables"):
+        print(f"  Tables: {metadata['tables']['count']} "
+              f"(from {metadata['tables']['candidate_pages']} candidate pages)")
+    print(f"  Status: {incremental['status']} "
+          f"({incremental['regenerated']} regenerated, {incremental['reused']} reused)")
     print(f"  Output: {args.output}")
 
     if metadata['toc']:
-        print(f"\nTable of Contents detected:")
+        print(f"\nSections detected ({metadata['section_source']}):")
         for item in metadata['toc'][:5]:
             print(f"  - {item['title']} (p.{item['page']})")
         if len(metadata['toc']) > 5:
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Full-text Search Index for Doc Analyzer Plugin
+
+SQLite FTS5 index (trigram tokenizer, so Korean needs no morphological
+analyzer) over processed document chunks, watchlist stock reports and
+temp_horus classification folders. Updates are incremental: only files
+whose size/mtime and content hash changed are re-indexed, deleted files
+are dropped.
+
+Usage:
+    python search_index.py update
+    python search_index.py search HBM 삼성전자
+    python search_index.py search '"스테이블 코인"' --source watchlist --json
+
+Dependencies:
+    Python sqlite3 built with FTS5 (SQLite 3.34+ for the trigram tokenizer)
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ticker_extractor import page_lookup  # noqa: E402
+
+DEFAULT_DB = "/tmp/doc-analyzer/search_index.db"
+
+# source name -> glob pattern (relative patterns resolve against --root)
+SOURCES = {
+    "doc": "/tmp/doc-analyzer/*/chunks/*.txt",
+    "watchlist": "watchlist/stocks/**/*.md",
+    "horus": "temp_horus/**/*.md",
+}
+
+# Trigram tokens: shorter terms (e.g. 2-syllable names like "다날") fall back to LIKE
+MIN_TERM_LENGTH = 3
+
+# bm25 column weights: title matches rank well above body matches
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+QUERY_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+HEADING_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL,
+    doc_rowid INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    path UNINDEXED, source UNINDEXED, title, body, tokenize='trigram'
+);
+"""
+
+
+def connect(db_path: str = DEFAULT_DB) -> sqlite3.Connection:
+    """Open (and create if needed) the index database."""
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def discover_files(root: str = ".", sources: dict = None) -> dict:
+    """{absolute path: source} for every indexable file."""
+    files = {}
+    for source, pattern in (sources or SOURCES).items():
+        if not os.path.isabs(pattern):
+            pattern = os.path.join(root, pattern)
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path):
+                files[os.path.abspath(path)] = source
+    return files
+
+
+def _title(path: str, body: str) -> str:
+    """First markdown heading, else the file name (e.g. 다날_064260)."""
+    match = HEADING_RE.search(body)
+    if match:
+        return match.group(1).strip()
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def update_index(conn: sqlite3.Connection, root: str = ".", sources: dict = None) -> dict:
+    """
+    Bring the index in line with the file system.
+    Returns {"added", "updated", "removed", "unchanged"} counts.
+    """
+    files = discover_files(root, sources)
+    known = {row[0]: row[1:] for row in conn.execute("SELECT path, size, mtime, sha256, doc_rowid FROM files")}
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+    with conn:
+        for path in set(known) - set(files):
+            conn.execute("DELETE FROM docs WHERE rowid = ?", (known[path][3],))
+            conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            stats["removed"] += 1
+
+        for path, source in sorted(files.items()):
+            stat = os.stat(path)
+            previous = known.get(path)
+            if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime:
+                stats["unchanged"] += 1
+                continue
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            sha256 = hashlib.sha256(data).hexdigest()
+            if previous and previous[2] == sha256:
+                # Touched but identical: just record the new mtime
+                conn.execute("UPDATE files SET size = ?, mtime = ? WHERE path = ?",
+                             (stat.st_size, stat.st_mtime, path))
+                stats["unchanged"] += 1
+                continue
+
+            body = data.decode('utf-8', errors='replace')
+            if previous:
+                conn.execute("DELETE FROM docs WHERE rowid = ?", (previous[3],))
+            cursor = conn.execute("INSERT INTO docs (path, source, title, body) VALUES (?, ?, ?, ?)",
+                                  (path, source, _title(path, body), body))
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                         (path, source, stat.st_size, stat.st_mtime, sha256, cursor.lastrowid))
+            stats["updated" if previous else "added"] += 1
+
+    return stats
+
+
+def parse_query(query: str) -> list:
+    """Split into terms; "quoted phrases" stay whole (spaces included)."""
+    return [phrase or word for phrase, word in QUERY_TERM_RE.findall(query)]
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def search(conn: sqlite3.Connection, query: str, source: str = None, limit: int = 20) -> list:
+    """
+    Ranked AND search over titles and bodies.
+    Terms of 3+ characters go through the trigram index and bm25 ranking;
+    shorter terms are applied as substring filters.
+    Ties (bm25 is ~0 for terms found in nearly every file) break on occurrences.
+    Returns [{path, source, title, score, hits, snippet, page}].
+    """
+    terms = parse_query(query)
+    if not terms:
+        return []
+    long_terms = [t for t in terms if len(t) >= MIN_TERM_LENGTH]
+    short_terms = [t for t in terms if len(t) < MIN_TERM_LENGTH]
+
+    where, params = [], []
+    if long_terms:
+        where.append("docs MATCH ?")
+        params.append(" AND ".join(_fts_phrase(t) for t in long_terms))
+    for term in short_terms:
+        where.append("(title LIKE ? ESCAPE '\\' OR body LIKE ? ESCAPE '\\')")
+        params.extend([_like(term), _like(term)])
+    if source:
+        where.append("source = ?")
+        params.append(source)
+
+    if long_terms:
+        rank = f"bm25(docs, 0, 0, {TITLE_WEIGHT}, {BODY_WEIGHT})"
+        snippet = "snippet(docs, 3, '[', ']', '...', 48)"
+    else:
+        rank = "0"
+        snippet = "substr(body, 1, 0)"
+
+    rows = conn.execute(
+        f"SELECT path, source, title, body, {rank} AS score, {snippet} "
+        f"FROM docs WHERE {' AND '.join(where)}",
+        params,
+    ).fetchall()
+
+    results = []
+    for path, src, title, body, score, snip in rows:
+        counts = [body.count(t) + title.count(t) for t in terms]
+        first = min((body.find(t) for t in terms if t in body), default=-1)
+        if not snip and first >= 0:
+            snip = body[max(0, first - 40):first + 80].replace("\n", " ")
+        results.append({
+            "path": path,
+            "source": src,
+            "title": title,
+            # bm25 is lower-is-better
+            "score": round(-score, 4),
+            "hits": sum(counts),
+            "snippet": snip.replace("\n", " ") if snip else "",
+            "page": page_lookup(body)(first) if src == "doc" and first >= 0 else None,
+        })
+
+    results.sort(key=lambda r: (-r["score"], -r["hits"]))
+    return results[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Full-text index over doc chunks, watchlist and temp_horus reports"
+    )
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Index database (default: {DEFAULT_DB})")
+    parser.add_argument("--root", default=".", help="Project root for watchlist/ and temp_horus/ (default: .)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("update", help="Index new/changed files, drop deleted ones")
+
+    search_parser = sub.add_parser("search", help="Ranked keyword / phrase search")
+    search_parser.add_argument("query", nargs="+", help='Terms (AND); quote phrases: \'"스테이블 코인"\'')
+    search_parser.add_argument("--source", "-s", choices=sorted(SOURCES), help="Limit to one source")
+    search_parser.add_argument("--limit", "-l", type=int, default=20, help="Max results (default: 20)")
+    search_parser.add_argument("--json", action="store_true", help="JSON output")
+    search_parser.add_argument("--no-update", action="store_true", help="Skip the incremental update")
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+
+    if args.command == "update":
+        stats = update_index(conn, args.root)
+        print(f"Index updated: {stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        return
+
+    if not args.no_update:
+        update_index(conn, args.root)
+
+    results = search(conn, " ".join(args.query), args.source, args.limit)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{len(results)} results for: {' '.join(args.query)}")
+    for r in results:
+        page = f" p.{r['page']}" if r["page"] else ""
+        print(f"\n  [{r['source']}] {r['title']}{page} (score {r['score']}, {r['hits']} hits)")
+        print(f"    {r['path']}")
+        if r["snippet"]:
+            print(f"    {r['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Table Extractor for Doc Analyzer Plugin
+
+Finds tables on candidate pages with pdfplumber and normalizes them into
+numeric grids (used by pdf_processor.py --tables). Estimate tables in
+analyst reports (매출액/영업이익 forecasts, EPS, 목표주가) are mapped to the
+same metric keys and units (억원) as vulture's get_fnguide_financial, so
+figures can be compared without re-reading the PDF.
+
+Dependencies:
+    pip install pdfplumber
+    pip install pandas pyarrow  (only for Parquet output)
+"""
+
+import csv
+import os
+import re
+
+# Candidate page: at least this many text lines carrying 3+ numbers
+TABLE_MIN_NUMERIC_LINES = 3
+# Kept table: at least this share of body cells are numbers
+TABLE_MIN_NUMERIC_RATIO = 0.5
+
+# Rows searched for a period header ("2024A  2025E ...")
+HEADER_SCAN_ROWS = 4
+
+# Whitespace-aligned tables (no ruling lines) are common in analyst reports
+TEXT_TABLE_SETTINGS = {"vertical_strategy": "text", "horizontal_strategy": "text"}
+
+NUMBER_TOKEN_RE = re.compile(r'[(△▲▽▼-]?\d[\d,]*(?:\.\d+)?%?\)?')
+NUMBER_CELL_RE = re.compile(r'^[▲+]?(?P<neg>[(△▽▼-])?(?P<num>\d[\d,]*(?:\.\d+)?|\.\d+)%?\)?$')
+EMPTY_CELLS = {"", "-", "–", "—", "N/A", "n/a", "NA", "na", "nm", "NM", "n.m."}
+
+UNIT_RE = re.compile(r'단위\s*[:：]?\s*(?P<unit>조원|십억원|억원|백만원|천원|원)')
+# Any unit-like note in a row label; units missing from UNIT_TO_EOK (e.g. 백만달러) are left unconverted
+ROW_UNIT_RE = re.compile(r'\((?P<unit>[^()]*?(?:원|달러|엔|위안|유로|USD|\$|%|배)|x)\)')
+# Multiplier to 억원 (FnGuide unit)
+UNIT_TO_EOK = {"조원": 10000, "십억원": 10, "억원": 1, "백만원": 0.01, "천원": 0.00001, "원": 0.00000001}
+
+# "2024", "2025E", "2025F", "FY24", "24A", "2025.12E", "2025/12(E)"
+PERIOD_RE = re.compile(r'^(?:FY)?(?P<year>20\d{2}|\d{2})(?:[./]\d{1,2})?\s*\(?(?P<flag>[AEFP])?\)?$', re.IGNORECASE)
+
+# Row label -> get_fnguide_financial metric key
+TABLE_METRICS = {
+    "매출액": "revenue",
+    "매출": "revenue",
+    "영업수익": "revenue",
+    "revenue": "revenue",
+    "sales": "revenue",
+    "영업이익": "operating_profit",
+    "operatingprofit": "operating_profit",
+    "당기순이익": "net_income",
+    "순이익": "net_income",
+    "netincome": "net_income",
+    "지배주주순이익": "net_income_controlling",
+    "지배순이익": "net_income_controlling",
+    "ebitda": "ebitda",
+    "영업이익률": "operating_margin",
+    "opm": "operating_margin",
+    "eps": "eps",
+    "bps": "bps",
+    "per": "per",
+    "pbr": "pbr",
+    "roe": "roe",
+    "ev/ebitda": "ev_ebitda",
+    "목표주가": "target_price",
+    "적정주가": "target_price",
+}
+# Metrics in currency amounts (converted to 억원); the rest are ratios or per-share values
+MONEY_METRICS = {"revenue", "operating_profit", "net_income", "net_income_controlling", "ebitda"}
+
+
+def numeric_line_count(lines: list) -> int:
+    """Lines with 3+ numeric tokens (cheap table-likeness signal from page text)."""
+    return sum(1 for line in lines if len(NUMBER_TOKEN_RE.findall(line)) >= 3)
+
+
+def detect_unit(text: str):
+    """Currency unit from a "(단위: 십억원)" note, or None."""
+    match = UNIT_RE.search(text)
+    return match.group("unit") if match else None
+
+
+def parse_number(cell: str):
+    """
+    Analyst-table number -> float, or None for blanks/dashes/text.
+    "1,234" / "▲1,234" -> 1234.0, "(1,234)" / "△1,234" / "▼1,234" / "-1,234" -> -1234.0, "12.3%" -> 12.3
+    """
+    text = (cell or "").strip().replace(" ", "")
+    if text in EMPTY_CELLS:
+        return None
+    match = NUMBER_CELL_RE.match(text)
+    if not match:
+        return None
+    value = float(match.group("num").replace(",", ""))
+    return -value if match.group("neg") else value
+
+
+def period_key(cell: str):
+    """Column header -> "2024" (actual) / "2025E" (estimate), or None."""
+    match = PERIOD_RE.match((cell or "").strip().replace(" ", ""))
+    if not match:
+        return None
+    year = match.group("year")
+    if len(year) == 2:
+        year = "20" + year
+    flag = (match.group("flag") or "").upper()
+    return year + ("E" if flag in ("E", "F", "P") else "")
+
+
+def metric_key(label: str):
+    """Row label -> (metric key, row unit) or (None, None)."""
+    label = (label or "").strip()
+    unit_match = ROW_UNIT_RE.search(label)
+    row_unit = unit_match.group("unit") if unit_match else None
+    key = re.sub(r'\(.*?\)|\s', '', label).lower()
+    return TABLE_METRICS.get(key), row_unit
+
+
+def normalize_table(raw: list) -> dict:
+    """
+    pdfplumber table -> {"header", "rows", "numeric_ratio"} with blank
+    rows/columns dropped and numeric cells parsed; None if not a numeric table.
+    """
+    grid = [[(cell or "").replace("\n", " ").strip() for cell in row] for row in raw if row]
+    grid = [row for row in grid if any(row)]
+    if len(grid) < 2:
+        return None
+    width = max(len(row) for row in grid)
+    grid = [row + [""] * (width - len(row)) for row in grid]
+    keep = [c for c in range(width) if any(row[c] for row in grid)]
+    grid = [[row[c] for c in keep] for row in grid]
+    if len(keep) < 2:
+        return None
+
+    # Header: first row with 2+ period columns (skips title / "단위" rows above it)
+    start = next((i for i, row in enumerate(grid[:HEADER_SCAN_ROWS])
+                  if sum(period_key(cell) is not None for cell in row[1:]) >= 2), 0)
+    header, body = grid[start], grid[start + 1:]
+    if not body:
+        return None
+    cells = [cell for row in body for cell in row[1:] if cell]
+    numeric = sum(1 for cell in cells if parse_number(cell) is not None)
+    ratio = numeric / len(cells) if cells else 0
+    if ratio < TABLE_MIN_NUMERIC_RATIO:
+        return None
+
+    rows = [[row[0]] + [_cell_value(cell) for cell in row[1:]] for row in body]
+    return {"header": header, "rows": rows, "numeric_ratio": round(ratio, 2)}
+
+
+def _cell_value(cell: str):
+    """Parsed number, None for blanks/dashes, else the text as-is."""
+    value = parse_number(cell)
+    if value is not None:
+        return value
+    return None if cell in EMPTY_CELLS else cell
+
+
+def table_metrics(table: dict, unit: str = None):
+    """
+    ({metric: {period: value}}, {metric: unit}) from rows with known labels
+    and period columns. Money metrics are converted to 억원 (row unit, else
+    page unit); when that unit is missing or unknown the values stay as
+    printed and the metric's unit is None.
+    """
+    periods = [period_key(cell) for cell in table["header"]]
+    metrics, units = {}, {}
+    for row in table["rows"]:
+        metric, row_unit = metric_key(row[0])
+        if not metric:
+            continue
+        scale = 1
+        units[metric] = row_unit
+        if metric in MONEY_METRICS:
+            scale = UNIT_TO_EOK.get(row_unit or unit)
+            units[metric] = "억원" if scale else None
+            scale = scale or 1
+        for period, value in zip(periods[1:], row[1:]):
+            if period and isinstance(value, float):
+                metrics.setdefault(metric, {})[period] = round(value * scale, 4)
+    return metrics, units
+
+
+def extract_page_tables(page, unit: str = None) -> list:
+    """
+    Numeric tables on one pdfplumber page: ruled tables first, then
+    whitespace-aligned ones. Returns [{header, rows, numeric_ratio, unit, metrics, metric_units}].
+    """
+    raw_tables = page.extract_tables() or page.extract_tables(TEXT_TABLE_SETTINGS)
+    tables = []
+    for raw in raw_tables:
+        table = normalize_table(raw)
+        if table:
+            table["unit"] = unit
+            table["metrics"], table["metric_units"] = table_metrics(table, unit)
+            tables.append(table)
+    return tables
+
+
+def write_table(table: dict, path_stem: str, fmt: str = "csv") -> str:
+    """Write one normalized table as CSV or Parquet; returns the file path."""
+    if fmt == "parquet":
+        import pandas as pd
+
+        columns = _unique_columns(table["header"])
+        frame = pd.DataFrame(table["rows"], columns=columns)
+        # Mixed text/number columns (e.g. "흑전") are stored as text
+        for column in columns:
+            if frame[column].map(lambda v: isinstance(v, str)).any():
+                frame[column] = frame[column].astype(str)
+        path = path_stem + ".parquet"
+        frame.to_parquet(path, index=False)
+        return path
+
+    path = path_stem + ".csv"
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(table["header"])
+        for row in table["rows"]:
+            writer.writerow(["" if v is None else (_format_number(v) if isinstance(v, float) else v) for v in row])
+    return path
+
+
+def _format_number(value: float) -> str:
+    """Full precision, no exponent: 3008709.0 -> "3008709", 3210450.5 -> "3210450.5"."""
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.15g}"
+
+
+def _unique_columns(header: list) -> list:
+    columns, seen = [], {}
+    for i, name in enumerate(header):
+        name = name or f"col{i}"
+        seen[name] = seen.get(name, 0) + 1
+        columns.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return columns
+
+
+def table_dir(output_dir: str) -> str:
+    path = os.path.join(output_dir, "tables")
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Ticker Mention Extractor for Doc Analyzer Plugin
+
+Scans chunk text produced by pdf_processor.py for Korean stock mentions
+(6-digit ticker codes and company names) with an Aho-Corasick automaton,
+so every chunk is read once in linear time regardless of how many names
+are searched. Results pre-populate queue.json "candidates" for the LLM
+to confirm instead of discovering stocks from scratch.
+
+Usage:
+    python ticker_extractor.py --output /tmp/doc-analyzer/report/
+    python ticker_extractor.py --output /tmp/doc-analyzer/report/ --names ticker_names.json
+
+Dependencies:
+    vulture plugin (pykrx) for the ticker/name list, or --names {ticker: name} JSON
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+
+# Ticker/name map cache (refreshed daily; listings change rarely)
+NAMES_CACHE_FILE = "/tmp/doc-analyzer/ticker_names.json"
+NAMES_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Names shorter than this are too ambiguous to match in free text
+MIN_NAME_LENGTH = 2
+# Hangul names shorter than this must be followed by a particle or non-Hangul
+# ("대원" matches "대원은" but not "대원들")
+SHORT_NAME_LENGTH = 3
+# First syllables of particles that may follow a name (은/는, 이/가, 을/를, 의, 에, 와/과, 도, 로/으로, 만, ...)
+PARTICLE_STARTS = frozenset("은는이가을를의에와과도로으만부까보처께")
+# Listed names that are everyday words in reports ("투자 대상으로", "전방 산업"):
+# matched by ticker code only
+AMBIGUOUS_NAMES = frozenset({"대상", "전방", "태양", "동양", "국보", "진도", "서원", "신흥", "고려"})
+
+PAGE_MARKER_RE = re.compile(r'^--- Page (\d+) ---$', re.MULTILINE)
+
+VULTURE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "vulture")
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher.
+    add() keywords, build() once, then search() reports every occurrence
+    in O(len(text) + matches).
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]  # keywords ending at each state (own + via failure links)
+
+    def add(self, keyword: str, value):
+        state = 0
+        for ch in keyword:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append((len(keyword), value))
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+        return self
+
+    def search(self, text: str):
+        """Yield (start, end, value) for every keyword occurrence."""
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for length, value in self.output[state]:
+                yield i - length + 1, i + 1, value
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _is_hangul(ch: str) -> bool:
+    return '\uac00' <= ch <= '\ud7a3'
+
+
+def _valid_boundary(text: str, start: int, end: int, keyword_is_ascii: bool) -> bool:
+    """
+    Korean names take trailing particles ("삼성전자는"), so only the start is
+    checked, except short names, which must be followed by a particle or
+    non-Hangul ("대원은" but not "대원들"). ASCII names and codes must also
+    not run into more ASCII letters or digits ("LGD", "0059301"), though
+    Korean may follow ("NAVER클라우드").
+    """
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end >= len(text):
+        return True
+    if keyword_is_ascii:
+        return not (text[end].isascii() and _is_word_char(text[end]))
+    if end - start < SHORT_NAME_LENGTH and _is_hangul(text[end]):
+        return text[end] in PARTICLE_STARTS
+    return True
+
+
+def build_matcher(names: dict) -> AhoCorasick:
+    """Automaton over ticker codes and company names. Values: (ticker, is_ascii)."""
+    matcher = AhoCorasick()
+    for ticker, name in names.items():
+        matcher.add(ticker, (ticker, True))
+        if name and len(name) >= MIN_NAME_LENGTH and name not in AMBIGUOUS_NAMES:
+            matcher.add(name, (ticker, name.isascii()))
+    return matcher.build()
+
+
+def find_mentions(matcher: AhoCorasick, text: str) -> list:
+    """
+    Leftmost-longest, non-overlapping matches with boundary checks.
+    "삼성전자우" wins over "삼성전자"; "LG" does not match inside "LGD".
+    Returns [(start, ticker)].
+    """
+    best = {}  # start -> (end, ticker)
+    for start, end, (ticker, is_ascii) in matcher.search(text):
+        if not _valid_boundary(text, start, end, is_ascii):
+            continue
+        if start not in best or end > best[start][0]:
+            best[start] = (end, ticker)
+
+    mentions = []
+    covered = 0
+    for start in sorted(best):
+        end, ticker = best[start]
+        if start >= covered:
+            mentions.append((start, ticker))
+            covered = end
+    return mentions
+
+
+def page_lookup(text: str):
+    """Map a text offset to its page number using "--- Page N ---" markers."""
+    offsets, numbers = [], []
+    for match in PAGE_MARKER_RE.finditer(text):
+        offsets.append(match.start())
+        numbers.append(int(match.group(1)))
+
+    def lookup(offset: int):
+        i = bisect.bisect_right(offsets, offset) - 1
+        return numbers[i] if i >= 0 else None
+
+    return lookup
+
+
+def page_position(text: str, span_start: int = 0):
+    """
+    Map a chunk text offset to (page, offset within the page text), or None
+    before the first marker. span_start is where the chunk's first page block
+    starts in that page (metadata "span"; budget chunks may begin mid-page).
+    """
+    markers = [(m.end() + 1, int(m.group(1))) for m in PAGE_MARKER_RE.finditer(text)]
+    starts = [block_start for block_start, _ in markers]
+
+    def lookup(offset: int):
+        i = bisect.bisect_right(starts, offset) - 1
+        if i < 0:
+            return None
+        block_start, page = markers[i]
+        return page, offset - block_start + (span_start if i == 0 else 0)
+
+    return lookup
+
+
+def load_ticker_names(names_file: str = None, refresh: bool = False) -> dict:
+    """
+    {ticker: name} for all listed stocks.
+    From names_file if given, else the daily cache, else vulture's
+    get_ticker_list / get_ticker_name (cached for next time).
+    """
+    if names_file:
+        with open(names_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    if not refresh and os.path.exists(NAMES_CACHE_FILE) \
+            and time.time() - os.path.getmtime(NAMES_CACHE_FILE) < NAMES_CACHE_MAX_AGE:
+        with open(NAMES_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    sys.path.insert(0, os.path.abspath(VULTURE_ROOT))
+    from utils.data_fetcher import get_ticker_list, get_ticker_name
+
+    tickers = get_ticker_list(market="ALL") or []
+    names = {ticker: get_ticker_name(ticker) for ticker in tickers}
+    names = {ticker: name for ticker, name in names.items() if name}
+    if not names:
+        return {}
+
+    os.makedirs(os.path.dirname(NAMES_CACHE_FILE), exist_ok=True)
+    with open(NAMES_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(names, f, ensure_ascii=False)
+    return names
+
+
+def extract_mentions(output_dir: str, names: dict) -> list:
+    """
+    Scan every chunk listed in metadata.json.
+    Text repeated across chunks (budget-mode overlap) is counted once, by
+    (page, offset within the page).
+    Returns [{ticker, name, mentions, pages, chunks}] sorted by mention count.
+    """
+    with open(os.path.join(output_dir, "metadata.json"), 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+
+    matcher = build_matcher(names)
+    found = {}
+    seen = set()
+    for chunk in metadata["chunks"]:
+        with open(chunk["file"], 'r', encoding='utf-8') as f:
+            text = f.read()
+        position_of = page_position(text, (chunk.get("span") or [0])[0])
+
+        for start, ticker in find_mentions(matcher, text):
+            position = position_of(start)
+            key = position if position is not None else ("chunk", chunk["chunk_id"], start)
+            counted = key in seen
+            seen.add(key)
+
+            entry = found.setdefault(ticker, {
+                "ticker": ticker,
+                "name": names[ticker],
+                "mentions": 0,
+                "pages": set(),
+                "chunks": set(),
+            })
+            entry["chunks"].add(chunk["chunk_id"])
+            if counted:
+                continue
+            entry["mentions"] += 1
+            if position is not None:
+                entry["pages"].add(position[0])
+
+    candidates = sorted(found.values(), key=lambda e: (-e["mentions"], e["ticker"]))
+    for entry in candidates:
+        entry["pages"] = sorted(entry["pages"])
+        entry["chunks"] = sorted(entry["chunks"])
+    return candidates
+
+
+def update_queue(output_dir: str, candidates: list) -> dict:
+    """Store candidates in queue.json, keeping discovered/completed progress."""
+    queue_file = os.path.join(output_dir, "queue.json")
+    queue = {"discovered": [], "completed": [], "current": None}
+    if os.path.exists(queue_file):
+        with open(queue_file, 'r', encoding='utf-8') as f:
+            queue = json.load(f)
+
+    queue["candidates"] = candidates
+    with open(queue_file, 'w', encoding='utf-8') as f:
+        json.dump(queue, f, ensure_ascii=False, indent=2)
+    return queue
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract ticker mentions from doc-analyzer chunks"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        required=True,
+        help="pdf_processor output directory (metadata.json, chunks/, queue.json)"
+    )
+    parser.add_argument(
+        "--names", "-n",
+        help="JSON file of {ticker: name} (default: fetch via vulture, cached daily)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached ticker/name list"
+    )
+    parser.add_argument(
+        "--min-mentions", "-m",
+        type=int,
+        default=1,
+        help="Drop candidates mentioned fewer times (default: 1)"
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.output, "metadata.json")):
+        print(f"ERROR: metadata.json not found in {args.output} (run pdf_processor.py first)")
+        sys.exit(1)
+
+    names = load_ticker_names(args.names, args.refresh)
+    if not names:
+        print("ERROR: Could not load ticker/name list")
+        sys.exit(1)
+
+    candidates = [c for c in extract_mentions(args.output, names) if c["mentions"] >= args.min_mentions]
+    update_queue(args.output, candidates)
+
+    print(f"Ticker candidates: {len(candidates)} (from {len(names)} listed stocks)")
+    for entry in candidates[:10]:
+        pages = ", ".join(str(p) for p in entry["pages"][:8])
+        print(f"  {entry['name']} ({entry['ticker']}): {entry['mentions']} mentions, p.{pages}")
+    if len(candidates) > 10:
+        print(f"  ... and {len(candidates) - 10} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Shared test setup for doc-analyzer scripts (imported as top-level modules) and a tiny PDF writer."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path: str, pages: list, outline: list = None) -> None:
+    """
+    Minimal text PDF (Helvetica, latin-1).
+    pages: [[line, ...], ...] where a line is "text" (10pt) or (size, "text");
+    outline: [(title, 0-indexed page), ...] top-level bookmarks.
+    """
+    objects = [None, None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids, page_ids = [], []
+    for lines in pages:
+        y, parts = 800, []
+        for line in lines:
+            size, text = (10, line) if isinstance(line, str) else line
+            parts.append(f"BT /F1 {size} Tf 40 {y} Td ({_escape(text)}) Tj ET")
+            y -= size + 6
+        stream = "\n".join(parts).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(pages))
+
+    catalog = b"<< /Type /Catalog /Pages 2 0 R >>"
+    if outline:
+        root = len(objects) + 1
+        first = root + 1
+        last = first + len(outline) - 1
+        objects.append(b"<< /Type /Outlines /First %d 0 R /Last %d 0 R /Count %d >>" % (first, last, len(outline)))
+        for i, (title, page_num) in enumerate(outline):
+            item = b"<< /Title (%s) /Parent %d 0 R /Dest [%d 0 R /Fit]" % (
+                _escape(title).encode("latin-1"), root, page_ids[page_num])
+            if i > 0:
+                item += b" /Prev %d 0 R" % (first + i - 1)
+            if i < len(outline) - 1:
+                item += b" /Next %d 0 R" % (first + i + 1)
+            objects.append(item + b" >>")
+        catalog = b"<< /Type /Catalog /Pages 2 0 R /Outlines %d 0 R >>" % root
+    objects[0] = catalog
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for obj_id, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (obj_id, body))
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Factory: make_pdf(pages, name="doc.pdf", outline=None) -> path of a generated PDF."""
+    def factory(pages: list, name: str = "doc.pdf", outline: list = None) -> str:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_pdf(str(path), pages, outline)
+        return str(path)
+    return factory
@@ -0,0 +1,71 @@
+"""Tests for PageTextCache - extract-once page store with temp-file spill."""
+from unittest.mock import patch
+
+import pdf_processor
+from pdf_processor import PageTextCache, pdfplumber, process_pdf
+
+PAGES = [[f"Page {n} line {i} with some words" for i in range(5)] for n in range(1, 5)]
+
+
+class TestExtractOnce:
+    """Each page is extracted at most once."""
+
+    def test_cached_reads(self, make_pdf):
+        path = make_pdf(PAGES)
+
+        with pdfplumber.open(path) as pdf:
+            pages = PageTextCache(pdf, path)
+            first = pages[1]
+            assert pages[1] == first
+            assert pages.heads(1)["lead"][0] == "Page 2 line 0 with some words"
+            pages.close()
+
+        assert pages.extractions == 1
+
+    def test_process_pdf_extracts_each_page_once(self, make_pdf, tmp_path):
+        path = make_pdf(PAGES)
+
+        with patch("pdf_processor.extract_page", wraps=pdf_processor.extract_page) as spy:
+            metadata = process_pdf(path, str(tmp_path / "out"), chunk_size=2)
+
+        assert spy.call_count == len(PAGES)
+        assert metadata["chunk_count"] == 2
+
+
+class TestSpill:
+    """Texts beyond spill_chars move to a temp file."""
+
+    def test_spilled_text_reads_back_identical(self, make_pdf):
+        path = make_pdf(PAGES + [["Unicode cafe \xe9 and (parens)"]])
+
+        with pdfplumber.open(path) as pdf:
+            in_memory = PageTextCache(pdf, path)
+            expected = [in_memory[i] for i in range(len(in_memory))]
+            in_memory.close()
+
+            pages = PageTextCache(pdf, path, spill_chars=50)
+            texts = [pages[i] for i in range(len(pages))]
+            spilled = pages.spilled
+            # Second pass reads from the spill file, not the PDF
+            again = [pages[i] for i in reversed(range(len(pages)))][::-1]
+            extractions = pages.extractions
+            pages.close()
+
+        assert not in_memory.spilled
+        assert spilled
+        assert texts == expected
+        assert again == expected
+        assert extractions == len(expected)
+
+    def test_close_removes_temp_file(self, make_pdf):
+        path = make_pdf(PAGES)
+
+        with pdfplumber.open(path) as pdf:
+            pages = PageTextCache(pdf, path, spill_chars=10)
+            pages[0]
+            pages[1]
+            spill = pages._spill
+            pages.close()
+
+        assert spill.closed
+        assert not pages.spilled
@@ -0,0 +1,216 @@
+"""Tests for pdf_processor."""
+import json
+import os
+from unittest.mock import patch
+
+import pdf_processor
+from pdf_processor import (
+    batch_output_dirs, effective_workers, pack_units, process_batch, process_pdf, split_page,
+)
+
+# Page texts stand in for PageTextCache (only pages[i] is used); sizes in characters
+PAGES = [
+    "Intro line one\nIntro line two\n\nSecond paragraph here",
+    "\n".join(f"line {i} of a long page with several words" for i in range(40)),
+    "short",
+    "x" * 500,
+]
+
+
+def units_for(pages, limit):
+    return [u for page_num in range(len(pages)) for u in split_page(pages, page_num, limit, len)]
+
+
+def visible(text):
+    return "".join(text.split())
+
+
+class TestSplitPage:
+    """Tests for split_page function."""
+
+    def test_whole_page_when_it_fits(self):
+        units = split_page(PAGES, 0, 1000, len)
+
+        assert [(u[0], u[1], u[2]) for u in units] == [(0, 0, len(PAGES[0]))]
+
+    def test_pieces_cover_page_in_order(self):
+        """Oversized pages split into ordered pieces that keep every character."""
+        for page_num in (1, 3):
+            units = split_page(PAGES, page_num, 120, len)
+
+            assert len(units) > 1
+            assert units[0][1] == 0
+            assert all(a[2] <= b[1] for a, b in zip(units, units[1:]))
+            text = PAGES[page_num]
+            assert visible("".join(text[s:e] for _, s, e, _ in units)) == visible(text)
+
+    def test_piece_sizes_within_limit(self):
+        units = split_page(PAGES, 3, 120, len)
+
+        assert all(size <= 120 for *_, size in units)
+
+
+class TestPackUnits:
+    """Tests for pack_units function."""
+
+    def test_chunks_within_budget(self):
+        units = units_for(PAGES, 150)
+
+        packed = pack_units(units, 150, 0, PAGES, len)
+
+        assert [u for chunk in packed for u in chunk] == units
+        assert all(sum(u[3] for u in chunk) <= 150 for chunk in packed if len(chunk) > 1)
+
+    def test_overlap_repeats_previous_tail(self):
+        """Each chunk starts with (at most `overlap` of) the previous chunk's tail."""
+        units = units_for(PAGES[:2], 200)
+
+        packed = pack_units(units, 200, 60, PAGES, len)
+
+        assert len(packed) > 2
+        for prev, chunk in zip(packed, packed[1:]):
+            prev_page, _, prev_end, _ = prev[-1]
+            repeated = [u for u in chunk if u[0] == prev_page and u[2] <= prev_end]
+            assert repeated, "no overlap carried over"
+            assert chunk[:len(repeated)] == repeated
+            assert sum(u[3] for u in repeated) <= 60
+            assert sum(u[3] for u in chunk) <= 200
+
+    def test_no_overlap_when_zero(self):
+        units = units_for(PAGES[:2], 200)
+
+        packed = pack_units(units, 200, 0, PAGES, len)
+
+        assert sum(len(chunk) for chunk in packed) == len(units)
+
+
+class TestEffectiveWorkers:
+    """Tests for effective_workers function."""
+
+    def test_capped_by_pages(self, monkeypatch):
+        monkeypatch.setattr(pdf_processor, "available_cpus", lambda: 8)
+
+        assert effective_workers(4, 7) == 1
+        assert effective_workers(4, 16) == 2
+        assert effective_workers(4, 300) == 4
+
+    def test_capped_by_cpus(self, monkeypatch):
+        monkeypatch.setattr(pdf_processor, "available_cpus", lambda: 1)
+
+        assert effective_workers(4, 300) == 1
+
+    def test_never_below_one(self, monkeypatch):
+        monkeypatch.setattr(pdf_processor, "available_cpus", lambda: 4)
+
+        assert effective_workers(0, 0) == 1
+
+
+def report(pages: int, changed: int = None) -> list:
+    """Plain text pages (no structure, so fixed-size chunking); `changed` page gets other text."""
+    return [
+        [f"Report page {n + 1} {'revised' if n == changed else 'original'} line {i}" for i in range(4)]
+        for n in range(pages)
+    ]
+
+
+class TestIncremental:
+    """Tests for incremental re-runs of process_pdf."""
+
+    def test_unchanged_file_skipped(self, make_pdf, tmp_path):
+        path = make_pdf(report(4))
+        out = str(tmp_path / "out")
+        first = process_pdf(path, out, chunk_size=2)
+
+        with patch("pdf_processor.extract_page") as spy:
+            second = process_pdf(path, out, chunk_size=2)
+
+        spy.assert_not_called()
+        assert first["incremental"]["status"] == "new"
+        assert second["incremental"] == {"status": "unchanged", "reused": 2, "regenerated": 0}
+
+    def test_changed_page_regenerates_its_chunk_only(self, make_pdf, tmp_path):
+        out = str(tmp_path / "out")
+        process_pdf(make_pdf(report(4)), out, chunk_size=2)
+
+        metadata = process_pdf(make_pdf(report(4, changed=3)), out, chunk_size=2)
+
+        assert metadata["incremental"] == {"status": "updated", "reused": 1, "regenerated": 1}
+        with open(metadata["chunks"][1]["file"], encoding="utf-8") as f:
+            assert "Report page 4 revised" in f.read()
+
+    def test_shrunk_document_removes_stale_chunks(self, make_pdf, tmp_path):
+        out = str(tmp_path / "out")
+        process_pdf(make_pdf(report(4)), out, chunk_size=1)
+
+        metadata = process_pdf(make_pdf(report(2)), out, chunk_size=1)
+
+        assert metadata["chunk_count"] == 2
+        assert sorted(os.listdir(os.path.join(out, "chunks"))) == ["chunk_001.txt", "chunk_002.txt"]
+
+    def test_existing_queue_kept(self, make_pdf, tmp_path):
+        out = tmp_path / "out"
+        process_pdf(make_pdf(report(2)), str(out))
+        queue = {"doc_name": "doc", "discovered": [{"name": "SK하이닉스"}], "completed": ["SK하이닉스"], "current": None}
+        (out / "queue.json").write_text(json.dumps(queue, ensure_ascii=False), encoding="utf-8")
+
+        process_pdf(make_pdf(report(2, changed=0)), str(out))
+
+        assert json.loads((out / "queue.json").read_text(encoding="utf-8")) == queue
+
+    def test_force_rebuilds_as_update(self, make_pdf, tmp_path):
+        path = make_pdf(report(4))
+        out = str(tmp_path / "out")
+        process_pdf(path, out, chunk_size=1)
+
+        metadata = process_pdf(make_pdf(report(2)), out, chunk_size=1, force=True)
+
+        assert metadata["incremental"] == {"status": "updated", "reused": 0, "regenerated": 2}
+        assert sorted(os.listdir(os.path.join(out, "chunks"))) == ["chunk_001.txt", "chunk_002.txt"]
+
+
+class TestBatch:
+    """Tests for batch_output_dirs and process_batch."""
+
+    def test_same_stem_dirs_do_not_depend_on_order(self):
+        paths = ["/reports/a/x.pdf", "/reports/sub/x.pdf", "/reports/y.pdf"]
+
+        dirs = batch_output_dirs(paths, "/out")
+        reversed_dirs = batch_output_dirs(paths[::-1], "/out")
+
+        assert dirs == reversed_dirs
+        assert dirs["/reports/y.pdf"] == "/out/y"
+        assert dirs["/reports/a/x.pdf"] != dirs["/reports/sub/x.pdf"]
+        assert all(os.path.basename(dirs[p]).startswith("x_") for p in paths[:2])
+
+    def test_added_file_keeps_existing_output_dir(self, make_pdf, tmp_path):
+        """A new same-named PDF must not take over the directory of an already processed one."""
+        out = str(tmp_path / "out")
+        existing = make_pdf(report(2), name="sub/x.pdf")
+        process_batch([existing], out)
+
+        added = make_pdf(report(3), name="a/x.pdf")
+        manifest = process_batch(sorted([added, existing]), out)
+
+        docs = {doc["file_path"]: doc for doc in manifest["documents"]}
+        assert docs[existing]["output_dir"] == os.path.join(out, "x")
+        assert docs[existing]["status"] == "unchanged"
+        assert docs[added]["output_dir"] != os.path.join(out, "x")
+        assert docs[added]["status"] == "new"
+
+    def test_failing_file_recorded_and_others_resume(self, make_pdf, tmp_path):
+        out = str(tmp_path / "out")
+        good = make_pdf(report(2), name="good.pdf")
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"not a pdf")
+        paths = [str(bad), good]
+
+        first = process_batch(paths, out)
+        second = process_batch(paths, out)
+
+        with open(os.path.join(out, "manifest.json"), encoding="utf-8") as f:
+            saved = json.load(f)
+        assert first["failed"] == 1
+        assert [doc["status"] for doc in first["documents"]] == ["failed", "new"]
+        assert first["documents"][0]["error"]
+        assert [doc["status"] for doc in second["documents"]] == ["failed", "unchanged"]
+        assert saved["finished_at"] is not None
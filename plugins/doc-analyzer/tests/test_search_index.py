@@ -0,0 +1,80 @@
+"""Tests for search_index - incremental FTS index and ranked search."""
+import os
+
+import pytest
+
+from search_index import connect, search, update_index
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Two sources of markdown files plus an open index over them."""
+    (tmp_path / "watch").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "watch" / "다날_064260.md").write_text(
+        "# 다날 원화 스테이블코인\n\n결제 인프라와 원화 스테이블코인 사업.", encoding="utf-8")
+    (tmp_path / "watch" / "기타_000000.md").write_text(
+        "# 반도체 장비\n\n다날 언급 한 번, 스테이블코인 언급 한 번.", encoding="utf-8")
+    (tmp_path / "docs" / "chunk_001.txt").write_text(
+        "--- Page 1 ---\n표지\n--- Page 2 ---\nHBM 수요 증가와 메모리 가격", encoding="utf-8")
+    sources = {"watchlist": "watch/*.md", "doc": "docs/*.txt"}
+    conn = connect(str(tmp_path / "index.db"))
+    yield tmp_path, sources, conn
+    conn.close()
+
+
+class TestUpdateIndex:
+    """Tests for update_index function."""
+
+    def test_incremental_counts(self, corpus):
+        root, sources, conn = corpus
+
+        assert update_index(conn, str(root), sources) == {"added": 3, "updated": 0, "removed": 0, "unchanged": 0}
+        assert update_index(conn, str(root), sources)["unchanged"] == 3
+
+        changed = root / "docs" / "chunk_001.txt"
+        changed.write_text("--- Page 1 ---\n전력 인프라", encoding="utf-8")
+        os.utime(changed, (1, 1))
+        (root / "watch" / "기타_000000.md").unlink()
+
+        assert update_index(conn, str(root), sources) == {"added": 0, "updated": 1, "removed": 1, "unchanged": 1}
+        assert search(conn, "HBM") == []
+        assert len(search(conn, "전력 인프라")) == 1
+
+    def test_touched_but_identical_not_reindexed(self, corpus):
+        root, sources, conn = corpus
+        update_index(conn, str(root), sources)
+
+        os.utime(root / "watch" / "다날_064260.md", (1, 1))
+
+        assert update_index(conn, str(root), sources)["updated"] == 0
+
+
+class TestSearch:
+    """Tests for search function."""
+
+    def test_title_match_ranks_first(self, corpus):
+        root, sources, conn = corpus
+        update_index(conn, str(root), sources)
+
+        results = search(conn, "스테이블코인")
+
+        assert [r["title"] for r in results] == ["다날 원화 스테이블코인", "반도체 장비"]
+
+    def test_short_term_like_fallback(self, corpus):
+        """Terms under 3 characters are matched as substrings, ANDed with the rest."""
+        root, sources, conn = corpus
+        update_index(conn, str(root), sources)
+
+        assert len(search(conn, "다날")) == 2
+        assert [r["title"] for r in search(conn, '다날 "원화 스테이블"')] == ["다날 원화 스테이블코인"]
+
+    def test_source_filter_and_page(self, corpus):
+        root, sources, conn = corpus
+        update_index(conn, str(root), sources)
+
+        results = search(conn, "HBM 수요", source="doc")
+
+        assert len(results) == 1
+        assert results[0]["page"] == 2
+        assert search(conn, "HBM", source="watchlist") == []
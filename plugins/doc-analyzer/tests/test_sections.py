@@ -0,0 +1,123 @@
+"""Tests for pdf_processor section detection (outline, printed TOC, font size, numbered headers)."""
+from pdf_processor import (
+    PageTextCache, _font_sections, _header_sections, detect_section_headers, detect_sections, pdfplumber,
+    process_pdf,
+)
+
+
+def body(n: int, lines: int = 6) -> list:
+    return [f"Body text of page {n} line {i} about memory demand" for i in range(lines)]
+
+
+def detect(path: str) -> tuple:
+    with pdfplumber.open(path) as pdf:
+        pages = PageTextCache(pdf, path)
+        try:
+            return detect_sections(pages)
+        finally:
+            pages.close()
+
+
+def heads(headings=(), lead=(), size=10.0) -> dict:
+    return {"body": size, "headings": [list(h) for h in headings], "lead": list(lead), "toc": []}
+
+
+class TestDetectSections:
+    """detect_sections on generated PDFs, one per strategy."""
+
+    def test_outline(self, make_pdf):
+        path = make_pdf([body(n) for n in range(6)],
+                        outline=[("Overview", 0), ("Memory", 2), ("Outlook", 4)])
+
+        sections, source = detect(path)
+
+        assert source == "outline"
+        assert sections == [{"title": "Overview", "page": 1}, {"title": "Memory", "page": 3},
+                            {"title": "Outlook", "page": 5}]
+
+    def test_printed_toc(self, make_pdf):
+        toc_page = ["Contents", "1. Overview ........ 2", "2. Memory ........ 4", "3. Outlook ........ 5"]
+        path = make_pdf([toc_page] + [body(n) for n in range(1, 6)])
+
+        sections, source = detect(path)
+
+        assert source == "toc"
+        assert [s["page"] for s in sections] == [2, 4, 5]
+        assert sections[0]["title"] == "1. Overview"
+
+    def test_font_size_headings(self, make_pdf):
+        pages = [body(n) for n in range(8)]
+        for n, title in ((0, "Industry Overview"), (3, "Memory Cycle"), (6, "Risks")):
+            pages[n] = [(18, title)] + pages[n]
+
+        sections, source = detect(make_pdf(pages))
+
+        assert source == "font"
+        assert sections == [{"title": "Industry Overview", "page": 1}, {"title": "Memory Cycle", "page": 4},
+                            {"title": "Risks", "page": 7}]
+
+    def test_numbered_headers(self, make_pdf):
+        pages = [body(n) for n in range(8)]
+        for n, title in ((0, "1. Introduction"), (2, "2. Market Outlook"), (5, "3. Valuation")):
+            pages[n] = [title] + pages[n]
+
+        sections, source = detect(make_pdf(pages))
+
+        assert source == "header"
+        assert [s["page"] for s in sections] == [1, 3, 6]
+
+    def test_outline_preferred_over_printed_toc(self, make_pdf):
+        toc_page = ["Contents", "1. Overview ........ 2", "2. Memory ........ 4", "3. Outlook ........ 5"]
+        path = make_pdf([toc_page] + [body(n) for n in range(1, 6)],
+                        outline=[("Cover", 0), ("A", 1), ("B", 3), ("C", 5)])
+
+        assert detect(path)[1] == "outline"
+
+    def test_unstructured_falls_back_to_fixed_chunks(self, make_pdf, tmp_path):
+        path = make_pdf([body(n) for n in range(4)])
+
+        assert detect(path) == ([], None)
+        metadata = process_pdf(path, str(tmp_path / "out"), chunk_size=2)
+        assert metadata["chunking_method"] == "fixed"
+        assert metadata["section_source"] is None
+
+
+class TestHeadSections:
+    """_font_sections / _header_sections on page heads."""
+
+    def test_running_header_ignored(self):
+        """A large title repeated on every page is a running header, not a section."""
+        page_heads = [heads([(16.0, "ACME Research")]) for _ in range(10)]
+        for n, title in ((1, "Demand"), (4, "Supply"), (7, "Pricing")):
+            page_heads[n]["headings"].append([16.0, title])
+
+        sections = _font_sections(page_heads, 10)
+
+        assert [s["title"] for s in sections] == ["Demand", "Supply", "Pricing"]
+
+    def test_per_page_titles_rejected(self):
+        """A heading on most pages (slide titles) does not split sections."""
+        page_heads = [heads([(16.0, f"Slide {n}")], lead=[f"{n + 1}. Slide Topic"]) for n in range(6)]
+
+        assert _font_sections(page_heads, 6) == []
+        assert _header_sections(page_heads, 6) == []
+
+    def test_too_few_sections(self):
+        page_heads = [heads(lead=["1. Introduction"])] + [heads() for _ in range(5)]
+
+        assert _header_sections(page_heads, 6) == []
+
+
+class TestSectionHeaderPattern:
+    """The combined SECTION_HEADER_RE alternation."""
+
+    def test_each_header_form(self):
+        lines = ["제1장 서론", "2절 시장 전망", "1. 서론", "2. Market Outlook", "Chapter 3: Supply",
+                 "Section 4 Pricing", "IV. Valuation"]
+
+        assert [h["title"] for h in detect_section_headers("\n".join(lines))] == lines
+
+    def test_plain_lines_not_headers(self):
+        text = "2024. 12. 31 기준\n1.5배 성장\n매출액 3,008,709\nIn 2025 demand grew"
+
+        assert detect_section_headers(text) == []
@@ -0,0 +1,124 @@
+"""Tests for table_extractor - analyst table parsing and metrics."""
+import csv
+
+from table_extractor import normalize_table, parse_number, period_key, table_metrics, write_table
+
+
+class TestParseNumber:
+    """Tests for parse_number function."""
+
+    def test_plain_and_percent(self):
+        assert parse_number("1,234") == 1234.0
+        assert parse_number("12.3%") == 12.3
+        assert parse_number(".5") == 0.5
+
+    def test_negative_notations(self):
+        """Parentheses, △/▽/▼ and minus all mean negative."""
+        for cell in ["(1,234)", "△1,234", "▽1,234", "▼1,234", "-1,234"]:
+            assert parse_number(cell) == -1234.0, cell
+
+    def test_explicit_positive(self):
+        """▲ and + mark increases, not negatives."""
+        assert parse_number("▲1,234") == 1234.0
+        assert parse_number("+5.2%") == 5.2
+
+    def test_blanks_and_text(self):
+        for cell in [None, "", "-", "N/A", "n.m.", "흑전", "적지"]:
+            assert parse_number(cell) is None, cell
+
+
+class TestPeriodKey:
+    """Tests for period_key function."""
+
+    def test_actual_and_estimate(self):
+        assert period_key("2024") == "2024"
+        assert period_key("2025E") == "2025E"
+        assert period_key("2026F") == "2026E"
+        assert period_key("FY2024") == "2024"
+
+    def test_short_year_and_month(self):
+        assert period_key("24A") == "2024"
+        assert period_key("2025.12E") == "2025E"
+        assert period_key("25/12(E)") == "2025E"
+
+    def test_not_a_period(self):
+        for cell in [None, "", "매출액", "3Q24", "12345"]:
+            assert period_key(cell) is None, cell
+
+
+class TestNormalizeTable:
+    """Tests for normalize_table function."""
+
+    def test_header_below_title_rows(self):
+        """Title and unit rows above the period row should be skipped."""
+        raw = [
+            ["투자지표", None, None, None],
+            ["(단위: 십억원)", "", "", ""],
+            ["", "2024", "2025E", "2026E"],
+            ["매출액", "300,871", "333,059", "350,000"],
+            ["영업이익", "(1,200)", "△500", "-"],
+        ]
+
+        table = normalize_table(raw)
+
+        assert table["header"] == ["", "2024", "2025E", "2026E"]
+        assert table["rows"] == [
+            ["매출액", 300871.0, 333059.0, 350000.0],
+            ["영업이익", -1200.0, -500.0, None],
+        ]
+
+    def test_drops_blank_columns(self):
+        raw = [["", "2024", None, "2025E"], ["매출액", "100", "", "200"], ["EPS", "1", None, "2"]]
+
+        table = normalize_table(raw)
+
+        assert table["header"] == ["", "2024", "2025E"]
+        assert table["rows"][0] == ["매출액", 100.0, 200.0]
+
+    def test_rejects_text_tables(self):
+        raw = [["항목", "내용", "비고"], ["회사명", "삼성전자", "반도체"], ["대표", "홍길동", "-"]]
+
+        assert normalize_table(raw) is None
+
+
+class TestTableMetrics:
+    """Tests for table_metrics function."""
+
+    TABLE = {
+        "header": ["", "2024", "2025E"],
+        "rows": [
+            ["매출액", 300871.0, 333059.0],
+            ["EPS (원)", 4950.0, 5200.0],
+            ["영업이익(조원)", 1.5, 2.0],
+            ["기타", 1.0, 2.0],
+        ],
+    }
+
+    def test_converts_money_to_eok(self):
+        """Page unit applies unless the row has its own unit."""
+        metrics, units = table_metrics(self.TABLE, "십억원")
+
+        assert metrics["revenue"] == {"2024": 3008710.0, "2025E": 3330590.0}
+        assert metrics["operating_profit"] == {"2024": 15000.0, "2025E": 20000.0}
+        assert units["revenue"] == "억원"
+
+    def test_unknown_unit_kept_as_printed(self):
+        metrics, units = table_metrics(self.TABLE, None)
+
+        assert metrics["revenue"]["2024"] == 300871.0
+        assert units["revenue"] is None
+        assert units["eps"] == "원"
+        assert "기타" not in metrics
+
+
+class TestWriteTable:
+    """Tests for write_table function."""
+
+    def test_csv_keeps_full_precision(self, tmp_path):
+        table = {"header": ["", "2024"], "rows": [["매출액", 3008709.0], ["OPM", 3210450.5], ["비고", None]]}
+
+        path = write_table(table, str(tmp_path / "p001_t1"))
+
+        with open(path, encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        assert rows[1:] == [["매출액", "3008709"], ["OPM", "3210450.5"], ["비고", ""]]
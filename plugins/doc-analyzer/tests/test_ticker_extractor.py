@@ -0,0 +1,71 @@
+"""Tests for ticker_extractor - company name / ticker matching."""
+from ticker_extractor import build_matcher, find_mentions, page_position
+
+NAMES = {
+    "005930": "삼성전자",
+    "005935": "삼성전자우",
+    "003550": "LG",
+    "034220": "LG디스플레이",
+    "035420": "NAVER",
+    "001680": "대상",
+    "054670": "대원",
+}
+
+
+def mentions(text):
+    return find_mentions(build_matcher(NAMES), text)
+
+
+class TestFindMentions:
+    """Tests for find_mentions function."""
+
+    def test_longest_match_wins(self):
+        assert mentions("삼성전자우 매수") == [(0, "005935")]
+        assert mentions("삼성전자는 HBM") == [(0, "005930")]
+
+    def test_ticker_codes(self):
+        assert mentions("(005930) 목표가") == [(1, "005930")]
+        assert mentions("0059301") == []
+
+    def test_ascii_boundaries(self):
+        """"LG" must not match inside "LGD", but Korean may follow ASCII names."""
+        assert mentions("LGD 패널") == []
+        assert mentions("LG 그룹") == [(0, "003550")]
+        assert mentions("NAVER클라우드") == [(0, "035420")]
+
+    def test_name_inside_word_ignored(self):
+        assert mentions("신삼성전자") == []
+
+    def test_ambiguous_names_skipped(self):
+        """Stoplisted common words ("대상" = target) are never matched."""
+        assert mentions("대상 기업") == []
+
+    def test_short_name_needs_particle(self):
+        """2-syllable names must be followed by a particle or non-Hangul."""
+        assert mentions("대원은 상승") == [(0, "054670")]
+        assert mentions("대원 상승") == [(0, "054670")]
+        assert mentions("대원들이 모였다") == []
+
+    def test_non_overlapping(self):
+        text = "삼성전자, LG디스플레이"
+        assert mentions(text) == [(0, "005930"), (6, "034220")]
+
+
+class TestPagePosition:
+    """Tests for page_position function."""
+
+    TEXT = "header\n\n--- Page 3 ---\nabc\n\n--- Page 4 ---\ndef"
+
+    def test_maps_to_page_offsets(self):
+        lookup = page_position(self.TEXT)
+
+        assert lookup(self.TEXT.index("abc") + 1) == (3, 1)
+        assert lookup(self.TEXT.index("def")) == (4, 0)
+        assert lookup(0) is None
+
+    def test_span_start_only_for_first_block(self):
+        """A budget chunk that starts mid-page shifts offsets of its first block only."""
+        lookup = page_position(self.TEXT, span_start=100)
+
+        assert lookup(self.TEXT.index("abc")) == (3, 100)
+        assert lookup(self.TEXT.index("def")) == (4, 0)
@@ -39,3 +39,12 @@ def mock_naver_response():
         <tr><td>시가총액</td><td>328조 4,300억</td></tr>
     </table>
     '''
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Reset data_fetcher circuit breakers so failures don't leak across tests."""
+    from utils.data_fetcher import reset_source_status
+    reset_source_status()
+    yield
+    reset_source_status()
@@ -0,0 +1,195 @@
+"""비동기 스크래핑 API 테스트
+
+httpx.MockTransport로 네트워크 호출 없이 테스트
+"""
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from utils import aio
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(filename: str) -> str:
+    """테스트 픽스처 파일 로드"""
+    with open(FIXTURES_DIR / filename, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def make_client(routes: dict, calls: list = None) -> httpx.AsyncClient:
+    """경로(path) → HTML 매핑으로 응답하는 mock client"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if calls is not None:
+            calls.append(str(request.url))
+        body = routes.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        if callable(body):
+            body = body(request)
+        return httpx.Response(200, text=body)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncNaver:
+    """네이버 금융 async 함수 테스트"""
+
+    def test_stock_info_matches_sync_parser(self):
+        """동기 함수와 같은 파서 결과 반환"""
+        async def main():
+            async with make_client({"/item/main.naver": load_fixture("naver_stock_page.html")}) as client:
+                return await aio.get_naver_stock_info("005930", client=client)
+
+        result = run(main())
+
+        assert result["name"] == "삼성전자"
+        assert result["market_cap"] == 3284300
+
+    def test_news_respects_limit(self):
+        """limit 적용"""
+        async def main():
+            async with make_client({"/item/news.naver": load_fixture("naver_news_page.html")}) as client:
+                return await aio.get_naver_stock_news("005930", limit=2, client=client)
+
+        result = run(main())
+
+        assert len(result) == 2
+        assert result[0]["url"].startswith("https://finance.naver.com")
+
+    def test_discussion_returns_posts(self):
+        """종목토론방 게시글 반환"""
+        async def main():
+            async with make_client({"/item/board.naver": load_fixture("naver_discussion_page.html")}) as client:
+                return await aio.get_naver_discussion("005930", limit=3, client=client)
+
+        result = run(main())
+
+        assert len(result) == 3
+        assert result[0]["title"] == "오늘 상한가 간다"
+
+    def test_returns_none_on_http_error(self):
+        """HTTP 오류 시 None"""
+        async def main():
+            async with make_client({}) as client:
+                return await aio.get_naver_stock_info("005930", client=client)
+
+        assert run(main()) is None
+
+    def test_many_concurrent_fetches_share_client(self):
+        """하나의 client로 다수 동시 요청"""
+        calls = []
+
+        async def main():
+            routes = {"/item/board.naver": load_fixture("naver_discussion_page.html")}
+            async with make_client(routes, calls) as client:
+                return await asyncio.gather(
+                    *(aio.get_naver_discussion(f"{i:06d}", client=client) for i in range(200))
+                )
+
+        results = run(main())
+
+        assert len(results) == 200
+        assert all(r and len(r) == 5 for r in results)
+        assert len(calls) == 200
+
+    def test_stock_list_stops_at_empty_page(self):
+        """빈 페이지에서 중단"""
+        row = '<tr><td><a class="tltle" href="/item/main.naver?code={code}">종목{code}</a></td></tr>'
+
+        def page(request):
+            page_no = int(request.url.params["page"])
+            if page_no > 3:
+                return '<table class="type_2"></table>'
+            return f'<table class="type_2">{row.format(code=f"{page_no:06d}")}</table>'
+
+        async def main():
+            async with make_client({"/sise/sise_market_sum.naver": page}) as client:
+                return await aio.get_naver_stock_list("KOSPI", client=client)
+
+        result = run(main())
+
+        assert [s["code"] for s in result] == ["000001", "000002", "000003"]
+
+
+class TestAsyncFnguide:
+    """FnGuide async 함수 테스트"""
+
+    def test_financial_parses_income(self):
+        """재무제표 파싱 (snapshot 실패해도 재무제표 반환)"""
+        async def main():
+            routes = {"/SVO2/ASP/SVD_Finance.asp": load_fixture("fnguide_financial_page.html")}
+            async with make_client(routes) as client:
+                return await aio.get_fnguide_financial("005930", retry=0, client=client)
+
+        result = run(main())
+
+        assert result["source"] == "FnGuide"
+        assert result["annual"]
+        assert result["fnguide_ratios"] is None
+
+    def test_financial_returns_none_on_failure(self):
+        """실패 시 None"""
+        async def main():
+            async with make_client({}) as client:
+                return await aio.get_fnguide_financial("005930", retry=0, client=client)
+
+        assert run(main()) is None
+
+
+class TestSharedClient:
+    """client 미지정 시 공유 client 테스트"""
+
+    def test_default_calls_reuse_one_client(self):
+        """client 생략한 동시 호출이 client 하나를 공유"""
+        from unittest.mock import patch
+
+        created = []
+
+        def fake_create_client():
+            client = make_client({"/item/board.naver": load_fixture("naver_discussion_page.html")})
+            created.append(client)
+            return client
+
+        async def main():
+            results = await asyncio.gather(
+                *(aio.get_naver_discussion(f"{i:06d}", limit=1) for i in range(20))
+            )
+            await aio.get_naver_stock_info("005930")
+            await aio.aclose_shared_client()
+            return results
+
+        with patch("utils.aio.create_client", side_effect=fake_create_client):
+            results = run(main())
+
+        assert all(len(posts) == 1 for posts in results)
+        assert len(created) == 1
+        assert created[0].is_closed
+
+    def test_recreated_after_close_and_per_loop(self):
+        """닫힌 뒤나 다른 이벤트 루프에서는 새 client 생성"""
+        from unittest.mock import patch
+
+        async def same_loop():
+            first = aio.get_shared_client()
+            again = aio.get_shared_client()
+            await aio.aclose_shared_client()
+            return first, again, aio.get_shared_client()
+
+        async def new_loop():
+            return aio.get_shared_client()
+
+        with patch("utils.aio.create_client", side_effect=lambda: make_client({})):
+            first, again, reopened = run(same_loop())
+            other = run(new_loop())
+            run(aio.aclose_shared_client())
+
+        assert first is again
+        assert reopened is not first
+        assert other is not reopened
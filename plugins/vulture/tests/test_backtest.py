@@ -0,0 +1,100 @@
+"""TI 신호 백테스트 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.backtest import backtest_signals
+from utils.screener import compute_signal_panels, ma_alignment, rsi_signal
+
+
+@pytest.fixture
+def signals():
+    """랜덤워크 5종목, 200 영업일"""
+    dates = pd.bdate_range(start="2025-01-01", periods=200)
+    rng = np.random.default_rng(1)
+    close = pd.DataFrame(
+        1000 * np.exp(rng.normal(0, 0.02, (200, 5)).cumsum(axis=0)),
+        index=dates,
+        columns=[f"T{i}" for i in range(5)],
+    )
+    close.iloc[:30, 4] = np.nan  # 상장 전 구간
+    return compute_signal_panels({"종가": close, "고가": close * 1.01, "저가": close * 0.99})
+
+
+def naive_stats(signals, condition, horizon, direction, entry):
+    """종목·일자 루프로 계산한 기대값"""
+    close = signals["close"]
+    mask = condition(signals)
+    returns, drawdowns = [], []
+    for ticker in close.columns:
+        for i in range(len(close) - horizon):
+            if not mask[ticker].iloc[i] or np.isnan(close[ticker].iloc[i]):
+                continue
+            if entry and i > 0 and mask[ticker].iloc[i - 1]:
+                continue
+            path = close[ticker].iloc[i + 1:i + horizon + 1] / close[ticker].iloc[i] - 1
+            returns.append(path.iloc[-1])
+            worst = path.min() if direction > 0 else -path.max()
+            drawdowns.append(min(worst, 0))
+    returns = np.array(returns)
+    return {
+        "samples": len(returns),
+        "mean_return_pct": round(returns.mean() * 100, 2),
+        "hit_rate_pct": round(float((returns * direction > 0).mean()) * 100, 1),
+        "max_drawdown_pct": round(np.mean(drawdowns) * 100, 2),
+    }
+
+
+class TestBacktestSignals:
+    """backtest_signals 함수 테스트"""
+
+    @pytest.mark.parametrize("mode", ["entry", "state"])
+    def test_matches_naive_loop(self, signals, mode):
+        """벡터화 결과 = 종목·일자 루프 결과"""
+        conditions = {"과매수": (rsi_signal("과매수"), -1), "정배열": ma_alignment("완전 정배열")}
+
+        result = backtest_signals(conditions, horizons=(5, 20), mode=mode, signals=signals)
+
+        for name, (cond, direction) in {"과매수": (rsi_signal("과매수"), -1),
+                                        "정배열": (ma_alignment("완전 정배열"), 1)}.items():
+            for h in (5, 20):
+                stats = result["signals"][name]["horizons"][str(h)]
+                expected = naive_stats(signals, cond, h, direction, entry=(mode == "entry"))
+                for key, value in expected.items():
+                    assert stats[key] == pytest.approx(value), (name, h, key)
+
+    def test_default_ti_signals_and_baseline(self, signals):
+        """기본 TI 신호 전체 + 기준 수익률"""
+        result = backtest_signals(signals=signals)
+
+        assert len(result["signals"]) == 8
+        assert set(result["baseline"]) == {"5", "20", "60"}
+        assert result["tickers"] == 5
+        assert result["signals"]["RSI 과매수"]["direction"] == -1
+        assert result["baseline"]["5"]["samples"] == 5 * 195 - 30
+
+    def test_entry_has_fewer_samples_than_state(self, signals):
+        """entry 모드 표본 <= state 모드"""
+        entry = backtest_signals(signals=signals, mode="entry")
+        state = backtest_signals(signals=signals, mode="state")
+
+        for name in entry["signals"]:
+            assert entry["signals"][name]["horizons"]["5"]["samples"] <= \
+                state["signals"][name]["horizons"]["5"]["samples"]
+
+    def test_no_samples(self, signals):
+        """표본 없으면 None 통계"""
+        never = rsi_signal("과매도") & rsi_signal("과매수")
+        stats = backtest_signals({"never": never}, horizons=(5,), signals=signals)["signals"]["never"]
+
+        assert stats["horizons"]["5"]["samples"] == 0
+        assert stats["horizons"]["5"]["hit_rate_pct"] is None
+
+    def test_invalid_mode(self, signals):
+        """알 수 없는 mode"""
+        with pytest.raises(ValueError):
+            backtest_signals(signals=signals, mode="daily")
+
+    def test_empty_store(self, tmp_path):
+        """저장소 비어 있으면 None"""
+        assert backtest_signals(store_dir=tmp_path) is None
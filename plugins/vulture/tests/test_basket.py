@@ -0,0 +1,201 @@
+"""워치리스트 폴더 바스켓 분석 테스트"""
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.basket import (
+    load_basket,
+    fetch_basket_data,
+    afetch_basket_data,
+    basket_returns,
+    basket_valuation,
+    analyze_basket,
+    print_basket_report,
+)
+
+
+@pytest.fixture
+def watchlist(tmp_path):
+    """테마 폴더: 파일 2개 + 분류 디렉토리 1개 + 하위 폴더 + 형식 외 파일"""
+    theme = tmp_path / "스테이블코인"
+    theme.mkdir()
+    (theme / "다날_064260.md").write_text("# 다날")
+    (theme / "NHN_KCP_060250.md").write_text("# NHN KCP")
+    (theme / "페스카로_0015S0").mkdir()
+    (theme / "NVIDIA_NVDA.md").write_text("# 해외")
+    (theme / "notes.txt").write_text("memo")
+    nested = theme / "후보"
+    nested.mkdir()
+    (nested / "아톤_158430.md").write_text("# 아톤")
+    (nested / "다날_064260.md").write_text("# 중복")
+    return theme
+
+
+def make_ohlcv(ticker, days=60):
+    """종목별로 다른 일정 수익률 (064260: +1%/일, 060250: -1%/일, 나머지: 0)"""
+    rate = {"064260": 0.01, "060250": -0.01}.get(ticker, 0.0)
+    dates = pd.bdate_range("2025-06-02", periods=days)
+    return pd.DataFrame({"종가": 1000 * (1 + rate) ** np.arange(days)}, index=dates)
+
+
+class TestLoadBasket:
+    """load_basket 함수 테스트"""
+
+    def test_parses_entries(self, watchlist):
+        """파일/디렉토리 종목, 종목명에 "_" 포함, 형식 외 항목 제외"""
+        result = load_basket(str(watchlist))
+
+        assert {(e["ticker"], e["name"]) for e in result} == {
+            ("064260", "다날"), ("060250", "NHN_KCP"), ("0015S0", "페스카로"),
+        }
+
+    def test_recursive_dedupes(self, watchlist):
+        """하위 폴더 포함, 종목코드 중복 제거"""
+        tickers = [e["ticker"] for e in load_basket(str(watchlist), recursive=True)]
+
+        assert sorted(tickers) == ["0015S0", "060250", "064260", "158430"]
+
+    def test_missing_dir(self, tmp_path):
+        """없는 폴더는 빈 목록"""
+        assert load_basket(str(tmp_path / "없음")) == []
+
+
+class TestFetchBasketData:
+    """fetch_basket_data 함수 테스트"""
+
+    def test_bulk_fundamentals_with_naver_fallback(self):
+        """시장 전체 표에 없는 종목만 네이버 조회"""
+        market = {"064260": {"market_cap": 9000, "PER": 20.0, "PBR": 2.0}}
+        naver = AsyncMock(return_value={"060250": {"market_cap": 1000, "PER": 10.0, "PBR": 1.0}})
+
+        with patch("utils.basket.get_ohlcv", side_effect=lambda t, days: make_ohlcv(t) if t != "999999" else None), \
+             patch("utils.basket.get_market_fundamentals", return_value=market) as mock_market, \
+             patch("utils.basket._naver_fundamentals", naver):
+            result = fetch_basket_data(["064260", "060250", "999999"])
+
+        mock_market.assert_called_once()
+        assert naver.await_args.args[0] == ["060250", "999999"]
+        assert list(result["close"].columns) == ["064260", "060250"]
+        assert result["failed"] == ["999999"]
+        assert set(result["fundamentals"]) == {"064260", "060250"}
+
+    def test_no_fallback_when_complete(self):
+        """모두 있으면 네이버 조회 없음"""
+        market = {"064260": {"market_cap": 9000, "PER": 20.0, "PBR": 2.0}}
+
+        with patch("utils.basket.get_ohlcv", side_effect=lambda t, days: make_ohlcv(t)), \
+             patch("utils.basket.get_market_fundamentals", return_value=market), \
+             patch("utils.basket._naver_fundamentals") as naver:
+            fetch_basket_data(["064260"])
+
+        naver.assert_not_called()
+
+    def test_sync_call_inside_running_loop(self):
+        """이벤트 루프 안에서 호출해도 RuntimeError 없이 네이버 조회"""
+        naver = AsyncMock(return_value={"060250": {"market_cap": 1000, "PER": 10.0, "PBR": 1.0}})
+
+        async def orchestrator():
+            return fetch_basket_data(["060250"])
+
+        with patch("utils.basket.get_ohlcv", side_effect=lambda t, days: make_ohlcv(t)), \
+             patch("utils.basket.get_market_fundamentals", return_value={}), \
+             patch("utils.basket._naver_fundamentals", naver):
+            result = asyncio.run(orchestrator())
+
+        assert set(result["fundamentals"]) == {"060250"}
+
+    def test_async_entry_point(self):
+        """afetch_basket_data: 현재 루프에서 네이버 조회 await"""
+        market = {"064260": {"market_cap": 9000, "PER": 20.0, "PBR": 2.0}}
+        naver = AsyncMock(return_value={"060250": {"market_cap": 1000, "PER": 10.0, "PBR": 1.0}})
+
+        with patch("utils.basket.get_ohlcv", side_effect=lambda t, days: make_ohlcv(t)), \
+             patch("utils.basket.get_market_fundamentals", return_value=market), \
+             patch("utils.basket._naver_fundamentals", naver):
+            result = asyncio.run(afetch_basket_data(["064260", "060250"]))
+
+        naver.assert_awaited_once_with(["060250"])
+        assert list(result["close"].columns) == ["064260", "060250"]
+        assert set(result["fundamentals"]) == {"064260", "060250"}
+
+
+class TestBasketMetrics:
+    """basket_returns / basket_valuation 함수 테스트"""
+
+    def test_equal_and_cap_weighted(self):
+        """동일 가중 = 평균, 시총 가중 = 비중 평균"""
+        close = pd.concat({t: make_ohlcv(t, 5)["종가"] for t in ("064260", "060250")}, axis=1)
+        caps = pd.Series({"064260": 3000.0, "060250": 1000.0})
+
+        result = basket_returns(close, caps)
+
+        assert result["equal_weight"].tolist() == pytest.approx([0.0] * 4)
+        assert result["cap_weighted"].tolist() == pytest.approx([0.005] * 4)
+
+    def test_weights_renormalized_for_missing(self):
+        """상장 전 종목은 비중에서 제외"""
+        close = pd.concat({t: make_ohlcv(t, 5)["종가"] for t in ("064260", "060250")}, axis=1)
+        close.iloc[:3, 1] = np.nan
+        caps = pd.Series({"064260": 3000.0, "060250": 1000.0})
+
+        result = basket_returns(close, caps)
+
+        assert result["cap_weighted"].iloc[0] == pytest.approx(0.01)
+        assert result["equal_weight"].iloc[0] == pytest.approx(0.01)
+
+    def test_weighted_valuation(self):
+        """시총 / 순이익 합 (적자 제외)"""
+        result = basket_valuation({
+            "A": {"market_cap": 3000, "PER": 30.0, "PBR": 3.0},
+            "B": {"market_cap": 1000, "PER": 10.0, "PBR": 1.0},
+            "C": {"market_cap": 500, "PER": 0.0, "PBR": 0.5},
+        })
+
+        # 순이익 100 + 100 → 4000 / 200
+        assert result["weighted_per"] == 20.0
+        assert result["per_excluded"] == 1
+        assert result["median_per"] == 20.0
+        assert result["market_cap"] == 4500
+
+
+class TestAnalyzeBasket:
+    """analyze_basket / print_basket_report 함수 테스트"""
+
+    @pytest.fixture
+    def mocked(self):
+        market = {
+            "064260": {"market_cap": 3000, "PER": 20.0, "PBR": 2.0},
+            "060250": {"market_cap": 1000, "PER": 10.0, "PBR": 1.0},
+            "0015S0": {"market_cap": 1000, "PER": None, "PBR": None},
+        }
+        with patch("utils.basket.get_ohlcv", side_effect=lambda t, days: make_ohlcv(t)), \
+             patch("utils.basket.get_market_fundamentals", return_value=market):
+            yield
+
+    def test_report(self, watchlist, mocked):
+        """바스켓 성과 / 밸류에이션 / 종목별"""
+        result = analyze_basket(str(watchlist))
+
+        assert result["basket"] == "스테이블코인"
+        assert result["period"]["days"] == 60
+        assert len(result["tickers"]) == 3
+        danal = next(t for t in result["tickers"] if t["ticker"] == "064260")
+        assert danal["weight_pct"] == 60.0
+        assert danal["max_drawdown_pct"] == 0.0
+        assert result["cap_weighted"]["return_pct"] > result["equal_weight"]["return_pct"]
+        assert result["valuation"]["per_excluded"] == 1
+
+    def test_print(self, watchlist, mocked, capsys):
+        """리포트 출력"""
+        print_basket_report(str(watchlist))
+
+        out = capsys.readouterr().out
+        assert "Basket Report: 스테이블코인 (3종목)" in out
+        assert "시총 가중 PER" in out
+
+    def test_empty_folder(self, tmp_path):
+        """종목 없으면 None"""
+        assert analyze_basket(str(tmp_path)) is None
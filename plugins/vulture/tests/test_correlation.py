@@ -0,0 +1,204 @@
+"""상관관계 / 베타 / 군집 테스트"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import correlation
+from utils.correlation import (
+    returns_panel,
+    correlation_matrix,
+    update_correlation_cache,
+    beta,
+    rolling_beta,
+    cluster_tickers,
+    top_pairs,
+    analyze_correlation,
+)
+
+
+@pytest.fixture
+def returns():
+    """두 테마(A*, B*) + 독립 종목 1개, 200 영업일 (A1은 앞 30일 상장 전)"""
+    dates = pd.bdate_range("2025-01-01", periods=200)
+    rng = np.random.default_rng(0)
+    theme_a = rng.normal(0, 0.02, 200)
+    theme_b = rng.normal(0, 0.02, 200)
+    frame = pd.DataFrame({
+        "A1": theme_a + rng.normal(0, 0.005, 200),
+        "A2": theme_a + rng.normal(0, 0.005, 200),
+        "A3": theme_a + rng.normal(0, 0.005, 200),
+        "B1": theme_b + rng.normal(0, 0.005, 200),
+        "B2": theme_b + rng.normal(0, 0.005, 200),
+        "SOLO": rng.normal(0, 0.02, 200),
+    }, index=dates)
+    frame.iloc[:30, 0] = np.nan
+    frame.iloc[100:105, 4] = np.nan
+    return frame
+
+
+class TestCorrelationMatrix:
+    """correlation_matrix 함수 테스트"""
+
+    def test_matches_pandas_pairwise(self, returns):
+        """결측 쌍별 제외 = DataFrame.corr"""
+        result = correlation_matrix(returns, window=120)
+
+        expected = returns.iloc[-120:].corr(min_periods=20)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+    def test_min_periods(self, returns):
+        """공통 관측 부족하면 NaN"""
+        result = correlation_matrix(returns, window=40, min_periods=20)
+        short = correlation_matrix(returns.iloc[:40], window=None, min_periods=20)
+
+        assert not result.isna().any().any()
+        assert short["A1"].isna().all()
+
+    def test_returns_panel_keeps_gaps(self):
+        """거래정지 구간은 수익률 NaN (앞 값으로 채우지 않음)"""
+        close = pd.DataFrame({"X": [100.0, np.nan, 110.0, 121.0]})
+
+        result = returns_panel(close)["X"]
+
+        assert result.iloc[1:3].isna().all()
+        assert result.iloc[3] == pytest.approx(0.1)
+
+
+class TestCorrelationCache:
+    """update_correlation_cache 함수 테스트"""
+
+    def test_incremental_matches_full(self, returns, tmp_path):
+        """새 영업일 추가 / 오래된 행 제외 후 전체 재계산과 동일"""
+        update_correlation_cache(returns.iloc[:150], "theme", window=60, store_dir=tmp_path)
+
+        with patch("utils.correlation._pair_sums", wraps=correlation._pair_sums) as spy:
+            result = update_correlation_cache(returns.iloc[:155], "theme", window=60, store_dir=tmp_path)
+
+        expected = correlation_matrix(returns.iloc[:155], window=60)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-10)
+        # 추가 5행 + 제외 5행만 계산
+        assert [call.args[0].shape[0] for call in spy.call_args_list] == [5, 5]
+
+    def test_same_period_reuses_cache(self, returns, tmp_path):
+        """변경 없으면 합계 재계산 없음"""
+        update_correlation_cache(returns, "theme", window=60, store_dir=tmp_path)
+
+        with patch("utils.correlation._pair_sums") as spy:
+            update_correlation_cache(returns, "theme", window=60, store_dir=tmp_path)
+
+        spy.assert_not_called()
+
+    def test_rewritten_tail_rows_replaced(self, returns, tmp_path):
+        """저장소가 다시 받은 끝 행(장중 봉, 수정주가)이 바뀌면 이전 합계 대신 새 값 반영"""
+        update_correlation_cache(returns.iloc[:150], "theme", window=60, store_dir=tmp_path)
+        revised = returns.iloc[:153].copy()
+        revised.iloc[146:150] = revised.iloc[146:150] * -3
+
+        with patch("utils.correlation._pair_sums", wraps=correlation._pair_sums) as spy:
+            result = update_correlation_cache(revised, "theme", window=60, store_dir=tmp_path)
+
+        expected = correlation_matrix(revised, window=60)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-10)
+        # 바뀐 4행 (이전 값 / 새 값) + 추가 3행 + 제외 3행
+        assert [call.args[0].shape[0] for call in spy.call_args_list] == [4, 4, 3, 3]
+
+    def test_ticker_change_recomputes(self, returns, tmp_path):
+        """종목 구성이 바뀌면 전체 재계산"""
+        update_correlation_cache(returns, "theme", window=60, store_dir=tmp_path)
+        subset = returns.drop(columns=["SOLO"])
+
+        result = update_correlation_cache(subset, "theme", window=60, store_dir=tmp_path)
+
+        assert list(result.columns) == list(subset.columns)
+        np.testing.assert_allclose(
+            result.to_numpy(), correlation_matrix(subset, window=60).to_numpy(), atol=1e-12
+        )
+
+
+class TestBeta:
+    """beta / rolling_beta 함수 테스트"""
+
+    def test_beta_of_scaled_benchmark(self, returns):
+        """지수 × 2 종목은 베타 2"""
+        bench = returns["B1"]
+        frame = pd.DataFrame({"X2": bench * 2, "NEG": -bench})
+
+        result = beta(frame, bench)
+
+        assert result["X2"] == pytest.approx(2.0)
+        assert result["NEG"] == pytest.approx(-1.0)
+
+    def test_rolling_last_equals_window_beta(self, returns):
+        """rolling 마지막 값 = 최근 window 베타"""
+        bench = returns["SOLO"]
+
+        rolled = rolling_beta(returns, bench, window=60)
+
+        np.testing.assert_allclose(rolled.iloc[-1].to_numpy(), beta(returns, bench, window=60).to_numpy())
+
+
+class TestClusterTickers:
+    """cluster_tickers / top_pairs 함수 테스트"""
+
+    def test_recovers_themes(self, returns):
+        """같은 테마끼리 군집, 독립 종목은 단독"""
+        corr = correlation_matrix(returns, window=120)
+
+        clusters = cluster_tickers(corr, threshold=0.5)
+
+        assert [c["tickers"] for c in clusters] == [["A1", "A2", "A3"], ["B1", "B2"], ["SOLO"]]
+        assert clusters[0]["avg_corr"] > 0.8
+        assert clusters[2]["avg_corr"] is None
+
+    def test_n_clusters(self, returns):
+        """목표 군집 수"""
+        corr = correlation_matrix(returns, window=120)
+
+        assert len(cluster_tickers(corr, n_clusters=2)) == 2
+        assert len(cluster_tickers(corr, n_clusters=1)) == 1
+
+    def test_top_pairs(self, returns):
+        """상관계수 높은 쌍 순서"""
+        corr = correlation_matrix(returns, window=120)
+
+        pairs = top_pairs(corr, limit=4)
+
+        # 같은 테마 쌍 4개 (A 3쌍 + B 1쌍)
+        assert all(p["a"][0] == p["b"][0] != "S" for p in pairs)
+        assert [p["corr"] for p in pairs] == sorted((p["corr"] for p in pairs), reverse=True)
+
+
+class TestAnalyzeCorrelation:
+    """analyze_correlation 함수 테스트"""
+
+    def test_report_from_store(self, returns):
+        """저장소 종가 → 상관 / 베타 / 군집"""
+        close = (1 + returns.fillna(0)).cumprod() * 1000
+        index_df = pd.DataFrame({"종가": close["SOLO"]})
+
+        with patch("utils.correlation.load_ohlcv_panel", return_value=close), \
+             patch("utils.correlation.get_index_ohlcv", return_value=index_df):
+            result = analyze_correlation(window=120)
+
+        assert result["tickers"] == 6
+        assert result["period"]["days"] == 120
+        assert result["beta"]["SOLO"] == pytest.approx(1.0)
+        assert result["clusters"][0]["tickers"] == ["A1", "A2", "A3"]
+
+    def test_cache_per_store(self, returns, tmp_path):
+        """저장소가 다르면 같은 캐시 이름이라도 캐시 파일이 따로 생김"""
+        close = (1 + returns.fillna(0)).cumprod() * 1000
+
+        with patch("utils.correlation.load_ohlcv_panel", return_value=close):
+            analyze_correlation(window=60, benchmark=None, cache="theme", store_dir=str(tmp_path / "a"))
+            analyze_correlation(window=60, benchmark=None, cache="theme", store_dir=str(tmp_path / "b"))
+
+        assert (tmp_path / "a" / "correlation" / "theme.npz").exists()
+        assert (tmp_path / "b" / "correlation" / "theme.npz").exists()
+
+    def test_empty_store(self):
+        """저장소 비어 있으면 None"""
+        with patch("utils.correlation.load_ohlcv_panel", return_value=None):
+            assert analyze_correlation() is None
@@ -58,6 +58,31 @@ class TestGetOhlcv:
         assert len(result) == 30
 
 
+class TestGetIndexOhlcv:
+    """Tests for get_index_ohlcv function."""
+
+    def test_maps_index_name_to_code(self):
+        """get_index_ohlcv should query pykrx with the KRX index code."""
+        from utils.data_fetcher import get_index_ohlcv
+
+        with patch('utils.data_fetcher.stock.get_index_ohlcv_by_date') as mock:
+            mock.return_value = pd.DataFrame({'종가': [2500.0 + i for i in range(10)]})
+            result = get_index_ohlcv("KOSDAQ", days=5)
+
+        assert mock.call_args.args[2] == "2001"
+        assert len(result) == 5
+
+    def test_returns_none_on_error(self):
+        """get_index_ohlcv should return None on error."""
+        from utils.data_fetcher import get_index_ohlcv
+
+        with patch('utils.data_fetcher.stock.get_index_ohlcv_by_date') as mock:
+            mock.side_effect = Exception("Network error")
+            result = get_index_ohlcv("KOSPI")
+
+        assert result is None
+
+
 class TestGetTickerName:
     """Tests for get_ticker_name function."""
 
@@ -172,6 +197,35 @@ class TestGetTickerList:
         assert result is None
 
 
+class TestGetMarketFundamentals:
+    """Tests for get_market_fundamentals function."""
+
+    def test_merges_market_tables(self):
+        """get_market_fundamentals should join cap and PER/PBR tables by ticker."""
+        from utils.data_fetcher import get_market_fundamentals
+
+        caps = pd.DataFrame({'시가총액': [884_990_000_000_000, 50_000_000_000]}, index=['005930', '064260'])
+        fundamentals = pd.DataFrame({'PER': [31.2, 0.0], 'PBR': [2.9, 1.1]}, index=['005930', '064260'])
+
+        with patch('utils.data_fetcher.stock.get_market_cap', return_value=caps) as mock_cap, \
+             patch('utils.data_fetcher.stock.get_market_fundamental', return_value=fundamentals):
+            result = get_market_fundamentals(date="20260115")
+
+        assert mock_cap.call_count == 1
+        assert result['005930'] == {'market_cap': 8_849_900, 'PER': 31.2, 'PBR': 2.9}
+        assert result['064260']['market_cap'] == 500
+
+    def test_returns_none_on_error(self):
+        """get_market_fundamentals should return None on error."""
+        from utils.data_fetcher import get_market_fundamentals
+
+        with patch('utils.data_fetcher.stock.get_market_cap') as mock:
+            mock.side_effect = Exception("Network error")
+            result = get_market_fundamentals(date="20260115")
+
+        assert result is None
+
+
 class TestGetMarketCap:
     """Tests for get_market_cap function."""
 
@@ -202,3 +256,191 @@ class TestGetMarketCap:
                 result = get_market_cap(sample_ticker_kr)
 
         assert result is None
+
+
+class TestCircuitBreaker:
+    """Tests for source circuit breaker and with_meta results."""
+
+    def test_with_meta_reports_source_and_attempts(self, sample_ticker_kr):
+        """with_meta=True should report which source answered."""
+        from utils.data_fetcher import get_fundamental
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock:
+            mock.return_value = pd.DataFrame({
+                'BPS': [50000], 'PER': [25.5], 'PBR': [1.12],
+                'EPS': [2000], 'DIV': [2.1], 'DPS': [1000],
+            })
+            result = get_fundamental(sample_ticker_kr, with_meta=True)
+
+        assert result['source'] == 'pykrx.fundamental'
+        assert result['data']['PER'] == 25.5
+        assert result['attempts'][0]['ok'] is True
+        assert result['latency_ms'] >= 0
+
+    def test_with_meta_records_error_class(self, sample_ticker_kr):
+        """Failed attempts should carry the exception class name."""
+        from utils.data_fetcher import get_fundamental
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock_pykrx:
+            mock_pykrx.return_value = pd.DataFrame()
+            with patch('utils.web_scraper.get_naver_stock_info') as mock_naver:
+                mock_naver.return_value = {'per': 12.5, 'pbr': 1.04}
+                result = get_fundamental(sample_ticker_kr, with_meta=True)
+
+        assert result['source'] == 'naver.fundamental'
+        assert result['data']['PER'] == 12.5
+        assert result['attempts'][0]['error'] == '_EmptyResult'
+
+    def test_login_wall_opens_provider_breaker(self, sample_ticker_kr):
+        """
+        KRX login wall: pykrx returns empty frames instead of raising.
+        Consecutive empty market-wide results should skip every pykrx source.
+        """
+        from utils.data_fetcher import (
+            get_fundamental, get_market_fundamentals, get_ticker_list, get_source_status,
+            BREAKER_FAILURE_THRESHOLD,
+        )
+
+        with patch('utils.data_fetcher.stock.get_market_ticker_list') as mock_list, \
+             patch('utils.data_fetcher.stock.get_market_cap') as mock_cap, \
+             patch('utils.data_fetcher.stock.get_market_fundamental') as mock_fund, \
+             patch('utils.web_scraper.get_naver_stock_list') as mock_naver_list, \
+             patch('utils.web_scraper.get_naver_stock_info') as mock_naver:
+            mock_list.return_value = []
+            mock_cap.return_value = pd.DataFrame()
+            mock_fund.return_value = pd.DataFrame()
+            mock_naver_list.return_value = [{'code': '005930'}]
+            mock_naver.return_value = {'per': 12.5, 'pbr': 1.04}
+            for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+                assert get_ticker_list() == ['005930']
+            assert get_market_fundamentals(date="20250102") is None
+            mock_fund.reset_mock()
+            result = get_fundamental(sample_ticker_kr, with_meta=True)
+            tickers = get_ticker_list(with_meta=True)
+
+        status = get_source_status()
+        assert status['pykrx']['open'] is True
+        assert status['pykrx']['last_error'] == '_EmptyResult'
+        assert mock_fund.call_count == 0
+        assert result['attempts'][0]['skipped'] is True
+        assert result['source'] == 'naver.fundamental'
+        assert mock_list.call_count == BREAKER_FAILURE_THRESHOLD - 1
+        assert tickers['source'] == 'naver.stock_list'
+
+    def test_market_wide_success_resets_provider(self):
+        """A non-empty market-wide result should clear earlier empty results."""
+        from utils.data_fetcher import get_ticker_list, get_source_status
+
+        with patch('utils.data_fetcher.stock.get_market_ticker_list') as mock:
+            mock.return_value = []
+            with patch.dict('sys.modules', {'utils.web_scraper': None}):
+                get_ticker_list()
+            mock.return_value = ['005930']
+            get_ticker_list()
+
+        assert 'pykrx' not in get_source_status()
+
+    def test_per_ticker_value_error_does_not_open_breaker(self, sample_ticker_kr):
+        """One ticker's unparsable value (int(NaN)) should not block other tickers."""
+        from utils.data_fetcher import get_fundamental, get_source_status
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock_pykrx:
+            mock_pykrx.return_value = pd.DataFrame({
+                'BPS': [float('nan')], 'PER': [25.5], 'PBR': [1.12],
+                'EPS': [2000], 'DIV': [2.1], 'DPS': [1000],
+            })
+            with patch.dict('sys.modules', {'utils.web_scraper': None}):
+                result = get_fundamental(sample_ticker_kr, with_meta=True)
+                get_fundamental(sample_ticker_kr)
+
+        assert result['attempts'][0]['error'] == 'ValueError'
+        assert mock_pykrx.call_count == 2
+        assert 'pykrx.fundamental' not in get_source_status()
+
+    def test_transient_errors_open_after_threshold(self, sample_ticker_kr):
+        """Transient errors should open the breaker after repeated failures."""
+        from utils.data_fetcher import (
+            get_market_cap, BREAKER_FAILURE_THRESHOLD,
+        )
+
+        with patch('utils.data_fetcher.stock.get_market_cap') as mock_pykrx:
+            mock_pykrx.side_effect = ConnectionError("timeout")
+            with patch.dict('sys.modules', {'utils.web_scraper': None}):
+                for _ in range(BREAKER_FAILURE_THRESHOLD + 2):
+                    get_market_cap(sample_ticker_kr)
+
+        assert mock_pykrx.call_count == BREAKER_FAILURE_THRESHOLD
+
+    def test_empty_results_do_not_open_breaker(self, sample_ticker_kr):
+        """Tickers without data should not block the source for other callers."""
+        from utils.data_fetcher import (
+            get_fundamental, get_market_cap, get_source_status, BREAKER_FAILURE_THRESHOLD,
+        )
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock_fund, \
+             patch('utils.data_fetcher.stock.get_market_cap') as mock_cap, \
+             patch('utils.web_scraper.get_naver_stock_info') as mock_naver:
+            mock_fund.return_value = pd.DataFrame()
+            mock_cap.return_value = pd.DataFrame()
+            mock_naver.return_value = {'per': None, 'pbr': None, 'market_cap': 4700}
+            for i in range(BREAKER_FAILURE_THRESHOLD + 1):
+                assert get_fundamental(f"{i:06d}") is None
+            result = get_market_cap(sample_ticker_kr, with_meta=True)
+
+        assert get_source_status() == {}
+        assert mock_fund.call_count == BREAKER_FAILURE_THRESHOLD + 1
+        assert result['source'] == 'naver.market_cap'
+        assert result['data']['시가총액'] == 4700 * 100000000
+
+    def test_parser_bug_does_not_open_breaker(self, sample_ticker_kr):
+        """TypeError/AttributeError are code bugs, not source outages."""
+        from utils.data_fetcher import get_fundamental, get_source_status
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock_pykrx:
+            mock_pykrx.side_effect = AttributeError("'NoneType' object has no attribute 'iloc'")
+            with patch.dict('sys.modules', {'utils.web_scraper': None}):
+                get_fundamental(sample_ticker_kr)
+                get_fundamental(sample_ticker_kr)
+
+        assert mock_pykrx.call_count == 2
+        assert 'pykrx.fundamental' not in get_source_status()
+
+    def test_naver_transport_error_counts_per_function(self, sample_ticker_kr):
+        """Naver HTTP errors trip only the breaker of the function that saw them."""
+        import requests
+        from utils.data_fetcher import (
+            get_fundamental, get_market_cap, get_source_status, BREAKER_FAILURE_THRESHOLD,
+        )
+
+        with patch('utils.data_fetcher.stock.get_market_fundamental') as mock_fund, \
+             patch('utils.data_fetcher.stock.get_market_cap') as mock_cap, \
+             patch('utils.web_scraper.requests.get') as mock_get:
+            mock_fund.return_value = pd.DataFrame()
+            mock_cap.return_value = pd.DataFrame()
+            mock_get.side_effect = requests.ConnectionError("timeout")
+            for _ in range(BREAKER_FAILURE_THRESHOLD):
+                get_fundamental(sample_ticker_kr)
+            status = get_source_status()
+            get_market_cap(sample_ticker_kr)
+
+        assert status['naver.fundamental']['open'] is True
+        assert 'naver.market_cap' not in status
+        assert mock_get.call_count == BREAKER_FAILURE_THRESHOLD + 1
+
+    def test_cooldown_expiry_retries_primary(self, sample_ticker_kr):
+        """After the cooldown the primary source should be tried again."""
+        from utils import data_fetcher
+        from utils.data_fetcher import get_ticker_list
+
+        with patch('utils.data_fetcher.stock.get_market_ticker_list') as mock:
+            mock.return_value = []
+            with patch.dict('sys.modules', {'utils.web_scraper': None}):
+                for _ in range(data_fetcher.BREAKER_FAILURE_THRESHOLD):
+                    get_ticker_list()
+            assert data_fetcher.get_source_status()['pykrx']['open'] is True
+            data_fetcher._breakers['pykrx']['open_until'] = 0.0
+            mock.return_value = ['005930']
+            result = get_ticker_list()
+
+        assert result == ['005930']
+        assert 'pykrx' not in data_fetcher.get_source_status()
@@ -0,0 +1,203 @@
+"""종목토론방 증분 동기화 테스트"""
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from utils.discussion_store import (
+    sync_naver_discussion,
+    load_discussion_posts,
+    get_discussion_volume,
+    get_discussion_volume_signal,
+)
+
+
+def make_board(posts: list) -> callable:
+    """(nid, date) 목록으로 페이지당 3건씩 응답하는 requests.get mock"""
+    def side_effect(url, **kwargs):
+        page = int(url.rsplit("page=", 1)[1])
+        last_page = max(1, (len(posts) + 2) // 3)
+        page = min(page, last_page)
+        rows = "".join(
+            f'<tr><td class="title"><a href="/item/board_read.naver?nid={nid}&code=005930">'
+            f'글 {nid}</a></td><td><span class="tah">{date}</span></td></tr>'
+            for nid, date in posts[(page - 1) * 3:page * 3]
+        )
+        response = Mock()
+        response.text = f'<table class="type2">{rows}</table>'
+        response.raise_for_status = Mock()
+        return response
+    return side_effect
+
+
+BOARD_V1 = [
+    (105, "2026.01.15 10:00"),
+    (104, "2026.01.15 09:00"),
+    (103, "2026.01.14 18:00"),
+    (102, "2026.01.14 10:00"),
+    (101, "2026.01.13 10:00"),
+]
+BOARD_V2 = [(107, "2026.01.15 12:00"), (106, "2026.01.15 11:00")] + BOARD_V1
+
+
+class TestSyncNaverDiscussion:
+    """sync_naver_discussion 함수 테스트"""
+
+    @patch("utils.web_scraper.requests.get")
+    def test_first_sync_stores_posts_in_order(self, mock_get, tmp_path):
+        """첫 동기화: 전체 저장 (작성 순서)"""
+        mock_get.side_effect = make_board(BOARD_V1)
+
+        result = sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+        posts = load_discussion_posts("005930", store_dir=tmp_path)
+
+        assert result["new_posts"] == 5
+        assert result["newest_nid"] == 105
+        assert [p["nid"] for p in posts] == [101, 102, 103, 104, 105]
+        assert posts[-1]["posted_at"] == "2026-01-15T10:00"
+
+    @patch("utils.web_scraper.requests.get")
+    def test_incremental_sync_fetches_only_new(self, mock_get, tmp_path):
+        """두 번째 동기화: 새 글만 추가, 저장된 글에서 중단"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        mock_get.reset_mock()
+        mock_get.side_effect = make_board(BOARD_V2)
+        result = sync_naver_discussion("005930", store_dir=tmp_path)
+        posts = load_discussion_posts("005930", store_dir=tmp_path)
+
+        assert result["new_posts"] == 2
+        assert result["total_posts"] == 7
+        assert [p["nid"] for p in posts][-2:] == [106, 107]
+        assert len({p["nid"] for p in posts}) == 7
+
+    @patch("utils.web_scraper.requests.get")
+    def test_no_new_posts(self, mock_get, tmp_path):
+        """새 글 없으면 저장소 변화 없음"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+        result = sync_naver_discussion("005930", store_dir=tmp_path)
+
+        assert result["new_posts"] == 0
+        assert len(load_discussion_posts("005930", store_dir=tmp_path)) == 5
+
+    @patch("utils.web_scraper.requests.get")
+    def test_index_written(self, mock_get, tmp_path):
+        """인덱스 파일에 nid → 작성시각 저장"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        with open(tmp_path / "005930.index.json", encoding="utf-8") as f:
+            index = json.load(f)
+
+        assert index["posts"]["103"] == "2026-01-14T18:00"
+
+    @patch("utils.web_scraper.requests.get")
+    def test_truncated_walk_resumes(self, mock_get, tmp_path):
+        """max_posts로 중단되면 newest_nid 유지, 다음 동기화에서 빈 구간 수집"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        mock_get.side_effect = make_board(
+            [(110 - i, "2026.01.16 10:00") for i in range(5)] + BOARD_V1
+        )
+        first = sync_naver_discussion("005930", store_dir=tmp_path, max_posts=3)
+        second = sync_naver_discussion("005930", store_dir=tmp_path, max_posts=3)
+        posts = load_discussion_posts("005930", store_dir=tmp_path)
+
+        assert first["complete"] is False
+        assert first["newest_nid"] == 105
+        assert second["complete"] is True
+        assert second["new_posts"] == 2
+        assert second["newest_nid"] == 110
+        assert [p["nid"] for p in posts] == [101, 102, 103, 104, 105, 106, 107, 108, 109, 110]
+
+    @patch("utils.web_scraper.requests.get")
+    def test_page_error_keeps_newest_nid(self, mock_get, tmp_path):
+        """페이지 요청 실패 시 받은 글만 저장, newest_nid 유지"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        board = make_board([(110 - i, "2026.01.16 10:00") for i in range(5)] + BOARD_V1)
+
+        def failing(url, **kwargs):
+            if url.endswith("page=2"):
+                raise ConnectionError("page 2 failed")
+            return board(url, **kwargs)
+        mock_get.side_effect = failing
+        failed = sync_naver_discussion("005930", store_dir=tmp_path)
+
+        mock_get.side_effect = board
+        resumed = sync_naver_discussion("005930", store_dir=tmp_path)
+
+        assert failed["complete"] is False
+        assert "page 2 failed" in failed["error"]
+        assert failed["new_posts"] == 3
+        assert failed["newest_nid"] == 105
+        assert resumed["new_posts"] == 2
+        assert resumed["newest_nid"] == 110
+        assert len(load_discussion_posts("005930", store_dir=tmp_path)) == 10
+
+
+class TestDiscussionVolume:
+    """게시글 볼륨 함수 테스트"""
+
+    @patch("utils.web_scraper.requests.get")
+    def test_daily_counts(self, mock_get, tmp_path):
+        """일 단위 게시글 수"""
+        mock_get.side_effect = make_board(BOARD_V1)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        volume = get_discussion_volume("005930", freq="1D", store_dir=tmp_path)
+
+        assert volume.tolist() == [1, 2, 2]
+
+    def test_empty_store(self, tmp_path):
+        """저장된 글 없으면 빈 Series"""
+        assert get_discussion_volume("005930", store_dir=tmp_path).empty
+        assert get_discussion_volume_signal("005930", store_dir=tmp_path)["signal"] is None
+
+    @patch("utils.web_scraper.requests.get")
+    def test_surge_signal(self, mock_get, tmp_path):
+        """마지막 구간 급증 시 surge"""
+        board = [(200 + i, "2026.01.15 10:00") for i in range(9, -1, -1)]
+        board += [(100, "2026.01.13 10:00"), (99, "2026.01.12 10:00"), (98, "2026.01.11 10:00")]
+        mock_get.side_effect = make_board(board)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        result = get_discussion_volume_signal(
+            "005930", freq="1D", store_dir=tmp_path, now=datetime(2026, 1, 16, 9, 0)
+        )
+
+        assert result["recent"] == 10
+        assert result["signal"] == "surge"
+
+    @patch("utils.web_scraper.requests.get")
+    def test_skips_in_progress_bucket(self, mock_get, tmp_path):
+        """진행 중인 구간은 제외하고 마지막 완료 구간으로 비교"""
+        board = [(300, "2026.01.15 09:00")]
+        board += [(200 + i, "2026.01.14 10:00") for i in range(9, -1, -1)]
+        board += [(100, "2026.01.13 10:00"), (99, "2026.01.12 10:00")]
+        mock_get.side_effect = make_board(board)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        result = get_discussion_volume_signal(
+            "005930", freq="1D", store_dir=tmp_path, now=datetime(2026, 1, 15, 9, 30)
+        )
+
+        assert result["recent"] == 10
+        assert result["signal"] == "surge"
+
+    @patch("utils.web_scraper.requests.get")
+    def test_quiet_board_reports_low(self, mock_get, tmp_path):
+        """마지막 글 이후 조용한 구간은 0건 → low (마지막 글 있던 구간으로 비교하지 않음)"""
+        board = [(200 + i, f"2026.01.0{8 - i % 8} 10:00") for i in range(15, -1, -1)]
+        mock_get.side_effect = make_board(board)
+        sync_naver_discussion("005930", store_dir=tmp_path, since=datetime(2026, 1, 1))
+
+        result = get_discussion_volume_signal(
+            "005930", freq="1D", store_dir=tmp_path, now=datetime(2026, 1, 15, 12, 0)
+        )
+
+        assert result["recent"] == 0
+        assert result["signal"] == "low"
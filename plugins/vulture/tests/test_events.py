@@ -0,0 +1,131 @@
+"""지표 이벤트 탐지 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import macd, rsi
+from utils.events import (
+    crossovers,
+    macd_crosses,
+    rsi_divergences,
+    detect_events,
+)
+
+
+def divergence_close() -> pd.Series:
+    """급락 저점(100) → 반등 → 완만한 하락으로 더 낮은 저점(98) → 반등"""
+    segments = [
+        np.linspace(150, 100, 30),
+        np.linspace(100, 120, 10)[1:],
+        np.linspace(120, 98, 25)[1:],
+        np.linspace(98, 130, 20)[1:],
+    ]
+    values = np.concatenate(segments)
+    return pd.Series(values, index=pd.bdate_range("2025-01-01", periods=len(values)))
+
+
+class TestCrossovers:
+    """crossovers 함수 테스트"""
+
+    def test_up_and_down(self):
+        """상향 1, 하향 -1, 첫 봉 0"""
+        fast = pd.Series([1, 2, 3, 2, 1])
+        slow = pd.Series([2, 2, 2, 2, 2])
+
+        assert crossovers(fast, slow).tolist() == [0, 0, 1, -1, 0]
+
+    def test_nan_does_not_create_cross(self):
+        """값이 없는 구간 다음 첫 봉은 크로스 아님"""
+        fast = pd.Series([np.nan, 3, 1])
+        slow = pd.Series([2, 2, 2])
+
+        assert crossovers(fast, slow).tolist() == [0, 0, -1]
+
+    def test_macd_cross_matches_state_change(self, sample_ohlcv_df):
+        """MACD > Signal 상태가 바뀐 봉과 일치"""
+        close = sample_ohlcv_df["종가"] + np.sin(np.arange(60) / 3) * 800
+        macd_line, signal_line, _ = macd(close)
+        above = macd_line > signal_line
+
+        crosses = macd_crosses(close)
+
+        assert (crosses == 1).sum() > 0
+        assert ((crosses == 1) == (above & ~above.shift(1, fill_value=True))).all()
+        assert ((crosses == -1) == (~above & above.shift(1, fill_value=False))).all()
+
+
+class TestRsiDivergences:
+    """rsi_divergences 함수 테스트"""
+
+    def test_bullish_divergence(self):
+        """가격 저점 하락 + RSI 저점 상승 → 확정 봉에 1"""
+        close = divergence_close()
+        r = rsi(close)
+        assert close.iloc[62] < close.iloc[29] and r.iloc[62] > r.iloc[29]
+
+        events = rsi_divergences(close, order=5)
+
+        assert events[events != 0].index.tolist() == [close.index[62 + 5]]
+        assert events.iloc[62 + 5] == 1
+
+    def test_bearish_divergence_on_mirror(self):
+        """가격을 뒤집으면 하락 다이버전스"""
+        events = rsi_divergences(300 - divergence_close(), order=5)
+
+        assert (events == -1).sum() == 1
+
+    def test_lookback_limits_pivot_distance(self):
+        """두 저점 간격이 lookback 초과면 무시"""
+        assert (rsi_divergences(divergence_close(), lookback=10) != 0).sum() == 0
+
+
+class TestDetectEvents:
+    """detect_events 함수 테스트"""
+
+    def test_single_ticker_dataframe(self):
+        """get_ohlcv 형식 입력 → 이벤트 목록"""
+        close = divergence_close()
+        df = pd.DataFrame({"고가": close + 1, "저가": close - 1, "종가": close})
+
+        events = detect_events(df, ticker="005930")
+
+        assert set(events["ticker"]) == {"005930"}
+        assert "RSI 상승 다이버전스" in events["label"].tolist()
+        assert events["date"].is_monotonic_increasing
+
+    def test_panel_equals_per_ticker(self):
+        """날짜 × 종목 입력 결과 = 종목별 결과 합"""
+        base = divergence_close()
+        close = pd.DataFrame({"A": base, "B": 300 - base, "C": base * 1.5})
+        panels = {"고가": close + 1, "저가": close - 1, "종가": close}
+
+        combined = detect_events(panels)
+        for ticker in close.columns:
+            single = detect_events(
+                pd.DataFrame({field: panels[field][ticker] for field in panels}), ticker=ticker
+            )
+            mine = combined[combined["ticker"] == ticker].reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                mine.sort_values(["date", "event"]).reset_index(drop=True),
+                single.sort_values(["date", "event"]).reset_index(drop=True),
+            )
+
+    def test_window_and_event_filter(self):
+        """최근 N 봉 / 이벤트 종류 필터"""
+        close = divergence_close()
+        df = pd.DataFrame({"고가": close + 1, "저가": close - 1, "종가": close})
+
+        events = detect_events(df, window=10, events=("macd_cross",))
+
+        assert set(events["event"]) <= {"macd_cross"}
+        assert (events["date"] >= close.index[-10]).all()
+
+    def test_no_events(self):
+        """이벤트 없으면 빈 DataFrame"""
+        close = pd.Series(100.0, index=pd.bdate_range("2025-01-01", periods=30))
+        df = pd.DataFrame({"고가": close, "저가": close, "종가": close})
+
+        events = detect_events(df, events=("macd_cross", "rsi_divergence"))
+
+        assert events.empty
+        assert list(events.columns) == ["date", "ticker", "event", "label", "direction"]
@@ -438,3 +438,128 @@ class TestSupportResistance:
         )
 
         assert result_default == result_explicit
+
+
+def make_range_bound_df():
+    """Price oscillating between ~100 (support) and ~120 (resistance)."""
+    wave = np.concatenate([np.linspace(100, 120, 11), np.linspace(120, 100, 11)[1:-1]] * 6)
+    close = pd.Series(np.append(wave, 110.0), index=pd.bdate_range('2025-01-01', periods=len(wave) + 1))
+    volume = pd.Series(1000.0, index=close.index)
+    return close + 0.5, close - 0.5, close, volume
+
+
+class TestSwingPoints:
+    """Tests for swing high/low detection."""
+
+    def test_swing_points_mark_peaks_and_troughs(self):
+        """Swing highs/lows should be the local extremes only."""
+        from utils.indicators import swing_points
+
+        high, low, _, _ = make_range_bound_df()
+        swing_high, swing_low = swing_points(high, low, order=3)
+
+        assert swing_high.dropna().round(1).unique().tolist() == [120.5]
+        assert swing_low.dropna().round(1).unique().tolist() == [99.5]
+
+    def test_swing_points_last_bars_unconfirmed(self):
+        """The last `order` bars cannot be swings (no right-hand bars yet)."""
+        from utils.indicators import swing_points
+
+        high, low, _, _ = make_range_bound_df()
+        swing_high, swing_low = swing_points(high, low, order=3)
+
+        assert swing_high.iloc[-3:].isna().all()
+        assert swing_low.iloc[-3:].isna().all()
+
+    def test_swing_points_work_on_panels(self):
+        """DataFrame input should match per-column Series results."""
+        from utils.indicators import swing_points
+
+        high, low, _, _ = make_range_bound_df()
+        panel_high = pd.DataFrame({'A': high, 'B': high * 2})
+        panel_low = pd.DataFrame({'A': low, 'B': low * 2})
+
+        swing_high, _ = swing_points(panel_high, panel_low, order=3)
+        expected, _ = swing_points(high * 2, low * 2, order=3)
+
+        pd.testing.assert_series_equal(swing_high['B'], expected, check_names=False)
+
+
+class TestSupportResistanceLevels:
+    """Tests for clustered multi-level support/resistance."""
+
+    def test_levels_find_range_bounds(self):
+        """Repeated highs/lows should become zones with touch counts."""
+        from utils.indicators import support_resistance_levels
+
+        high, low, close, volume = make_range_bound_df()
+        result = support_resistance_levels(high, low, close, volume, order=3)
+
+        assert result['price'] == 110.0
+        assert result['resistance'][0]['price'] == pytest.approx(120.5)
+        assert result['resistance'][0]['touches'] >= 5
+        assert result['support'][0]['price'] == pytest.approx(99.5)
+        assert result['support'][0]['distance_pct'] < 0
+
+    def test_levels_ranked_by_touches(self):
+        """Levels on each side should be sorted by touch count."""
+        from utils.indicators import support_resistance_levels
+
+        rng = np.random.default_rng(0)
+        close = pd.Series(1000 + rng.normal(0, 15, 250).cumsum(), index=pd.bdate_range('2025-01-01', periods=250))
+        result = support_resistance_levels(close + 5, close - 5, close, max_levels=5)
+
+        for side in ('support', 'resistance'):
+            touches = [z['touches'] for z in result[side]]
+            assert touches == sorted(touches, reverse=True)
+            assert len(result[side]) <= 5
+
+    def test_zone_width_within_tolerance(self):
+        """A zone should not span more than tolerance_pct from its low."""
+        from utils.indicators import support_resistance_levels
+
+        rng = np.random.default_rng(1)
+        close = pd.Series(1000 + rng.normal(0, 15, 250).cumsum(), index=pd.bdate_range('2025-01-01', periods=250))
+        result = support_resistance_levels(close + 5, close - 5, close, tolerance_pct=1.0, max_levels=10)
+
+        for zone in result['support'] + result['resistance']:
+            assert (zone['high'] - zone['low']) / zone['low'] * 100 <= 1.0 + 1e-9
+
+    def test_volume_fields(self):
+        """volume_pct / volume_poc only when volume is given."""
+        from utils.indicators import support_resistance_levels
+
+        high, low, close, volume = make_range_bound_df()
+        with_volume = support_resistance_levels(high, low, close, volume, order=3)
+        without = support_resistance_levels(high, low, close, order=3)
+
+        assert with_volume['volume_poc'] is not None
+        assert with_volume['resistance'][0]['volume_pct'] > 0
+        assert without['volume_poc'] is None
+        assert without['resistance'][0]['volume_pct'] is None
+
+    def test_levels_on_panel(self):
+        """DataFrame input should return per-ticker dicts."""
+        from utils.indicators import support_resistance_levels
+
+        high, low, close, volume = make_range_bound_df()
+        result = support_resistance_levels(
+            pd.DataFrame({'A': high, 'B': high}),
+            pd.DataFrame({'A': low, 'B': low}),
+            pd.DataFrame({'A': close, 'B': close}),
+            order=3,
+        )
+
+        assert set(result) == {'A', 'B'}
+        assert result['A'] == support_resistance_levels(high, low, close, order=3)
+
+    def test_monotonic_series_has_no_levels(self, sample_ohlcv_df):
+        """A straight uptrend has no swing points."""
+        from utils.indicators import support_resistance_levels
+
+        result = support_resistance_levels(
+            sample_ohlcv_df['고가'], sample_ohlcv_df['저가'], sample_ohlcv_df['종가']
+        )
+
+        assert result['support'] == []
+        assert result['resistance'] == []
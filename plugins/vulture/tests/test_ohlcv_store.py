@@ -0,0 +1,96 @@
+"""OHLCV 로컬 저장소 테스트"""
+from unittest.mock import patch
+
+import pandas as pd
+
+from utils.ohlcv_store import (
+    update_ohlcv_store,
+    load_ohlcv,
+    load_ohlcv_panel,
+    load_ohlcv_panels,
+    list_stored_tickers,
+)
+
+
+def make_ohlcv(start: str, periods: int, base: float = 1000.0) -> pd.DataFrame:
+    """영업일 OHLCV DataFrame"""
+    dates = pd.bdate_range(start=start, periods=periods)
+    close = [base + i for i in range(periods)]
+    return pd.DataFrame({
+        "시가": close,
+        "고가": [c + 5 for c in close],
+        "저가": [c - 5 for c in close],
+        "종가": close,
+        "거래량": [1000] * periods,
+    }, index=dates)
+
+
+class TestUpdateOhlcvStore:
+    """update_ohlcv_store 함수 테스트"""
+
+    @patch("utils.ohlcv_store.get_ohlcv")
+    def test_first_update_stores_history(self, mock_get, tmp_path):
+        """새 종목은 history_days 만큼 조회해 저장"""
+        mock_get.return_value = make_ohlcv("2026-01-01", 10)
+
+        result = update_ohlcv_store(["005930", "000660"], store_dir=tmp_path, history_days=10)
+
+        assert result["updated"] == 2
+        assert result["new_rows"] == 20
+        assert list_stored_tickers(tmp_path) == ["000660", "005930"]
+        assert mock_get.call_args.kwargs["days"] == 10
+
+    @patch("utils.ohlcv_store.get_ohlcv")
+    def test_incremental_update_merges_overlap(self, mock_get, tmp_path):
+        """두 번째 업데이트: 겹치는 날짜는 새 값으로 교체, 새 날짜만 추가"""
+        mock_get.return_value = make_ohlcv("2026-01-01", 10)
+        update_ohlcv_store(["005930"], store_dir=tmp_path)
+
+        mock_get.return_value = make_ohlcv("2026-01-12", 5, base=2000.0)
+        result = update_ohlcv_store(["005930"], store_dir=tmp_path)
+        df = load_ohlcv("005930", tmp_path)
+
+        assert result["new_rows"] == 2
+        assert len(df) == 12
+        assert df.index.is_monotonic_increasing
+        assert df.loc["2026-01-12", "종가"] == 2000.0
+
+    @patch("utils.ohlcv_store.get_ohlcv")
+    def test_failed_tickers_reported(self, mock_get, tmp_path):
+        """조회 실패 종목은 failed 목록"""
+        mock_get.side_effect = lambda ticker, days: None if ticker == "999999" else make_ohlcv("2026-01-01", 5)
+
+        result = update_ohlcv_store(["005930", "999999"], store_dir=tmp_path)
+
+        assert result["failed"] == ["999999"]
+        assert list_stored_tickers(tmp_path) == ["005930"]
+
+
+class TestLoadOhlcvPanels:
+    """load_ohlcv_panels 함수 테스트"""
+
+    @patch("utils.ohlcv_store.get_ohlcv")
+    def test_dates_by_tickers_matrix(self, mock_get, tmp_path):
+        """날짜 × 종목 행렬, 상장 전 구간은 NaN"""
+        mock_get.side_effect = lambda ticker, days: (
+            make_ohlcv("2026-01-01", 10) if ticker == "005930" else make_ohlcv("2026-01-08", 5)
+        )
+        update_ohlcv_store(["005930", "000660"], store_dir=tmp_path)
+
+        panels = load_ohlcv_panels(("종가", "거래량"), store_dir=tmp_path)
+
+        assert set(panels) == {"종가", "거래량"}
+        assert panels["종가"].shape == (10, 2)
+        assert panels["종가"]["000660"].isna().sum() == 5
+
+    @patch("utils.ohlcv_store.get_ohlcv")
+    def test_days_limits_rows(self, mock_get, tmp_path):
+        """days: 최근 N 영업일만"""
+        mock_get.return_value = make_ohlcv("2026-01-01", 10)
+        update_ohlcv_store(["005930"], store_dir=tmp_path)
+
+        assert len(load_ohlcv_panel("종가", days=3, store_dir=tmp_path)) == 3
+
+    def test_empty_store(self, tmp_path):
+        """저장 종목 없으면 None"""
+        assert load_ohlcv_panel(store_dir=tmp_path) is None
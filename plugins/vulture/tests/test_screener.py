@@ -0,0 +1,183 @@
+"""전 종목 기술적 스크리너 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import sma, rsi
+from utils.ti_analyzer import get_ma_alignment, get_rsi_signal
+from utils.screener import (
+    compute_signal_panels,
+    screen,
+    rsi_signal,
+    stochastic_signal,
+    rsi_between,
+    ma_alignment,
+    macd_trend,
+    macd_cross,
+    bollinger_position,
+    week52_position,
+    volume_surge,
+    liquidity,
+)
+
+
+@pytest.fixture
+def panels():
+    """상승 / 하락 / 횡보(랜덤) 종목 3개, 120 영업일"""
+    dates = pd.bdate_range(start="2025-06-02", periods=120)
+    rng = np.random.default_rng(0)
+    close = pd.DataFrame({
+        "UP": 1000 + np.arange(120) * 10.0 + rng.normal(0, 3, 120),
+        "DOWN": 3000 - np.arange(120) * 10.0 + rng.normal(0, 3, 120),
+        "FLAT": 2000 + rng.normal(0, 30, 120).cumsum(),
+    }, index=dates)
+    return {"종가": close, "고가": close + 10, "저가": close - 10}
+
+
+@pytest.fixture
+def signals(panels):
+    return compute_signal_panels(panels)
+
+
+class TestComputeSignalPanels:
+    """compute_signal_panels 함수 테스트"""
+
+    def test_matches_single_ticker_logic(self, panels, signals):
+        """종목별 ti_analyzer 판단과 동일"""
+        for ticker in panels["종가"].columns:
+            close = panels["종가"][ticker]
+            expected = get_ma_alignment(
+                close.iloc[-1], sma(close, 5).iloc[-1], sma(close, 20).iloc[-1], sma(close, 60).iloc[-1]
+            )
+            code = signals["ma_alignment"][ticker].iloc[-1]
+            assert {1: "완전 정배열", -1: "완전 역배열", 0: "혼조"}[code] == expected
+            assert signals["rsi"][ticker].iloc[-1] == pytest.approx(rsi(close).iloc[-1])
+
+    def test_alignment_nan_before_ma60(self, signals):
+        """MA60 계산 전 구간은 NaN"""
+        assert signals["ma_alignment"].iloc[:59].isna().all().all()
+
+    def test_week52_position_range(self, signals):
+        """52주 위치 0~100"""
+        values = signals["week52_position_pct"].stack()
+        assert values.between(0, 100).all()
+
+
+class TestConditions:
+    """조건 조합 테스트"""
+
+    def test_ma_alignment(self, signals):
+        """정배열/역배열"""
+        last = ma_alignment("완전 정배열")(signals).iloc[-1]
+        assert last["UP"] and not last["DOWN"]
+        assert ma_alignment("완전 역배열")(signals).iloc[-1]["DOWN"]
+
+    def test_combinators(self, signals):
+        """&, |, ~ 조합"""
+        up = ma_alignment("완전 정배열")
+        down = ma_alignment("완전 역배열")
+
+        assert not (up & down)(signals).any().any()
+        assert ((up | down)(signals) == (up(signals) | down(signals))).all().all()
+        assert ((~up)(signals) == ~up(signals)).all().all()
+
+    def test_rsi_signal_matches_get_rsi_signal(self, signals):
+        """RSI 조건 = get_rsi_signal 기준"""
+        last_rsi = signals["rsi"].iloc[-1]
+        for label in ("과매수", "과매도", "중립"):
+            mask = rsi_signal(label)(signals).iloc[-1]
+            for ticker, value in last_rsi.items():
+                assert mask[ticker] == (get_rsi_signal(value) == label)
+
+    def test_stochastic_signal(self, signals):
+        """스토캐스틱 %K 80/20 기준"""
+        k = signals["stoch_k"]
+
+        assert (stochastic_signal("과매수")(signals) == (k > 80)).all().all()
+        assert (stochastic_signal("과매도")(signals) == (k < 20)).all().all()
+
+    def test_macd_cross_within(self, signals):
+        """within 기간 안에 크로스가 있으면 True"""
+        crosses = signals["macd_cross"] == 1
+        within = macd_cross("golden", within=5)(signals)
+        assert (within | ~crosses).all().all()
+        assert within.sum().sum() >= crosses.sum().sum()
+
+    def test_range_conditions(self, signals):
+        """볼린저 / 52주 위치 범위"""
+        high = week52_position(above=90)(signals).iloc[-1]
+        assert high["UP"] and not high["DOWN"]
+        assert bollinger_position(below=100)(signals).iloc[-1].any()
+
+    def test_unknown_label_raises(self):
+        """알 수 없는 라벨"""
+        with pytest.raises(ValueError):
+            rsi_signal("강세")
+        with pytest.raises(ValueError):
+            macd_cross("up")
+
+
+class TestVolumeConditions:
+    """거래량 조건 테스트"""
+
+    @pytest.fixture
+    def volume_signals(self, panels):
+        volume = pd.DataFrame(1000.0, index=panels["종가"].index, columns=panels["종가"].columns)
+        volume["UP"] *= 10
+        volume.iloc[-1, volume.columns.get_loc("FLAT")] = 5000.0
+        return compute_signal_panels({**panels, "거래량": volume})
+
+    def test_volume_panels_included(self, signals, volume_signals):
+        """거래량 있을 때만 거래량 지표 포함"""
+        assert "rvol" not in signals
+        assert volume_signals["rvol"].shape == volume_signals["close"].shape
+
+    def test_volume_surge(self, volume_signals):
+        """당일 거래량 / 직전 20일 평균"""
+        last = volume_surge()(volume_signals).iloc[-1]
+
+        assert last["FLAT"] and not last["UP"] and not last["DOWN"]
+
+    def test_liquidity(self, volume_signals):
+        """거래대금 상위 종목"""
+        last = liquidity(top_pct=34)(volume_signals).iloc[-1]
+
+        assert last["UP"] and not last["DOWN"]
+
+    def test_screen_adds_volume_fields(self, volume_signals):
+        """후보에 rvol / liquidity_pct 포함"""
+        result = screen(volume_surge(), signals=volume_signals)
+
+        assert result[0]["ticker"] == "FLAT"
+        assert result[0]["rvol"] == 5.0
+        assert result[0]["liquidity_pct"] is not None
+
+
+class TestScreen:
+    """screen 함수 테스트"""
+
+    def test_ranked_candidates(self, signals):
+        """조건 만족 종목을 rank_by 순으로"""
+        result = screen(rsi_between(0, 100), signals=signals, rank_by="week52_position_pct", ascending=False)
+
+        assert [c["ticker"] for c in result][0] == "UP"
+        assert result[0]["ma_alignment"] == "완전 정배열"
+        assert result[0]["rsi_signal"] == get_rsi_signal(signals["rsi"]["UP"].iloc[-1])
+
+    def test_condition_list_is_and(self, signals):
+        """조건 목록은 AND"""
+        result = screen([ma_alignment("완전 역배열"), macd_trend("하락")], signals=signals)
+        expected = screen(ma_alignment("완전 역배열") & macd_trend("하락"), signals=signals)
+
+        assert result == expected
+
+    def test_as_of_and_limit(self, signals):
+        """기준일 / 개수 제한"""
+        result = screen(rsi_between(0, 100), signals=signals, as_of="2025-09-01", limit=1)
+
+        assert len(result) == 1
+        assert result[0]["date"] == "2025-09-01"
+
+    def test_empty_store(self, tmp_path):
+        """저장소 비어 있으면 빈 목록"""
+        assert screen(rsi_signal("과매도"), store_dir=tmp_path) == []
@@ -0,0 +1,134 @@
+"""Tests for sentiment module - lexicon-based title scoring."""
+import pytest
+
+
+class TestScoreTitles:
+    """Tests for score_titles function."""
+
+    def test_scores_by_level(self):
+        """Each level should map to its weight, clipped to -2..+2."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["내일 상한가", "매수 추천", "실적 발표 언제?", "손절합니다", "상장폐지 위기"])
+
+        assert df["score"].tolist() == [2, 2, 0, -1, -2]
+
+    def test_accepts_scraper_dicts(self):
+        """get_naver_discussion results should be accepted directly."""
+        from utils.sentiment import score_titles
+
+        posts = [{"title": "반등 기대", "date": "01/15", "url": "..."}]
+        df = score_titles(posts)
+
+        assert df["title"].iloc[0] == "반등 기대"
+        assert df["score"].iloc[0] == 2
+
+    def test_flags_pump_dump(self):
+        """Pump-and-dump phrases should be flagged by pattern name."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["지금 안 사면 후회합니다", "세력 매집 중", "10만원 간다", "평범한 글"])
+
+        assert df["pump_dump"].tolist() == ["과장 표현", "세력 언급", "근거 없는 목표가", None]
+
+    def test_bullish_words_in_bearish_context(self):
+        """Bullish words inside bearish phrases should not score positive."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["주가 내려간다", "실적 기대 이하", "기대감 소멸", "상승분 반납", "반등 실패"])
+
+        assert df["score"].tolist() == [-1, -1, -1, -1, -1]
+        assert df["bullish"].tolist() == [0, 0, 0, 0, 0]
+
+    def test_bullish_words_still_match_alone(self):
+        """The same words should stay bullish outside those phrases."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["위로 간다", "실적 기대", "기대감 상승", "반등 나옴"])
+
+        assert df["score"].tolist() == [1, 1, 2, 1]
+
+    def test_overlapping_keywords_counted_once(self):
+        """A longer keyword should not also count its substrings ("풀매수" is not "매수")."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["풀매수 갑니다", "실적 발표"])
+
+        assert df.loc[0, ["very_bullish", "bullish"]].tolist() == [1, 0]
+        assert df["score"].tolist() == [2, 0]
+        assert df["bullish"].dtype.kind == "i"
+
+    def test_pump_dump_ignores_plain_words(self):
+        """Bare 후회/세력/작전 in ordinary titles should not be flagged."""
+        from utils.sentiment import score_titles
+
+        df = score_titles(["후회 없는 장기투자", "외국인 세력 매도", "작전 타임", "이거 안 사면 후회", "작전주 조심"])
+
+        assert df["pump_dump"].tolist() == [None, None, None, "과장 표현", "세력 언급"]
+
+    def test_empty_input(self):
+        """Empty input should give an empty frame."""
+        from utils.sentiment import score_titles
+
+        assert score_titles([]).empty
+        assert score_titles(None).empty
+
+
+class TestSummarizeSentiment:
+    """Tests for summarize_sentiment function."""
+
+    def test_summary_fields(self):
+        """Summary should aggregate score, distribution and keywords."""
+        from utils.sentiment import summarize_sentiment
+
+        titles = ["상한가 간다", "매수 추천", "손절", "그냥 글"]
+        result = summarize_sentiment(titles)
+
+        assert result["count"] == 4
+        assert result["score"] == pytest.approx((2 + 2 - 1 + 0) / 4)
+        assert result["label"] == "낙관적"
+        assert result["bullish_pct"] == 50.0
+        assert result["bearish_pct"] == 25.0
+        assert result["neutral_pct"] == 25.0
+        assert ["상한가", 1] in result["top_keywords"]
+
+    def test_counts_duplicate_titles(self):
+        """Repeated titles (도배) should be counted, ignoring whitespace."""
+        from utils.sentiment import summarize_sentiment
+
+        result = summarize_sentiment(["무조건 오른다", "무조건  오른다", "무조건 오른다", "다른 글"])
+
+        assert result["pump_dump"]["duplicates"] == 2
+        assert result["pump_dump"]["flagged"] == 3
+        assert result["pump_dump"]["patterns"] == {"과장 표현": 3}
+
+    def test_returns_none_when_empty(self):
+        """No titles should give None."""
+        from utils.sentiment import summarize_sentiment
+
+        assert summarize_sentiment([]) is None
+
+    def test_handles_thousands_of_titles(self):
+        """Large batches should be processed in one pass."""
+        from utils.sentiment import summarize_sentiment
+
+        result = summarize_sentiment(["매수 추천", "손절"] * 5000)
+
+        assert result["count"] == 10000
+        assert result["score"] == pytest.approx(0.5)
+
+
+class TestGetSentimentLabel:
+    """Tests for get_sentiment_label function."""
+
+    @pytest.mark.parametrize("score,label", [
+        (1.8, "극단적 낙관"),
+        (1.0, "낙관적"),
+        (0.0, "중립"),
+        (-1.0, "비관적"),
+        (-1.8, "극단적 비관"),
+    ])
+    def test_label_ranges(self, score, label):
+        from utils.sentiment import get_sentiment_label
+
+        assert get_sentiment_label(score) == label
@@ -0,0 +1,174 @@
+"""Playwright snapshot 구조화 추출 테스트"""
+from utils.snapshot_parser import (
+    parse_snapshot,
+    parse_snapshot_tables,
+    table_to_records,
+    parse_naver_discussion_snapshot,
+    parse_fnguide_ratio_snapshot,
+)
+
+
+FNGUIDE_RATIO_SNAPSHOT = """\
+- navigation [ref=e1]:
+  - link "홈" [ref=e2] [cursor=pointer]:
+    - /url: /
+- main [ref=e3]:
+  - heading "수익성" [level=3] [ref=e4]
+  - table "수익성비율" [ref=e5]:
+    - rowgroup [ref=e6]:
+      - row "IFRS연결 2022/12 2023/12 2024/12" [ref=e7]:
+        - columnheader "IFRS연결" [ref=e8]
+        - columnheader "2022/12" [ref=e9]
+        - columnheader "2023/12" [ref=e10]
+        - columnheader "2024/12" [ref=e11]
+    - rowgroup [ref=e12]:
+      - row "ROE 16.22 3.84 9.01" [ref=e13]:
+        - rowheader "ROE" [ref=e14]
+        - cell "16.22" [ref=e15]
+        - cell "3.84" [ref=e16]
+        - cell "9.01" [ref=e17]
+      - row "영업이익률 14.35 2.53 10.87" [ref=e18]:
+        - rowheader "영업이익률" [ref=e19]
+        - cell "14.35" [ref=e20]
+        - cell "2.53" [ref=e21]
+        - cell "10.87" [ref=e22]
+  - table [ref=e23]:
+    - rowgroup [ref=e24]:
+      - row [ref=e25]:
+        - columnheader "IFRS연결" [ref=e26]
+        - columnheader "2023/12" [ref=e27]
+        - columnheader "2024/12" [ref=e28]
+    - rowgroup [ref=e29]:
+      - row [ref=e30]:
+        - rowheader "PER" [ref=e31]
+        - cell "34.12" [ref=e32]
+        - cell "29.34" [ref=e33]
+- contentinfo [ref=e34]:
+  - text: Copyright
+"""
+
+NAVER_DISCUSSION_SNAPSHOT = """\
+- table [ref=e1]:
+  - rowgroup [ref=e2]:
+    - row "날짜 제목 글쓴이 조회" [ref=e3]:
+      - columnheader "날짜" [ref=e4]
+      - columnheader "제목" [ref=e5]
+      - columnheader "글쓴이" [ref=e6]
+      - columnheader "조회" [ref=e7]
+    - row [ref=e8]:
+      - cell "2026.01.15 10:21" [ref=e9]
+      - cell [ref=e10]:
+        - link "오늘 상한가 간다" [ref=e11] [cursor=pointer]:
+          - /url: /item/board_read.naver?nid=101&code=005930
+      - cell "개미1" [ref=e12]
+      - cell "120" [ref=e13]
+    - row [ref=e14]:
+      - cell [ref=e15]
+    - row [ref=e16]:
+      - cell "2026.01.15 09:45" [ref=e17]
+      - cell [ref=e18]:
+        - 'link "실적: 언제 나오나" [ref=e19]':
+          - /url: /item/board_read.naver?nid=100&code=005930
+      - cell "개미2" [ref=e20]
+      - cell "85" [ref=e21]
+"""
+
+
+class TestParseSnapshot:
+    """parse_snapshot 함수 테스트"""
+
+    def test_builds_tree_by_indent(self):
+        """들여쓰기로 계층 구성, ref/cursor 속성 제외"""
+        roots = parse_snapshot(FNGUIDE_RATIO_SNAPSHOT)
+
+        assert [n["role"] for n in roots] == ["navigation", "main", "contentinfo"]
+        link = roots[0]["children"][0]
+        assert link["name"] == "홈"
+        assert link["children"][0] == {"role": "/url", "name": None, "value": "/", "children": []}
+
+    def test_text_value(self):
+        """'- text: 값' 형식"""
+        roots = parse_snapshot('- paragraph:\n  - text: "가격: 1,000원"')
+
+        assert roots[0]["children"][0]["value"] == "가격: 1,000원"
+
+    def test_ignores_non_node_lines(self):
+        """노드가 아닌 줄은 무시"""
+        assert parse_snapshot("### Page state\n\n") == []
+
+
+class TestParseSnapshotTables:
+    """parse_snapshot_tables 함수 테스트"""
+
+    def test_headers_and_rows(self):
+        """columnheader 행 → 헤더, 나머지 → 데이터 행"""
+        tables = parse_snapshot_tables(FNGUIDE_RATIO_SNAPSHOT)
+
+        assert len(tables) == 2
+        assert tables[0]["name"] == "수익성비율"
+        assert tables[0]["headers"] == ["IFRS연결", "2022/12", "2023/12", "2024/12"]
+        assert tables[0]["rows"][0] == ["ROE", "16.22", "3.84", "9.01"]
+
+    def test_cell_text_from_children_and_row_url(self):
+        """이름 없는 셀은 하위 텍스트, 행별 첫 링크 주소"""
+        table = parse_snapshot_tables(NAVER_DISCUSSION_SNAPSHOT)[0]
+
+        assert table["rows"][0][1] == "오늘 상한가 간다"
+        assert table["urls"][0] == "/item/board_read.naver?nid=101&code=005930"
+        assert table["urls"][1] is None
+
+    def test_records(self):
+        """헤더 → 키 매핑, 셀 수가 다르면 colN 키"""
+        records = table_to_records(parse_snapshot_tables(NAVER_DISCUSSION_SNAPSHOT)[0])
+
+        assert records[0]["제목"] == "오늘 상한가 간다"
+        assert records[0]["url"].startswith("/item/board_read.naver")
+        assert records[1] == {"col0": ""}
+
+
+class TestParseNaverDiscussionSnapshot:
+    """parse_naver_discussion_snapshot 함수 테스트"""
+
+    def test_same_format_as_html_parser(self):
+        """get_naver_discussion과 동일 형식"""
+        posts = parse_naver_discussion_snapshot(NAVER_DISCUSSION_SNAPSHOT)
+
+        assert posts == [
+            {
+                "title": "오늘 상한가 간다",
+                "date": "2026.01.15 10:21",
+                "url": "https://finance.naver.com/item/board_read.naver?nid=101&code=005930",
+            },
+            {
+                "title": "실적: 언제 나오나",
+                "date": "2026.01.15 09:45",
+                "url": "https://finance.naver.com/item/board_read.naver?nid=100&code=005930",
+            },
+        ]
+
+    def test_limit(self):
+        """limit 적용"""
+        assert len(parse_naver_discussion_snapshot(NAVER_DISCUSSION_SNAPSHOT, limit=1)) == 1
+
+    def test_no_posts(self):
+        """게시글 없으면 None"""
+        assert parse_naver_discussion_snapshot(FNGUIDE_RATIO_SNAPSHOT) is None
+
+
+class TestParseFnguideRatioSnapshot:
+    """parse_fnguide_ratio_snapshot 함수 테스트"""
+
+    def test_parses_ratio_tables(self):
+        """get_fnguide_ratios와 동일 형식"""
+        result = parse_fnguide_ratio_snapshot(FNGUIDE_RATIO_SNAPSHOT, "005930")
+
+        assert result["source"] == "FnGuide FinanceRatio (snapshot)"
+        assert result["period"] == "2024/12"
+        assert result["roe"] == 9.01
+        assert result["per"] == 29.34
+        assert result["operating_margin"] == 10.87
+        assert result["annual"]["2022"] == {"roe": 16.22, "operating_margin": 14.35}
+
+    def test_returns_none_without_tables(self):
+        """재무비율 테이블 없으면 None"""
+        assert parse_fnguide_ratio_snapshot("- main:\n  - text: 없음", "005930") is None
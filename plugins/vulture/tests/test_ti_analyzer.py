@@ -1,5 +1,6 @@
 """Tests for ti_analyzer module - Technical Intelligence integration."""
 import pytest
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from io import StringIO
@@ -312,6 +313,165 @@ class TestGetTiFullAnalysis:
         assert 'stochastic_signal' in result['signals']
         assert 'ma_alignment' in result['signals']
 
+    def test_series_not_included_by_default(self, sample_ticker_kr, sample_ohlcv_df):
+        """Default output should not carry the series section."""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = sample_ohlcv_df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            result = get_ti_full_analysis(sample_ticker_kr)
+
+        assert 'series' not in result
+
+    def test_series_mode_returns_float32_arrays(self, sample_ticker_kr, sample_ohlcv_df):
+        """series=True should return float32 arrays aligned with one dates array."""
+        import numpy as np
+        from utils.ti_analyzer import get_ti_full_analysis, TI_SERIES_KEYS
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = sample_ohlcv_df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            result = get_ti_full_analysis(sample_ticker_kr, series=True)
+
+        series = result['series']
+        assert series['dates'].dtype == np.dtype('datetime64[D]')
+        assert len(series['dates']) == len(sample_ohlcv_df)
+        for key in TI_SERIES_KEYS:
+            assert series[key].dtype == np.float32
+            assert len(series[key]) == len(sample_ohlcv_df)
+        # last value matches the summary indicators
+        assert round(float(series['rsi'][-1]), 1) == result['indicators']['rsi']['value']
+        assert np.isnan(series['ma60'][0])
+
+    def test_indicators_contain_volume(self, sample_ticker_kr, sample_ohlcv_df):
+        """Volume analytics should be computed from the OHLCV volume column."""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = sample_ohlcv_df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            result = get_ti_full_analysis(sample_ticker_kr)
+
+        volume = result['indicators']['volume']
+        assert volume['signal'] == 'normal'
+        assert volume['obv_trend'] == '상승'
+        assert volume['rvol'] > 1
+        assert volume['vwap'] < sample_ohlcv_df['종가'].iloc[-1]
+
+    def test_sr_levels_populated(self, sample_ticker_kr, sample_ohlcv_df):
+        """sr_levels should carry the current price and both level lists."""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = sample_ohlcv_df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            result = get_ti_full_analysis(sample_ticker_kr)
+
+        levels = result['sr_levels']
+        assert levels['price'] == sample_ohlcv_df['종가'].iloc[-1]
+        assert isinstance(levels['support'], list)
+        assert isinstance(levels['resistance'], list)
+
+    def test_days_passed_to_ohlcv(self, sample_ticker_kr, sample_ohlcv_df):
+        """days should control the indicator window fetch (warm-up bars only in series mode)."""
+        from utils.ti_analyzer import get_ti_full_analysis, TI_WARMUP_DAYS
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = sample_ohlcv_df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            get_ti_full_analysis(sample_ticker_kr, days=120)
+            default_days = mock_ohlcv.call_args_list[-1].kwargs['days']
+            get_ti_full_analysis(sample_ticker_kr, series=True, days=120)
+
+        assert default_days == 120
+        assert mock_ohlcv.call_args_list[-1].kwargs['days'] == 120 + TI_WARMUP_DAYS
+
+    def test_series_trimmed_after_warmup(self, sample_ticker_kr):
+        """Series should cover the last `days` bars with ma60/MACD signal fully warmed up."""
+        import numpy as np
+        from utils.ti_analyzer import get_ti_full_analysis, TI_WARMUP_DAYS
+
+        bars = 60 + TI_WARMUP_DAYS
+        dates = pd.date_range(end=datetime.now(), periods=bars, freq='D')
+        df = pd.DataFrame({
+            '시가': np.linspace(50000, 60000, bars),
+            '고가': np.linspace(50500, 60500, bars),
+            '저가': np.linspace(49500, 59500, bars),
+            '종가': np.linspace(50200, 60200, bars),
+            '거래량': np.full(bars, 1000000.0),
+        }, index=dates)
+
+        with patch('utils.ti_analyzer.get_ohlcv') as mock_ohlcv, \
+             patch('utils.ti_analyzer.get_naver_stock_info') as mock_naver, \
+             patch('utils.ti_analyzer.get_ticker_name') as mock_name:
+            mock_ohlcv.return_value = df
+            mock_naver.return_value = None
+            mock_name.return_value = '삼성전자'
+
+            result = get_ti_full_analysis(sample_ticker_kr, series=True, days=60)
+
+        series = result['series']
+        assert len(series['dates']) == 60
+        assert not np.isnan(series['ma60']).any()
+        assert not np.isnan(series['macd_signal']).any()
+
+
+class TestTiSeriesSerialization:
+    """Tests for series frame conversion and Parquet round trip."""
+
+    def make_series(self):
+        import numpy as np
+        from utils.ti_analyzer import _build_ti_series, TI_SERIES_KEYS
+
+        dates = pd.date_range('2026-01-01', periods=5, freq='D')
+        return _build_ti_series(dates, {key: np.arange(5.0) for key in TI_SERIES_KEYS})
+
+    def test_frame_keeps_float32(self):
+        """Frame columns should stay float32 with a date index."""
+        import numpy as np
+        from utils.ti_analyzer import ti_series_to_frame
+
+        frame = ti_series_to_frame(self.make_series())
+
+        assert (frame.dtypes == np.float32).all()
+        assert frame.index[0] == pd.Timestamp('2026-01-01')
+
+    def test_parquet_round_trip(self, tmp_path):
+        """save_ti_series / load_ti_series should round trip."""
+        import numpy as np
+        pytest.importorskip('pyarrow')
+        from utils.ti_analyzer import save_ti_series, load_ti_series, TI_SERIES_KEYS
+
+        series = self.make_series()
+        save_ti_series(series, str(tmp_path / 'ti.parquet'))
+        loaded = load_ti_series(str(tmp_path / 'ti.parquet'))
+
+        assert (loaded['dates'] == series['dates']).all()
+        for key in TI_SERIES_KEYS:
+            assert loaded[key].dtype == np.float32
+            np.testing.assert_array_equal(loaded[key], series[key])
+
 
 class TestPrintTiReport:
     """Tests for print_ti_report function."""
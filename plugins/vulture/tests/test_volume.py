@@ -0,0 +1,180 @@
+"""거래량 / 유동성 지표 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.volume import (
+    relative_volume,
+    get_volume_signal,
+    obv,
+    vwap,
+    turnover,
+    liquidity_rank,
+    volume_at_price,
+    volume_poc,
+    volume_panels,
+)
+
+
+@pytest.fixture
+def panels():
+    """종목 3개, 60 영업일 (BIG 거래대금 최대, NEW는 앞 20일 상장 전)"""
+    dates = pd.bdate_range("2025-06-02", periods=60)
+    rng = np.random.default_rng(0)
+    close = pd.DataFrame({
+        "BIG": 50000 + rng.normal(0, 300, 60).cumsum(),
+        "SMALL": 3000 + rng.normal(0, 30, 60).cumsum(),
+        "NEW": 10000 + rng.normal(0, 100, 60).cumsum(),
+    }, index=dates)
+    volume = pd.DataFrame({
+        "BIG": rng.integers(1_000_000, 2_000_000, 60),
+        "SMALL": rng.integers(10_000, 20_000, 60),
+        "NEW": rng.integers(100_000, 200_000, 60),
+    }, index=dates).astype(float)
+    close.iloc[:20, 2] = np.nan
+    volume.iloc[:20, 2] = np.nan
+    return {"종가": close, "고가": close * 1.01, "저가": close * 0.99, "거래량": volume}
+
+
+class TestRelativeVolume:
+    """relative_volume / get_volume_signal 테스트"""
+
+    def test_excludes_current_bar(self):
+        """당일 거래량 / 직전 구간 평균"""
+        volume = pd.Series([100.0, 100, 100, 400])
+
+        assert relative_volume(volume, window=3).tolist()[-1] == pytest.approx(4.0)
+        assert relative_volume(volume, window=3).iloc[:3].isna().all()
+
+    def test_zero_baseline_is_nan(self):
+        """기준 평균 0이면 NaN"""
+        volume = pd.Series([0.0, 0, 10])
+
+        assert np.isnan(relative_volume(volume, window=2).iloc[-1])
+
+    def test_signal_thresholds(self):
+        """discussion_store 게시글 볼륨과 같은 기준"""
+        assert get_volume_signal(3.0) == "surge"
+        assert get_volume_signal(1.5) == "high"
+        assert get_volume_signal(0.5) == "normal"
+        assert get_volume_signal(0.49) == "low"
+        assert get_volume_signal(np.nan) is None
+
+
+class TestObvVwap:
+    """obv / vwap 테스트"""
+
+    def test_obv_accumulates_by_direction(self):
+        """상승 +거래량, 하락 -거래량, 보합 0"""
+        close = pd.Series([10.0, 11, 10, 10, 12])
+        volume = pd.Series([100.0, 200, 300, 400, 500])
+
+        assert obv(close, volume).tolist() == [0, 200, -100, -100, 400]
+
+    def test_obv_panel_matches_series(self, panels):
+        """패널 열별 결과 = 종목별 결과 (상장 전 NaN)"""
+        result = obv(panels["종가"], panels["거래량"])
+
+        expected = obv(panels["종가"]["BIG"], panels["거래량"]["BIG"])
+        pd.testing.assert_series_equal(result["BIG"], expected)
+        assert result["NEW"].iloc[:20].isna().all()
+        assert result["NEW"].iloc[20] == 0
+
+    def test_vwap_matches_naive(self, panels):
+        """rolling VWAP = 구간 (대표가 × 거래량) 합 / 거래량 합"""
+        high, low, close, volume = (panels[k]["BIG"] for k in ("고가", "저가", "종가", "거래량"))
+        result = vwap(high, low, close, volume, window=5)
+
+        typical = ((high + low + close) / 3).iloc[-5:]
+        expected = (typical * volume.iloc[-5:]).sum() / volume.iloc[-5:].sum()
+        assert result.iloc[-1] == pytest.approx(expected)
+        assert result.iloc[:4].isna().all()
+
+    def test_cumulative_vwap(self):
+        """window=None이면 전체 누적"""
+        price = pd.Series([10.0, 20.0])
+        volume = pd.Series([1.0, 3.0])
+
+        assert vwap(price, price, price, volume, window=None).tolist() == [10.0, 17.5]
+
+
+class TestLiquidity:
+    """turnover / liquidity_rank 테스트"""
+
+    def test_turnover_prefers_value_column(self, panels):
+        """거래대금 있으면 그대로, 없으면 종가 × 거래량"""
+        close, volume = panels["종가"], panels["거래량"]
+        value = close * volume * 1.001
+
+        assert turnover(close, volume, value) is value
+        pd.testing.assert_frame_equal(turnover(close, volume), close * volume)
+
+    def test_rank_percentile(self, panels):
+        """거래대금 최상위 100, 상장 전 NaN"""
+        rank = liquidity_rank(turnover(panels["종가"], panels["거래량"]))
+
+        assert rank["BIG"].iloc[-1] == 100
+        assert rank["SMALL"].iloc[-1] < rank["NEW"].iloc[-1]
+        assert rank["NEW"].iloc[:20].isna().all()
+
+
+class TestVolumeAtPrice:
+    """volume_at_price / volume_poc 테스트"""
+
+    def test_matches_numpy_histogram(self, panels):
+        """np.histogram(weights=거래량)과 동일"""
+        close, volume = panels["종가"]["BIG"], panels["거래량"]["BIG"]
+        profile = volume_at_price(close, volume, bins=10)
+
+        hist, edges = np.histogram(close, bins=10, weights=volume)
+        np.testing.assert_allclose(profile["volume"], hist)
+        np.testing.assert_allclose(profile["price_low"], edges[:-1])
+        assert profile["volume_pct"].sum() == pytest.approx(100)
+
+    def test_poc_at_heaviest_price(self):
+        """거래량이 몰린 가격대"""
+        close = pd.Series([100.0, 110, 120, 130, 140])
+        volume = pd.Series([1.0, 1, 50, 1, 1])
+
+        assert volume_poc(close, volume, bins=4) == pytest.approx(125)
+
+    def test_panel_matches_series(self, panels):
+        """패널 = 종목별, 상장 전 NaN 구간 제외"""
+        profiles = volume_at_price(panels["종가"], panels["거래량"], bins=10)
+        pocs = volume_poc(panels["종가"], panels["거래량"], bins=10)
+
+        for ticker in panels["종가"].columns:
+            close = panels["종가"][ticker].dropna()
+            volume = panels["거래량"][ticker].dropna()
+            expected = volume_at_price(close, volume, bins=10)
+            pd.testing.assert_frame_equal(profiles[ticker], expected)
+            assert pocs[ticker] == pytest.approx(volume_poc(close, volume, bins=10))
+
+    def test_lookback(self, panels):
+        """최근 N 봉만 집계"""
+        close, volume = panels["종가"]["SMALL"], panels["거래량"]["SMALL"]
+
+        profile = volume_at_price(close, volume, lookback=10)
+
+        assert profile["volume"].sum() == pytest.approx(volume.iloc[-10:].sum())
+
+
+class TestVolumePanels:
+    """volume_panels 테스트"""
+
+    def test_keys_and_shapes(self, panels):
+        """전 종목 동시 계산 결과"""
+        result = volume_panels(panels)
+
+        assert set(result) == {"volume", "rvol", "obv", "vwap", "turnover", "turnover_avg", "liquidity_pct"}
+        for panel in result.values():
+            assert panel.shape == panels["종가"].shape
+
+    def test_series_input_has_no_rank(self, panels):
+        """1종목 입력은 순위 없음"""
+        single = {key: panel["BIG"] for key, panel in panels.items()}
+
+        result = volume_panels(single)
+
+        assert "liquidity_pct" not in result
+        assert result["rvol"].iloc[-1] == pytest.approx(volume_panels(panels)["rvol"]["BIG"].iloc[-1])
@@ -4,6 +4,7 @@
 실제 네트워크 호출 없이 mock을 사용하여 테스트
 """
 import os
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -14,7 +15,11 @@ from utils.web_scraper import (
     get_naver_stock_news,
     get_naver_discussion,
     get_naver_stock_list,
+    iter_naver_discussion,
+    iter_naver_stock_news,
     clean_playwright_result,
+    clean_playwright_file,
+    _parse_post_date,
     _parse_number,
     _parse_float,
     _parse_market_cap,
@@ -360,6 +365,143 @@ class TestGetNaverStockList:
         assert result is None
 
 
+def make_board_page(page: int, posts_per_page: int = 3, last_page: int = 3) -> str:
+    """페이지 번호별 종목토론방 HTML 생성 (last_page 이후는 마지막 페이지 반복)"""
+    page = min(page, last_page)
+    rows = []
+    for i in range(posts_per_page):
+        nid = 1000 - (page - 1) * posts_per_page - i
+        day = 20 - (page - 1)
+        rows.append(
+            f'<tr><td class="title"><a href="/item/board_read.naver?nid={nid}&code=005930">'
+            f'글 {nid}</a></td><td><span class="tah">2026.01.{day:02d} 10:{i:02d}</span></td></tr>'
+        )
+    return f'<table class="type2">{"".join(rows)}</table>'
+
+
+def board_side_effect(last_page: int = 3):
+    """requests.get mock: URL의 page 파라미터에 따라 응답"""
+    def side_effect(url, **kwargs):
+        page = int(url.rsplit("page=", 1)[1])
+        response = Mock()
+        response.text = make_board_page(page, last_page=last_page)
+        response.raise_for_status = Mock()
+        return response
+    return side_effect
+
+
+class TestIterNaverDiscussion:
+    """iter_naver_discussion 함수 테스트"""
+
+    @patch("utils.web_scraper.requests.get")
+    def test_walks_pages_until_repeat(self, mock_get):
+        """마지막 페이지 반복 시 중단"""
+        mock_get.side_effect = board_side_effect(last_page=3)
+
+        posts = list(iter_naver_discussion("005930", prefetch=2))
+
+        assert len(posts) == 9
+        assert posts[0]["title"] == "글 1000"
+        assert posts[-1]["title"] == "글 992"
+
+    @patch("utils.web_scraper.requests.get")
+    def test_stops_at_max_posts(self, mock_get):
+        """max_posts 도달 시 중단"""
+        mock_get.side_effect = board_side_effect(last_page=10)
+
+        posts = list(iter_naver_discussion("005930", max_posts=4))
+
+        assert len(posts) == 4
+
+    @patch("utils.web_scraper.requests.get")
+    def test_stops_at_since_cutoff(self, mock_get):
+        """since 이전 글이 나오면 중단"""
+        mock_get.side_effect = board_side_effect(last_page=10)
+
+        posts = list(iter_naver_discussion("005930", since=datetime(2026, 1, 19)))
+
+        assert len(posts) == 6
+        assert all(p["date"] >= "2026.01.19" for p in posts)
+
+    @patch("utils.web_scraper.requests.get")
+    def test_is_lazy(self, mock_get):
+        """소비한 만큼만 (prefetch 포함) 요청"""
+        mock_get.side_effect = board_side_effect(last_page=50)
+
+        gen = iter_naver_discussion("005930", prefetch=2)
+        next(gen)
+        gen.close()
+
+        assert mock_get.call_count <= 3
+
+    @patch("utils.web_scraper.requests.get")
+    def test_raises_on_error(self, mock_get):
+        """요청 실패 시 예외 (마지막 페이지와 구분)"""
+        mock_get.side_effect = Exception("Network error")
+
+        with pytest.raises(Exception, match="Network error"):
+            list(iter_naver_discussion("005930"))
+
+    @patch("utils.web_scraper.requests.get")
+    def test_raises_after_yielding_fetched_pages(self, mock_get):
+        """중간 페이지 실패 시 앞 페이지 게시글을 yield 한 뒤 예외"""
+        pages_ok = board_side_effect(last_page=10)
+
+        def side_effect(url, **kwargs):
+            if url.endswith("page=2"):
+                raise ConnectionError("page 2 failed")
+            return pages_ok(url, **kwargs)
+        mock_get.side_effect = side_effect
+
+        posts = []
+        with pytest.raises(ConnectionError):
+            for post in iter_naver_discussion("005930", prefetch=1):
+                posts.append(post)
+
+        assert [p["title"] for p in posts] == ["글 1000", "글 999", "글 998"]
+
+
+class TestIterNaverStockNews:
+    """iter_naver_stock_news 함수 테스트"""
+
+    @patch("utils.web_scraper.requests.get")
+    def test_uses_news_url_with_page(self, mock_get):
+        """뉴스 URL + page 파라미터 사용"""
+        mock_response = Mock()
+        mock_response.text = load_fixture("naver_news_page.html")
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        posts = list(iter_naver_stock_news("005930", prefetch=1))
+
+        assert len(posts) == 5  # 2페이지가 1페이지와 같으면 중단
+        assert "news.naver" in mock_get.call_args_list[0][0][0]
+        assert "page=1" in mock_get.call_args_list[0][0][0]
+
+
+class TestParsePostDate:
+    """_parse_post_date 함수 테스트"""
+
+    def test_full_datetime(self):
+        assert _parse_post_date("2026.01.15 10:21") == datetime(2026, 1, 15, 10, 21)
+
+    def test_month_day_uses_current_year(self):
+        now = datetime(2026, 3, 1)
+        assert _parse_post_date("01/15 10:21", now) == datetime(2026, 1, 15, 10, 21)
+
+    def test_future_month_day_rolls_back_year(self):
+        now = datetime(2026, 1, 2)
+        assert _parse_post_date("12/31", now) == datetime(2025, 12, 31)
+
+    def test_time_only_is_today(self):
+        now = datetime(2026, 1, 2, 15, 0)
+        assert _parse_post_date("10:21", now) == datetime(2026, 1, 2, 10, 21)
+
+    def test_invalid_returns_none(self):
+        assert _parse_post_date("어제") is None
+        assert _parse_post_date("") is None
+
+
 class TestCleanPlaywrightResult:
     """clean_playwright_result 함수 테스트"""
 
@@ -409,6 +551,67 @@ class TestCleanPlaywrightResult:
         result = clean_playwright_result("test")
         assert isinstance(result, str)
 
+    def test_prune_drops_nav_and_footer_subtrees(self):
+        """prune=True면 navigation/contentinfo 하위 트리 제거"""
+        text = (
+            '- navigation "메뉴" [ref=e1]:\n'
+            '  - link "홈" [ref=e2]\n'
+            '  - link "증권" [ref=e3]\n'
+            '- main [ref=e4]:\n'
+            '  - table [ref=e5]:\n'
+            '    - row "삼성전자 55,000" [ref=e6]\n'
+            '  - contentinfo [ref=e7]:\n'
+            '    - text: Copyright\n'
+            '  - link "맨위로" [ref=e8]'
+        )
+        result = clean_playwright_result(text, prune=True)
+
+        assert "홈" not in result
+        assert "Copyright" not in result
+        assert "삼성전자 55,000" in result
+        assert "맨위로" in result
+
+    def test_prune_disabled_by_default(self):
+        """기본값은 구조 유지"""
+        text = '- navigation [ref=e1]:\n  - link "홈" [ref=e2]'
+        assert "홈" in clean_playwright_result(text)
+
+
+class TestCleanPlaywrightFile:
+    """clean_playwright_file 함수 테스트"""
+
+    SNAPSHOT = (
+        '  - link "뉴스 1" [ref=e1] [cursor=pointer]:\n'
+        '\n'
+        '    - /url: /news/1 [ref=e2]\n'
+        '   \n'
+        '[ref=e3]\n'
+        '  - link "뉴스 2" [ref=e4]\n'
+    ) * 50
+
+    @pytest.mark.parametrize("chunk_size", [16, 100, 1 << 20])
+    def test_matches_in_memory_result(self, tmp_path, chunk_size):
+        """조각 크기와 무관하게 clean_playwright_result와 동일"""
+        src = tmp_path / "snapshot.txt"
+        dst = tmp_path / "clean.txt"
+        src.write_text(self.SNAPSHOT, encoding="utf-8")
+
+        stats = clean_playwright_file(str(src), str(dst), chunk_size=chunk_size)
+
+        assert dst.read_text(encoding="utf-8") == clean_playwright_result(self.SNAPSHOT)
+        assert stats["output_bytes"] < stats["input_bytes"]
+
+    def test_prune_matches_in_memory_result(self, tmp_path):
+        """prune 옵션도 동일 결과"""
+        text = '- navigation [ref=e1]:\n  - link "홈"\n- main:\n  - text: 본문\n' * 20
+        src = tmp_path / "snapshot.txt"
+        dst = tmp_path / "clean.txt"
+        src.write_text(text, encoding="utf-8")
+
+        clean_playwright_file(str(src), str(dst), prune=True, chunk_size=32)
+
+        assert dst.read_text(encoding="utf-8") == clean_playwright_result(text, prune=True)
+
     def test_handles_empty_string(self):
         """빈 문자열 처리"""
         result = clean_playwright_result("")
@@ -5,10 +5,13 @@ pykrx 기반 데이터 조회 및 기술지표 유틸리티
 """
 from utils.data_fetcher import (
     get_ohlcv,
+    get_index_ohlcv,
     get_ticker_name,
     get_ticker_list,
     get_fundamental,
+    get_market_fundamentals,
     get_market_cap,
+    get_source_status,
 )
 from utils.deprecated import (
     get_investor_trading,
@@ -22,18 +25,92 @@ from utils.indicators import (
     bollinger,
     stochastic,
     support_resistance,
+    swing_points,
+    support_resistance_levels,
 )
 from utils.web_scraper import (
     get_naver_stock_info,
     get_naver_stock_news,
     get_naver_discussion,
+    iter_naver_discussion,
+    iter_naver_stock_news,
     clean_playwright_result,
+    clean_playwright_file,
+)
+from utils.snapshot_parser import (
+    parse_snapshot_tables,
+    parse_naver_discussion_snapshot,
+    parse_fnguide_ratio_snapshot,
+)
+from utils.discussion_store import (
+    sync_naver_discussion,
+    load_discussion_posts,
+    get_discussion_volume,
+    get_discussion_volume_signal,
+)
+from utils.sentiment import (
+    score_titles,
+    summarize_sentiment,
 )
 from utils.ti_analyzer import (
     get_ti_full_analysis,
     print_ti_report,
     get_rsi_signal,
     get_ma_alignment,
+    ti_series_to_frame,
+    save_ti_series,
+    load_ti_series,
+)
+from utils.ohlcv_store import (
+    update_ohlcv_store,
+    load_ohlcv_panel,
+    load_ohlcv_panels,
+)
+from utils.screener import (
+    screen,
+    compute_signal_panels,
+    rsi_signal,
+    stochastic_signal,
+    rsi_between,
+    ma_alignment,
+    macd_trend,
+    macd_cross,
+    bollinger_position,
+    week52_position,
+    volume_surge,
+    liquidity,
+)
+from utils.volume import (
+    relative_volume,
+    get_volume_signal,
+    obv,
+    vwap,
+    turnover,
+    liquidity_rank,
+    volume_histogram,
+    volume_at_price,
+    volume_poc,
+    volume_panels,
+)
+from utils.correlation import (
+    analyze_correlation,
+    correlation_matrix,
+    update_correlation_cache,
+    beta,
+    rolling_beta,
+    cluster_tickers,
+)
+from utils.basket import (
+    load_basket,
+    analyze_basket,
+    print_basket_report,
+)
+from utils.backtest import backtest_signals
+from utils.events import (
+    detect_events,
+    macd_crosses,
+    stochastic_crosses,
+    rsi_divergences,
 )
 from utils.financial_scraper import (
     get_financial_data,
@@ -47,10 +124,13 @@ from utils.financial_scraper import (
 __all__ = [
     # data_fetcher
     'get_ohlcv',
+    'get_index_ohlcv',
     'get_ticker_name',
     'get_ticker_list',
     'get_fundamental',
+    'get_market_fundamentals',
     'get_market_cap',
+    'get_source_status',
     'get_investor_trading',
     'get_short_selling',
     # indicators
@@ -61,16 +141,82 @@ __all__ = [
     'bollinger',
     'stochastic',
     'support_resistance',
+    'swing_points',
+    'support_resistance_levels',
     # web_scraper
     'get_naver_stock_info',
     'get_naver_stock_news',
     'get_naver_discussion',
+    'iter_naver_discussion',
+    'iter_naver_stock_news',
     'clean_playwright_result',
+    'clean_playwright_file',
+    # snapshot_parser
+    'parse_snapshot_tables',
+    'parse_naver_discussion_snapshot',
+    'parse_fnguide_ratio_snapshot',
+    # discussion_store
+    'sync_naver_discussion',
+    'load_discussion_posts',
+    'get_discussion_volume',
+    'get_discussion_volume_signal',
+    # sentiment
+    'score_titles',
+    'summarize_sentiment',
     # ti_analyzer
     'get_ti_full_analysis',
     'print_ti_report',
     'get_rsi_signal',
     'get_ma_alignment',
+    'ti_series_to_frame',
+    'save_ti_series',
+    'load_ti_series',
+    # ohlcv_store
+    'update_ohlcv_store',
+    'load_ohlcv_panel',
+    'load_ohlcv_panels',
+    # screener
+    'screen',
+    'compute_signal_panels',
+    'rsi_signal',
+    'stochastic_signal',
+    'rsi_between',
+    'ma_alignment',
+    'macd_trend',
+    'macd_cross',
+    'bollinger_position',
+    'week52_position',
+    'volume_surge',
+    'liquidity',
+    # volume
+    'relative_volume',
+    'get_volume_signal',
+    'obv',
+    'vwap',
+    'turnover',
+    'liquidity_rank',
+    'volume_histogram',
+    'volume_at_price',
+    'volume_poc',
+    'volume_panels',
+    # correlation
+    'analyze_correlation',
+    'correlation_matrix',
+    'update_correlation_cache',
+    'beta',
+    'rolling_beta',
+    'cluster_tickers',
+    # basket
+    'load_basket',
+    'analyze_basket',
+    'print_basket_report',
+    # backtest
+    'backtest_signals',
+    # events
+    'detect_events',
+    'macd_crosses',
+    'stochastic_crosses',
+    'rsi_divergences',
     # financial_scraper
     'get_financial_data',
     'get_fnguide_financial',
@@ -0,0 +1,291 @@
+"""비동기(asyncio) 스크래핑 API
+
+web_scraper / financial_scraper 스크래핑 함수의 async 버전
+- httpx.AsyncClient 하나를 공유하여 커넥션 풀 재사용
+- HTML 파싱(BeautifulSoup)은 asyncio.to_thread로 워커 스레드에서 처리
+- 반환 형식/실패 시 None 반환은 동기 함수와 동일
+- client 미지정 시 이벤트 루프별 공유 client 사용 (종료 시 aclose_shared_client)
+
+사용 예:
+    async with create_client() as client:
+        infos = await asyncio.gather(
+            *(get_naver_stock_info(t, client=client) for t in tickers)
+        )
+
+    # client 생략
+    infos = await asyncio.gather(*(get_naver_stock_info(t) for t in tickers))
+    await aclose_shared_client()
+"""
+import asyncio
+from typing import Optional
+
+import httpx
+
+from utils.web_scraper import (
+    NAVER_HEADERS,
+    NAVER_STOCK_INFO_URL,
+    NAVER_NEWS_URL,
+    NAVER_DISCUSSION_URL,
+    NAVER_STOCK_LIST_MAX_PAGES,
+    _naver_stock_list_url,
+    _parse_naver_stock_info,
+    _parse_naver_news,
+    _parse_naver_discussion,
+    _parse_naver_stock_list_page,
+)
+from utils.financial_scraper import (
+    FNGUIDE_URL,
+    FNGUIDE_HEADERS,
+    _parse_fnguide_statements,
+    _build_fnguide_financial,
+    _parse_fnguide_snapshot,
+)
+
+# 종목 리스트 페이지를 한 번에 요청하는 개수
+STOCK_LIST_PAGE_BATCH = 10
+
+# client 미지정 호출용 공유 client (생성한 이벤트 루프에서만 재사용)
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_client(max_connections: int = 100) -> httpx.AsyncClient:
+    """
+    공유용 AsyncClient 생성
+
+    Args:
+        max_connections: 커넥션 풀 최대 크기 (초과 요청은 풀에서 대기)
+
+    Returns:
+        httpx.AsyncClient (async with 로 사용)
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        # pool=None: 수백 개 동시 요청 시 풀 대기로 실패하지 않도록
+        timeout=httpx.Timeout(15.0, pool=None),
+        follow_redirects=True,
+    )
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    client 미지정 호출이 함께 쓰는 AsyncClient
+
+    처음 호출 시 생성하고, 닫혔거나 다른 이벤트 루프(asyncio.run 재호출)면
+    새로 생성 (커넥션은 생성한 루프에 묶여 있음)
+
+    Returns:
+        httpx.AsyncClient (호출자가 닫지 않음, aclose_shared_client 사용)
+    """
+    global _shared_client, _shared_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = create_client()
+        _shared_loop = loop
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    """공유 client 종료 (다음 get_shared_client 호출 시 다시 생성)"""
+    global _shared_client, _shared_loop
+
+    client, _shared_client, _shared_loop = _shared_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def _get_text(
+    client: Optional[httpx.AsyncClient],
+    url: str,
+    headers: dict,
+    timeout: float
+) -> str:
+    """GET 요청 후 본문 반환 (client 미지정 시 공유 client 사용)"""
+    if client is None:
+        client = get_shared_client()
+
+    response = await client.get(url, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+async def get_naver_stock_info(
+    ticker: str,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[dict]:
+    """
+    네이버 금융 종목 정보 (web_scraper.get_naver_stock_info async 버전)
+
+    Args:
+        ticker: 종목코드
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        get_naver_stock_info와 동일 or None (실패 시)
+    """
+    try:
+        url = NAVER_STOCK_INFO_URL.format(ticker=ticker)
+        html = await _get_text(client, url, NAVER_HEADERS, 10)
+        return await asyncio.to_thread(_parse_naver_stock_info, html)
+    except Exception:
+        return None
+
+
+async def get_naver_stock_news(
+    ticker: str,
+    limit: int = 5,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[list]:
+    """
+    네이버 금융 종목 뉴스 (web_scraper.get_naver_stock_news async 버전)
+
+    Args:
+        ticker: 종목코드
+        limit: 최대 뉴스 개수
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        get_naver_stock_news와 동일 or None (실패 시)
+    """
+    try:
+        url = NAVER_NEWS_URL.format(ticker=ticker)
+        html = await _get_text(client, url, NAVER_HEADERS, 10)
+        return await asyncio.to_thread(_parse_naver_news, html, limit)
+    except Exception:
+        return None
+
+
+async def get_naver_discussion(
+    ticker: str,
+    limit: int = 10,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[list]:
+    """
+    네이버 종목토론방 (web_scraper.get_naver_discussion async 버전)
+
+    Args:
+        ticker: 종목코드
+        limit: 최대 게시글 개수
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        get_naver_discussion과 동일 or None (실패 시)
+    """
+    try:
+        url = NAVER_DISCUSSION_URL.format(ticker=ticker)
+        html = await _get_text(client, url, NAVER_HEADERS, 10)
+        return await asyncio.to_thread(_parse_naver_discussion, html, limit)
+    except Exception:
+        return None
+
+
+async def get_naver_stock_list(
+    market: str = "KOSPI",
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[list]:
+    """
+    네이버 금융 종목 리스트 (web_scraper.get_naver_stock_list async 버전)
+
+    페이지를 STOCK_LIST_PAGE_BATCH 개씩 동시에 요청하고
+    빈 페이지가 나오면 중단
+
+    Args:
+        market: "KOSPI" 또는 "KOSDAQ"
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        [{"code": "005930", "name": "삼성전자"}, ...] or None
+    """
+    if client is None:
+        client = get_shared_client()
+
+    url = _naver_stock_list_url(market)
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+
+    async def fetch_page(page: int) -> list:
+        html = await _get_text(client, f"{url}&page={page}", headers, 10)
+        return await asyncio.to_thread(_parse_naver_stock_list_page, html)
+
+    try:
+        all_stocks = []
+        for batch_start in range(1, NAVER_STOCK_LIST_MAX_PAGES, STOCK_LIST_PAGE_BATCH):
+            batch_end = min(batch_start + STOCK_LIST_PAGE_BATCH, NAVER_STOCK_LIST_MAX_PAGES)
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(batch_start, batch_end))
+            )
+            for page_stocks in pages:
+                if not page_stocks:
+                    return all_stocks if all_stocks else None
+                all_stocks.extend(page_stocks)
+
+        return all_stocks if all_stocks else None
+    except Exception:
+        return None
+
+
+async def get_fnguide_snapshot_ratios(
+    ticker: str,
+    retry: int = 1,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[dict]:
+    """
+    FnGuide Snapshot ROE/ROA/EV/EBITDA (financial_scraper.get_fnguide_snapshot_ratios async 버전)
+
+    Args:
+        ticker: 종목코드
+        retry: 실패 시 재시도 횟수
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        get_fnguide_snapshot_ratios와 동일 or None (실패 시)
+    """
+    url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Main.asp?pGB=1&gicode=A{ticker}&cID=&MenuYn=Y"
+
+    for attempt in range(retry + 1):
+        try:
+            html = await _get_text(client, url, FNGUIDE_HEADERS, 15)
+            return await asyncio.to_thread(_parse_fnguide_snapshot, html, ticker)
+        except Exception:
+            if attempt < retry:
+                await asyncio.sleep(1)
+                continue
+            return None
+
+    return None
+
+
+async def get_fnguide_financial(
+    ticker: str,
+    retry: int = 2,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[dict]:
+    """
+    FnGuide 재무제표 (financial_scraper.get_fnguide_financial async 버전)
+
+    Args:
+        ticker: 종목코드
+        retry: 실패 시 재시도 횟수
+        client: AsyncClient (None이면 get_shared_client)
+
+    Returns:
+        get_fnguide_financial과 동일 or None (실패 시)
+    """
+    url = f"{FNGUIDE_URL}?pGB=1&gicode=A{ticker}"
+
+    for attempt in range(retry + 1):
+        try:
+            html = await _get_text(client, url, FNGUIDE_HEADERS, 15)
+            statements = await asyncio.to_thread(_parse_fnguide_statements, html)
+            fnguide_ratios = await get_fnguide_snapshot_ratios(ticker, retry=1, client=client)
+            return _build_fnguide_financial(statements, ticker, fnguide_ratios)
+        except Exception:
+            if attempt < retry:
+                await asyncio.sleep(1)
+                continue
+            return None
+
+    return None
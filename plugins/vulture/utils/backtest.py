@@ -0,0 +1,164 @@
+"""TI 신호 벡터화 백테스트
+
+get_ti_full_analysis가 출력하는 신호(RSI / MACD / 스토캐스틱 / 이동평균 배열)를
+OHLCV 저장소 전 종목·전 기간에 대해 한 번에 재현하고,
+신호별 적중률 / 선행 수익률 / 낙폭을 집계 (일별·종목별 Python 루프 없음)
+
+- 신호 판단: screener.compute_signal_panels + Condition (ti_analyzer와 같은 기준)
+- 선행 수익률: 신호일 종가 → h 영업일 후 종가
+- 적중: 기대 방향(매수 신호=상승, 매도 신호=하락)으로 움직인 비율
+- 낙폭: h 영업일 동안 기대 방향 반대로 가장 크게 움직인 폭 (종가 기준)
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.ohlcv_store import load_ohlcv_panels
+from utils.screener import (
+    compute_signal_panels,
+    rsi_signal,
+    stochastic_signal,
+    macd_trend,
+    ma_alignment,
+)
+
+DEFAULT_HORIZONS = (5, 20, 60)
+
+# 신호 이름 → (조건, 기대 방향: 1=상승, -1=하락)
+TI_SIGNALS = {
+    "RSI 과매도": (rsi_signal("과매도"), 1),
+    "RSI 과매수": (rsi_signal("과매수"), -1),
+    "MACD 상승": (macd_trend("상승"), 1),
+    "MACD 하락": (macd_trend("하락"), -1),
+    "스토캐스틱 과매도": (stochastic_signal("과매도"), 1),
+    "스토캐스틱 과매수": (stochastic_signal("과매수"), -1),
+    "완전 정배열": (ma_alignment("완전 정배열"), 1),
+    "완전 역배열": (ma_alignment("완전 역배열"), -1),
+}
+
+
+def _forward_windows(close: pd.DataFrame, horizon: int) -> tuple:
+    """(h일 후 수익률, t+1~t+h 최저 종가 수익률, 최고 종가 수익률) 행렬 - 기간 부족 시 NaN"""
+    future = close.iloc[::-1]
+    future_min = future.rolling(horizon, min_periods=horizon).min().iloc[::-1].shift(-1)
+    future_max = future.rolling(horizon, min_periods=horizon).max().iloc[::-1].shift(-1)
+    forward = close.shift(-horizon) / close - 1
+    return (
+        forward.to_numpy(),
+        (future_min / close - 1).to_numpy(),
+        (future_max / close - 1).to_numpy(),
+    )
+
+
+def _stats(returns: np.ndarray, lows: np.ndarray, highs: np.ndarray, direction: int) -> dict:
+    """표본 선행 수익률 → 집계"""
+    if returns.size == 0:
+        return {
+            "samples": 0,
+            "mean_return_pct": None,
+            "median_return_pct": None,
+            "hit_rate_pct": None,
+            "max_drawdown_pct": None,
+        }
+    # 기대 방향 기준 최대 역행 폭 (매수=최저 종가, 매도=최고 종가)
+    drawdown = lows if direction > 0 else -highs
+    return {
+        "samples": int(returns.size),
+        "mean_return_pct": round(float(returns.mean()) * 100, 2),
+        "median_return_pct": round(float(np.median(returns)) * 100, 2),
+        "hit_rate_pct": round(float((returns * direction > 0).mean()) * 100, 1),
+        "max_drawdown_pct": round(float(np.minimum(drawdown, 0).mean()) * 100, 2),
+    }
+
+
+def backtest_signals(
+    conditions: Optional[dict] = None,
+    horizons: tuple = DEFAULT_HORIZONS,
+    mode: str = "entry",
+    signals: Optional[dict] = None,
+    days: Optional[int] = None,
+    store_dir: Optional[str] = None
+) -> Optional[dict]:
+    """
+    TI 신호 백테스트 (전 종목 동시)
+
+    Args:
+        conditions: {이름: Condition 또는 (Condition, 기대 방향)} (None=TI_SIGNALS)
+        horizons: 선행 수익률 기간 (영업일)
+        mode: "entry"=신호가 새로 켜진 날만 표본, "state"=신호가 켜져 있는 모든 날
+        signals: compute_signal_panels 결과 재사용 (None이면 저장소에서 로드)
+        days: 저장소에서 최근 N 영업일만 사용 (None=전체)
+        store_dir: OHLCV 저장소 디렉토리
+
+    Returns:
+        {
+            "period": {"start": "2024-01-02", "end": "2026-01-15"},
+            "tickers": 2450,
+            "mode": "entry",
+            "baseline": {"5": {...}, "20": {...}},   # 모든 종목·일자 (매수 기준)
+            "signals": {
+                "RSI 과매도": {
+                    "direction": 1,
+                    "horizons": {
+                        "5": {
+                            "samples": 1820,
+                            "mean_return_pct": 1.12,
+                            "median_return_pct": 0.64,
+                            "hit_rate_pct": 54.3,
+                            "max_drawdown_pct": -3.8
+                        },
+                        ...
+                    }
+                },
+                ...
+            }
+        }
+        or None (저장소 비어 있음)
+    """
+    if mode not in ("entry", "state"):
+        raise ValueError(f"unknown mode: {mode}")
+
+    if signals is None:
+        panels = load_ohlcv_panels(("고가", "저가", "종가"), days=days, store_dir=store_dir)
+        if "종가" not in panels:
+            return None
+        signals = compute_signal_panels(panels)
+
+    if conditions is None:
+        conditions = TI_SIGNALS
+
+    close = signals["close"]
+    windows = {h: _forward_windows(close, h) for h in horizons}
+    valid = close.notna().to_numpy()
+
+    result = {
+        "period": {
+            "start": close.index[0].strftime("%Y-%m-%d"),
+            "end": close.index[-1].strftime("%Y-%m-%d"),
+        },
+        "tickers": int(close.shape[1]),
+        "mode": mode,
+        "baseline": {},
+        "signals": {},
+    }
+
+    for h, (forward, lows, highs) in windows.items():
+        sample = valid & ~np.isnan(forward)
+        result["baseline"][str(h)] = _stats(forward[sample], lows[sample], highs[sample], 1)
+
+    for name, spec in conditions.items():
+        condition, direction = spec if isinstance(spec, tuple) else (spec, 1)
+        mask = condition(signals)
+        if mode == "entry":
+            # 전일 꺼져 있다가 켜진 날
+            mask = mask & ~mask.shift(1, fill_value=False)
+        mask = mask.to_numpy() & valid
+
+        horizon_stats = {}
+        for h, (forward, lows, highs) in windows.items():
+            sample = mask & ~np.isnan(forward)
+            horizon_stats[str(h)] = _stats(forward[sample], lows[sample], highs[sample], direction)
+        result["signals"][name] = {"direction": direction, "horizons": horizon_stats}
+
+    return result
@@ -0,0 +1,367 @@
+"""워치리스트 폴더 바스켓 분석
+
+워치리스트/분류 폴더(예: watchlist/stocks/스테이블코인, temp_horus/upvote)의 종목을
+하나의 바스켓으로 보고 수익률 / 변동성 / 낙폭 / 가중 밸류에이션을 계산
+
+- 종목 목록: 폴더 안 {종목명}_{종목코드}.md 파일 또는 {종목명}_{종목코드}/ 디렉토리
+- OHLCV: 스레드 풀로 동시 조회 (pykrx 동기 API)
+- 시가총액/PER/PBR: pykrx 시장 전체 표 1회 조회, 빠진 종목만 네이버 async 동시 조회
+- 이벤트 루프 안(async 오케스트레이터)에서는 afetch_basket_data 사용
+"""
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.correlation import CLUSTER_THRESHOLD, correlation_matrix, cluster_tickers
+from utils.data_fetcher import get_ohlcv, get_market_fundamentals
+
+# "{종목명}_{종목코드}" (종목명에 "_" 포함 가능, 종목코드는 KRX 6자리 - 예: 005930, 0015S0)
+WATCHLIST_ENTRY_RE = re.compile(r'^(?P<name>.+)_(?P<ticker>\d[0-9A-Z]{5})(?:\.md)?$')
+
+# 연율화 영업일 수
+TRADING_DAYS = 252
+# 기본 분석 기간 (영업일, 약 1년)
+BASKET_HISTORY_DAYS = 250
+
+
+def load_basket(path: str, recursive: bool = False) -> list:
+    """
+    워치리스트 폴더 → 종목 목록
+
+    Args:
+        path: 폴더 경로 (예: "watchlist/stocks/스테이블코인")
+        recursive: True면 하위 폴더 종목도 포함 ({종목명}_{종목코드}/ 디렉토리 내부는 제외)
+
+    Returns:
+        [{"ticker": "064260", "name": "다날", "path": ".../다날_064260.md"}, ...]
+        (종목코드 중복 제거, 파일명 순 / 해외 종목 등 형식이 다른 항목은 제외)
+    """
+    root = Path(path)
+    if not root.is_dir():
+        return []
+
+    entries = []
+    seen = set()
+    pending = [root]
+    while pending:
+        folder = pending.pop(0)
+        for child in sorted(folder.iterdir()):
+            match = WATCHLIST_ENTRY_RE.match(child.name)
+            if match and (child.is_dir() or child.suffix == ".md"):
+                if match["ticker"] not in seen:
+                    seen.add(match["ticker"])
+                    entries.append({"ticker": match["ticker"], "name": match["name"], "path": str(child)})
+            elif recursive and child.is_dir():
+                pending.append(child)
+    return entries
+
+
+async def _naver_fundamentals(tickers: list) -> dict:
+    """네이버 종목 정보 동시 조회 → {ticker: {"market_cap", "PER", "PBR"}} (실패 종목 제외)"""
+    from utils import aio  # httpx 필요 (pykrx 일괄 조회에서 빠진 종목이 있을 때만)
+
+    async with aio.create_client() as client:
+        infos = await asyncio.gather(*(aio.get_naver_stock_info(t, client=client) for t in tickers))
+    return {
+        ticker: {"market_cap": info.get("market_cap"), "PER": info.get("per"), "PBR": info.get("pbr")}
+        for ticker, info in zip(tickers, infos)
+        if info
+    }
+
+
+def _run_coroutine(coro):
+    """동기 코드에서 코루틴 실행 (이벤트 루프 실행 중이면 별도 스레드의 새 루프에서)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _fetch_closes(tickers: list, days: int, max_workers: int) -> tuple:
+    """OHLCV 동시 조회 → (날짜 × 종목 종가, 실패 종목)"""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        frames = list(pool.map(lambda t: get_ohlcv(t, days=days), tickers))
+
+    closes = {t: df["종가"] for t, df in zip(tickers, frames) if df is not None and not df.empty}
+    failed = [t for t in tickers if t not in closes]
+    close = pd.concat(closes, axis=1).sort_index() if closes else pd.DataFrame()
+    return close, failed
+
+
+def _market_fundamentals(tickers: list) -> tuple:
+    """pykrx 시장 전체 표 → (종목별 시가총액/PER/PBR, 표에 없는 종목)"""
+    market = get_market_fundamentals() or {}
+    fundamentals = {t: market[t] for t in tickers if t in market}
+    missing = [t for t in tickers if t not in fundamentals]
+    return fundamentals, missing
+
+
+def fetch_basket_data(
+    tickers: Iterable[str],
+    days: int = BASKET_HISTORY_DAYS,
+    max_workers: int = 8
+) -> dict:
+    """
+    바스켓 종목 OHLCV + 시가총액/PER/PBR 일괄 조회
+
+    실행 중인 이벤트 루프 안에서 호출되면 네이버 조회를 별도 스레드에서 실행
+    (루프를 막지 않으려면 afetch_basket_data를 await)
+
+    Args:
+        tickers: 종목코드 목록
+        days: OHLCV 조회 일수 (영업일)
+        max_workers: OHLCV 동시 조회 스레드 수
+
+    Returns:
+        {
+            "close": DataFrame (날짜 × 종목 종가),
+            "fundamentals": {"064260": {"market_cap": 12345, "PER": 15.2, "PBR": 1.8}, ...},
+            "failed": ["123456"]    # OHLCV 조회 실패 종목
+        }
+    """
+    tickers = list(tickers)
+    close, failed = _fetch_closes(tickers, days, max_workers)
+    fundamentals, missing = _market_fundamentals(tickers)
+    if missing:
+        fundamentals.update(_run_coroutine(_naver_fundamentals(missing)))
+
+    return {"close": close, "fundamentals": fundamentals, "failed": failed}
+
+
+async def afetch_basket_data(
+    tickers: Iterable[str],
+    days: int = BASKET_HISTORY_DAYS,
+    max_workers: int = 8
+) -> dict:
+    """
+    fetch_basket_data의 async 버전 (pykrx 동기 조회는 워커 스레드, 네이버 조회는 현재 루프)
+
+    Returns:
+        fetch_basket_data와 동일
+    """
+    tickers = list(tickers)
+    close, failed = await asyncio.to_thread(_fetch_closes, tickers, days, max_workers)
+    fundamentals, missing = await asyncio.to_thread(_market_fundamentals, tickers)
+    if missing:
+        fundamentals.update(await _naver_fundamentals(missing))
+
+    return {"close": close, "fundamentals": fundamentals, "failed": failed}
+
+
+def _series_stats(returns: pd.Series) -> dict:
+    """일간 수익률 → 누적 수익률 / 연율 변동성 / 최대 낙폭"""
+    returns = returns.dropna()
+    if returns.empty:
+        return {"return_pct": None, "volatility_pct": None, "max_drawdown_pct": None}
+    level = (1 + returns).cumprod()
+    drawdown = level / level.cummax() - 1
+    return {
+        "return_pct": round(float(level.iloc[-1] - 1) * 100, 2),
+        "volatility_pct": round(float(returns.std() * np.sqrt(TRADING_DAYS)) * 100, 2),
+        "max_drawdown_pct": round(float(drawdown.min()) * 100, 2),
+    }
+
+
+def basket_returns(close: pd.DataFrame, market_caps: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    바스켓 일간 수익률
+
+    Args:
+        close: 날짜 × 종목 종가
+        market_caps: 종목별 시가총액 (시가총액 가중용, 현재 시가총액 고정 비중)
+
+    Returns:
+        DataFrame (index=날짜)
+            equal_weight: 동일 가중 (매일 재조정, 값이 있는 종목 평균)
+            cap_weighted: 시가총액 가중 (market_caps 있을 때, 값이 있는 종목끼리 비중 재정규화)
+    """
+    returns = close.pct_change(fill_method=None).iloc[1:]
+    result = pd.DataFrame({"equal_weight": returns.mean(axis=1)}, index=returns.index)
+    if market_caps is not None:
+        weights = market_caps.reindex(returns.columns).fillna(0).astype(float)
+        present = returns.notna()
+        total = present.mul(weights, axis=1).sum(axis=1)
+        result["cap_weighted"] = returns.fillna(0).mul(weights, axis=1).sum(axis=1) / total.where(total > 0)
+    return result
+
+
+def basket_valuation(fundamentals: dict) -> dict:
+    """
+    바스켓 가중 밸류에이션
+
+    시가총액 가중 PER/PBR은 바스켓 전체 시가총액 / 전체 순이익(순자산)으로 계산
+    (= 시가총액 가중 조화평균, 적자·자본잠식(PER/PBR <= 0) 종목은 제외)
+
+    Returns:
+        {
+            "market_cap": 152340,         # 합계 (억)
+            "weighted_per": 18.4,
+            "weighted_pbr": 1.9,
+            "median_per": 21.0,           # 동일 가중 (중앙값)
+            "median_pbr": 1.6,
+            "per_excluded": 2             # 적자 / PER 없음으로 제외된 종목 수
+        }
+    """
+    frame = pd.DataFrame.from_dict(fundamentals, orient="index", columns=["market_cap", "PER", "PBR"])
+    frame = frame.apply(pd.to_numeric, errors="coerce")
+    caps = frame["market_cap"]
+
+    def weighted(col):
+        ok = (frame[col] > 0) & (caps > 0)
+        if not ok.any():
+            return None
+        return round(float(caps[ok].sum() / (caps[ok] / frame.loc[ok, col]).sum()), 2)
+
+    def median(col):
+        values = frame.loc[frame[col] > 0, col]
+        return round(float(values.median()), 2) if not values.empty else None
+
+    return {
+        "market_cap": int(caps.sum()) if caps.notna().any() else None,
+        "weighted_per": weighted("PER"),
+        "weighted_pbr": weighted("PBR"),
+        "median_per": median("PER"),
+        "median_pbr": median("PBR"),
+        "per_excluded": int((~(frame["PER"] > 0)).sum()),
+    }
+
+
+def analyze_basket(
+    path: str,
+    days: int = BASKET_HISTORY_DAYS,
+    recursive: bool = False,
+    max_workers: int = 8
+) -> Optional[dict]:
+    """
+    워치리스트 폴더 바스켓 분석
+
+    Args:
+        path: 워치리스트 폴더 (예: "watchlist/stocks/스테이블코인", "temp_horus/upvote")
+        days: 분석 기간 (영업일)
+        recursive: 하위 폴더 종목 포함 여부
+        max_workers: OHLCV 동시 조회 스레드 수
+
+    Returns:
+        {
+            "basket": "스테이블코인",
+            "period": {"start", "end", "days"},
+            "tickers": [
+                {"ticker", "name", "market_cap", "per", "pbr", "weight_pct", "return_pct", "volatility_pct", "max_drawdown_pct"},
+                ...
+            ],
+            "equal_weight": {"return_pct", "volatility_pct", "max_drawdown_pct"},
+            "cap_weighted": {...} or None,
+            "valuation": basket_valuation 결과,
+            "clusters": cluster_tickers 결과 (수익률 상관 군집),
+            "failed": ["123456"]
+        }
+        or None (종목 없음 / OHLCV 전부 실패)
+    """
+    entries = load_basket(path, recursive=recursive)
+    if not entries:
+        return None
+
+    data = fetch_basket_data([e["ticker"] for e in entries], days=days, max_workers=max_workers)
+    close = data["close"]
+    if close.empty:
+        return None
+
+    fundamentals = data["fundamentals"]
+    caps = pd.Series({t: f.get("market_cap") for t, f in fundamentals.items()}, dtype=float).dropna()
+    returns = basket_returns(close, caps if not caps.empty else None)
+    cap_total = caps.reindex(close.columns).sum()
+
+    tickers = []
+    for entry in entries:
+        ticker = entry["ticker"]
+        if ticker not in close.columns:
+            continue
+        info = fundamentals.get(ticker, {})
+        cap = caps.get(ticker)
+        tickers.append({
+            "ticker": ticker,
+            "name": entry["name"],
+            "market_cap": int(cap) if cap is not None and pd.notna(cap) else None,
+            "per": info.get("PER"),
+            "pbr": info.get("PBR"),
+            "weight_pct": round(float(cap / cap_total * 100), 1) if cap is not None and cap_total > 0 else None,
+            **_series_stats(close[ticker].pct_change(fill_method=None)),
+        })
+
+    corr = correlation_matrix(close.pct_change(fill_method=None).iloc[1:], window=None)
+    return {
+        "basket": Path(path).name,
+        "period": {
+            "start": close.index[0].strftime("%Y-%m-%d"),
+            "end": close.index[-1].strftime("%Y-%m-%d"),
+            "days": len(close),
+        },
+        "tickers": tickers,
+        "equal_weight": _series_stats(returns["equal_weight"]),
+        "cap_weighted": _series_stats(returns["cap_weighted"]) if "cap_weighted" in returns else None,
+        "valuation": basket_valuation({t: fundamentals[t] for t in close.columns if t in fundamentals}),
+        "clusters": cluster_tickers(corr, CLUSTER_THRESHOLD),
+        "failed": data["failed"],
+    }
+
+
+def print_basket_report(path: str, days: int = BASKET_HISTORY_DAYS) -> None:
+    """바스켓 리포트 출력
+
+    Args:
+        path: 워치리스트 폴더
+        days: 분석 기간 (영업일)
+    """
+    data = analyze_basket(path, days=days)
+    if data is None:
+        print(f"바스켓 종목 없음: {path}")
+        return
+
+    period = data["period"]
+    print("=" * 50)
+    print(f"Basket Report: {data['basket']} ({len(data['tickers'])}종목)")
+    print(f"기간: {period['start']} ~ {period['end']} ({period['days']}영업일)")
+    print("=" * 50)
+
+    print("\n[1. 바스켓 성과]")
+    for label, key in (("동일 가중", "equal_weight"), ("시총 가중", "cap_weighted")):
+        stats = data.get(key)
+        if stats and stats["return_pct"] is not None:
+            print(
+                f"{label}: 수익률 {stats['return_pct']:+.2f}%, "
+                f"변동성 {stats['volatility_pct']:.2f}%, 최대낙폭 {stats['max_drawdown_pct']:.2f}%"
+            )
+
+    val = data["valuation"]
+    print("\n[2. 밸류에이션]")
+    print(f"시총 가중 PER: {val['weighted_per']} / PBR: {val['weighted_pbr']} (적자 제외 {val['per_excluded']}종목)")
+    print(f"중앙값 PER: {val['median_per']} / PBR: {val['median_pbr']}")
+
+    print("\n[3. 종목별]")
+    for t in sorted(data["tickers"], key=lambda x: -(x["weight_pct"] or 0)):
+        ret = f"{t['return_pct']:+.1f}%" if t["return_pct"] is not None else "-"
+        print(f"{t['name']}({t['ticker']}): 비중 {t['weight_pct']}%, 수익률 {ret}, PER {t['per']}, PBR {t['pbr']}")
+
+    groups = [c for c in data["clusters"] if c["size"] > 1]
+    if groups:
+        print("\n[4. 동조화 그룹 (수익률 상관)]")
+        names = {t["ticker"]: t["name"] for t in data["tickers"]}
+        for c in groups:
+            print(f"{', '.join(names[t] for t in c['tickers'])} (평균 상관 {c['avg_corr']})")
+
+    if data["failed"]:
+        print(f"\n조회 실패: {', '.join(data['failed'])}")
+
+    print("\n" + "=" * 50)
+
+
+if __name__ == "__main__":
+    import sys
+    print_basket_report(sys.argv[1] if len(sys.argv) > 1 else "watchlist/stocks")
@@ -0,0 +1,422 @@
+"""종목 간 수익률 상관관계 / 베타 / 계층 군집
+
+OHLCV 저장소의 종가 행렬(날짜 × 종목)로 테마 바스켓·전 종목 상관행렬을 한 번에 계산
+
+- 상관행렬: 결측(상장 전/거래정지)을 쌍별로 제외하는 합계 행렬(n, Σx, Σx², Σxy)을
+  행렬곱 4번으로 구함 (종목 쌍마다 pandas 호출 → 종목 수² 번 호출하지 않음)
+- 증분 캐시: 합계 행렬을 저장해 두고 새 영업일 행은 더하고, window 밖으로 밀려난 행은 뺌
+  (저장소가 다시 받는 마지막 UPDATE_OVERLAP_DAYS 행은 값이 바뀌었으면 교체)
+- 베타: KOSPI/KOSDAQ 지수 수익률 대비 (전체 / rolling)
+- 군집: 1 - 상관계수 거리의 평균 연결(average linkage) 계층 군집 (numpy만 사용)
+
+캐시 위치: $VULTURE_DATA_DIR/correlation (기본 ~/.cache/vulture/correlation)
+    {name}.npz  # tickers, start, end, window, n, sx, sxx, sxy, tail_dates, tail
+    analyze_correlation(store_dir=...)는 {store_dir}/correlation (저장소별 캐시)
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.data_fetcher import get_index_ohlcv
+from utils.ohlcv_store import UPDATE_OVERLAP_DAYS, load_ohlcv_panel
+
+# 기본 상관계수 계산 구간 (영업일, 약 6개월)
+CORR_WINDOW = 120
+# 쌍별 최소 공통 관측일 수 (미만이면 NaN)
+CORR_MIN_PERIODS = 20
+# 같은 군집으로 묶는 최소 평균 상관계수
+CLUSTER_THRESHOLD = 0.5
+
+
+def _default_store_dir() -> Path:
+    """기본 캐시 디렉토리"""
+    base = os.environ.get("VULTURE_DATA_DIR", "~/.cache/vulture")
+    return Path(base).expanduser() / "correlation"
+
+
+def returns_panel(close: pd.DataFrame) -> pd.DataFrame:
+    """종가 행렬 → 일간 수익률 행렬 (결측 구간은 NaN 유지, 앞 값으로 채우지 않음)"""
+    return close.pct_change(fill_method=None)
+
+
+def _pair_sums(values: np.ndarray) -> dict:
+    """
+    날짜 × 종목 수익률 배열 → 쌍별 합계 행렬 (두 종목 모두 값이 있는 날만)
+
+    Returns:
+        {"n": 공통 관측 수, "sx": Σx_i, "sxx": Σx_i², "sxy": Σx_i·x_j} (각 종목 × 종목)
+        sx[i, j]는 j와 공통 관측일의 x_i 합 → Σx_j = sx.T
+    """
+    valid = ~np.isnan(values)
+    mask = valid.astype(np.float64)
+    x = np.where(valid, values, 0.0)
+    return {
+        "n": mask.T @ mask,
+        "sx": x.T @ mask,
+        "sxx": (x * x).T @ mask,
+        "sxy": x.T @ x,
+    }
+
+
+def _corr_from_sums(sums: dict, min_periods: int) -> np.ndarray:
+    """합계 행렬 → 피어슨 상관계수 (공통 관측 min_periods 미만 / 분산 0이면 NaN)"""
+    n, sx, sxx, sxy = sums["n"], sums["sx"], sums["sxx"], sums["sxy"]
+    cov = n * sxy - sx * sx.T
+    var = n * sxx - sx * sx
+    denom = var * var.T
+    ok = (n >= min_periods) & (var > 0) & (var.T > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = np.where(ok, cov / np.sqrt(np.where(ok, denom, 1.0)), np.nan)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def correlation_matrix(
+    returns: pd.DataFrame,
+    window: Optional[int] = CORR_WINDOW,
+    min_periods: int = CORR_MIN_PERIODS
+) -> pd.DataFrame:
+    """
+    수익률 상관행렬 (결측은 쌍별 제외, pandas DataFrame.corr와 같은 결과)
+
+    Args:
+        returns: 날짜 × 종목 수익률 (returns_panel 결과)
+        window: 최근 N 영업일 (None=전체)
+        min_periods: 쌍별 최소 공통 관측일 수
+
+    Returns:
+        종목 × 종목 DataFrame (-1~1, 계산 불가 NaN)
+    """
+    if window is not None:
+        returns = returns.iloc[-window:]
+    sums = _pair_sums(returns.to_numpy(dtype=np.float64))
+    corr = _corr_from_sums(sums, min_periods)
+    return pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+
+
+def _load_cache(path: Path) -> Optional[dict]:
+    """캐시 파일 → dict (없거나 깨졌으면 None)"""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(path: Path, cache: dict) -> None:
+    """캐시 저장 (임시 파일 → 교체)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez(tmp_path, **cache)
+    os.replace(tmp_path, path)
+
+
+def update_correlation_cache(
+    returns: pd.DataFrame,
+    name: str,
+    window: int = CORR_WINDOW,
+    min_periods: int = CORR_MIN_PERIODS,
+    store_dir: Optional[str] = None,
+    refresh: bool = False
+) -> pd.DataFrame:
+    """
+    증분 캐시를 이용한 최근 window 영업일 상관행렬
+
+    캐시의 종목 구성/구간이 returns와 맞으면 새 영업일 행의 합계를 더하고
+    window 밖으로 밀려난 행의 합계를 빼서 갱신 (변경 행 수만큼만 계산)
+    OHLCV 저장소는 업데이트마다 마지막 UPDATE_OVERLAP_DAYS 봉을 다시 받으므로
+    (장중 봉, 수정주가) 캐시 끝 행들의 값을 함께 저장해 두고, 값이 바뀐 행은
+    이전 값의 합계를 빼고 새 값의 합계를 더함
+    종목 구성이 바뀌었거나 변경 행이 window 이상이면 전체 재계산
+
+    Args:
+        returns: 날짜 × 종목 수익률 (window보다 긴 이력 포함 가능, 밀려난 행을 빼는 데 사용)
+        name: 캐시 이름 (예: 바스켓/테마 이름)
+        window: 상관계수 계산 구간 (영업일)
+        min_periods: 쌍별 최소 공통 관측일 수
+        store_dir: 캐시 디렉토리 (기본 $VULTURE_DATA_DIR/correlation)
+        refresh: True면 캐시 무시하고 전체 재계산 (수정주가 변경 반영)
+
+    Returns:
+        종목 × 종목 상관 DataFrame (correlation_matrix(returns, window)와 같은 값)
+    """
+    path = (Path(store_dir) if store_dir else _default_store_dir()) / f"{name}.npz"
+    tickers = np.asarray(returns.columns, dtype=str)
+    dates = pd.DatetimeIndex(returns.index)
+    values = returns.to_numpy(dtype=np.float64)
+    new_start = max(len(dates) - window, 0)
+    new_end = len(dates)
+
+    cache = None if refresh else _load_cache(path)
+    sums = None
+    if (
+        cache is not None
+        and int(cache["window"]) == window
+        and np.array_equal(cache["tickers"], tickers)
+    ):
+        old_start = dates.get_indexer([pd.Timestamp(cache["start"][()])])[0]
+        old_end = dates.get_indexer([pd.Timestamp(cache["end"][()])])[0] + 1
+        changed = (new_end - old_end) + (new_start - old_start)
+        tail_start = old_end - len(cache.get("tail_dates", ()))
+        if (
+            old_start >= 0 and old_end > 0 and old_start <= new_start and old_end <= new_end
+            and changed < window
+            and "tail" in cache
+            and np.array_equal(cache["tail_dates"], dates[tail_start:old_end].to_numpy(dtype="datetime64[D]"))
+        ):
+            sums = {key: cache[key] for key in ("n", "sx", "sxx", "sxy")}
+            # 저장소가 다시 받은 끝 행: 값이 바뀐 행만 이전 값 → 현재 값으로 교체
+            old_tail, new_tail = cache["tail"], values[tail_start:old_end]
+            rewritten = ~((old_tail == new_tail) | (np.isnan(old_tail) & np.isnan(new_tail))).all(axis=1)
+            if rewritten.any():
+                removed = _pair_sums(old_tail[rewritten])
+                added = _pair_sums(new_tail[rewritten])
+                sums = {key: sums[key] - removed[key] + added[key] for key in sums}
+            if old_end < new_end:
+                added = _pair_sums(values[old_end:new_end])
+                sums = {key: sums[key] + added[key] for key in sums}
+            if old_start < new_start:
+                removed = _pair_sums(values[old_start:new_start])
+                sums = {key: sums[key] - removed[key] for key in sums}
+
+    if sums is None:
+        sums = _pair_sums(values[new_start:new_end])
+
+    if len(dates):
+        tail_start = max(new_end - UPDATE_OVERLAP_DAYS, new_start)
+        _save_cache(path, {
+            "tickers": tickers,
+            "start": np.datetime64(dates[new_start], "D"),
+            "end": np.datetime64(dates[new_end - 1], "D"),
+            "window": np.int64(window),
+            "tail_dates": dates[tail_start:new_end].to_numpy(dtype="datetime64[D]"),
+            "tail": values[tail_start:new_end],
+            **sums,
+        })
+    corr = _corr_from_sums(sums, min_periods)
+    return pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+
+
+def benchmark_returns(index: str = "KOSPI", days: int = CORR_WINDOW) -> Optional[pd.Series]:
+    """시장 지수 일간 수익률 (get_index_ohlcv 종가 기준, 실패 시 None)"""
+    df = get_index_ohlcv(index, days=days + 1)
+    if df is None or df.empty:
+        return None
+    return df["종가"].pct_change(fill_method=None).iloc[1:].rename(index)
+
+
+def _aligned(returns: pd.DataFrame, benchmark: pd.Series) -> tuple:
+    """종목 / 지수 수익률을 둘 다 값이 있는 칸만 남겨 같은 모양으로"""
+    bench = pd.DataFrame(
+        np.repeat(benchmark.reindex(returns.index).to_numpy(dtype=np.float64)[:, None], returns.shape[1], axis=1),
+        index=returns.index,
+        columns=returns.columns,
+    )
+    valid = returns.notna() & bench.notna()
+    return returns.where(valid), bench.where(valid)
+
+
+def beta(
+    returns: pd.DataFrame,
+    benchmark: pd.Series,
+    window: Optional[int] = CORR_WINDOW,
+    min_periods: int = CORR_MIN_PERIODS
+) -> pd.Series:
+    """
+    지수 대비 베타 (최근 window 영업일)
+
+    Formula:
+        beta = Cov(종목, 지수) / Var(지수)  (둘 다 값이 있는 날만)
+
+    Returns:
+        종목별 Series (관측 min_periods 미만 NaN)
+    """
+    if window is not None:
+        returns = returns.iloc[-window:]
+    x, y = _aligned(returns, benchmark)
+    n = x.notna().sum()
+    cov = (x * y).sum() / n - x.sum() / n * (y.sum() / n)
+    var = (y * y).sum() / n - (y.sum() / n) ** 2
+    return (cov / var.where(var > 0)).where(n >= min_periods)
+
+
+def rolling_beta(
+    returns: pd.DataFrame,
+    benchmark: pd.Series,
+    window: int = CORR_WINDOW,
+    min_periods: int = CORR_MIN_PERIODS
+) -> pd.DataFrame:
+    """
+    지수 대비 rolling 베타
+
+    Returns:
+        날짜 × 종목 DataFrame (각 날짜 기준 직전 window 영업일 베타)
+    """
+    x, y = _aligned(returns, benchmark)
+
+    def mean(frame):
+        return frame.rolling(window, min_periods=min_periods).mean()
+
+    cov = mean(x * y) - mean(x) * mean(y)
+    var = mean(y * y) - mean(y) ** 2
+    return cov / var.where(var > 0)
+
+
+def cluster_tickers(
+    corr: pd.DataFrame,
+    threshold: float = CLUSTER_THRESHOLD,
+    n_clusters: Optional[int] = None
+) -> list:
+    """
+    평균 연결 계층 군집 (거리 = 1 - 상관계수)
+
+    가장 가까운 두 군집을 반복해서 합치고, 군집 간 평균 상관계수가 threshold 미만이거나
+    군집 수가 n_clusters가 되면 중단 (상관계수 NaN은 0으로 간주)
+
+    Args:
+        corr: 종목 × 종목 상관행렬
+        threshold: 합칠 최소 평균 상관계수
+        n_clusters: 목표 군집 수 (지정 시 threshold 대신 사용)
+
+    Returns:
+        [
+            {"tickers": ["064260", "094480"], "size": 2, "avg_corr": 0.72},
+            ...
+        ]
+        (크기 → 평균 상관계수 내림차순, 단독 종목은 avg_corr None)
+    """
+    tickers = list(corr.index)
+    size = len(tickers)
+    if size == 0:
+        return []
+
+    dist = 1.0 - np.nan_to_num(corr.to_numpy(dtype=np.float64), nan=0.0)
+    np.fill_diagonal(dist, np.inf)
+    members = [[i] for i in range(size)]
+    counts = np.ones(size)
+    active = np.ones(size, dtype=bool)
+    max_dist = 1.0 - threshold
+    remaining = size
+
+    while remaining > 1:
+        flat = int(np.argmin(dist))
+        i, j = divmod(flat, size)
+        if n_clusters is not None:
+            if remaining <= n_clusters:
+                break
+        elif dist[i, j] > max_dist:
+            break
+
+        # Lance-Williams 평균 연결 갱신: d(k, i∪j) = (n_i·d(k,i) + n_j·d(k,j)) / (n_i + n_j)
+        merged = (counts[i] * dist[i] + counts[j] * dist[j]) / (counts[i] + counts[j])
+        merged[~active] = np.inf
+        merged[i] = np.inf
+        dist[i, :] = merged
+        dist[:, i] = merged
+        dist[j, :] = np.inf
+        dist[:, j] = np.inf
+        members[i] += members[j]
+        counts[i] += counts[j]
+        active[j] = False
+        remaining -= 1
+
+    values = corr.to_numpy(dtype=np.float64)
+    clusters = []
+    for i in np.flatnonzero(active):
+        idx = sorted(members[i])
+        avg = None
+        if len(idx) > 1:
+            block = values[np.ix_(idx, idx)]
+            avg = round(float(np.nanmean(block[~np.eye(len(idx), dtype=bool)])), 3)
+        clusters.append({"tickers": [tickers[k] for k in idx], "size": len(idx), "avg_corr": avg})
+
+    clusters.sort(key=lambda c: (-c["size"], -(c["avg_corr"] or 0)))
+    return clusters
+
+
+def top_pairs(corr: pd.DataFrame, limit: int = 10, ascending: bool = False) -> list:
+    """
+    상관계수 상위(또는 하위) 종목 쌍
+
+    Returns:
+        [{"a": "064260", "b": "094480", "corr": 0.81}, ...]
+    """
+    values = corr.to_numpy(dtype=np.float64)
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_corr = values[rows, cols]
+    keep = ~np.isnan(pair_corr)
+    rows, cols, pair_corr = rows[keep], cols[keep], pair_corr[keep]
+    order = np.argsort(pair_corr if ascending else -pair_corr, kind="stable")[:limit]
+    return [
+        {"a": corr.index[rows[k]], "b": corr.columns[cols[k]], "corr": round(float(pair_corr[k]), 3)}
+        for k in order
+    ]
+
+
+def analyze_correlation(
+    tickers: Optional[Iterable[str]] = None,
+    window: int = CORR_WINDOW,
+    benchmark: str = "KOSPI",
+    threshold: float = CLUSTER_THRESHOLD,
+    cache: Optional[str] = None,
+    store_dir: Optional[str] = None
+) -> Optional[dict]:
+    """
+    종목 묶음 상관관계 분석 (OHLCV 저장소 기준)
+
+    Args:
+        tickers: 대상 종목 (None=저장소 전체)
+        window: 계산 구간 (영업일)
+        benchmark: 베타 기준 지수 ("KOSPI", "KOSDAQ", None=베타 생략)
+        threshold: 군집 최소 평균 상관계수
+        cache: 증분 캐시 이름 (None=캐시 없이 계산)
+        store_dir: OHLCV 저장소 디렉토리 (지정 시 캐시는 {store_dir}/correlation)
+
+    Returns:
+        {
+            "period": {"start", "end", "days"},
+            "tickers": 12,
+            "benchmark": "KOSPI",
+            "beta": {"005930": 1.12, ...} or None (지수 조회 실패),
+            "clusters": [...],              # cluster_tickers 결과
+            "top_pairs": [...],             # top_pairs 결과
+            "corr": DataFrame               # 종목 × 종목 상관행렬
+        }
+        or None (저장소에 대상 종목 없음)
+    """
+    close = load_ohlcv_panel("종가", tickers=tickers, store_dir=store_dir)
+    if close is None or close.empty:
+        return None
+
+    returns = returns_panel(close).iloc[1:]
+    if cache:
+        cache_dir = str(Path(store_dir) / "correlation") if store_dir else None
+        corr = update_correlation_cache(returns, cache, window=window, store_dir=cache_dir)
+    else:
+        corr = correlation_matrix(returns, window=window)
+
+    period = returns.iloc[-window:]
+    betas = None
+    if benchmark:
+        bench = benchmark_returns(benchmark, days=window + 5)
+        if bench is not None:
+            values = beta(period, bench, window=None)
+            betas = {t: (round(float(v), 2) if pd.notna(v) else None) for t, v in values.items()}
+
+    return {
+        "period": {
+            "start": period.index[0].strftime("%Y-%m-%d"),
+            "end": period.index[-1].strftime("%Y-%m-%d"),
+            "days": len(period),
+        },
+        "tickers": int(close.shape[1]),
+        "benchmark": benchmark,
+        "beta": betas,
+        "clusters": cluster_tickers(corr, threshold),
+        "top_pairs": top_pairs(corr),
+        "corr": corr,
+    }
@@ -1,14 +1,194 @@
 """pykrx 래퍼 함수
 
 다른 에이전트가 사용할 데이터 조회 인프라 함수
-실패 시 None 반환
+실패 시 None 반환 (with_meta=True 이면 출처/지연시간/실패 사유 포함 dict 반환)
+
+fallback이 있는 함수는 소스별 circuit breaker를 사용:
+영구 장애(KRX 로그인 필수화 등)로 판단되면 cooldown 동안 해당 소스를 건너뛰고
+바로 fallback으로 넘어간다 (배치 스크래핑 시 종목마다 timeout 대기 방지)
+종목에 데이터가 없는 빈 결과나 파싱 오류는 소스 장애로 세지 않는다
+KRX 로그인 차단 시 pykrx는 예외 대신 빈 DataFrame을 반환하므로, 시장 전체 조회의
+연속 빈 결과로 장애를 판단해 pykrx 전체("pykrx")를 차단한다
 """
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 from pykrx import stock
 
+# 시장 지수 코드 (pykrx)
+INDEX_CODES = {"KOSPI": "1001", "KOSDAQ": "2001", "KOSPI200": "1028"}
+
+# Circuit breaker 설정
+BREAKER_FAILURE_THRESHOLD = 3  # 연속 실패 N회 → 차단
+BREAKER_COOLDOWN_SEC = 600.0   # 차단 유지 시간 (10분)
+
+# 재시도해도 결과가 같은 오류 (응답 컬럼 변경) → 즉시 차단
+_PERMANENT_ERRORS = (KeyError,)
+# 소스 장애가 아닌 오류 (종목별 값 파싱 실패 예: int(NaN), 파싱 코드 버그) → 실패로 세지 않음
+_NOT_OUTAGE_ERRORS = (ValueError, TypeError, AttributeError)
+# 정상이면 절대 비지 않는 시장 전체 조회 → 빈 결과 = 제공자 장애 (제공자 단위 breaker에 기록)
+_MARKET_WIDE_SOURCES = frozenset({"pykrx.ticker_list", "pykrx.market_fundamentals"})
+
+# {source: {"failures": int, "open_until": float, "last_error": str | None}}
+_breakers = {}
+
+
+class _EmptyResult(Exception):
+    """소스가 빈 결과를 반환 (해당 종목 데이터 없음 → 다음 소스 시도, 차단 안 함)"""
+
+
+def get_source_status() -> dict:
+    """
+    소스별 circuit breaker 상태 조회
+
+    Returns:
+        {
+            "pykrx.fundamental": {
+                "failures": 3,
+                "open": True,
+                "retry_in_sec": 512.3,
+                "last_error": "ConnectionError"
+            },
+            "pykrx": {...},  # 제공자 전체 (시장 전체 조회가 연속으로 빈 결과)
+            ...
+        }
+    """
+    now = time.monotonic()
+    return {
+        source: {
+            "failures": state["failures"],
+            "open": state["open_until"] > now,
+            "retry_in_sec": round(max(0.0, state["open_until"] - now), 1),
+            "last_error": state["last_error"],
+        }
+        for source, state in _breakers.items()
+    }
+
+
+def reset_source_status(source: Optional[str] = None) -> None:
+    """
+    circuit breaker 초기화
+
+    Args:
+        source: 초기화할 소스 (예: "pykrx.fundamental", "pykrx", None=전체)
+    """
+    if source is None:
+        _breakers.clear()
+    else:
+        _breakers.pop(source, None)
+
+
+def _record_failure(source: str, error: Exception) -> None:
+    """실패 기록 (영구 오류 또는 연속 실패 시 차단)"""
+    state = _breakers.setdefault(
+        source, {"failures": 0, "open_until": 0.0, "last_error": None}
+    )
+    state["failures"] += 1
+    state["last_error"] = type(error).__name__
+    if isinstance(error, _PERMANENT_ERRORS) or state["failures"] >= BREAKER_FAILURE_THRESHOLD:
+        state["open_until"] = time.monotonic() + BREAKER_COOLDOWN_SEC
+
+
+def _provider(source: str) -> str:
+    """제공자 이름 (예: "pykrx.fundamental" → "pykrx")"""
+    return source.split(".", 1)[0]
+
+
+def _open_breaker(source: str) -> Optional[dict]:
+    """소스 또는 제공자의 열린 breaker 상태 (없으면 None)"""
+    now = time.monotonic()
+    for key in (source, _provider(source)):
+        state = _breakers.get(key)
+        if state and state["open_until"] > now:
+            return state
+    return None
+
+
+def _fetch_with_fallback(steps: list, with_meta: bool):
+    """
+    소스를 순서대로 시도 (소스 또는 제공자가 차단된 경우 건너뜀)
+
+    Args:
+        steps: [(source, fetch_fn), ...] - fetch_fn은 결과 반환, 실패 시 예외
+        with_meta: True=결과 dict 반환, False=data만 반환
+
+    Returns:
+        with_meta=False: data or None
+        with_meta=True:
+        {
+            "data": ... or None,
+            "source": "pykrx.fundamental" or None,
+            "latency_ms": 12.3,
+            "attempts": [
+                {"source": "pykrx.fundamental", "ok": False, "skipped": True,
+                 "error": "KeyError", "latency_ms": 0.0},
+                {"source": "naver.fundamental", "ok": True, "skipped": False,
+                 "error": None, "latency_ms": 12.3},
+            ]
+        }
+    """
+    attempts = []
+    data = None
+    used_source = None
+    total_start = time.perf_counter()
+
+    for source, fetch_fn in steps:
+        state = _open_breaker(source)
+        if state:
+            attempts.append({
+                "source": source,
+                "ok": False,
+                "skipped": True,
+                "error": state["last_error"],
+                "latency_ms": 0.0,
+            })
+            continue
+
+        start = time.perf_counter()
+        try:
+            data = fetch_fn()
+            if not data:
+                raise _EmptyResult(source)
+        except Exception as e:
+            data = None
+            if isinstance(e, _EmptyResult):
+                if source in _MARKET_WIDE_SOURCES:
+                    _record_failure(_provider(source), e)
+            elif not isinstance(e, _NOT_OUTAGE_ERRORS):
+                _record_failure(source, e)
+            attempts.append({
+                "source": source,
+                "ok": False,
+                "skipped": False,
+                "error": type(e).__name__,
+                "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+            })
+            continue
+
+        _breakers.pop(source, None)
+        _breakers.pop(_provider(source), None)
+        used_source = source
+        attempts.append({
+            "source": source,
+            "ok": True,
+            "skipped": False,
+            "error": None,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        })
+        break
+
+    if not with_meta:
+        return data
+
+    return {
+        "data": data,
+        "source": used_source,
+        "latency_ms": round((time.perf_counter() - total_start) * 1000, 1),
+        "attempts": attempts,
+    }
+
 
 def get_ohlcv(
     ticker: str,
@@ -55,6 +235,47 @@ def get_ohlcv(
         return None
 
 
+def get_index_ohlcv(
+    index: str = "KOSPI",
+    days: int = 60,
+    end_date: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """
+    시장 지수 OHLCV 조회
+
+    Args:
+        index: "KOSPI", "KOSDAQ", "KOSPI200" 또는 pykrx 지수코드 (예: "1001")
+        days: 조회 일수 (기본 60)
+        end_date: 종료일 YYYYMMDD (기본 오늘)
+
+    Returns:
+        DataFrame or None (실패 시)
+
+    Columns:
+        시가, 고가, 저가, 종가, 거래량, 거래대금 (pykrx 버전에 따라 상장시가총액 포함)
+    """
+    try:
+        if end_date is None:
+            end_dt = datetime.now()
+        else:
+            end_dt = datetime.strptime(end_date, "%Y%m%d")
+
+        start_dt = end_dt - timedelta(days=days * 2)  # 영업일 고려하여 여유있게
+        df = stock.get_index_ohlcv_by_date(
+            start_dt.strftime("%Y%m%d"),
+            end_dt.strftime("%Y%m%d"),
+            INDEX_CODES.get(index, index),
+        )
+
+        if df.empty:
+            return None
+
+        return df.tail(days)
+
+    except Exception:
+        return None
+
+
 def get_ticker_name(ticker: str) -> Optional[str]:
     """
     종목명 조회
@@ -80,42 +301,44 @@ def get_ticker_name(ticker: str) -> Optional[str]:
 
 def get_ticker_list(
     date: Optional[str] = None,
-    market: str = "KOSPI"
-) -> Optional[list]:
+    market: str = "KOSPI",
+    with_meta: bool = False
+) -> Union[list, dict, None]:
     """
     전체 종목 리스트 조회 (pykrx 우선, 실패 시 Naver fallback)
 
     Args:
         date: 조회일 YYYYMMDD (기본 오늘)
         market: "KOSPI", "KOSDAQ", "KONEX", "ALL"
+        with_meta: True=출처/지연시간/실패 사유 포함 dict 반환
 
     Returns:
         ['005930', '000660', ...] or None (실패 시)
+        with_meta=True: {"data", "source", "latency_ms", "attempts"}
     """
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
+
     # 1차: pykrx
-    try:
-        if date is None:
-            date = datetime.now().strftime("%Y%m%d")
-        tickers = stock.get_market_ticker_list(date, market=market)
-        if tickers:
-            return list(tickers)
-    except Exception:
-        pass
+    def from_pykrx():
+        return list(stock.get_market_ticker_list(date, market=market))
 
     # 2차: Naver fallback
-    try:
+    def from_naver():
         from utils.web_scraper import get_naver_stock_list
         stocks = get_naver_stock_list(market)
-        if stocks:
-            return [s["code"] for s in stocks]
-    except Exception:
-        pass
-    return None
+        return [s["code"] for s in stocks] if stocks else None
+
+    return _fetch_with_fallback(
+        [("pykrx.ticker_list", from_pykrx), ("naver.stock_list", from_naver)],
+        with_meta,
+    )
 
 
 def get_fundamental(
     ticker: str,
-    date: Optional[str] = None
+    date: Optional[str] = None,
+    with_meta: bool = False
 ) -> Optional[dict]:
     """
     펀더멘털 지표 조회 (pykrx 우선, 실패 시 네이버 금융 fallback)
@@ -123,6 +346,7 @@ def get_fundamental(
     Args:
         ticker: 종목코드
         date: 조회일 YYYYMMDD (기본 오늘)
+        with_meta: True=출처/지연시간/실패 사유 포함 dict 반환
 
     Returns:
         {
@@ -134,49 +358,93 @@ def get_fundamental(
             "DPS": int       # 주당배당금
         }
         or None (실패 시)
+        with_meta=True: {"data", "source", "latency_ms", "attempts"}
     """
-    # 1차 시도: pykrx
-    try:
-        if date is None:
-            date = datetime.now().strftime("%Y%m%d")
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
 
+    # 1차 시도: pykrx
+    def from_pykrx():
         df = stock.get_market_fundamental(date, date, ticker)
-
-        if not df.empty:
-            row = df.iloc[-1]
-            return {
-                "BPS": int(row["BPS"]),
-                "PER": float(row["PER"]),
-                "PBR": float(row["PBR"]),
-                "EPS": int(row["EPS"]),
-                "DIV": float(row["DIV"]),
-                "DPS": int(row["DPS"]),
-            }
-    except Exception:
-        pass
+        if df.empty:
+            return None
+        row = df.iloc[-1]
+        return {
+            "BPS": int(row["BPS"]),
+            "PER": float(row["PER"]),
+            "PBR": float(row["PBR"]),
+            "EPS": int(row["EPS"]),
+            "DIV": float(row["DIV"]),
+            "DPS": int(row["DPS"]),
+        }
 
     # 2차 시도: 네이버 금융 fallback
-    try:
+    def from_naver():
         from utils.web_scraper import get_naver_stock_info
-        info = get_naver_stock_info(ticker)
-        if info and (info.get("per") is not None or info.get("pbr") is not None):
-            return {
-                "BPS": 0,  # 네이버에서 제공 안 함
-                "PER": float(info.get("per", 0) or 0),
-                "PBR": float(info.get("pbr", 0) or 0),
-                "EPS": 0,  # 네이버에서 제공 안 함
-                "DIV": 0.0,  # 네이버에서 제공 안 함
-                "DPS": 0,  # 네이버에서 제공 안 함
+        info = get_naver_stock_info(ticker, raise_errors=True)
+        if not info or (info.get("per") is None and info.get("pbr") is None):
+            return None
+        return {
+            "BPS": 0,  # 네이버에서 제공 안 함
+            "PER": float(info.get("per", 0) or 0),
+            "PBR": float(info.get("pbr", 0) or 0),
+            "EPS": 0,  # 네이버에서 제공 안 함
+            "DIV": 0.0,  # 네이버에서 제공 안 함
+            "DPS": 0,  # 네이버에서 제공 안 함
+        }
+
+    return _fetch_with_fallback(
+        [("pykrx.fundamental", from_pykrx), ("naver.fundamental", from_naver)],
+        with_meta,
+    )
+
+
+def get_market_fundamentals(
+    date: Optional[str] = None,
+    market: str = "ALL",
+    with_meta: bool = False
+) -> Optional[dict]:
+    """
+    전 종목 시가총액 / PER / PBR 일괄 조회 (pykrx 시장 전체 조회 2회)
+
+    종목마다 get_fundamental / get_market_cap을 호출하지 않고 시장 전체 표를 한 번에 받음
+
+    Args:
+        date: 조회일 YYYYMMDD (기본 최근 영업일)
+        market: "KOSPI", "KOSDAQ", "KONEX", "ALL"
+        with_meta: True=출처/지연시간/실패 사유 포함 dict 반환
+
+    Returns:
+        {
+            "005930": {"market_cap": 8849900, "PER": 31.2, "PBR": 2.9},  # market_cap 억 단위
+            ...
+        }
+        or None (실패 시)
+        with_meta=True: {"data", "source", "latency_ms", "attempts"}
+    """
+    def from_pykrx():
+        day = date or stock.get_nearest_business_day_in_a_week()
+        caps = stock.get_market_cap(day, market=market)
+        fundamentals = stock.get_market_fundamental(day, market=market)
+        if caps.empty:
+            return None
+        merged = caps[["시가총액"]].join(fundamentals[["PER", "PBR"]], how="left")
+        return {
+            ticker: {
+                "market_cap": int(row["시가총액"]) // 100_000_000,
+                "PER": float(row["PER"]) if pd.notna(row["PER"]) else None,
+                "PBR": float(row["PBR"]) if pd.notna(row["PBR"]) else None,
             }
-    except Exception:
-        pass
+            for ticker, row in merged.iterrows()
+        }
 
-    return None
+    return _fetch_with_fallback([("pykrx.market_fundamentals", from_pykrx)], with_meta)
 
 
 def get_market_cap(
     ticker: str,
-    date: Optional[str] = None
+    date: Optional[str] = None,
+    with_meta: bool = False
 ) -> Optional[dict]:
     """
     시가총액 정보 조회 (pykrx 우선, 실패 시 Naver fallback)
@@ -184,6 +452,7 @@ def get_market_cap(
     Args:
         ticker: 종목코드
         date: 조회일 YYYYMMDD (기본 오늘)
+        with_meta: True=출처/지연시간/실패 사유 포함 dict 반환
 
     Returns:
         {
@@ -194,41 +463,40 @@ def get_market_cap(
             "외국인보유주식수": int or None
         }
         or None (실패 시)
+        with_meta=True: {"data", "source", "latency_ms", "attempts"}
     """
-    # 1차: pykrx
-    try:
-        if date is None:
-            date = datetime.now().strftime("%Y%m%d")
+    if date is None:
+        date = datetime.now().strftime("%Y%m%d")
 
+    # 1차: pykrx
+    def from_pykrx():
         df = stock.get_market_cap(date, date, ticker)
-
-        if not df.empty:
-            row = df.iloc[-1]
-            return {
-                "시가총액": int(row["시가총액"]),
-                "거래량": int(row["거래량"]),
-                "거래대금": int(row["거래대금"]),
-                "상장주식수": int(row["상장주식수"]),
-                "외국인보유주식수": int(row.get("외국인보유주식수", 0)),
-            }
-    except Exception:
-        pass
+        if df.empty:
+            return None
+        row = df.iloc[-1]
+        return {
+            "시가총액": int(row["시가총액"]),
+            "거래량": int(row["거래량"]),
+            "거래대금": int(row["거래대금"]),
+            "상장주식수": int(row["상장주식수"]),
+            "외국인보유주식수": int(row.get("외국인보유주식수", 0)),
+        }
 
     # 2차: Naver fallback
-    try:
+    def from_naver():
         from utils.web_scraper import get_naver_stock_info
-        info = get_naver_stock_info(ticker)
-        if info and info.get("market_cap"):
-            return {
-                "시가총액": int(info["market_cap"]) * 100000000,  # 억→원
-                "거래량": int(info.get("volume", 0) or 0),
-                "거래대금": None,  # Naver 미제공
-                "상장주식수": None,  # Naver 미제공
-                "외국인보유주식수": None,  # Naver 미제공
-            }
-    except Exception:
-        pass
-
-    return None
-
+        info = get_naver_stock_info(ticker, raise_errors=True)
+        if not info or not info.get("market_cap"):
+            return None
+        return {
+            "시가총액": int(info["market_cap"]) * 100000000,  # 억→원
+            "거래량": int(info.get("volume", 0) or 0),
+            "거래대금": None,  # Naver 미제공
+            "상장주식수": None,  # Naver 미제공
+            "외국인보유주식수": None,  # Naver 미제공
+        }
 
+    return _fetch_with_fallback(
+        [("pykrx.market_cap", from_pykrx), ("naver.market_cap", from_naver)],
+        with_meta,
+    )
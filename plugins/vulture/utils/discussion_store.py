@@ -0,0 +1,278 @@
+"""종목토론방 증분 동기화
+
+종목별로 이미 수집한 게시글 ID(nid)와 작성 시각을 로컬에 저장하고,
+동기화 시 가장 최근에 저장된 글에 도달하면 수집을 중단 (중복 다운로드 방지)
+
+newest_nid는 순회가 이전 newest_nid(또는 since)까지 끊김 없이 도달했을 때만 갱신.
+max_posts 제한이나 페이지 요청 실패로 중간에 멈추면 newest_nid는 그대로 두고,
+다음 동기화가 다시 맨 위부터 순회하며 인덱스에 있는 글은 건너뛰고 그 아래
+빈 구간을 이어서 수집
+
+저장 위치: $VULTURE_DATA_DIR/discussion (기본 ~/.cache/vulture/discussion)
+    {ticker}.jsonl       # 게시글 (수집 순서대로 append)
+    {ticker}.index.json  # {"posts": {nid: 작성시각}, "newest_nid": int, "synced_at": str}
+"""
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from utils.volume import volume_baseline, get_volume_signal
+from utils.web_scraper import iter_naver_discussion, _parse_post_date
+
+_NID_RE = re.compile(r'[?&]nid=(\d+)')
+
+# 첫 동기화 시 기본 수집 범위
+INITIAL_SYNC_DAYS = 7
+INITIAL_SYNC_MAX_POSTS = 1000
+
+
+def _default_store_dir() -> Path:
+    """기본 저장 디렉토리"""
+    base = os.environ.get("VULTURE_DATA_DIR", "~/.cache/vulture")
+    return Path(base).expanduser() / "discussion"
+
+
+def _paths(ticker: str, store_dir: Optional[str]) -> tuple:
+    """(게시글 파일, 인덱스 파일) 경로"""
+    root = Path(store_dir) if store_dir else _default_store_dir()
+    return root / f"{ticker}.jsonl", root / f"{ticker}.index.json"
+
+
+def _load_index(index_path: Path) -> dict:
+    """인덱스 로드 (없으면 빈 인덱스)"""
+    if not index_path.exists():
+        return {"posts": {}, "newest_nid": None, "synced_at": None}
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _parse_nid(url: str) -> Optional[int]:
+    """게시글 URL에서 nid 추출"""
+    match = _NID_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+def _store_entry(post: dict, nid: int, now: datetime) -> dict:
+    """저장할 게시글 레코드"""
+    posted_at = _parse_post_date(post["date"], now)
+    return {
+        "nid": nid,
+        "title": post["title"],
+        "date": post["date"],
+        "posted_at": posted_at.isoformat(timespec="minutes") if posted_at else None,
+        "url": post["url"],
+    }
+
+
+def sync_naver_discussion(
+    ticker: str,
+    store_dir: Optional[str] = None,
+    max_posts: int = INITIAL_SYNC_MAX_POSTS,
+    since: Optional[datetime] = None
+) -> dict:
+    """
+    종목토론방 증분 동기화
+
+    최신 글부터 페이지를 순회하다가 newest_nid(끊김 없이 저장된 가장 최근 글)에
+    도달하면 중단하고, 새 글만 로컬 저장소에 추가 (이전 동기화가 중간에 멈췄으면
+    이미 받은 글은 건너뛰고 빈 구간을 이어서 수집)
+
+    Args:
+        ticker: 종목코드
+        store_dir: 저장 디렉토리 (기본 $VULTURE_DATA_DIR/discussion)
+        max_posts: 한 번에 수집할 최대 게시글 수
+        since: 이 시각 이전 글은 수집 안 함 (첫 동기화 기본값: 최근 7일)
+
+    Returns:
+        {
+            "ticker": "005930",
+            "new_posts": 42,
+            "total_posts": 1234,
+            "newest_nid": 398123456,
+            "complete": True,        # False=max_posts/요청 실패로 중단 (다음 동기화에서 이어서 수집)
+            "error": None,           # 페이지 요청 실패 시 예외 메시지
+            "synced_at": "2026-01-15 10:30:00"
+        }
+    """
+    posts_path, index_path = _paths(ticker, store_dir)
+    index = _load_index(index_path)
+    newest_nid = index["newest_nid"]
+
+    if since is None and newest_nid is None:
+        since = datetime.now() - timedelta(days=INITIAL_SYNC_DAYS)
+
+    now = datetime.now()
+    new_posts = []
+    complete = True
+    error = None
+    try:
+        for post in iter_naver_discussion(ticker, since=since):
+            nid = _parse_nid(post["url"])
+            if nid is None:
+                continue
+            # nid는 증가하는 번호 - 끊김 없이 저장된 최신 글에 도달하면 수집 완료
+            if newest_nid is not None and nid <= newest_nid:
+                break
+            # 이전 동기화가 중간에 멈춘 경우 이미 받은 글 (빈 구간은 그 아래)
+            if str(nid) not in index["posts"]:
+                if len(new_posts) >= max_posts:
+                    complete = False
+                    break
+                new_posts.append(_store_entry(post, nid, now))
+    except Exception as e:
+        # 받은 글은 저장하되 newest_nid는 올리지 않음 (다음 동기화에서 빈 구간 재시도)
+        complete = False
+        error = f"{type(e).__name__}: {e}"
+
+    if new_posts:
+        posts_path.parent.mkdir(parents=True, exist_ok=True)
+        # 수집은 최신순 → 저장은 작성 순서대로
+        new_posts.reverse()
+        with open(posts_path, "a", encoding="utf-8") as f:
+            for post in new_posts:
+                f.write(json.dumps(post, ensure_ascii=False) + "\n")
+                index["posts"][str(post["nid"])] = post["posted_at"]
+
+    if complete and index["posts"]:
+        # 맨 위부터 이전 newest_nid(또는 since)까지 모두 저장됨
+        index["newest_nid"] = max(int(nid) for nid in index["posts"])
+
+    index["synced_at"] = now.strftime("%Y-%m-%d %H:%M:%S")
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+    return {
+        "ticker": ticker,
+        "new_posts": len(new_posts),
+        "total_posts": len(index["posts"]),
+        "newest_nid": index["newest_nid"],
+        "complete": complete,
+        "error": error,
+        "synced_at": index["synced_at"],
+    }
+
+
+def load_discussion_posts(
+    ticker: str,
+    since: Optional[datetime] = None,
+    store_dir: Optional[str] = None
+) -> list:
+    """
+    로컬에 저장된 게시글 조회
+
+    Args:
+        ticker: 종목코드
+        since: 이 시각 이후 글만 (None=전체)
+        store_dir: 저장 디렉토리
+
+    Returns:
+        [{"nid", "title", "date", "posted_at", "url"}, ...] (작성 순서)
+    """
+    posts_path, _ = _paths(ticker, store_dir)
+    if not posts_path.exists():
+        return []
+
+    cutoff = since.isoformat(timespec="minutes") if since else None
+    posts = []
+    with open(posts_path, "r", encoding="utf-8") as f:
+        for line in f:
+            post = json.loads(line)
+            if cutoff and (post["posted_at"] or "") < cutoff:
+                continue
+            posts.append(post)
+    # 중단됐던 동기화가 빈 구간을 나중에 채우면 파일 순서가 작성 순서와 다름
+    posts.sort(key=lambda p: p["nid"])
+    return posts
+
+
+def get_discussion_volume(
+    ticker: str,
+    freq: str = "1h",
+    since: Optional[datetime] = None,
+    store_dir: Optional[str] = None
+) -> pd.Series:
+    """
+    시간 구간별 게시글 수 (인덱스만 읽음)
+
+    Args:
+        ticker: 종목코드
+        freq: 구간 크기 (pandas offset, 예: "1h", "1D")
+        since: 이 시각 이후만 (None=전체)
+        store_dir: 저장 디렉토리
+
+    Returns:
+        Series (index=구간 시작 시각, value=게시글 수, 빈 구간은 0)
+    """
+    _, index_path = _paths(ticker, store_dir)
+    timestamps = [t for t in _load_index(index_path)["posts"].values() if t]
+    if not timestamps:
+        return pd.Series(dtype="int64")
+
+    times = pd.to_datetime(pd.Series(timestamps))
+    if since is not None:
+        times = times[times >= since]
+    if times.empty:
+        return pd.Series(dtype="int64")
+
+    return pd.Series(1, index=times.values).sort_index().resample(freq).sum().astype("int64")
+
+
+def get_discussion_volume_signal(
+    ticker: str,
+    freq: str = "1D",
+    baseline_periods: int = 7,
+    store_dir: Optional[str] = None,
+    now: Optional[datetime] = None
+) -> dict:
+    """
+    게시글 볼륨 신호 (sentiment-intelligence.md 볼륨 분석)
+
+    마지막으로 끝난 구간의 게시글 수를 직전 baseline_periods 구간 평균과 비교
+    (아직 진행 중인 구간은 채워지는 중이라 제외, 마지막 글 이후 now까지의 빈 구간은 0)
+
+    Args:
+        ticker: 종목코드
+        freq: 구간 크기 (기본 1일)
+        baseline_periods: 비교 기준 구간 수
+        store_dir: 저장 디렉토리
+        now: 기준 시각 (기본 현재)
+
+    Returns:
+        {
+            "signal": "surge" | "high" | "normal" | "low" | None,
+            "recent": 120,        # 마지막 완료 구간 게시글 수
+            "baseline": 35.2,     # 직전 구간 평균
+            "ratio": 3.41         # recent / baseline
+        }
+    """
+    volume = get_discussion_volume(ticker, freq=freq, store_dir=store_dir)
+    now = pd.Timestamp(now or datetime.now())
+    if len(volume):
+        # 조용해진 게시판: 마지막 글 이후 구간도 0건으로 채워 마지막 완료 구간까지 연장
+        offset = pd.tseries.frequencies.to_offset(freq)
+        buckets = pd.date_range(volume.index[0], now, freq=offset)
+        volume = volume.reindex(buckets[buckets + offset <= now], fill_value=0)
+    result = {"signal": None, "recent": None, "baseline": None, "ratio": None}
+    if len(volume) < 2:
+        return result
+
+    recent = int(volume.iloc[-1])
+    baseline = float(volume_baseline(volume, baseline_periods, min_periods=1).iloc[-1])
+    result["recent"] = recent
+    result["baseline"] = round(baseline, 2)
+    if baseline == 0:
+        result["signal"] = "surge" if recent > 0 else "low"
+        return result
+
+    ratio = recent / baseline
+    result["ratio"] = round(ratio, 2)
+    result["signal"] = get_volume_signal(ratio)
+    return result
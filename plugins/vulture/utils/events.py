@@ -0,0 +1,197 @@
+"""지표 이벤트 탐지 (크로스 / 다이버전스)
+
+indicators의 macd / rsi / stochastic / sma 결과에서
+"언제" 신호가 발생했는지를 전 기간·전 종목 한 번에 찾음
+
+- 입력: Series(1종목) 또는 DataFrame(날짜 × 종목) - 지표 함수가 열 단위로 동작
+- 이벤트 행렬: 1=상향(골든크로스/상승 다이버전스), -1=하향, 0=없음
+- detect_events(): 이벤트 행렬 → (날짜, 종목, 이벤트) 목록
+"""
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import sma, rsi, macd, stochastic, swing_points
+
+Frame = Union[pd.Series, pd.DataFrame]
+
+# 이벤트 키 → (상향 라벨, 하향 라벨)
+EVENT_LABELS = {
+    "macd_cross": ("MACD 골든크로스", "MACD 데드크로스"),
+    "ma_cross": ("MA 골든크로스", "MA 데드크로스"),
+    "stoch_cross": ("스토캐스틱 골든크로스", "스토캐스틱 데드크로스"),
+    "rsi_divergence": ("RSI 상승 다이버전스", "RSI 하락 다이버전스"),
+}
+
+# 다이버전스 기본값: 고점/저점 판단 좌우 봉 수, 두 고점/저점 최대 간격
+PIVOT_ORDER = 5
+DIVERGENCE_LOOKBACK = 60
+
+
+def crossovers(fast: Frame, slow: Frame) -> Frame:
+    """
+    fast가 slow를 돌파한 봉
+
+    Args:
+        fast: 빠른 선 (예: MACD, %K, MA5)
+        slow: 느린 선 (예: Signal, %D, MA20)
+
+    Returns:
+        같은 모양 (1=상향 돌파, -1=하향 돌파, 0=없음 / 전일 값이 없으면 0)
+    """
+    above = (fast > slow).astype(float).where(fast.notna() & slow.notna())
+    return above.diff().fillna(0.0).astype(np.int8)
+
+
+def macd_crosses(close: Frame, fast: int = 12, slow: int = 26, signal: int = 9) -> Frame:
+    """MACD / Signal 골든·데드크로스 (1/-1/0)"""
+    macd_line, signal_line, _ = macd(close, fast, slow, signal)
+    return crossovers(macd_line, signal_line)
+
+
+def ma_crosses(close: Frame, short: int = 5, long: int = 20) -> Frame:
+    """단기 / 장기 이동평균 골든·데드크로스 (1/-1/0)"""
+    return crossovers(sma(close, short), sma(close, long))
+
+
+def stochastic_crosses(
+    high: Frame,
+    low: Frame,
+    close: Frame,
+    k_period: int = 14,
+    d_period: int = 3
+) -> Frame:
+    """스토캐스틱 %K / %D 크로스 (1/-1/0)"""
+    k, d = stochastic(high, low, close, k_period, d_period)
+    return crossovers(k, d)
+
+
+def _pivots(values: Frame, order: int, kind: str) -> Frame:
+    """좌우 order 봉 중 최저(kind="low") / 최고(kind="high")인 봉"""
+    swing_high, swing_low = swing_points(values, values, order)
+    return (swing_low if kind == "low" else swing_high).notna()
+
+
+def _previous_at_pivot(values: Frame, is_pivot: Frame) -> Frame:
+    """각 봉 기준 직전(현재 봉 제외) 피벗의 값"""
+    return values.where(is_pivot).ffill().shift(1)
+
+
+def rsi_divergences(
+    close: Frame,
+    period: int = 14,
+    order: int = PIVOT_ORDER,
+    lookback: int = DIVERGENCE_LOOKBACK
+) -> Frame:
+    """
+    가격 vs RSI 다이버전스
+
+    연속된 두 저점에서 가격은 낮아지고 RSI는 높아지면 상승 다이버전스(1),
+    연속된 두 고점에서 가격은 높아지고 RSI는 낮아지면 하락 다이버전스(-1)
+
+    저점/고점은 좌우 order 봉을 확인해야 확정되므로 이벤트는 확정 봉
+    (피벗 + order 봉)에 표시 → 미래 데이터 참조 없음
+
+    Args:
+        close: 종가
+        period: RSI 기간
+        order: 피벗 판단 좌우 봉 수
+        lookback: 두 피벗의 최대 간격 (봉)
+
+    Returns:
+        같은 모양 (1/-1/0)
+    """
+    rsi_values = rsi(close, period)
+    position = pd.Series(np.arange(len(close)), index=close.index, dtype=float)
+    if isinstance(close, pd.DataFrame):
+        position = pd.DataFrame(
+            np.repeat(position.to_numpy()[:, None], close.shape[1], axis=1),
+            index=close.index,
+            columns=close.columns,
+        )
+
+    events = []
+    for kind, sign in (("low", 1), ("high", -1)):
+        is_pivot = _pivots(close, order, kind)
+        prev_close = _previous_at_pivot(close, is_pivot)
+        prev_rsi = _previous_at_pivot(rsi_values, is_pivot)
+        prev_pos = _previous_at_pivot(position, is_pivot)
+
+        price_diff = (close - prev_close) * sign    # 저점: 가격 하락(<0), 고점: 가격 상승(<0)
+        rsi_diff = (rsi_values - prev_rsi) * sign   # 저점: RSI 상승(>0), 고점: RSI 하락(>0)
+        found = is_pivot & (price_diff < 0) & (rsi_diff > 0) & (position - prev_pos <= lookback)
+        events.append(found.astype(np.int8) * sign)
+
+    return (events[0] + events[1]).shift(order).fillna(0).astype(np.int8)
+
+
+def event_panels(ohlcv: dict) -> dict:
+    """
+    OHLCV → 이벤트 행렬 전체
+
+    Args:
+        ohlcv: {"고가", "저가", "종가"} → Series 또는 날짜 × 종목 DataFrame
+
+    Returns:
+        {"macd_cross": ..., "ma_cross": ..., "stoch_cross": ..., "rsi_divergence": ...}
+    """
+    close = ohlcv["종가"]
+    return {
+        "macd_cross": macd_crosses(close),
+        "ma_cross": ma_crosses(close),
+        "stoch_cross": stochastic_crosses(ohlcv["고가"], ohlcv["저가"], close),
+        "rsi_divergence": rsi_divergences(close),
+    }
+
+
+def detect_events(
+    ohlcv: Union[pd.DataFrame, dict],
+    window: Optional[int] = None,
+    ticker: Optional[str] = None,
+    events: Optional[tuple] = None
+) -> pd.DataFrame:
+    """
+    크로스 / 다이버전스 이벤트 목록
+
+    Args:
+        ohlcv: get_ohlcv 결과(1종목) 또는 load_ohlcv_panels 결과(날짜 × 종목)
+        window: 최근 N 봉의 이벤트만 (None=전체, 지표는 전체 기간으로 계산)
+        ticker: 1종목 입력일 때 ticker 컬럼 값
+        events: 탐지할 이벤트 키 (None=EVENT_LABELS 전체)
+
+    Returns:
+        DataFrame (날짜, 종목 순 정렬)
+            date: 발생일
+            ticker: 종목코드
+            event: "macd_cross" | "ma_cross" | "stoch_cross" | "rsi_divergence"
+            label: "MACD 골든크로스" 등
+            direction: 1 (상향) | -1 (하향)
+    """
+    if isinstance(ohlcv, pd.DataFrame):
+        ohlcv = {field: ohlcv[field].rename(ticker).to_frame() for field in ("고가", "저가", "종가")}
+
+    panels = event_panels(ohlcv)
+    rows = []
+    for key in events or EVENT_LABELS:
+        matrix = panels[key]
+        if window is not None:
+            matrix = matrix.iloc[-window:]
+        values = matrix.to_numpy()
+        date_idx, ticker_idx = np.nonzero(values)
+        if len(date_idx) == 0:
+            continue
+        directions = values[date_idx, ticker_idx].astype(int)
+        up_label, down_label = EVENT_LABELS[key]
+        rows.append(pd.DataFrame({
+            "date": matrix.index[date_idx],
+            "ticker": matrix.columns[ticker_idx],
+            "event": key,
+            "label": np.where(directions > 0, up_label, down_label),
+            "direction": directions,
+        }))
+
+    if not rows:
+        return pd.DataFrame(columns=["date", "ticker", "event", "label", "direction"])
+    result = pd.concat(rows, ignore_index=True)
+    return result.sort_values(["date", "ticker"], kind="stable").reset_index(drop=True)
@@ -357,32 +357,7 @@ def get_fnguide_financial(ticker: str, retry: int = 2) -> Optional[dict]:
         try:
             response = requests.get(url, headers=FNGUIDE_HEADERS, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 종목명 추출
-            name = _extract_company_name(soup)
-
-            # 테이블 파싱
-            income_annual = _parse_fnguide_table(soup, "divSonikY", INCOME_METRICS)
-            balance_annual = _parse_fnguide_table(soup, "divDaechaY", BALANCE_METRICS)
-            cash_annual = _parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
-
-            if not income_annual:
-                raise ValueError("Failed to parse income data")
-
-            # FCF 계산
-            if cash_annual:
-                for year, data in cash_annual.items():
-                    ocf = data.get("operating_cash_flow")
-                    icf = data.get("investing_cash_flow")
-                    if ocf is not None and icf is not None:
-                        data["fcf"] = ocf + icf
-
-            # 누적 기간 감지
-            period_labels = _detect_accumulated_periods(income_annual, soup)
-
-            # 성장률 계산 (완결 연도 기준)
-            growth = _calculate_growth(income_annual, period_labels)
+            statements = _parse_fnguide_statements(response.text)
 
             # FnGuide에서 ROE/ROA 가져오기
             # 1순위: SVD_Main.asp (Snapshot 페이지) - requests로 직접 가져옴
@@ -391,34 +366,7 @@ def get_fnguide_financial(ticker: str, retry: int = 2) -> Optional[dict]:
             # TODO: SVD_FinanceRatio.asp는 JS 동적 로드로 requests 불가
             # Playwright MCP 사용 시 get_fnguide_ratios() 활성화 검토
 
-            # 재무비율 계산 (FnGuide Snapshot 1순위, 직접계산 2순위 fallback)
-            ratios = _calculate_ratios(income_annual, balance_annual, fnguide_ratios)
-
-            # 최신 연도
-            years = sorted(income_annual.keys(), reverse=True)
-            latest_year = years[0] if years else None
-
-            # latest 구성
-            latest = {}
-            if latest_year and latest_year in income_annual:
-                latest.update(income_annual[latest_year])
-            if balance_annual and latest_year in balance_annual:
-                latest.update(balance_annual[latest_year])
-
-            return {
-                "source": "FnGuide",
-                "ticker": ticker,
-                "name": name,
-                "period": f"{latest_year}/12" if latest_year else None,
-                "annual": income_annual,
-                "balance": balance_annual or {},
-                "cash_flow": cash_annual or {},
-                "latest": latest,
-                "growth": growth,
-                "ratios": ratios,
-                "fnguide_ratios": fnguide_ratios,
-                "period_labels": period_labels,
-            }
+            return _build_fnguide_financial(statements, ticker, fnguide_ratios)
 
         except Exception as e:
             if attempt < retry:
@@ -429,6 +377,95 @@ def get_fnguide_financial(ticker: str, retry: int = 2) -> Optional[dict]:
     return None
 
 
+def _parse_fnguide_statements(html: str) -> dict:
+    """SVD_Finance.asp HTML에서 재무제표 파싱
+
+    Returns:
+        {"name", "income", "balance", "cash_flow", "period_labels", "growth"}
+
+    Raises:
+        ValueError: 손익계산서 파싱 실패
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # 종목명 추출
+    name = _extract_company_name(soup)
+
+    # 테이블 파싱
+    income_annual = _parse_fnguide_table(soup, "divSonikY", INCOME_METRICS)
+    balance_annual = _parse_fnguide_table(soup, "divDaechaY", BALANCE_METRICS)
+    cash_annual = _parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
+
+    if not income_annual:
+        raise ValueError("Failed to parse income data")
+
+    # FCF 계산
+    if cash_annual:
+        for year, data in cash_annual.items():
+            ocf = data.get("operating_cash_flow")
+            icf = data.get("investing_cash_flow")
+            if ocf is not None and icf is not None:
+                data["fcf"] = ocf + icf
+
+    # 누적 기간 감지
+    period_labels = _detect_accumulated_periods(income_annual, soup)
+
+    # 성장률 계산 (완결 연도 기준)
+    growth = _calculate_growth(income_annual, period_labels)
+
+    return {
+        "name": name,
+        "income": income_annual,
+        "balance": balance_annual,
+        "cash_flow": cash_annual,
+        "period_labels": period_labels,
+        "growth": growth,
+    }
+
+
+def _build_fnguide_financial(
+    statements: dict,
+    ticker: str,
+    fnguide_ratios: Optional[dict]
+) -> dict:
+    """재무제표 + FnGuide 재무비율 → get_fnguide_financial 반환 형식으로 조립"""
+    name = statements["name"]
+    income_annual = statements["income"]
+    balance_annual = statements["balance"]
+    cash_annual = statements["cash_flow"]
+    period_labels = statements["period_labels"]
+    growth = statements["growth"]
+
+    # 재무비율 계산 (FnGuide Snapshot 1순위, 직접계산 2순위 fallback)
+    ratios = _calculate_ratios(income_annual, balance_annual, fnguide_ratios)
+
+    # 최신 연도
+    years = sorted(income_annual.keys(), reverse=True)
+    latest_year = years[0] if years else None
+
+    # latest 구성
+    latest = {}
+    if latest_year and latest_year in income_annual:
+        latest.update(income_annual[latest_year])
+    if balance_annual and latest_year in balance_annual:
+        latest.update(balance_annual[latest_year])
+
+    return {
+        "source": "FnGuide",
+        "ticker": ticker,
+        "name": name,
+        "period": f"{latest_year}/12" if latest_year else None,
+        "annual": income_annual,
+        "balance": balance_annual or {},
+        "cash_flow": cash_annual or {},
+        "latest": latest,
+        "growth": growth,
+        "ratios": ratios,
+        "fnguide_ratios": fnguide_ratios,
+        "period_labels": period_labels,
+    }
+
+
 def get_fnguide_ratios(ticker: str, retry: int = 1) -> Optional[dict]:
     """FnGuide 재무비율 페이지에서 ROE, ROA, PER, PBR 스크래핑
 
@@ -469,37 +506,14 @@ def get_fnguide_ratios(ticker: str, retry: int = 1) -> Optional[dict]:
                 "annual": {},
             }
 
-            # 수익성 지표 파싱 (ROE, ROA)
+            # 수익성 지표 (ROE, ROA) / 밸류에이션 지표 (PER, PBR) 파싱
             profit_data = _parse_fnguide_ratio_table(soup, "divProfitRatio", PROFITABILITY_METRICS)
-            if profit_data:
-                for year, metrics in profit_data.items():
-                    if year not in result["annual"]:
-                        result["annual"][year] = {}
-                    result["annual"][year].update(metrics)
-
-            # 밸류에이션 지표 파싱 (PER, PBR)
             value_data = _parse_fnguide_ratio_table(soup, "divValueRatio", VALUATION_METRICS)
-            if value_data:
-                for year, metrics in value_data.items():
-                    if year not in result["annual"]:
-                        result["annual"][year] = {}
-                    result["annual"][year].update(metrics)
+            _merge_fnguide_ratio_data(result, [profit_data, value_data])
 
             if not result["annual"]:
                 raise ValueError("Failed to parse ratio data")
 
-            # 최신 연도 데이터 추출
-            years = sorted(result["annual"].keys(), reverse=True)
-            if years:
-                latest_year = years[0]
-                result["period"] = f"{latest_year}/12"
-                latest = result["annual"][latest_year]
-                result["roe"] = latest.get("roe")
-                result["roa"] = latest.get("roa")
-                result["per"] = latest.get("per")
-                result["pbr"] = latest.get("pbr")
-                result["operating_margin"] = latest.get("operating_margin")
-
             return result
 
         except Exception as e:
@@ -511,6 +525,29 @@ def get_fnguide_ratios(ticker: str, retry: int = 1) -> Optional[dict]:
     return None
 
 
+def _merge_fnguide_ratio_data(result: dict, tables: list) -> None:
+    """연도별 재무비율 테이블 파싱 결과를 result["annual"]에 합치고 최신 연도 값 설정"""
+    for data in tables:
+        if not data:
+            continue
+        for year, metrics in data.items():
+            if year not in result["annual"]:
+                result["annual"][year] = {}
+            result["annual"][year].update(metrics)
+
+    # 최신 연도 데이터 추출
+    years = sorted(result["annual"].keys(), reverse=True)
+    if years:
+        latest_year = years[0]
+        result["period"] = f"{latest_year}/12"
+        latest = result["annual"][latest_year]
+        result["roe"] = latest.get("roe")
+        result["roa"] = latest.get("roa")
+        result["per"] = latest.get("per")
+        result["pbr"] = latest.get("pbr")
+        result["operating_margin"] = latest.get("operating_margin")
+
+
 def _parse_fnguide_ratio_table(soup: BeautifulSoup, div_id: str, metrics: dict) -> Optional[dict]:
     """FnGuide 재무비율 테이블 파싱
 
@@ -543,6 +580,28 @@ def _parse_fnguide_ratio_table(soup: BeautifulSoup, div_id: str, metrics: dict)
             if text:
                 headers.append(text)
 
+    tbody = table.find("tbody")
+    if not tbody:
+        return None
+
+    rows = [
+        [cell.text.strip() for cell in tr.find_all(["th", "td"])]
+        for tr in tbody.find_all("tr")
+    ]
+    return _parse_fnguide_ratio_rows(headers, rows, metrics)
+
+
+def _parse_fnguide_ratio_rows(headers: list, rows: list, metrics: dict) -> Optional[dict]:
+    """재무비율 표 텍스트 파싱 (HTML 테이블 / Playwright snapshot 공용)
+
+    Args:
+        headers: 헤더 셀 텍스트 (예: ["IFRS연결", "2023/12", "2024/12"])
+        rows: 행별 셀 텍스트 목록 (첫 셀 = 행 이름)
+        metrics: 한글→영문 메트릭 매핑
+
+    Returns:
+        _parse_fnguide_ratio_table과 동일 or None
+    """
     if len(headers) < 2:
         return None
 
@@ -557,26 +616,20 @@ def _parse_fnguide_ratio_table(soup: BeautifulSoup, div_id: str, metrics: dict)
 
     # 데이터 행 파싱
     result = {p: {} for p in periods if p}
-    tbody = table.find("tbody")
-    if not tbody:
-        return None
-
-    for tr in tbody.find_all("tr"):
-        cells = tr.find_all(["th", "td"])
+    for cells in rows:
         if len(cells) < 2:
             continue
 
         # 행 이름 (첫 번째 셀)
-        row_name = cells[0].text.strip()
-        eng_key = metrics.get(row_name)
+        eng_key = metrics.get(cells[0])
         if not eng_key:
             continue
 
         # 값 추출
-        for i, cell in enumerate(cells[1:]):
+        for i, text in enumerate(cells[1:]):
             if i >= len(periods) or not periods[i]:
                 continue
-            value = _parse_fnguide_number(cell.text.strip())
+            value = _parse_fnguide_number(text)
             if value is not None:
                 result[periods[i]][eng_key] = value
 
@@ -808,152 +861,161 @@ def get_fnguide_snapshot_ratios(ticker: str, retry: int = 1) -> Optional[dict]:
         try:
             response = requests.get(url, headers=FNGUIDE_HEADERS, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            return _parse_fnguide_snapshot(response.text, ticker)
 
-            result = {
-                "source": "FnGuide Snapshot",
-                "ticker": ticker,
-                "roe": None,
-                "roe_period": None,
-                "roa": None,
-                "roa_period": None,
-                "ev_ebitda": None,
-                "ev_ebitda_period": None,
-            }
-
-            # IFRS(연결) Annual 테이블에서 최신 연도 데이터 찾기
-            for table in soup.find_all("table"):
-                # 테이블 헤더 확인
-                thead = table.find("thead")
-                if not thead:
-                    continue
+        except Exception:
+            if attempt < retry:
+                time.sleep(1)
+                continue
+            return None
 
-                headers = [th.get_text(strip=True) for th in thead.find_all("th")]
+    return None
 
-                # IFRS(연결) Annual 테이블인지 확인
-                if not headers or "IFRS(연결)" not in headers[0]:
-                    continue
-                if "Annual" not in headers:
-                    continue
 
-                # 연도 컬럼 인덱스 찾기 (YYYY/12 형식, 잠정실적 제외)
-                year_indices = {}
-                first_year_header_idx = None
-                for i, h in enumerate(headers):
-                    # 잠정실적(P) 제외, 확정 연간 데이터만
-                    match = re.match(r"^(\d{4})/12$", h)
-                    if match:
-                        if first_year_header_idx is None:
-                            first_year_header_idx = i
-                        year_indices[int(match.group(1))] = i
-
-                if not year_indices or first_year_header_idx is None:
-                    continue
+def _parse_fnguide_snapshot(html: str, ticker: str) -> dict:
+    """SVD_Main.asp HTML에서 ROE, ROA, EV/EBITDA 파싱
 
-                # 최신 연도 찾기
-                latest_year = max(year_indices.keys())
-                latest_header_idx = year_indices[latest_year]
-
-                # 데이터 행에서 ROE, EV/EBITDA 찾기
-                for row in table.find_all("tr"):
-                    ths = row.find_all("th")
-                    tds = row.find_all("td")
-
-                    if not ths or not tds:
-                        continue
-
-                    th_text = ths[0].get_text(strip=True)
-
-                    # ROE
-                    if result["roe"] is None and "ROE" in th_text and "%" in th_text:
-                        # td 인덱스 = header 인덱스 - 첫 번째 연도 헤더 인덱스
-                        # (IFRS(연결), Annual, Net Quarter 등 비연도 컬럼 제외)
-                        td_idx = latest_header_idx - first_year_header_idx
-                        if 0 <= td_idx < len(tds):
-                            val_text = tds[td_idx].get_text(strip=True)
-                            if val_text and val_text not in ["", "-"]:
-                                try:
-                                    result["roe"] = float(val_text.replace(",", ""))
-                                    result["roe_period"] = f"{latest_year}/12"
-                                except ValueError:
-                                    pass
-
-                    # ROA
-                    if result["roa"] is None and "ROA" in th_text and "%" in th_text:
-                        td_idx = latest_header_idx - first_year_header_idx
-                        if 0 <= td_idx < len(tds):
-                            val_text = tds[td_idx].get_text(strip=True)
-                            if val_text and val_text not in ["", "-"]:
-                                try:
-                                    result["roa"] = float(val_text.replace(",", ""))
-                                    result["roa_period"] = f"{latest_year}/12"
-                                except ValueError:
-                                    pass
-
-                    # EV/EBITDA
-                    if result["ev_ebitda"] is None and "EV/EBITDA" in th_text:
-                        td_idx = latest_header_idx - first_year_header_idx
-                        if 0 <= td_idx < len(tds):
-                            val_text = tds[td_idx].get_text(strip=True)
-                            if val_text and val_text not in ["", "-"]:
-                                try:
-                                    result["ev_ebitda"] = float(val_text.replace(",", ""))
-                                    result["ev_ebitda_period"] = f"{latest_year}/12"
-                                except ValueError:
-                                    pass
-
-                # 첫 번째 IFRS(연결) Annual 테이블에서 ROE 찾으면 종료
-                if result["roe"] is not None:
-                    break
+    Raises:
+        ValueError: 세 지표 모두 찾지 못한 경우
+    """
+    soup = BeautifulSoup(html, "html.parser")
 
-            # EV/EBITDA는 별도 테이블에서 찾기 (구분, 삼성전자, 코스피... 형태)
-            if result["ev_ebitda"] is None:
-                for table in soup.find_all("table"):
-                    thead = table.find("thead")
-                    if not thead:
-                        continue
+    result = {
+        "source": "FnGuide Snapshot",
+        "ticker": ticker,
+        "roe": None,
+        "roe_period": None,
+        "roa": None,
+        "roa_period": None,
+        "ev_ebitda": None,
+        "ev_ebitda_period": None,
+    }
 
-                    headers = [th.get_text(strip=True) for th in thead.find_all("th")]
-                    # "구분" 컬럼이 있고, 종목명이 두 번째 컬럼인 테이블
-                    if not headers or headers[0] != "구분":
-                        continue
+    # IFRS(연결) Annual 테이블에서 최신 연도 데이터 찾기
+    for table in soup.find_all("table"):
+        # 테이블 헤더 확인
+        thead = table.find("thead")
+        if not thead:
+            continue
 
-                    for row in table.find_all("tr"):
-                        ths = row.find_all("th")
-                        tds = row.find_all("td")
+        headers = [th.get_text(strip=True) for th in thead.find_all("th")]
 
-                        if not ths or not tds:
-                            continue
+        # IFRS(연결) Annual 테이블인지 확인
+        if not headers or "IFRS(연결)" not in headers[0]:
+            continue
+        if "Annual" not in headers:
+            continue
 
-                        th_text = ths[0].get_text(strip=True)
+        # 연도 컬럼 인덱스 찾기 (YYYY/12 형식, 잠정실적 제외)
+        year_indices = {}
+        first_year_header_idx = None
+        for i, h in enumerate(headers):
+            # 잠정실적(P) 제외, 확정 연간 데이터만
+            match = re.match(r"^(\d{4})/12$", h)
+            if match:
+                if first_year_header_idx is None:
+                    first_year_header_idx = i
+                year_indices[int(match.group(1))] = i
+
+        if not year_indices or first_year_header_idx is None:
+            continue
 
-                        if "EV/EBITDA" in th_text:
-                            # 첫 번째 td가 해당 종목의 EV/EBITDA
-                            val_text = tds[0].get_text(strip=True)
-                            if val_text and val_text not in ["", "-"]:
-                                try:
-                                    result["ev_ebitda"] = float(val_text.replace(",", ""))
-                                    result["ev_ebitda_period"] = "latest"
-                                except ValueError:
-                                    pass
-                            break
+        # 최신 연도 찾기
+        latest_year = max(year_indices.keys())
+        latest_header_idx = year_indices[latest_year]
 
-                    if result["ev_ebitda"] is not None:
-                        break
+        # 데이터 행에서 ROE, EV/EBITDA 찾기
+        for row in table.find_all("tr"):
+            ths = row.find_all("th")
+            tds = row.find_all("td")
 
-            # 하나라도 찾았으면 반환
-            if result["roe"] is not None or result["roa"] is not None or result["ev_ebitda"] is not None:
-                return result
+            if not ths or not tds:
+                continue
 
-            raise ValueError("Failed to find ROE, ROA or EV/EBITDA")
+            th_text = ths[0].get_text(strip=True)
+
+            # ROE
+            if result["roe"] is None and "ROE" in th_text and "%" in th_text:
+                # td 인덱스 = header 인덱스 - 첫 번째 연도 헤더 인덱스
+                # (IFRS(연결), Annual, Net Quarter 등 비연도 컬럼 제외)
+                td_idx = latest_header_idx - first_year_header_idx
+                if 0 <= td_idx < len(tds):
+                    val_text = tds[td_idx].get_text(strip=True)
+                    if val_text and val_text not in ["", "-"]:
+                        try:
+                            result["roe"] = float(val_text.replace(",", ""))
+                            result["roe_period"] = f"{latest_year}/12"
+                        except ValueError:
+                            pass
+
+            # ROA
+            if result["roa"] is None and "ROA" in th_text and "%" in th_text:
+                td_idx = latest_header_idx - first_year_header_idx
+                if 0 <= td_idx < len(tds):
+                    val_text = tds[td_idx].get_text(strip=True)
+                    if val_text and val_text not in ["", "-"]:
+                        try:
+                            result["roa"] = float(val_text.replace(",", ""))
+                            result["roa_period"] = f"{latest_year}/12"
+                        except ValueError:
+                            pass
+
+            # EV/EBITDA
+            if result["ev_ebitda"] is None and "EV/EBITDA" in th_text:
+                td_idx = latest_header_idx - first_year_header_idx
+                if 0 <= td_idx < len(tds):
+                    val_text = tds[td_idx].get_text(strip=True)
+                    if val_text and val_text not in ["", "-"]:
+                        try:
+                            result["ev_ebitda"] = float(val_text.replace(",", ""))
+                            result["ev_ebitda_period"] = f"{latest_year}/12"
+                        except ValueError:
+                            pass
+
+        # 첫 번째 IFRS(연결) Annual 테이블에서 ROE 찾으면 종료
+        if result["roe"] is not None:
+            break
+
+    # EV/EBITDA는 별도 테이블에서 찾기 (구분, 삼성전자, 코스피... 형태)
+    if result["ev_ebitda"] is None:
+        for table in soup.find_all("table"):
+            thead = table.find("thead")
+            if not thead:
+                continue
 
-        except Exception:
-            if attempt < retry:
-                time.sleep(1)
+            headers = [th.get_text(strip=True) for th in thead.find_all("th")]
+            # "구분" 컬럼이 있고, 종목명이 두 번째 컬럼인 테이블
+            if not headers or headers[0] != "구분":
                 continue
-            return None
 
-    return None
+            for row in table.find_all("tr"):
+                ths = row.find_all("th")
+                tds = row.find_all("td")
+
+                if not ths or not tds:
+                    continue
+
+                th_text = ths[0].get_text(strip=True)
+
+                if "EV/EBITDA" in th_text:
+                    # 첫 번째 td가 해당 종목의 EV/EBITDA
+                    val_text = tds[0].get_text(strip=True)
+                    if val_text and val_text not in ["", "-"]:
+                        try:
+                            result["ev_ebitda"] = float(val_text.replace(",", ""))
+                            result["ev_ebitda_period"] = "latest"
+                        except ValueError:
+                            pass
+                    break
+
+            if result["ev_ebitda"] is not None:
+                break
+
+    # 하나라도 찾았으면 반환
+    if result["roe"] is not None or result["roa"] is not None or result["ev_ebitda"] is not None:
+        return result
+
+    raise ValueError("Failed to find ROE, ROA or EV/EBITDA")
 
 
 if __name__ == "__main__":
@@ -4,11 +4,13 @@
 입력: pandas Series
 출력: pandas Series 또는 tuple
 """
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pandas as pd
 import numpy as np
 
+from utils.volume import VOLUME_PROFILE_BINS, volume_histogram
+
 
 def sma(close: pd.Series, period: int) -> pd.Series:
     """
@@ -224,3 +226,204 @@ def support_resistance(
         "s1": float(s1),
         "s2": float(s2),
     }
+
+
+def swing_points(
+    high: pd.Series,
+    low: pd.Series,
+    order: int = 5
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    스윙 고점/저점 (좌우 order 봉 중 최고가/최저가인 봉)
+
+    Args:
+        high: 고가 Series (또는 날짜 × 종목 DataFrame)
+        low: 저가 Series (또는 날짜 × 종목 DataFrame)
+        order: 좌우 비교 봉 수 (기본 5)
+
+    Returns:
+        (swing_high, swing_low) - 스윙 봉은 가격, 나머지는 NaN
+        (마지막 order 봉은 오른쪽 봉이 없어 미확정 → NaN)
+
+    Note:
+        pandas rolling max/min은 단조 덱 기반 O(n) - 긴 기간/전 종목에도 선형 시간
+    """
+    window = 2 * order + 1
+    swing_high = high.where(high == high.rolling(window, center=True).max())
+    swing_low = low.where(low == low.rolling(window, center=True).min())
+    return swing_high, swing_low
+
+
+def _cluster_prices(prices: np.ndarray, tolerance_pct: float) -> list:
+    """정렬된 가격을 구간 하단 대비 tolerance_pct 이내끼리 묶음 → [[index, ...], ...]"""
+    clusters = []
+    current = [0]
+    for i in range(1, len(prices)):
+        base = prices[current[0]]
+        if (prices[i] - base) / base * 100 <= tolerance_pct:
+            current.append(i)
+        else:
+            clusters.append(current)
+            current = [i]
+    clusters.append(current)
+    return clusters
+
+
+def _format_date(value) -> str:
+    """인덱스 값 → 날짜 문자열"""
+    return value.strftime("%Y-%m-%d") if hasattr(value, "strftime") else str(value)
+
+
+def _levels_for_series(
+    index: pd.Index,
+    close: np.ndarray,
+    volume: Optional[np.ndarray],
+    swing_high: np.ndarray,
+    swing_low: np.ndarray,
+    tolerance_pct: float,
+    max_levels: int
+) -> dict:
+    """1종목 스윙 포인트 → 지지/저항 구간 (numpy 배열 입력)"""
+    result = {"price": None, "support": [], "resistance": [], "volume_poc": None}
+    valid = ~np.isnan(close)
+    if not valid.any():
+        return result
+
+    positions = np.flatnonzero(valid)
+    index, close, swing_high, swing_low = index[positions], close[positions], swing_high[positions], swing_low[positions]
+    weights = np.nan_to_num(volume[positions].astype(float)) if volume is not None else None
+    current = float(close[-1])
+    result["price"] = current
+
+    # 거래량 최다 가격대 (Point of Control)
+    total_volume = weights.sum() if weights is not None else 0.0
+    if total_volume > 0:
+        edges, hist = volume_histogram(close[:, None], weights[:, None], VOLUME_PROFILE_BINS)
+        peak = int(hist[0].argmax())
+        result["volume_poc"] = round(float((edges[0, peak] + edges[0, peak + 1]) / 2), 2)
+
+    is_high = ~np.isnan(swing_high)
+    is_low = ~np.isnan(swing_low)
+    prices = np.concatenate([swing_high[is_high], swing_low[is_low]])
+    if prices.size == 0:
+        return result
+    bars = np.arange(len(close))
+    pivot_pos = np.concatenate([bars[is_high], bars[is_low]])
+    pivot_weight = weights[pivot_pos] if weights is not None else np.ones(len(prices))
+
+    order_idx = np.argsort(prices, kind="stable")
+    prices, pivot_pos, pivot_weight = prices[order_idx], pivot_pos[order_idx], pivot_weight[order_idx]
+
+    zones = []
+    for members in _cluster_prices(prices, tolerance_pct):
+        member_prices = prices[members]
+        member_weight = pivot_weight[members]
+        # 스윙 봉 거래량 가중 평균 (거래량 없으면 단순 평균)
+        if member_weight.sum() > 0:
+            price = float(np.average(member_prices, weights=member_weight))
+        else:
+            price = float(member_prices.mean())
+        zone_low, zone_high = float(member_prices.min()), float(member_prices.max())
+        zone = {
+            "price": round(price, 2),
+            "low": round(zone_low, 2),
+            "high": round(zone_high, 2),
+            "touches": len(members),
+            "last_touch": _format_date(index[int(pivot_pos[members].max())]),
+            "volume_pct": None,
+            "distance_pct": round((price - current) / current * 100, 2),
+        }
+        if total_volume > 0:
+            band = price * tolerance_pct / 100
+            in_zone = (close >= zone_low - band) & (close <= zone_high + band)
+            zone["volume_pct"] = round(float(weights[in_zone].sum() / total_volume * 100), 1)
+        zones.append(zone)
+
+    # 강도 순: 터치 횟수 → 거래량 비중 → 현재가와 가까운 순
+    zones.sort(key=lambda z: (-z["touches"], -(z["volume_pct"] or 0), abs(z["distance_pct"])))
+    result["support"] = [z for z in zones if z["price"] <= current][:max_levels]
+    result["resistance"] = [z for z in zones if z["price"] > current][:max_levels]
+    return result
+
+
+def support_resistance_levels(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    volume: Optional[pd.Series] = None,
+    order: int = 5,
+    lookback: int = 250,
+    tolerance_pct: float = 1.5,
+    max_levels: int = 3
+):
+    """
+    다중 지지/저항 구간 (스윙 고저점 클러스터링)
+
+    lookback 기간의 스윙 고점/저점을 가격 차이 tolerance_pct 이내끼리 묶어 구간으로 만들고
+    터치 횟수(묶인 스윙 수)와 거래량 비중으로 순위를 매김
+
+    Args:
+        high: 고가 Series (또는 날짜 × 종목 DataFrame)
+        low: 저가 Series (또는 DataFrame)
+        close: 종가 Series (또는 DataFrame)
+        volume: 거래량 (있으면 구간 가격을 거래량 가중 평균, 거래량 비중 계산)
+        order: 스윙 판단 좌우 봉 수 (기본 5)
+        lookback: 계산 기간 (기본 250 ≈ 1년)
+        tolerance_pct: 같은 구간으로 묶을 가격 차이 % (기본 1.5)
+        max_levels: 지지/저항 각각 최대 구간 수
+
+    Returns:
+        Series 입력:
+        {
+            "price": 55000.0,                # 현재가 (마지막 종가)
+            "support": [
+                {
+                    "price": 52150.0,        # 구간 대표 가격 (거래량 가중)
+                    "low": 51900.0,          # 구간 하단
+                    "high": 52400.0,         # 구간 상단
+                    "touches": 4,            # 구간에 속한 스윙 고저점 수
+                    "last_touch": "2026-01-10",
+                    "volume_pct": 18.2,      # 구간 가격대 거래량 비중 % (거래량 없으면 None)
+                    "distance_pct": -5.18    # 현재가 대비 %
+                },
+                ...
+            ],
+            "resistance": [...],             # 같은 형식
+            "volume_poc": 53000.0            # 거래량 최다 가격대 (거래량 없으면 None)
+        }
+        DataFrame 입력: {종목코드: 위 dict}
+    """
+    high, low, close = high.iloc[-lookback:], low.iloc[-lookback:], close.iloc[-lookback:]
+    if volume is not None:
+        volume = volume.iloc[-lookback:]
+
+    # 스윙 탐지는 전 종목 한 번에 (rolling 연산)
+    swing_high, swing_low = swing_points(high, low, order)
+
+    if isinstance(close, pd.Series):
+        return _levels_for_series(
+            close.index,
+            close.to_numpy(dtype=float),
+            volume.to_numpy() if volume is not None else None,
+            swing_high.to_numpy(dtype=float),
+            swing_low.to_numpy(dtype=float),
+            tolerance_pct,
+            max_levels,
+        )
+
+    closes = close.to_numpy(dtype=float)
+    volumes = volume.reindex(columns=close.columns).to_numpy() if volume is not None else None
+    highs = swing_high.to_numpy(dtype=float)
+    lows = swing_low.to_numpy(dtype=float)
+    return {
+        ticker: _levels_for_series(
+            close.index,
+            closes[:, i],
+            volumes[:, i] if volumes is not None else None,
+            highs[:, i],
+            lows[:, i],
+            tolerance_pct,
+            max_levels,
+        )
+        for i, ticker in enumerate(close.columns)
+    }
@@ -0,0 +1,205 @@
+"""종목별 OHLCV 로컬 저장소
+
+전 종목 스크리닝/백테스트용 일봉 저장소
+- 종목별 파일 1개 (pandas pickle, 추가 의존성 없음)
+- 증분 업데이트: 마지막 저장일 이후 구간만 pykrx 조회 (스레드 풀로 동시 처리)
+- load_ohlcv_panels(): 전 종목을 날짜 × 종목 행렬로 로드
+
+저장 위치: $VULTURE_DATA_DIR/ohlcv (기본 ~/.cache/vulture/ohlcv)
+    {ticker}.pkl  # get_ohlcv와 같은 컬럼의 DataFrame (index=날짜)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from utils.data_fetcher import get_ohlcv, get_ticker_list
+
+# 첫 저장 시 조회 일수 (52주 + 여유)
+INITIAL_HISTORY_DAYS = 500
+# 증분 업데이트 시 겹쳐 받는 영업일 수 (수정주가 변경 반영)
+UPDATE_OVERLAP_DAYS = 5
+
+OHLCV_FIELDS = ("시가", "고가", "저가", "종가", "거래량")
+
+
+def _default_store_dir() -> Path:
+    """기본 저장 디렉토리"""
+    base = os.environ.get("VULTURE_DATA_DIR", "~/.cache/vulture")
+    return Path(base).expanduser() / "ohlcv"
+
+
+def _store_root(store_dir: Optional[str]) -> Path:
+    """저장 디렉토리 (미지정 시 기본값)"""
+    return Path(store_dir) if store_dir else _default_store_dir()
+
+
+def list_stored_tickers(store_dir: Optional[str] = None) -> list:
+    """저장소에 있는 종목코드 목록 (정렬)"""
+    root = _store_root(store_dir)
+    if not root.exists():
+        return []
+    return sorted(p.stem for p in root.glob("*.pkl"))
+
+
+def load_ohlcv(ticker: str, store_dir: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    저장된 종목 OHLCV 조회
+
+    Returns:
+        DataFrame (get_ohlcv와 동일 컬럼) or None (저장 안 됨)
+    """
+    path = _store_root(store_dir) / f"{ticker}.pkl"
+    if not path.exists():
+        return None
+    return pd.read_pickle(path)
+
+
+def _update_ticker(ticker: str, root: Path, history_days: int, today: datetime) -> int:
+    """종목 1개 증분 업데이트 → 새로 추가된 행 수 (실패 시 예외)"""
+    path = root / f"{ticker}.pkl"
+    stored = pd.read_pickle(path) if path.exists() else None
+
+    if stored is None or stored.empty:
+        days = history_days
+    else:
+        # 마지막 저장일 이후 달력일 수 + 겹침 구간 (get_ohlcv는 days*2 달력일을 조회)
+        gap = (today - pd.Timestamp(stored.index[-1]).to_pydatetime()).days
+        days = max(gap, 0) + UPDATE_OVERLAP_DAYS
+
+    fetched = get_ohlcv(ticker, days=days)
+    if fetched is None or fetched.empty:
+        raise ValueError(f"no OHLCV for {ticker}")
+
+    if stored is None or stored.empty:
+        merged = fetched
+    else:
+        merged = pd.concat([stored, fetched])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+
+    added = len(merged) - (0 if stored is None else len(stored))
+    tmp_path = path.with_suffix(".tmp")
+    merged.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+    return added
+
+
+def update_ohlcv_store(
+    tickers: Optional[Iterable[str]] = None,
+    market: str = "ALL",
+    store_dir: Optional[str] = None,
+    history_days: int = INITIAL_HISTORY_DAYS,
+    max_workers: int = 8
+) -> dict:
+    """
+    OHLCV 저장소 증분 업데이트
+
+    저장된 종목은 마지막 저장일 이후 구간만, 새 종목은 history_days 만큼 조회
+
+    Args:
+        tickers: 업데이트할 종목코드 (None이면 get_ticker_list(market) 전체)
+        market: tickers가 None일 때 대상 시장 ("KOSPI", "KOSDAQ", "ALL")
+        store_dir: 저장 디렉토리 (기본 $VULTURE_DATA_DIR/ohlcv)
+        history_days: 새 종목 조회 일수
+        max_workers: 동시 조회 스레드 수
+
+    Returns:
+        {
+            "updated": 2450,       # 성공 종목 수
+            "new_rows": 2450,      # 추가된 행 수 합계
+            "failed": ["123456"],  # 실패 종목
+            "elapsed_sec": 95.2
+        }
+    """
+    start = datetime.now()
+    if tickers is None:
+        tickers = get_ticker_list(market=market) or []
+    tickers = list(tickers)
+
+    root = _store_root(store_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    def task(ticker):
+        try:
+            return ticker, _update_ticker(ticker, root, history_days, start)
+        except Exception:
+            return ticker, None
+
+    updated = 0
+    new_rows = 0
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for ticker, added in pool.map(task, tickers):
+            if added is None:
+                failed.append(ticker)
+            else:
+                updated += 1
+                new_rows += added
+
+    return {
+        "updated": updated,
+        "new_rows": new_rows,
+        "failed": failed,
+        "elapsed_sec": round((datetime.now() - start).total_seconds(), 1),
+    }
+
+
+def load_ohlcv_panels(
+    fields: Iterable[str] = OHLCV_FIELDS,
+    tickers: Optional[Iterable[str]] = None,
+    days: Optional[int] = None,
+    store_dir: Optional[str] = None
+) -> dict:
+    """
+    저장소 전 종목 OHLCV → 필드별 날짜 × 종목 행렬
+
+    종목 파일은 한 번씩만 읽고, 필드별로 한 번에 합침
+
+    Args:
+        fields: 로드할 컬럼 (기본 시가/고가/저가/종가/거래량)
+        tickers: 대상 종목 (None=저장소 전체)
+        days: 최근 N 영업일만 (None=전체)
+        store_dir: 저장 디렉토리
+
+    Returns:
+        {"종가": DataFrame(index=날짜, columns=종목코드), "고가": ..., ...}
+        (상장 전/거래정지 구간은 NaN, 저장된 종목이 없으면 빈 dict)
+    """
+    fields = list(fields)
+    if tickers is None:
+        tickers = list_stored_tickers(store_dir)
+
+    columns = {field: {} for field in fields}
+    for ticker in tickers:
+        df = load_ohlcv(ticker, store_dir)
+        if df is None or df.empty:
+            continue
+        for field in fields:
+            if field in df.columns:
+                columns[field][ticker] = df[field]
+
+    panels = {}
+    for field, series in columns.items():
+        if not series:
+            continue
+        panel = pd.concat(series, axis=1).sort_index()
+        panels[field] = panel.tail(days) if days else panel
+    return panels
+
+
+def load_ohlcv_panel(
+    field: str = "종가",
+    tickers: Optional[Iterable[str]] = None,
+    days: Optional[int] = None,
+    store_dir: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """
+    저장소 전 종목의 한 필드 → 날짜 × 종목 행렬
+
+    Returns:
+        DataFrame(index=날짜, columns=종목코드) or None (저장된 종목 없음)
+    """
+    return load_ohlcv_panels([field], tickers=tickers, days=days, store_dir=store_dir).get(field)
@@ -0,0 +1,324 @@
+"""전 종목 기술적 스크리너
+
+OHLCV 저장소를 날짜 × 종목 행렬로 로드해 기술지표를 전 종목 동시에 계산하고,
+조합 가능한 조건(Condition)으로 후보를 골라 순위 목록으로 반환
+
+신호 기준은 ti_analyzer와 동일 (RSI 70/30, 완전 정배열/역배열, MACD 크로스 등)
+
+사용 예:
+    cond = rsi_signal("과매도") & ma_alignment("완전 정배열")
+    candidates = screen(cond, rank_by="rsi")
+"""
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import sma, rsi, macd, bollinger, stochastic
+from utils.ohlcv_store import load_ohlcv_panels
+from utils.volume import VOLUME_SURGE_RATIO, volume_panels
+from utils.ti_analyzer import (
+    RSI_OVERBOUGHT,
+    RSI_OVERSOLD,
+    STOCH_OVERBOUGHT,
+    STOCH_OVERSOLD,
+    get_rsi_signal,
+)
+
+# 52주 영업일 수
+WEEK52_DAYS = 252
+# 스크리닝 시 로드하는 영업일 수 (52주 + 지표 계산 여유)
+SCREEN_HISTORY_DAYS = 300
+
+# ma_alignment 패널 값 → get_ma_alignment 결과
+MA_ALIGNMENT_LABELS = {1: "완전 정배열", -1: "완전 역배열", 0: "혼조"}
+
+
+class Condition:
+    """
+    스크리닝 조건 (신호 패널 dict → 날짜 × 종목 bool 행렬)
+
+    & (AND), | (OR), ~ (NOT) 으로 조합
+    """
+
+    def __init__(self, name: str, fn: Callable[[dict], pd.DataFrame]):
+        self.name = name
+        self.fn = fn
+
+    def __call__(self, signals: dict) -> pd.DataFrame:
+        return self.fn(signals).fillna(False).astype(bool)
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return Condition(f"({self.name} & {other.name})", lambda s: self(s) & other(s))
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return Condition(f"({self.name} | {other.name})", lambda s: self(s) | other(s))
+
+    def __invert__(self) -> "Condition":
+        return Condition(f"~{self.name}", lambda s: ~self(s))
+
+    def __repr__(self) -> str:
+        return f"Condition({self.name})"
+
+
+def compute_signal_panels(panels: dict) -> dict:
+    """
+    OHLCV 행렬 → 신호 판단용 지표 행렬 (전 종목 동시 계산)
+
+    Args:
+        panels: load_ohlcv_panels 결과 ("고가", "저가", "종가" 필요, "거래량" 있으면 거래량 지표 포함)
+
+    Returns:
+        {
+            "close", "rsi", "macd", "macd_signal", "macd_hist",
+            "bb_position_pct",      # 볼린저 밴드 내 위치 (0=하단, 100=상단)
+            "stoch_k", "stoch_d",
+            "ma5", "ma20", "ma60",
+            "ma_alignment",         # 1=완전 정배열, -1=완전 역배열, 0=혼조 (MA60 전 NaN)
+            "macd_cross",           # 1=골든크로스, -1=데드크로스 (해당일), 0=없음
+            "week52_position_pct",  # 52주 고저 범위 내 위치 (0=최저, 100=최고)
+            + volume_panels 결과 ("rvol", "obv", "vwap", "turnover", "liquidity_pct" 등, 거래량 있을 때)
+        }
+        각 값은 날짜 × 종목 DataFrame
+    """
+    close = panels["종가"]
+    high = panels["고가"]
+    low = panels["저가"]
+
+    macd_line, signal_line, hist = macd(close)
+    upper, _, lower = bollinger(close)
+    stoch_k, stoch_d = stochastic(high, low, close)
+    ma5, ma20, ma60 = sma(close, 5), sma(close, 20), sma(close, 60)
+
+    # get_ma_alignment와 동일한 엄격 부등호
+    alignment = pd.DataFrame(
+        np.select(
+            [(close > ma5) & (ma5 > ma20) & (ma20 > ma60),
+             (close < ma5) & (ma5 < ma20) & (ma20 < ma60)],
+            [1.0, -1.0],
+            default=0.0,
+        ),
+        index=close.index,
+        columns=close.columns,
+    ).where(ma60.notna())
+
+    # MACD > Signal 상태가 바뀐 날
+    above = (macd_line > signal_line).astype(float).where(signal_line.notna())
+    cross = above.diff().fillna(0.0)
+
+    high_52w = high.rolling(WEEK52_DAYS, min_periods=1).max()
+    low_52w = low.rolling(WEEK52_DAYS, min_periods=1).min()
+    week52_range = (high_52w - low_52w).where(high_52w > low_52w)
+
+    signals = {
+        "close": close,
+        "rsi": rsi(close),
+        "macd": macd_line,
+        "macd_signal": signal_line,
+        "macd_hist": hist,
+        "bb_position_pct": (close - lower) / (upper - lower) * 100,
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+        "ma5": ma5,
+        "ma20": ma20,
+        "ma60": ma60,
+        "ma_alignment": alignment,
+        "macd_cross": cross,
+        "week52_position_pct": (close - low_52w) / week52_range * 100,
+    }
+    if "거래량" in panels:
+        signals.update(volume_panels(panels))
+    return signals
+
+
+def rsi_signal(label: str) -> Condition:
+    """RSI 신호 조건 ("과매수" | "과매도" | "중립", get_rsi_signal 기준)"""
+    if label == "과매수":
+        return Condition(label, lambda s: s["rsi"] > RSI_OVERBOUGHT)
+    if label == "과매도":
+        return Condition(label, lambda s: s["rsi"] < RSI_OVERSOLD)
+    if label == "중립":
+        return Condition(label, lambda s: (s["rsi"] >= RSI_OVERSOLD) & (s["rsi"] <= RSI_OVERBOUGHT))
+    raise ValueError(f"unknown RSI signal: {label}")
+
+
+def stochastic_signal(label: str) -> Condition:
+    """스토캐스틱 %K 신호 조건 ("과매수" | "과매도" | "중립", ti_analyzer 기준)"""
+    if label == "과매수":
+        return Condition(f"스토캐스틱 {label}", lambda s: s["stoch_k"] > STOCH_OVERBOUGHT)
+    if label == "과매도":
+        return Condition(f"스토캐스틱 {label}", lambda s: s["stoch_k"] < STOCH_OVERSOLD)
+    if label == "중립":
+        return Condition(
+            f"스토캐스틱 {label}",
+            lambda s: (s["stoch_k"] >= STOCH_OVERSOLD) & (s["stoch_k"] <= STOCH_OVERBOUGHT),
+        )
+    raise ValueError(f"unknown stochastic signal: {label}")
+
+
+def rsi_between(low: float, high: float) -> Condition:
+    """low <= RSI <= high"""
+    return Condition(f"{low}<=RSI<={high}", lambda s: (s["rsi"] >= low) & (s["rsi"] <= high))
+
+
+def ma_alignment(label: str) -> Condition:
+    """이동평균 배열 조건 ("완전 정배열" | "완전 역배열" | "혼조", get_ma_alignment 기준)"""
+    codes = {v: k for k, v in MA_ALIGNMENT_LABELS.items()}
+    if label not in codes:
+        raise ValueError(f"unknown MA alignment: {label}")
+    return Condition(label, lambda s: s["ma_alignment"] == codes[label])
+
+
+def macd_trend(label: str = "상승") -> Condition:
+    """MACD 추세 조건 ("상승": MACD > Signal, "하락": MACD <= Signal)"""
+    if label not in ("상승", "하락"):
+        raise ValueError(f"unknown MACD trend: {label}")
+    if label == "상승":
+        return Condition("MACD 상승", lambda s: s["macd"] > s["macd_signal"])
+    return Condition("MACD 하락", lambda s: s["macd"] <= s["macd_signal"])
+
+
+def macd_cross(direction: str = "golden", within: int = 1) -> Condition:
+    """
+    최근 within 영업일 안에 MACD 크로스 발생
+
+    Args:
+        direction: "golden" (MACD가 Signal 상향 돌파) | "dead" (하향 돌파)
+        within: 확인 기간 (1=당일만)
+    """
+    if direction not in ("golden", "dead"):
+        raise ValueError(f"unknown MACD cross: {direction}")
+    sign = 1.0 if direction == "golden" else -1.0
+    return Condition(
+        f"MACD {direction} cross ({within}d)",
+        lambda s: (s["macd_cross"] == sign).astype(float).rolling(within, min_periods=1).max() > 0,
+    )
+
+
+def _range_condition(key: str, name: str, below: Optional[float], above: Optional[float]) -> Condition:
+    """신호 패널 값이 above 이상, below 이하"""
+    def fn(s):
+        mask = s[key].notna()
+        if below is not None:
+            mask &= s[key] <= below
+        if above is not None:
+            mask &= s[key] >= above
+        return mask
+    return Condition(f"{name}[{above}, {below}]", fn)
+
+
+def bollinger_position(below: Optional[float] = None, above: Optional[float] = None) -> Condition:
+    """볼린저 밴드 위치 % 조건 (예: below=10 → 하단 근처, above=100 → 상단 돌파)"""
+    return _range_condition("bb_position_pct", "BB%", below, above)
+
+
+def week52_position(below: Optional[float] = None, above: Optional[float] = None) -> Condition:
+    """52주 고저 범위 내 위치 % 조건 (예: above=90 → 신고가 근처)"""
+    return _range_condition("week52_position_pct", "52W%", below, above)
+
+
+def volume_surge(min_ratio: float = VOLUME_SURGE_RATIO) -> Condition:
+    """상대 거래량(당일 / 직전 20일 평균) min_ratio 배 이상 (기본 3배, 게시글 볼륨 surge 기준과 동일)"""
+    return Condition(f"RVOL>={min_ratio}", lambda s: s["rvol"] >= min_ratio)
+
+
+def liquidity(top_pct: float = 30) -> Condition:
+    """20일 평균 거래대금 상위 top_pct % 종목"""
+    return _range_condition("liquidity_pct", "유동성%", None, 100 - top_pct)
+
+
+def _label(value, labels: dict):
+    """NaN이 아닌 패널 값 → 라벨"""
+    return None if pd.isna(value) else labels.get(int(value))
+
+
+def screen(
+    condition: Union[Condition, list],
+    rank_by: str = "rsi",
+    ascending: bool = True,
+    limit: Optional[int] = 50,
+    as_of: Optional[str] = None,
+    signals: Optional[dict] = None,
+    store_dir: Optional[str] = None
+) -> list:
+    """
+    전 종목 스크리닝
+
+    Args:
+        condition: Condition 또는 Condition 목록 (목록은 모두 만족 = AND)
+        rank_by: 정렬 기준 신호 패널 키 (예: "rsi", "week52_position_pct")
+        ascending: 오름차순 정렬 여부
+        limit: 최대 후보 수 (None=전체)
+        as_of: 기준일 (YYYY-MM-DD, None=마지막 영업일)
+        signals: compute_signal_panels 결과 재사용 (None이면 저장소에서 로드)
+        store_dir: OHLCV 저장소 디렉토리
+
+    Returns:
+        [
+            {
+                "ticker": "005930",
+                "date": "2026-01-15",
+                "close": 55000,
+                "rsi": 28.4,
+                "rsi_signal": "과매도",
+                "macd_trend": "상승",
+                "bb_position_pct": 8.2,
+                "ma_alignment": "혼조",
+                "week52_position_pct": 35.1,
+                "rvol": 2.3,             # 거래량 지표가 있을 때만
+                "liquidity_pct": 88.0
+            },
+            ...
+        ]
+        (rank_by 순, 저장소가 비었거나 후보가 없으면 빈 목록)
+    """
+    if isinstance(condition, (list, tuple)):
+        combined = condition[0]
+        for cond in condition[1:]:
+            combined = combined & cond
+        condition = combined
+
+    if signals is None:
+        panels = load_ohlcv_panels(
+            ("고가", "저가", "종가", "거래량", "거래대금"), days=SCREEN_HISTORY_DAYS, store_dir=store_dir
+        )
+        if "종가" not in panels:
+            return []
+        signals = compute_signal_panels(panels)
+
+    close = signals["close"]
+    date = close.index[-1] if as_of is None else close.index[close.index <= pd.Timestamp(as_of)][-1]
+
+    mask = condition(signals).loc[date]
+    tickers = mask.index[mask.to_numpy()]
+    if len(tickers) == 0:
+        return []
+
+    order = signals[rank_by].loc[date, tickers].sort_values(ascending=ascending, na_position="last")
+    if limit is not None:
+        order = order.head(limit)
+
+    row = {key: panel.loc[date] for key, panel in signals.items()}
+    candidates = []
+    for ticker in order.index:
+        rsi_val = row["rsi"][ticker]
+        candidates.append({
+            "ticker": ticker,
+            "date": date.strftime("%Y-%m-%d"),
+            "close": float(row["close"][ticker]),
+            "rsi": round(float(rsi_val), 1) if pd.notna(rsi_val) else None,
+            "rsi_signal": get_rsi_signal(rsi_val) if pd.notna(rsi_val) else None,
+            "macd_trend": "상승" if row["macd"][ticker] > row["macd_signal"][ticker] else "하락",
+            "bb_position_pct": _round(row["bb_position_pct"][ticker]),
+            "ma_alignment": _label(row["ma_alignment"][ticker], MA_ALIGNMENT_LABELS),
+            "week52_position_pct": _round(row["week52_position_pct"][ticker]),
+        })
+        if "rvol" in row:
+            candidates[-1]["rvol"] = _round(row["rvol"][ticker], 2)
+            candidates[-1]["liquidity_pct"] = _round(row["liquidity_pct"][ticker])
+    return candidates
+
+
+def _round(value, digits: int = 1) -> Optional[float]:
+    """NaN → None, 나머지는 반올림"""
+    return None if pd.isna(value) else round(float(value), digits)
@@ -0,0 +1,196 @@
+"""키워드 사전 기반 센티먼트 점수
+
+get_naver_discussion / get_naver_stock_news 제목 목록을 한 번에 점수화
+- 전체 키워드를 하나의 정규식(긴 키워드 우선)으로 컴파일 → pandas str 연산으로 전체 제목을 일괄 처리
+  (겹치는 키워드는 한 번만: "풀매수"는 very_bullish 1건, "매수"로 중복 집계 안 함)
+- 제목 점수: very_bullish(+2) ~ very_bearish(-2), 종합 점수는 평균 (sentiment-intelligence.md)
+- 펌프앤덤프 의심 표현 / 도배(동일 제목 반복) 탐지
+
+LLM에는 원문 대신 summarize_sentiment() 요약만 전달
+"""
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 등급별 키워드 (정규식 허용)
+# 부정 문맥에 들어가는 짧은 키워드는 전후방 탐색으로 제외하고 해당 구문을 반대 등급에 둠
+# ("내려간다"의 "간다", "기대 이하"의 "기대", "상승분 반납"의 "상승")
+SENTIMENT_LEXICON = {
+    "very_bullish": [
+        "상한가", "쩜상", "대박", "폭등", "떡상", "급등", "신고가", "풀매수", "가즈아",
+        "무조건 오른다",
+    ],
+    "bullish": [
+        "매수", r"상승(?!분?\s*반납)", "오른다", "오를", r"(?<!내려)간다", "저점", r"반등(?!\s*실패)",
+        "호재", r"기대(?!\s*이하|감\s*(?:소멸|꺾))", "추천", "좋음", "좋다", "돌파", "수주", "흑자",
+        "실적 개선", "턴어라운드", "저평가",
+    ],
+    "bearish": [
+        "매도", "하락", "내린다", "내릴", "내려간다", "손절", "고점", "악재", "조정", "우려",
+        "적자", "물렸", "고평가", "실망", r"기대\s*이하", r"기대감\s*(?:소멸|꺾)", r"상승분?\s*반납",
+        r"반등\s*실패",
+    ],
+    "very_bearish": [
+        "하한가", "폭락", "떡락", "급락", "상폐", "상장폐지", "망했", "나락", "탈출하세요",
+    ],
+}
+
+SENTIMENT_WEIGHTS = {
+    "very_bullish": 2,
+    "bullish": 1,
+    "bearish": -1,
+    "very_bearish": -2,
+}
+
+# 펌프앤덤프 의심 패턴 (sentiment-intelligence.md 이상 징후 탐지)
+PUMP_DUMP_PATTERNS = {
+    "과장 표현": [
+        r"무조건\s*오른", r"지금\s*안\s*사면", r"(?:사면|팔면|놓치면)\s*후회", r"마지막\s*기회", r"인생\s*역전",
+    ],
+    "근거 없는 목표가": [r"\d+\s*만\s*원\s*간다", r"\d+\s*배\s*(?:간다|오른다|상승)", r"목표가\s*\d+"],
+    "비밀 정보": [r"비밀\s*정보", r"내부\s*정보", r"찌라시", r"지인\s*피셜"],
+    # 단독 "세력"/"작전"은 일반 글("외국인 세력 매도")에도 쓰여 구문으로만 탐지
+    "세력 언급": [r"세력\s*(?:매집|개입|작업|진입|들어)", r"작전\s*(?:주|세력|중|들어)"],
+}
+
+
+def _compile(patterns: list) -> re.Pattern:
+    """키워드 목록 → 하나의 정규식 (긴 키워드 우선)"""
+    return re.compile("|".join(sorted(patterns, key=len, reverse=True)))
+
+
+_LEXICON_RE = {level: _compile(words) for level, words in SENTIMENT_LEXICON.items()}
+_ALL_KEYWORDS_RE = _compile([w for words in SENTIMENT_LEXICON.values() for w in words])
+# 매칭 문자열 → 등급 캐시
+_KEYWORD_LEVELS = {}
+_PUMP_DUMP_RE = {name: _compile(patterns) for name, patterns in PUMP_DUMP_PATTERNS.items()}
+
+
+def _to_titles(items) -> pd.Series:
+    """제목 문자열 목록 또는 get_naver_* 결과(dict 목록) → 문자열 Series"""
+    if items is None:
+        return pd.Series([], dtype="object")
+    titles = [item.get("title", "") if isinstance(item, dict) else item for item in items]
+    return pd.Series(titles, dtype="object").fillna("").astype(str)
+
+
+def _keyword_level(keyword: str) -> Optional[str]:
+    """_ALL_KEYWORDS_RE 매칭 문자열 → 등급 (해당 등급 키워드와 전체 일치)"""
+    if keyword not in _KEYWORD_LEVELS:
+        _KEYWORD_LEVELS[keyword] = next(
+            (level for level, pattern in _LEXICON_RE.items() if pattern.fullmatch(keyword)), None
+        )
+    return _KEYWORD_LEVELS[keyword]
+
+
+def score_titles(items) -> pd.DataFrame:
+    """
+    제목별 센티먼트 점수 (일괄 처리)
+
+    Args:
+        items: ["제목", ...] 또는 get_naver_discussion / get_naver_stock_news 결과
+
+    Returns:
+        DataFrame
+            title: 제목
+            very_bullish ~ very_bearish: 등급별 키워드 매칭 수 (겹치는 구간은 긴 키워드로 1회)
+            score: -2 ~ +2 (매칭 없으면 0)
+            pump_dump: 펌프앤덤프 의심 패턴 이름 ("과장 표현" 등) 또는 None
+    """
+    titles = _to_titles(items)
+    df = pd.DataFrame({"title": titles})
+
+    # 하나의 alternation으로 찾아 각 매칭 구간을 한 등급에만 집계
+    matches = titles.str.findall(_ALL_KEYWORDS_RE).explode().dropna()
+    levels = matches.map(_keyword_level).dropna()
+    counts = pd.crosstab(levels.index, levels).reindex(
+        index=range(len(titles)), columns=list(SENTIMENT_LEXICON), fill_value=0
+    )
+
+    raw = np.zeros(len(titles))
+    for level in SENTIMENT_LEXICON:
+        df[level] = counts[level].to_numpy()
+        raw += SENTIMENT_WEIGHTS[level] * df[level].to_numpy()
+    df["score"] = np.clip(raw, -2, 2)
+
+    flags = pd.Series([None] * len(titles), dtype="object")
+    for name, pattern in _PUMP_DUMP_RE.items():
+        hit = titles.str.contains(pattern) & flags.isna()
+        flags[hit] = name
+    df["pump_dump"] = flags
+    return df
+
+
+def get_sentiment_label(score: float) -> str:
+    """
+    종합 점수 → 신호 분류 (sentiment-intelligence.md 신호 분류 표)
+
+    Returns:
+        "극단적 낙관" | "낙관적" | "중립" | "비관적" | "극단적 비관"
+    """
+    if score >= 1.5:
+        return "극단적 낙관"
+    elif score >= 0.5:
+        return "낙관적"
+    elif score > -0.5:
+        return "중립"
+    elif score > -1.5:
+        return "비관적"
+    else:
+        return "극단적 비관"
+
+
+def summarize_sentiment(items, top_n: int = 10, examples: int = 3) -> Optional[dict]:
+    """
+    제목 목록 센티먼트 요약 (LLM 전달용)
+
+    Args:
+        items: ["제목", ...] 또는 get_naver_discussion / get_naver_stock_news 결과
+        top_n: 상위 키워드 개수
+        examples: 펌프앤덤프 의심 제목 예시 개수
+
+    Returns:
+        {
+            "count": 500,
+            "score": 0.84,               # -2 ~ +2 평균
+            "label": "낙관적",
+            "bullish_pct": 55.0,
+            "bearish_pct": 20.0,
+            "neutral_pct": 25.0,
+            "top_keywords": [["상한가", 42], ["매수", 30], ...],
+            "pump_dump": {
+                "flagged": 12,
+                "patterns": {"과장 표현": 8, "세력 언급": 4},
+                "duplicates": 5,         # 동일 제목 반복 게시 (도배)
+                "examples": ["무조건 오른다 지금 사라", ...]
+            }
+        }
+        or None (제목 없음)
+    """
+    df = score_titles(items)
+    if df.empty:
+        return None
+
+    count = len(df)
+    score = float(df["score"].mean())
+    keywords = df["title"].str.findall(_ALL_KEYWORDS_RE).explode().dropna()
+    flagged = df[df["pump_dump"].notna()]
+    normalized = df["title"].str.replace(r"\s+", "", regex=True)
+
+    return {
+        "count": count,
+        "score": round(score, 2),
+        "label": get_sentiment_label(score),
+        "bullish_pct": round(float((df["score"] > 0).mean()) * 100, 1),
+        "bearish_pct": round(float((df["score"] < 0).mean()) * 100, 1),
+        "neutral_pct": round(float((df["score"] == 0).mean()) * 100, 1),
+        "top_keywords": [[k, int(v)] for k, v in keywords.value_counts().head(top_n).items()],
+        "pump_dump": {
+            "flagged": len(flagged),
+            "patterns": {k: int(v) for k, v in flagged["pump_dump"].value_counts().items()},
+            "duplicates": int(normalized[normalized != ""].duplicated().sum()),
+            "examples": flagged["title"].head(examples).tolist(),
+        },
+    }
@@ -0,0 +1,294 @@
+"""Playwright 접근성 트리 snapshot 구조화 추출
+
+browser_snapshot 결과(YAML 형식 접근성 트리)를 노드 트리로 파싱하고
+table/row/cell 구조를 레코드로 변환 → 수십 KB snapshot을 수 KB JSON으로 축소
+
+    - table [ref=e10]:
+      - rowgroup [ref=e11]:
+        - row "IFRS연결 2023/12 2024/12" [ref=e12]:
+          - columnheader "IFRS연결" [ref=e13]
+          - columnheader "2023/12" [ref=e14]
+
+계층 구조는 들여쓰기로 판단하므로 clean_playwright_result 이전의
+원본 snapshot(또는 prune만 적용한 결과)을 입력으로 사용
+"""
+import json
+import re
+from typing import Iterable, Iterator, Optional
+
+from utils.web_scraper import _POST_DATE_RE
+from utils.financial_scraper import (
+    PROFITABILITY_METRICS,
+    VALUATION_METRICS,
+    _parse_fnguide_ratio_rows,
+    _merge_fnguide_ratio_data,
+)
+
+# "- role "name" [attr] [attr=value]: value" 형식 한 줄
+_LINE_RE = re.compile(r'^(?P<indent> *)- (?P<body>.*?)\s*$')
+_KEY_RE = re.compile(
+    r'^(?P<role>/?[\w-]+)'
+    r'(?: "(?P<name>(?:[^"\\]|\\.)*)")?'
+    r'(?P<attrs>(?: \[[^\]]*\])*)'
+    r'(?P<colon>:)?(?: (?P<value>.*))?$'
+)
+
+TABLE_ROLES = ("table", "grid", "treegrid")
+CELL_ROLES = ("cell", "gridcell", "columnheader", "rowheader")
+NAVER_BASE_URL = "https://finance.naver.com"
+
+
+def _unquote(text: str) -> str:
+    """YAML 따옴표 문자열 → 원문 ("..." 는 JSON 이스케이프, '...' 는 '' 이스케이프)"""
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text[1:-1]
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    return text
+
+
+def _parse_line(line: str) -> Optional[tuple]:
+    """snapshot 한 줄 → (들여쓰기, 노드) or None (노드가 아닌 줄)"""
+    match = _LINE_RE.match(line)
+    if not match:
+        return None
+
+    body = match.group("body")
+    # 특수문자가 있으면 키 전체가 '...' 로 감싸짐: - 'link "a: b"': value
+    if body.startswith("'"):
+        end = 1
+        while True:
+            end = body.find("'", end)
+            if end < 0 or body[end:end + 2] != "''":
+                break
+            end += 2
+        if end > 0:
+            body = _unquote(body[:end + 1]) + body[end + 1:]
+
+    key = _KEY_RE.match(body)
+    if not key:
+        return None
+
+    name = key.group("name")
+    if name is not None:
+        name = _unquote(f'"{name}"')
+    value = key.group("value")
+    node = {
+        "role": key.group("role"),
+        "name": name or None,
+        "value": _unquote(value) if value else None,
+        "children": [],
+    }
+    return len(match.group("indent")), node
+
+
+def parse_snapshot(text: str) -> list:
+    """
+    snapshot 텍스트 → 노드 트리
+
+    Args:
+        text: Playwright browser_snapshot 결과 (원본, 들여쓰기 유지)
+
+    Returns:
+        최상위 노드 목록
+        [{"role": "table", "name": None, "value": None, "children": [...]}, ...]
+        링크 주소는 {"role": "/url", "value": "/item/..."} 자식 노드로 표현
+    """
+    roots = []
+    stack = []  # (들여쓰기, 노드)
+    for line in text.splitlines():
+        parsed = _parse_line(line)
+        if parsed is None:
+            continue
+        indent, node = parsed
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        (stack[-1][1]["children"] if stack else roots).append(node)
+        stack.append((indent, node))
+    return roots
+
+
+def iter_nodes(nodes: Iterable[dict], roles: tuple, nested: bool = True) -> Iterator[dict]:
+    """
+    트리에서 roles에 해당하는 노드를 문서 순서대로 반환
+
+    Args:
+        nodes: 노드 목록
+        roles: 찾을 role 목록
+        nested: False면 찾은 노드의 하위는 탐색하지 않음
+    """
+    for node in nodes:
+        if node["role"] in roles:
+            yield node
+            if not nested:
+                continue
+        yield from iter_nodes(node["children"], roles, nested)
+
+
+def node_text(node: dict) -> str:
+    """노드 표시 텍스트 (이름 우선, 없으면 하위 텍스트를 공백으로 연결)"""
+    if node["name"]:
+        return node["name"]
+    parts = [node["value"]] if node["value"] and not node["role"].startswith("/") else []
+    for child in node["children"]:
+        if child["role"].startswith("/"):
+            continue
+        text = node_text(child)
+        if text:
+            parts.append(text)
+    return " ".join(parts)
+
+
+def node_url(node: dict) -> Optional[str]:
+    """노드 하위의 첫 번째 링크 주소"""
+    for child in iter_nodes(node["children"], ("/url",)):
+        if child["value"]:
+            return child["value"]
+    return None
+
+
+def _table_rows(table: dict) -> Iterator[dict]:
+    """테이블의 행 (중첩 테이블 제외)"""
+    for node in table["children"]:
+        if node["role"] == "row":
+            yield node
+        elif node["role"] not in TABLE_ROLES:
+            yield from _table_rows(node)
+
+
+def parse_snapshot_tables(text: str, min_rows: int = 1) -> list:
+    """
+    snapshot의 모든 테이블을 헤더/행 텍스트로 추출
+
+    columnheader로만 구성된 첫 행을 헤더로 사용
+
+    Args:
+        text: Playwright browser_snapshot 결과
+        min_rows: 데이터 행이 이보다 적은 테이블 제외
+
+    Returns:
+        [
+            {
+                "name": "재무비율",                        # 테이블 이름 (없으면 None)
+                "headers": ["IFRS연결", "2023/12", ...],
+                "rows": [["ROE", "3.84", "9.01"], ...],
+                "urls": [None, ...]                        # 행별 첫 링크 주소
+            },
+            ...
+        ]
+    """
+    tables = []
+    for table in iter_nodes(parse_snapshot(text), TABLE_ROLES):
+        headers = None
+        rows = []
+        urls = []
+        for row in _table_rows(table):
+            cells = [c for c in row["children"] if c["role"] in CELL_ROLES]
+            if not cells:
+                continue
+            texts = [node_text(c) for c in cells]
+            if headers is None and not rows and all(c["role"] == "columnheader" for c in cells):
+                headers = texts
+                continue
+            rows.append(texts)
+            urls.append(node_url(row))
+
+        if len(rows) >= min_rows:
+            tables.append({
+                "name": table["name"],
+                "headers": headers or [],
+                "rows": rows,
+                "urls": urls,
+            })
+    return tables
+
+
+def table_to_records(table: dict) -> list:
+    """
+    parse_snapshot_tables 결과 테이블 → 행별 dict
+
+    Returns:
+        [{"날짜": "2026.01.15 10:21", "제목": "...", "url": "/item/..."}, ...]
+        (헤더가 없으면 "col0", "col1", ... 키 사용)
+    """
+    records = []
+    for cells, url in zip(table["rows"], table["urls"]):
+        keys = table["headers"] if len(table["headers"]) == len(cells) else [
+            f"col{i}" for i in range(len(cells))
+        ]
+        record = dict(zip(keys, cells))
+        if url:
+            record["url"] = url
+        records.append(record)
+    return records
+
+
+def parse_naver_discussion_snapshot(text: str, limit: Optional[int] = None) -> Optional[list]:
+    """
+    네이버 종목토론방 snapshot → 게시글 목록 (get_naver_discussion과 동일 형식)
+
+    Args:
+        text: 종목토론방(board.naver) browser_snapshot 결과
+        limit: 최대 게시글 개수 (None=전체)
+
+    Returns:
+        [{"title": "...", "date": "2026.01.15 10:21", "url": "https://finance.naver.com/..."}, ...]
+        or None
+    """
+    posts = []
+    for row in iter_nodes(parse_snapshot(text), ("row",), nested=False):
+        link = next(
+            (
+                node for node in iter_nodes(row["children"], ("link",))
+                if "board_read" in (node_url(node) or "")
+            ),
+            None,
+        )
+        if link is None:
+            continue
+
+        cells = [node_text(c) for c in row["children"] if c["role"] in CELL_ROLES]
+        date = next((c for c in cells if c and _POST_DATE_RE.match(c)), "")
+        url = node_url(link)
+        posts.append({
+            "title": node_text(link).strip(),
+            "date": date,
+            "url": url if url.startswith("http") else NAVER_BASE_URL + url,
+        })
+        if limit is not None and len(posts) >= limit:
+            break
+
+    return posts if posts else None
+
+
+def parse_fnguide_ratio_snapshot(text: str, ticker: str) -> Optional[dict]:
+    """
+    FnGuide 재무비율(SVD_FinanceRatio.asp) snapshot → get_fnguide_ratios와 동일 형식
+
+    JS 렌더링 페이지라 requests로 가져오지 못할 때 Playwright snapshot에서 추출
+
+    Args:
+        text: SVD_FinanceRatio.asp browser_snapshot 결과
+        ticker: 종목코드
+
+    Returns:
+        get_fnguide_ratios와 동일 (source="FnGuide FinanceRatio (snapshot)") or None
+    """
+    result = {
+        "source": "FnGuide FinanceRatio (snapshot)",
+        "ticker": ticker,
+        "period": None,
+        "annual": {},
+    }
+
+    parsed = []
+    for table in parse_snapshot_tables(text):
+        headers = [h for h in table["headers"] if h]
+        for metrics in (PROFITABILITY_METRICS, VALUATION_METRICS):
+            parsed.append(_parse_fnguide_ratio_rows(headers, table["rows"], metrics))
+    _merge_fnguide_ratio_data(result, parsed)
+
+    return result if result["annual"] else None
@@ -6,10 +6,34 @@ TI 워커 에이전트가 사용하는 통합 분석 함수
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
 from utils.data_fetcher import get_ohlcv, get_ticker_name
-from utils.indicators import sma, ema, rsi, macd, bollinger, stochastic, support_resistance
+from utils.indicators import (
+    sma, ema, rsi, macd, bollinger, stochastic, support_resistance, support_resistance_levels,
+)
+from utils.volume import relative_volume, get_volume_signal, obv, vwap, turnover
 from utils.web_scraper import get_naver_stock_info
 
+# 신호 판단 기준 (screener 전 종목 조건에서도 사용)
+RSI_OVERBOUGHT = 70
+RSI_OVERSOLD = 30
+STOCH_OVERBOUGHT = 80
+STOCH_OVERSOLD = 20
+
+# 지표 warm-up 구간 (영업일): 가장 긴 lookback(ma60) + MACD(26+9) 수렴 여유
+# series 모드는 days + TI_WARMUP_DAYS 봉을 받아 계산하고 마지막 days 봉만 반환
+# (기본 모드는 기존 리포트 값 유지를 위해 days 봉만 조회)
+TI_WARMUP_DAYS = 60 + 26 + 9
+
+# series 모드 지표 배열 순서 (ti_series_to_frame 컬럼 순서)
+TI_SERIES_KEYS = (
+    "close", "rsi", "macd", "macd_signal", "macd_hist",
+    "bb_upper", "bb_middle", "bb_lower", "stoch_k", "stoch_d",
+    "ma5", "ma20", "ma60",
+)
+
 
 def format_market_cap(market_cap_eok) -> str:
     """시가총액을 읽기 쉬운 형식으로 포맷
@@ -51,9 +75,9 @@ def get_rsi_signal(rsi_value: float) -> str:
     Returns:
         "과매수" | "과매도" | "중립"
     """
-    if rsi_value > 70:
+    if rsi_value > RSI_OVERBOUGHT:
         return "과매수"
-    elif rsi_value < 30:
+    elif rsi_value < RSI_OVERSOLD:
         return "과매도"
     else:
         return "중립"
@@ -79,13 +103,18 @@ def get_ma_alignment(current: float, ma5: float, ma20: float, ma60: float) -> st
         return "혼조"
 
 
-def get_ti_full_analysis(ticker: str) -> dict:
+def get_ti_full_analysis(ticker: str, series: bool = False, days: int = 60) -> dict:
     """TI 워커를 위한 통합 분석 함수
 
     숫자 데이터, 52주 고저, 기술지표, 신호 판단을 모두 수행
 
     Args:
         ticker: 종목코드 (예: "005930")
+        series: True면 지표 전체 시계열(float32 배열)을 "series"에 함께 반환
+            (차트/다이버전스 분석에서 지표를 다시 계산하지 않도록)
+        days: 기술지표 계산 기간 (영업일, 기본 60)
+            series=True면 출력 기간이 되고, 계산용으로 TI_WARMUP_DAYS 봉을 더 받아
+            ma60/MACD signal이 첫 봉부터 채워짐
 
     Returns:
         {
@@ -94,7 +123,15 @@ def get_ti_full_analysis(ticker: str) -> dict:
             "week52": {...} or None,
             "indicators": {...} or None,
             "support_resistance": {...} or None,
-            "signals": {...} or None
+            "sr_levels": {...} or None,   # 52주 스윙 고저점 기반 다중 지지/저항 구간
+            "signals": {...} or None,
+            "series": {...} or None   # series=True 일 때만
+        }
+
+        series:
+        {
+            "dates": datetime64[D] 배열 (1회만 저장),
+            "close", "rsi", "macd", ..., "ma60": float32 배열 (dates와 같은 길이, 최대 days개)
         }
     """
     result = {
@@ -107,8 +144,11 @@ def get_ti_full_analysis(ticker: str) -> dict:
         "week52": None,
         "indicators": None,
         "support_resistance": None,
+        "sr_levels": None,
         "signals": None,
     }
+    if series:
+        result["series"] = None
 
     # 1. 종목명 조회
     name = get_ticker_name(ticker)
@@ -155,8 +195,16 @@ def get_ti_full_analysis(ticker: str) -> dict:
             "position_pct": round(position_pct, 1) if position_pct else None,
         }
 
-    # 4. 기술지표 (pykrx 60일 데이터)
-    df = get_ohlcv(ticker, days=60)
+        # 다중 지지/저항 구간 (52주 스윙 고저점 + 거래량)
+        result["sr_levels"] = support_resistance_levels(
+            df_year['고가'],
+            df_year['저가'],
+            df_year['종가'],
+            df_year['거래량'] if '거래량' in df_year.columns else None,
+        )
+
+    # 4. 기술지표 (pykrx days 데이터, series 모드는 warm-up 포함)
+    df = get_ohlcv(ticker, days=days + TI_WARMUP_DAYS if series else days)
     if df is not None and not df.empty:
         close = df['종가']
         high = df['고가']
@@ -177,7 +225,10 @@ def get_ti_full_analysis(ticker: str) -> dict:
 
         # 스토캐스틱
         k, d = stochastic(high, low, close)
-        stoch_signal = "과매수" if k.iloc[-1] > 80 else ("과매도" if k.iloc[-1] < 20 else "중립")
+        stoch_signal = (
+            "과매수" if k.iloc[-1] > STOCH_OVERBOUGHT
+            else ("과매도" if k.iloc[-1] < STOCH_OVERSOLD else "중립")
+        )
 
         # 이동평균
         ma5_val = sma(close, 5).iloc[-1]
@@ -219,6 +270,21 @@ def get_ti_full_analysis(ticker: str) -> dict:
             },
         }
 
+        # 거래량 (상대 거래량 / OBV / VWAP / 평균 거래대금)
+        if '거래량' in df.columns:
+            volume = df['거래량']
+            rvol_val = relative_volume(volume).iloc[-1]
+            obv_line = obv(close, volume)
+            vwap_val = vwap(high, low, close, volume).iloc[-1]
+            turnover_avg = turnover(close, volume, df.get('거래대금')).tail(20).mean()
+            result["indicators"]["volume"] = {
+                "rvol": round(float(rvol_val), 2) if pd.notna(rvol_val) else None,
+                "signal": get_volume_signal(rvol_val),
+                "obv_trend": "상승" if obv_line.iloc[-1] > sma(obv_line, 20).iloc[-1] else "하락",
+                "vwap": round(float(vwap_val), 0) if pd.notna(vwap_val) else None,
+                "turnover_avg": round(float(turnover_avg), 0),
+            }
+
         # 지지/저항선
         sr = support_resistance(high, low, close)
         result["support_resistance"] = {
@@ -237,9 +303,73 @@ def get_ti_full_analysis(ticker: str) -> dict:
             "ma_alignment": ma_alignment_str,
         }
 
+        if series:
+            values = {
+                "close": close,
+                "rsi": rsi(close),
+                "macd": macd_line,
+                "macd_signal": signal_line,
+                "macd_hist": hist,
+                "bb_upper": upper,
+                "bb_middle": middle,
+                "bb_lower": lower,
+                "stoch_k": k,
+                "stoch_d": d,
+                "ma5": sma(close, 5),
+                "ma20": sma(close, 20),
+                "ma60": sma(close, 60),
+            }
+            # warm-up 구간 제외 (마지막 days 봉)
+            result["series"] = _build_ti_series(
+                close.index[-days:], {key: value.iloc[-days:] for key, value in values.items()}
+            )
+
+    return result
+
+
+def _build_ti_series(index: pd.Index, values: dict) -> dict:
+    """지표 Series → {"dates": datetime64[D], 지표: float32 배열}"""
+    result = {"dates": pd.DatetimeIndex(index).values.astype("datetime64[D]")}
+    for key in TI_SERIES_KEYS:
+        result[key] = np.asarray(values[key], dtype=np.float32)
     return result
 
 
+def ti_series_to_frame(series: dict) -> pd.DataFrame:
+    """
+    get_ti_full_analysis(series=True)의 "series" → DataFrame
+
+    Returns:
+        DataFrame (index=날짜, columns=TI_SERIES_KEYS, dtype=float32)
+    """
+    return pd.DataFrame(
+        {key: series[key] for key in TI_SERIES_KEYS},
+        index=pd.DatetimeIndex(series["dates"], name="date"),
+    )
+
+
+def save_ti_series(series: dict, path: str) -> None:
+    """
+    지표 시계열을 Parquet 파일로 저장 (float32 유지, pyarrow 필요)
+
+    Args:
+        series: get_ti_full_analysis(series=True)의 "series"
+        path: 저장 경로 (.parquet)
+    """
+    ti_series_to_frame(series).to_parquet(path)
+
+
+def load_ti_series(path: str) -> dict:
+    """
+    save_ti_series로 저장한 파일 → "series" dict
+
+    Returns:
+        {"dates": datetime64[D] 배열, "close": float32 배열, ...}
+    """
+    frame = pd.read_parquet(path)
+    return _build_ti_series(frame.index, {key: frame[key] for key in TI_SERIES_KEYS})
+
+
 def print_ti_report(ticker: str) -> None:
     """TI 리포트 출력 (TI 에이전트 호출용)
 
@@ -313,6 +443,13 @@ def print_ti_report(ticker: str) -> None:
         print(f"이동평균: {ma_str}")
         if ma.get('alignment'):
             print(f"배열: {ma.get('alignment')}")
+
+        vol = ind.get("volume")
+        if vol:
+            rvol_str = f"{vol.get('rvol')}배 ({vol.get('signal')})" if vol.get('rvol') is not None else "-"
+            print(f"거래량: RVOL(20) {rvol_str}, OBV {vol.get('obv_trend')}")
+            if vol.get('vwap'):
+                print(f"VWAP(20): {vol.get('vwap'):,.0f}원 / 20일 평균 거래대금: {vol.get('turnover_avg') / 1e8:,.0f}억원")
     else:
         print("\n[3. 기술지표] 조회 실패")
 
@@ -323,6 +460,19 @@ def print_ti_report(ticker: str) -> None:
         print(f"저항선: R1={sr.get('r1'):,.0f}원, R2={sr.get('r2'):,.0f}원")
         print(f"지지선: S1={sr.get('s1'):,.0f}원, S2={sr.get('s2'):,.0f}원")
 
+    levels = data.get("sr_levels")
+    if levels and (levels.get("resistance") or levels.get("support")):
+        print("\n[5. 지지/저항 구간 (52주 스윙, 강도순)]")
+        for label, key in (("저항", "resistance"), ("지지", "support")):
+            for zone in levels.get(key, []):
+                volume_str = f", 거래량 {zone['volume_pct']}%" if zone.get("volume_pct") is not None else ""
+                print(
+                    f"{label}: {zone['low']:,.0f}~{zone['high']:,.0f}원 "
+                    f"(터치 {zone['touches']}회{volume_str}, 현재가 대비 {zone['distance_pct']:+.1f}%)"
+                )
+        if levels.get("volume_poc"):
+            print(f"거래량 최다 가격대: {levels['volume_poc']:,.0f}원")
+
     print("\n" + "=" * 50)
     print("TI 데이터 수집 완료")
     print("=" * 50)
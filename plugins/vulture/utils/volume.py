@@ -0,0 +1,268 @@
+"""거래량 / 유동성 지표
+
+get_ohlcv의 거래량·거래대금 컬럼으로 계산하는 거래량 분석 함수
+
+- 입력: Series(1종목) 또는 DataFrame(날짜 × 종목) - indicators와 같이 열 단위로 동작
+- volume_panels(): 스크리너 / TI 리포트가 함께 쓰는 거래량 지표 행렬 (한 번 계산해 재사용)
+- 거래량 신호 기준(VOLUME_*_RATIO)은 종목토론방 게시글 볼륨 신호(discussion_store)와 공용
+"""
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+Frame = Union[pd.Series, pd.DataFrame]
+
+# 상대 거래량 기준 구간 (영업일)
+RVOL_WINDOW = 20
+# 거래량 프로파일 가격 구간 수
+VOLUME_PROFILE_BINS = 50
+
+# 볼륨 신호 기준 (최근 구간 / 이전 구간 평균)
+VOLUME_SURGE_RATIO = 3.0
+VOLUME_HIGH_RATIO = 1.5
+VOLUME_LOW_RATIO = 0.5
+
+
+def volume_baseline(volume: Frame, window: int = RVOL_WINDOW, min_periods: Optional[int] = None) -> Frame:
+    """
+    직전 window 구간 평균 거래량 (현재 봉 제외)
+
+    Args:
+        volume: 거래량 (또는 게시글 수 등 구간별 건수)
+        window: 기준 구간 수
+        min_periods: 최소 구간 수 (None=window, 부족하면 NaN)
+    """
+    return volume.shift(1).rolling(window, min_periods=min_periods or window).mean()
+
+
+def relative_volume(volume: Frame, window: int = RVOL_WINDOW, min_periods: Optional[int] = None) -> Frame:
+    """
+    상대 거래량 (RVOL) = 당일 거래량 / 직전 window 구간 평균
+
+    Returns:
+        같은 모양 (기준 평균이 0 또는 NaN이면 NaN)
+    """
+    baseline = volume_baseline(volume, window, min_periods)
+    return volume / baseline.where(baseline > 0)
+
+
+def get_volume_signal(ratio: float) -> Optional[str]:
+    """
+    상대 거래량 → 볼륨 신호
+
+    Returns:
+        "surge" (>= 3.0) | "high" (>= 1.5) | "normal" (>= 0.5) | "low" | None (NaN)
+    """
+    if ratio is None or pd.isna(ratio):
+        return None
+    if ratio >= VOLUME_SURGE_RATIO:
+        return "surge"
+    if ratio >= VOLUME_HIGH_RATIO:
+        return "high"
+    if ratio >= VOLUME_LOW_RATIO:
+        return "normal"
+    return "low"
+
+
+def obv(close: Frame, volume: Frame) -> Frame:
+    """
+    OBV (On-Balance Volume)
+
+    Formula:
+        OBV = OBV_prev + volume (종가 상승) / - volume (하락) / 0 (보합)
+        첫 봉은 0에서 시작 (종가가 없는 봉은 NaN)
+    """
+    direction = np.sign(close.diff()).fillna(0.0)
+    return (direction * volume.fillna(0)).cumsum().where(close.notna())
+
+
+def vwap(
+    high: Frame,
+    low: Frame,
+    close: Frame,
+    volume: Frame,
+    window: Optional[int] = RVOL_WINDOW
+) -> Frame:
+    """
+    거래량 가중 평균가 (VWAP, 일봉 기준)
+
+    Args:
+        window: 이동 구간 (None=전체 기간 누적)
+
+    Formula:
+        VWAP = sum(typical × volume) / sum(volume)
+        typical = (고가 + 저가 + 종가) / 3
+    """
+    typical = (high + low + close) / 3
+    traded = typical * volume
+    if window is None:
+        value, shares = traded.cumsum(), volume.cumsum()
+    else:
+        value, shares = traded.rolling(window).sum(), volume.rolling(window).sum()
+    return value / shares.where(shares > 0)
+
+
+def turnover(close: Frame, volume: Frame, value: Optional[Frame] = None) -> Frame:
+    """
+    거래대금 (get_ohlcv의 거래대금 컬럼이 있으면 그대로, 없으면 종가 × 거래량)
+    """
+    if value is not None:
+        return value
+    return close * volume
+
+
+def liquidity_rank(turnover_panel: pd.DataFrame, window: int = RVOL_WINDOW) -> pd.DataFrame:
+    """
+    거래대금 기준 유동성 순위 (날짜별 종목 백분위)
+
+    Args:
+        turnover_panel: 거래대금 날짜 × 종목 DataFrame
+        window: 평균 거래대금 구간
+
+    Returns:
+        날짜 × 종목 DataFrame (100=거래대금 최상위, 상장 전/거래정지는 NaN)
+    """
+    average = turnover_panel.rolling(window, min_periods=1).mean()
+    return average.rank(axis=1, pct=True) * 100
+
+
+def volume_histogram(prices: np.ndarray, weights: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    열별 가격대 거래량 히스토그램 (날짜 × 종목 배열, 전 종목 bincount 한 번)
+
+    Returns:
+        (edges: 종목 × (bins+1), hist: 종목 × bins) - 열별 [최저가, 최고가] 균등 분할
+    """
+    n_cols = prices.shape[1]
+    valid = ~np.isnan(prices)
+    has_data = valid.any(axis=0)
+    filled = np.where(valid, prices, 0.0)
+    lo = np.where(has_data, np.where(valid, prices, np.inf).min(axis=0), np.nan)
+    hi = np.where(has_data, np.where(valid, prices, -np.inf).max(axis=0), np.nan)
+    span = hi - lo
+    scale = np.where(span > 0, bins / np.where(span > 0, span, 1.0), 0.0)
+
+    idx = np.floor((filled - np.nan_to_num(lo)) * scale).astype(np.int64)
+    idx = np.clip(idx, 0, bins - 1) + np.arange(n_cols) * bins
+    hist = np.bincount(
+        idx[valid], weights=np.nan_to_num(weights)[valid], minlength=n_cols * bins
+    ).reshape(n_cols, bins)
+    edges = lo[:, None] + span[:, None] * np.linspace(0.0, 1.0, bins + 1)
+    return edges, hist
+
+
+def _profile(close: Frame, volume: Frame, bins: int, lookback: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Series / DataFrame → volume_histogram (Series는 1열로 처리)"""
+    if lookback is not None:
+        close, volume = close.iloc[-lookback:], volume.iloc[-lookback:]
+    if isinstance(volume, pd.DataFrame) and isinstance(close, pd.DataFrame):
+        volume = volume.reindex(columns=close.columns)
+
+    prices = close.to_numpy(dtype=float)
+    weights = volume.to_numpy(dtype=float)
+    if prices.ndim == 1:
+        prices, weights = prices[:, None], weights[:, None]
+    return volume_histogram(prices, weights, bins)
+
+
+def volume_at_price(
+    close: Frame,
+    volume: Frame,
+    bins: int = VOLUME_PROFILE_BINS,
+    lookback: Optional[int] = None
+):
+    """
+    가격대별 거래량 (Volume Profile)
+
+    Args:
+        close: 종가 Series (또는 날짜 × 종목 DataFrame)
+        volume: 거래량 (같은 모양)
+        bins: 가격 구간 수 (기간 최저가~최고가 균등 분할)
+        lookback: 최근 N 봉만 (None=전체)
+
+    Returns:
+        Series 입력: DataFrame (구간별 행)
+            price_low, price_high: 구간 가격
+            volume: 구간 거래량 합
+            volume_pct: 기간 거래량 대비 %
+        DataFrame 입력: {종목코드: 위 DataFrame}
+    """
+    edges, hist = _profile(close, volume, bins, lookback)
+
+    totals = hist.sum(axis=1, keepdims=True)
+    pct = np.divide(hist * 100, totals, out=np.zeros_like(hist), where=totals > 0)
+    frames = [
+        pd.DataFrame({
+            "price_low": edges[i, :-1],
+            "price_high": edges[i, 1:],
+            "volume": hist[i],
+            "volume_pct": pct[i],
+        })
+        for i in range(hist.shape[0])
+    ]
+    if isinstance(close, pd.Series):
+        return frames[0]
+    return dict(zip(close.columns, frames))
+
+
+def volume_poc(
+    close: Frame,
+    volume: Frame,
+    bins: int = VOLUME_PROFILE_BINS,
+    lookback: Optional[int] = None
+):
+    """
+    거래량 최다 가격대 (Point of Control, 구간 중간값)
+
+    Returns:
+        Series 입력: float (거래량이 없으면 None)
+        DataFrame 입력: 종목별 Series (거래량이 없으면 NaN)
+    """
+    edges, hist = _profile(close, volume, bins, lookback)
+
+    peak = hist.argmax(axis=1)
+    rows = np.arange(hist.shape[0])
+    poc = (edges[rows, peak] + edges[rows, peak + 1]) / 2
+    poc = np.where(hist.sum(axis=1) > 0, poc, np.nan)
+    if isinstance(close, pd.Series):
+        return None if np.isnan(poc[0]) else float(poc[0])
+    return pd.Series(poc, index=close.columns)
+
+
+def volume_panels(panels: dict, window: int = RVOL_WINDOW) -> dict:
+    """
+    OHLCV 행렬 → 거래량 지표 행렬 (전 종목 동시 계산)
+
+    Args:
+        panels: load_ohlcv_panels 결과 ("종가", "거래량" 필요 / "고가", "저가", "거래대금" 있으면 사용)
+        window: RVOL / VWAP / 평균 거래대금 구간
+
+    Returns:
+        {
+            "volume": 거래량,
+            "rvol": 상대 거래량 (당일 / 직전 window 평균),
+            "obv": OBV,
+            "vwap": window 구간 VWAP (고가/저가 없으면 종가 기준),
+            "turnover": 거래대금,
+            "turnover_avg": window 평균 거래대금,
+            "liquidity_pct": 평균 거래대금 백분위 (100=최상위, DataFrame 입력만)
+        }
+    """
+    close = panels["종가"]
+    volume = panels["거래량"]
+    high = panels.get("고가", close)
+    low = panels.get("저가", close)
+    value = turnover(close, volume, panels.get("거래대금"))
+
+    result = {
+        "volume": volume,
+        "rvol": relative_volume(volume, window),
+        "obv": obv(close, volume),
+        "vwap": vwap(high, low, close, volume, window),
+        "turnover": value,
+        "turnover_avg": value.rolling(window, min_periods=1).mean(),
+    }
+    if isinstance(close, pd.DataFrame):
+        result["liquidity_pct"] = liquidity_rank(value, window)
+    return result
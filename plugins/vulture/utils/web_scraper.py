@@ -3,18 +3,51 @@
 네이버 금융 등에서 데이터를 추출하는 함수들
 Playwright 결과를 후처리하거나 requests로 직접 스크래핑
 """
+import logging
+import os
 import re
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional
 import requests
 from bs4 import BeautifulSoup
 
-
-def get_naver_stock_info(ticker: str) -> Optional[dict]:
+logger = logging.getLogger(__name__)
+
+NAVER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+}
+NAVER_STOCK_INFO_URL = "https://finance.naver.com/item/main.naver?code={ticker}"
+NAVER_NEWS_URL = "https://finance.naver.com/item/news.naver?code={ticker}"
+NAVER_DISCUSSION_URL = "https://finance.naver.com/item/board.naver?code={ticker}"
+NAVER_STOCK_LIST_URL = "https://finance.naver.com/sise/sise_market_sum.naver?sosok={market_code}"
+NAVER_STOCK_LIST_MAX_PAGES = 50
+
+# Playwright snapshot 정제용 정규식 (모듈 로드 시 1회 컴파일)
+# 태그 3종을 하나로 합쳐 "[" 리터럴 접두사 탐색을 유지 (단일 alternation 정규식보다 빠름)
+_PLAYWRIGHT_TAG_RE = re.compile(r'\[(?:ref=e\d+|cursor=\w+|\s*)\]')
+_MULTI_SPACE_RE = re.compile(r'  +')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_TRAILING_BLANK_RE = re.compile(r'\n\s*\Z')
+# 접근성 트리 노드 role: "- navigation "메뉴" [ref=e12]:"
+_PLAYWRIGHT_ROLE_RE = re.compile(r'- (\w+)')
+PLAYWRIGHT_PRUNE_ROLES = ("navigation", "contentinfo")
+
+# 게시판 날짜 형식: "2026.01.15 10:21", "2026.01.15", "01/15 10:21", "01/15", "10:21"
+_POST_DATE_RE = re.compile(
+    r'^(?:(?P<year>\d{4})[./-])?(?:(?P<month>\d{1,2})[./-](?P<day>\d{1,2}))?'
+    r'\s*(?:(?P<hour>\d{1,2}):(?P<minute>\d{2}))?$'
+)
+
+
+def get_naver_stock_info(ticker: str, raise_errors: bool = False) -> Optional[dict]:
     """
     네이버 금융에서 종목 정보 스크래핑
 
     Args:
         ticker: 종목코드 (예: "048910")
+        raise_errors: True=요청/HTTP 오류를 그대로 raise (data_fetcher circuit breaker용)
 
     Returns:
         {
@@ -35,97 +68,99 @@ def get_naver_stock_info(ticker: str) -> Optional[dict]:
         or None (실패 시)
     """
     try:
-        url = f"https://finance.naver.com/item/main.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        url = NAVER_STOCK_INFO_URL.format(ticker=ticker)
+        response = requests.get(url, headers=NAVER_HEADERS, timeout=10)
         response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        result = {}
-
-        # 종목명
-        wrap_company = soup.select_one("div.wrap_company h2 a")
-        if wrap_company:
-            result["name"] = wrap_company.text.strip()
-
-        # 현재가
-        no_today = soup.select_one("p.no_today span.blind")
-        if no_today:
-            result["price"] = _parse_number(no_today.text)
-
-        # 전일대비
-        no_exday = soup.select("p.no_exday span.blind")
-        if len(no_exday) >= 2:
-            change = _parse_number(no_exday[0].text)
-            change_pct = _parse_float(no_exday[1].text.replace("%", ""))
-
-            # 상승/하락 판단
-            ico = soup.select_one("p.no_exday em")
-            if ico and "down" in str(ico.get("class", [])):
-                change = -change
-                change_pct = -change_pct
-
-            result["change"] = change
-            result["change_pct"] = change_pct
-
-        # 시세 테이블 (전일, 시가, 고가, 저가, 거래량)
-        table = soup.select_one("table.no_info")
-        if table:
-            rows = table.select("tr")
-            for row in rows:
-                tds = row.select("td")
-                for td in tds:
-                    text = td.text.strip()
-                    blind = td.select_one("span.blind")
-                    if blind:
-                        value = _parse_number(blind.text)
-                        if "전일" in text:
-                            result["prev_close"] = value
-                        elif "시가" in text:
-                            result["open"] = value
-                        elif "고가" in text:
-                            result["high"] = value
-                        elif "저가" in text:
-                            result["low"] = value
-                        elif "거래량" in text:
-                            result["volume"] = value
-
-        # 투자정보 (시가총액, PER, PBR, 외국인비율)
-        aside = soup.select_one("div.aside_invest_info")
-        if aside:
-            items = aside.select("tr")
-            for item in items:
-                th = item.select_one("th")
-                td = item.select_one("td")
-                if th and td:
-                    label = th.text.strip()
-                    value_elem = td.select_one("em") or td
-                    value_text = value_elem.text.strip()
-
-                    if label == "시가총액":  # 정확 매칭 (시가총액순위와 구분)
-                        result["market_cap"] = _parse_market_cap(value_text)
-                    elif label.startswith("PERl") or label.startswith("PER|"):
-                        # "PERlEPS(2025.09)" 형태 - 동일업종 PER 제외
-                        result["per"] = _parse_float(value_text)
-                    elif label.startswith("추정PER"):
-                        # "추정PERlEPS" 형태
-                        result["estimated_per"] = _parse_float(value_text)
-                    elif label.startswith("PBRl") or label.startswith("PBR|"):
-                        # "PBRlBPS (2025.09)" 형태
-                        result["pbr"] = _parse_float(value_text)
-                    elif "외국인" in label:
-                        result["foreign_ratio"] = _parse_float(value_text.replace("%", ""))
-
-        return result if result else None
+        return _parse_naver_stock_info(response.text)
 
     except Exception:
+        if raise_errors:
+            raise
         return None
 
 
+def _parse_naver_stock_info(html: str) -> Optional[dict]:
+    """종목 메인 페이지 HTML 파싱 (get_naver_stock_info 참고)"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    result = {}
+
+    # 종목명
+    wrap_company = soup.select_one("div.wrap_company h2 a")
+    if wrap_company:
+        result["name"] = wrap_company.text.strip()
+
+    # 현재가
+    no_today = soup.select_one("p.no_today span.blind")
+    if no_today:
+        result["price"] = _parse_number(no_today.text)
+
+    # 전일대비
+    no_exday = soup.select("p.no_exday span.blind")
+    if len(no_exday) >= 2:
+        change = _parse_number(no_exday[0].text)
+        change_pct = _parse_float(no_exday[1].text.replace("%", ""))
+
+        # 상승/하락 판단
+        ico = soup.select_one("p.no_exday em")
+        if ico and "down" in str(ico.get("class", [])):
+            change = -change
+            change_pct = -change_pct
+
+        result["change"] = change
+        result["change_pct"] = change_pct
+
+    # 시세 테이블 (전일, 시가, 고가, 저가, 거래량)
+    table = soup.select_one("table.no_info")
+    if table:
+        rows = table.select("tr")
+        for row in rows:
+            tds = row.select("td")
+            for td in tds:
+                text = td.text.strip()
+                blind = td.select_one("span.blind")
+                if blind:
+                    value = _parse_number(blind.text)
+                    if "전일" in text:
+                        result["prev_close"] = value
+                    elif "시가" in text:
+                        result["open"] = value
+                    elif "고가" in text:
+                        result["high"] = value
+                    elif "저가" in text:
+                        result["low"] = value
+                    elif "거래량" in text:
+                        result["volume"] = value
+
+    # 투자정보 (시가총액, PER, PBR, 외국인비율)
+    aside = soup.select_one("div.aside_invest_info")
+    if aside:
+        items = aside.select("tr")
+        for item in items:
+            th = item.select_one("th")
+            td = item.select_one("td")
+            if th and td:
+                label = th.text.strip()
+                value_elem = td.select_one("em") or td
+                value_text = value_elem.text.strip()
+
+                if label == "시가총액":  # 정확 매칭 (시가총액순위와 구분)
+                    result["market_cap"] = _parse_market_cap(value_text)
+                elif label.startswith("PERl") or label.startswith("PER|"):
+                    # "PERlEPS(2025.09)" 형태 - 동일업종 PER 제외
+                    result["per"] = _parse_float(value_text)
+                elif label.startswith("추정PER"):
+                    # "추정PERlEPS" 형태
+                    result["estimated_per"] = _parse_float(value_text)
+                elif label.startswith("PBRl") or label.startswith("PBR|"):
+                    # "PBRlBPS (2025.09)" 형태
+                    result["pbr"] = _parse_float(value_text)
+                elif "외국인" in label:
+                    result["foreign_ratio"] = _parse_float(value_text.replace("%", ""))
+
+    return result if result else None
+
+
 def get_naver_stock_news(ticker: str, limit: int = 5) -> Optional[list]:
     """
     네이버 금융에서 종목 뉴스 스크래핑
@@ -142,37 +177,37 @@ def get_naver_stock_news(ticker: str, limit: int = 5) -> Optional[list]:
         or None (실패 시)
     """
     try:
-        url = f"https://finance.naver.com/item/news.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        url = NAVER_NEWS_URL.format(ticker=ticker)
+        response = requests.get(url, headers=NAVER_HEADERS, timeout=10)
         response.raise_for_status()
+        return _parse_naver_news(response.text, limit)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    except Exception:
+        return None
 
-        news_list = []
-        items = soup.select("table.type5 tr")
 
-        for item in items[:limit * 2]:  # 헤더 등 건너뛰기 위해 여유있게
-            title_elem = item.select_one("td.title a")
-            date_elem = item.select_one("td.date")
+def _parse_naver_news(html: str, limit: int) -> Optional[list]:
+    """종목 뉴스 페이지 HTML 파싱"""
+    soup = BeautifulSoup(html, "html.parser")
 
-            if title_elem and date_elem:
-                news_list.append({
-                    "title": title_elem.text.strip(),
-                    "date": date_elem.text.strip(),
-                    "url": "https://finance.naver.com" + title_elem.get("href", "")
-                })
+    news_list = []
+    items = soup.select("table.type5 tr")
 
-                if len(news_list) >= limit:
-                    break
+    for item in items[:limit * 2]:  # 헤더 등 건너뛰기 위해 여유있게
+        title_elem = item.select_one("td.title a")
+        date_elem = item.select_one("td.date")
 
-        return news_list if news_list else None
+        if title_elem and date_elem:
+            news_list.append({
+                "title": title_elem.text.strip(),
+                "date": date_elem.text.strip(),
+                "url": "https://finance.naver.com" + title_elem.get("href", "")
+            })
 
-    except Exception:
-        return None
+            if len(news_list) >= limit:
+                break
+
+    return news_list if news_list else None
 
 
 def get_naver_discussion(ticker: str, limit: int = 10) -> Optional[list]:
@@ -191,66 +226,322 @@ def get_naver_discussion(ticker: str, limit: int = 10) -> Optional[list]:
         or None (실패 시)
     """
     try:
-        url = f"https://finance.naver.com/item/board.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
+        url = NAVER_DISCUSSION_URL.format(ticker=ticker)
+        response = requests.get(url, headers=NAVER_HEADERS, timeout=10)
         response.raise_for_status()
+        return _parse_naver_discussion(response.text, limit)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    except Exception:
+        return None
 
-        posts = []
-        items = soup.select("table.type2 tr")
 
-        for item in items:
-            title_elem = item.select_one("td.title a")
-            date_elem = item.select_one("td span.tah")
+def _parse_naver_discussion(html: str, limit: int) -> Optional[list]:
+    """종목토론방 페이지 HTML 파싱"""
+    soup = BeautifulSoup(html, "html.parser")
 
-            if title_elem:
-                date_text = date_elem.text.strip() if date_elem else ""
-                posts.append({
-                    "title": title_elem.text.strip(),
-                    "date": date_text,
-                    "url": "https://finance.naver.com" + title_elem.get("href", "")
-                })
+    posts = []
+    items = soup.select("table.type2 tr")
 
-                if len(posts) >= limit:
-                    break
+    for item in items:
+        title_elem = item.select_one("td.title a")
+        date_elem = item.select_one("td span.tah")
 
-        return posts if posts else None
+        if title_elem:
+            date_text = date_elem.text.strip() if date_elem else ""
+            posts.append({
+                "title": title_elem.text.strip(),
+                "date": date_text,
+                "url": "https://finance.naver.com" + title_elem.get("href", "")
+            })
 
-    except Exception:
+            if len(posts) >= limit:
+                break
+
+    return posts if posts else None
+
+
+def iter_naver_discussion(
+    ticker: str,
+    max_posts: Optional[int] = None,
+    since: Optional[datetime] = None,
+    max_pages: int = 100,
+    prefetch: int = 3
+) -> Iterator[dict]:
+    """
+    네이버 종목토론방 여러 페이지를 순회하며 게시글을 하나씩 반환 (generator)
+
+    다음 페이지들을 prefetch 개수만큼 미리 동시에 요청하고,
+    파싱된 게시글을 바로 yield 하므로 메모리는 페이지 수와 무관하게 일정
+
+    Args:
+        ticker: 종목코드
+        max_posts: 최대 게시글 수 (None=제한 없음)
+        since: 이 시각보다 오래된 글이 나오면 중단 (None=제한 없음)
+        max_pages: 최대 페이지 수
+        prefetch: 미리 요청할 페이지 수 (동시 요청 수)
+
+    Yields:
+        {"title": "...", "date": "2026.01.15 10:21", "url": "..."}
+
+    Raises:
+        페이지 요청/파싱 실패 시 그때까지의 게시글을 yield 한 뒤 원래 예외를 raise
+        (마지막 페이지 도달과 구분 - 부분 수집 결과를 확정하지 않도록)
+    """
+    url = NAVER_DISCUSSION_URL.format(ticker=ticker)
+    yield from _iter_naver_pages(
+        url, _parse_naver_discussion, max_posts, since, max_pages, prefetch
+    )
+
+
+def iter_naver_stock_news(
+    ticker: str,
+    max_posts: Optional[int] = None,
+    since: Optional[datetime] = None,
+    max_pages: int = 100,
+    prefetch: int = 3
+) -> Iterator[dict]:
+    """
+    네이버 종목 뉴스 여러 페이지를 순회하며 기사를 하나씩 반환 (generator)
+
+    Args:
+        ticker: 종목코드
+        max_posts: 최대 기사 수 (None=제한 없음)
+        since: 이 시각보다 오래된 기사가 나오면 중단 (None=제한 없음)
+        max_pages: 최대 페이지 수
+        prefetch: 미리 요청할 페이지 수 (동시 요청 수)
+
+    Yields:
+        {"title": "...", "date": "2026.01.15 10:21", "url": "..."}
+
+    Raises:
+        페이지 요청/파싱 실패 시 iter_naver_discussion과 동일하게 예외 raise
+    """
+    url = NAVER_NEWS_URL.format(ticker=ticker)
+    yield from _iter_naver_pages(
+        url, _parse_naver_news, max_posts, since, max_pages, prefetch
+    )
+
+
+def _iter_naver_pages(
+    url: str,
+    parse_fn: Callable[[str, int], Optional[list]],
+    max_posts: Optional[int],
+    since: Optional[datetime],
+    max_pages: int,
+    prefetch: int
+) -> Iterator[dict]:
+    """페이지 순회 공통 로직 (빈 페이지/마지막 페이지 반복/개수/날짜 기준 중단, 요청 실패는 raise)"""
+    def fetch(page: int) -> Optional[list]:
+        response = requests.get(f"{url}&page={page}", headers=NAVER_HEADERS, timeout=10)
+        response.raise_for_status()
+        # 페이지당 게시글 수보다 충분히 큰 limit
+        return parse_fn(response.text, 1000)
+
+    now = datetime.now()
+    count = 0
+    prev_first_url = None
+    executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+    pending = deque()
+    next_page = 1
+
+    try:
+        while next_page <= min(prefetch, max_pages):
+            pending.append((next_page, executor.submit(fetch, next_page)))
+            next_page += 1
+
+        while pending:
+            page, future = pending.popleft()
+            try:
+                posts = future.result()
+            except Exception as e:
+                logger.warning("Naver page %d fetch failed (%s): %s", page, url, e)
+                raise
+
+            # 네이버는 마지막 페이지를 넘기면 마지막 페이지를 반복 반환
+            if not posts or posts[0]["url"] == prev_first_url:
+                return
+            prev_first_url = posts[0]["url"]
+
+            if next_page <= max_pages:
+                pending.append((next_page, executor.submit(fetch, next_page)))
+                next_page += 1
+
+            for post in posts:
+                if since is not None:
+                    posted_at = _parse_post_date(post["date"], now)
+                    if posted_at is not None and posted_at < since:
+                        return
+                yield post
+                count += 1
+                if max_posts is not None and count >= max_posts:
+                    return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_post_date(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    게시판/뉴스 날짜 텍스트를 datetime으로 변환
+
+    Args:
+        text: "2026.01.15 10:21", "01/15 10:21", "10:21"(오늘) 등
+        now: 기준 시각 (연도 생략 시 사용, 기본 현재)
+
+    Returns:
+        datetime or None (파싱 실패 시)
+    """
+    match = _POST_DATE_RE.match(text.strip()) if text else None
+    if not match or not (match.group("day") or match.group("hour")):
         return None
 
+    now = now or datetime.now()
+    try:
+        if match.group("day"):
+            year = int(match.group("year")) if match.group("year") else now.year
+            posted_at = datetime(year, int(match.group("month")), int(match.group("day")))
+        else:
+            posted_at = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if match.group("hour"):
+            posted_at = posted_at.replace(
+                hour=int(match.group("hour")), minute=int(match.group("minute"))
+            )
+    except ValueError:
+        return None
 
-def clean_playwright_result(text: str) -> str:
+    # 연도 없는 "12/31" 이 1월에 조회되면 작년 글
+    if not match.group("year") and posted_at > now:
+        posted_at = posted_at.replace(year=posted_at.year - 1)
+    return posted_at
+
+
+def clean_playwright_result(
+    text: str,
+    prune: bool = False,
+    prune_roles: tuple = PLAYWRIGHT_PRUNE_ROLES
+) -> str:
     """
     Playwright 결과물 후처리 (크기 축소)
 
     Args:
         text: Playwright snapshot 텍스트
+        prune: True면 prune_roles 노드의 하위 트리 전체 제거
+        prune_roles: 제거할 접근성 트리 role (기본 navigation, contentinfo=footer)
 
     Returns:
         정제된 텍스트 (크기 약 70-80% 감소)
     """
-    # 1. [ref=eXXX] 제거
-    text = re.sub(r'\[ref=e\d+\]', '', text)
+    if prune:
+        text = "\n".join(_prune_snapshot_lines(text.split("\n"), prune_roles))
+    return _clean_snapshot_text(text).strip()
 
-    # 2. [cursor=pointer] 제거
-    text = re.sub(r'\[cursor=\w+\]', '', text)
 
-    # 3. 빈 괄호 정리
-    text = re.sub(r'\[\s*\]', '', text)
+def _clean_snapshot_text(text: str) -> str:
+    """[ref=eXXX]/[cursor=xxx]/빈 괄호 제거 → 연속 공백 → 빈 줄 정리"""
+    text = _PLAYWRIGHT_TAG_RE.sub('', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
+    return _BLANK_LINES_RE.sub('\n', text)
 
-    # 4. 연속 공백 정리
-    text = re.sub(r'  +', ' ', text)
 
-    # 5. 빈 줄 정리
-    text = re.sub(r'\n\s*\n', '\n', text)
+def clean_playwright_file(
+    input_path: str,
+    output_path: str,
+    prune: bool = False,
+    prune_roles: tuple = PLAYWRIGHT_PRUNE_ROLES,
+    chunk_size: int = 1 << 20
+) -> dict:
+    """
+    디스크의 Playwright snapshot 파일을 조각 단위로 정제
 
-    return text.strip()
+    줄 경계에서 자른 chunk_size 크기 조각만 메모리에 올리므로
+    snapshot 크기와 무관하게 메모리 사용량 일정
+
+    Args:
+        input_path: snapshot 파일 경로
+        output_path: 정제 결과 저장 경로
+        prune: True면 prune_roles 노드의 하위 트리 전체 제거
+        prune_roles: 제거할 접근성 트리 role
+        chunk_size: 한 번에 처리할 글자 수 (기본 1M)
+
+    Returns:
+        {"input_bytes": 74213, "output_bytes": 15302}
+    """
+    with open(input_path, "r", encoding="utf-8") as src, \
+            open(output_path, "w", encoding="utf-8") as dst:
+        if prune:
+            lines = (line.rstrip("\n") for line in src)
+            chunks = _iter_line_chunks(_prune_snapshot_lines(lines, prune_roles), chunk_size)
+        else:
+            chunks = _iter_text_chunks(src, chunk_size)
+
+        pending = ""
+        for chunk in chunks:
+            # 다음 조각이 "\n"으로 시작하므로 조각 끝의 빈 줄은 버림
+            cleaned = _TRAILING_BLANK_RE.sub('', _clean_snapshot_text(chunk))
+            if not cleaned.strip():
+                continue
+            if pending:
+                dst.write(pending)
+            else:
+                cleaned = cleaned.lstrip()
+            pending = cleaned
+        dst.write(pending.rstrip())
+
+    return {
+        "input_bytes": os.path.getsize(input_path),
+        "output_bytes": os.path.getsize(output_path),
+    }
+
+
+def _iter_text_chunks(f, chunk_size: int) -> Iterator[str]:
+    """파일을 줄 경계에서 자른 조각으로 반환 (두 번째 조각부터 '\n'으로 시작)"""
+    carry = ""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        block = carry + block
+        cut = block.rfind("\n")
+        if cut <= 0:
+            carry = block
+            continue
+        yield block[:cut]
+        carry = block[cut:]
+    if carry:
+        yield carry
+
+
+def _iter_line_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """줄들을 chunk_size 크기 조각으로 묶음 (두 번째 조각부터 '\n'으로 시작)"""
+    buffer = []
+    size = 0
+    first = True
+    for line in lines:
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= chunk_size:
+            yield ("" if first else "\n") + "\n".join(buffer)
+            first = False
+            buffer = []
+            size = 0
+    if buffer:
+        yield ("" if first else "\n") + "\n".join(buffer)
+
+
+def _prune_snapshot_lines(lines: Iterable[str], prune_roles: tuple) -> Iterator[str]:
+    """prune_roles 노드와 그보다 깊게 들여쓰기된 하위 줄 제거"""
+    prune_indent = None
+    for line in lines:
+        stripped = line.lstrip(" ")
+        indent = len(line) - len(stripped)
+        if prune_indent is not None:
+            if indent > prune_indent or not stripped.strip():
+                continue
+            prune_indent = None
+        match = _PLAYWRIGHT_ROLE_RE.match(stripped)
+        if match and match.group(1) in prune_roles:
+            prune_indent = indent
+            continue
+        yield line
 
 
 def _parse_number(text: str) -> int:
@@ -281,25 +572,14 @@ def get_naver_stock_list(market: str = "KOSPI") -> Optional[list]:
     Returns:
         [{"code": "005930", "name": "삼성전자"}, ...] or None
     """
-    market_code = "0" if market == "KOSPI" else "1"
-    url = f"https://finance.naver.com/sise/sise_market_sum.naver?sosok={market_code}"
+    url = _naver_stock_list_url(market)
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
 
     try:
         all_stocks = []
-        for page in range(1, 50):  # 최대 50페이지
+        for page in range(1, NAVER_STOCK_LIST_MAX_PAGES):  # 최대 50페이지
             resp = requests.get(f"{url}&page={page}", headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
-            rows = soup.select("table.type_2 tr")
-            page_stocks = []
-
-            for row in rows:
-                link = row.select_one("a.tltle")
-                if link:
-                    href = link.get("href", "")
-                    code = href.split("code=")[-1] if "code=" in href else ""
-                    if code and len(code) == 6:
-                        page_stocks.append({"code": code, "name": link.get_text(strip=True)})
+            page_stocks = _parse_naver_stock_list_page(resp.text)
 
             if not page_stocks:
                 break
@@ -310,6 +590,29 @@ def get_naver_stock_list(market: str = "KOSPI") -> Optional[list]:
         return None
 
 
+def _naver_stock_list_url(market: str) -> str:
+    """시가총액 순위 페이지 URL (page 파라미터 제외)"""
+    market_code = "0" if market == "KOSPI" else "1"
+    return NAVER_STOCK_LIST_URL.format(market_code=market_code)
+
+
+def _parse_naver_stock_list_page(html: str) -> list:
+    """시가총액 순위 페이지 HTML 파싱"""
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select("table.type_2 tr")
+    page_stocks = []
+
+    for row in rows:
+        link = row.select_one("a.tltle")
+        if link:
+            href = link.get("href", "")
+            code = href.split("code=")[-1] if "code=" in href else ""
+            if code and len(code) == 6:
+                page_stocks.append({"code": code, "name": link.get_text(strip=True)})
+
+    return page_stocks
+
+
 def _parse_market_cap(text: str) -> int:
     """
     시가총액 텍스트를 억 단위 숫자로 변환